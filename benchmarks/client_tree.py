@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# benchmarks/client_tree.py
+# ============================================================================
+# CLIENT/PROGRAM TREE BENCHMARK
+# ============================================================================
+#
+# PURPOSE:
+#     Time queries.get_client_program_tree() against the implementation it
+#     replaced, on a synthetic database (default: 50 clients x 10 programs),
+#     and check that both return the same tree.
+#
+# AVIATION ANALOGY:
+#     Like flight-testing a new fuel system against the old one on the same
+#     airframe and route - same inputs, same answer required, compare the
+#     burn.
+#
+# WHY: The old query LEFT JOINed user_stories and uat_test_cases onto each
+#     program, so every story was paired with every test before
+#     COUNT(DISTINCT ...) removed the duplicates - stories x tests rows per
+#     program, one query per client. The new one reads pre-aggregated
+#     program_stats counts in a single query.
+#
+# USAGE:
+#     python3 benchmarks/client_tree.py                       # 50 x 10, defaults
+#     python3 benchmarks/client_tree.py --stories 500 --tests 5000
+#     python3 benchmarks/client_tree.py --runs 5 --json
+#     python3 benchmarks/client_tree.py --db /tmp/tree.db --keep   # Reuse the DB
+#
+# ============================================================================
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+import tempfile
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from database.db_manager import ClientProductDatabase
+from database.queries import get_client_program_tree
+
+STORY_STATUSES = ['Draft', 'Internal Review', 'Pending Client Review',
+                  'Approved', 'Needs Discussion', 'Out of Scope']
+TEST_STATUSES = ['Not Run', 'Pass', 'Fail', 'Blocked', 'Skipped']
+
+
+# ============================================================================
+# SYNTHETIC DATABASE
+# ============================================================================
+
+def build_database(
+    db_path: str,
+    clients: int = 50,
+    programs_per_client: int = 10,
+    stories: int = 50,
+    tests: int = 500,
+    seed: int = 42
+) -> dict:
+    """
+    PURPOSE:
+        Create a database with clients x programs, each program holding
+        `stories` user stories and `tests` test cases.
+
+    RETURNS:
+        dict: Row counts and build seconds
+
+    WHY THIS APPROACH:
+        Rows go in with executemany() in one transaction, through the real
+        schema and triggers, so program_stats is maintained exactly as it
+        would be in production.
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    db = ClientProductDatabase(db_path)
+    conn = db.get_connection()
+
+    with conn:
+        for c in range(clients):
+            client_id = f"CLI-{c:04d}"
+            conn.execute("INSERT INTO clients (client_id, name) VALUES (?, ?)",
+                         (client_id, f"Client {c:04d}"))
+
+            for p in range(programs_per_client):
+                prefix = f"C{c:03d}P{p:02d}"
+                program_id = f"PRG-{prefix}"
+                conn.execute("""
+                    INSERT INTO programs (program_id, client_id, name, prefix)
+                    VALUES (?, ?, ?, ?)
+                """, (program_id, client_id, f"Program {prefix}", prefix))
+
+                story_ids = [f"{prefix}-S{s:05d}" for s in range(stories)]
+                conn.executemany("""
+                    INSERT INTO user_stories (story_id, program_id, title, status)
+                    VALUES (?, ?, ?, ?)
+                """, [(sid, program_id, f"Story {sid}", rng.choice(STORY_STATUSES))
+                      for sid in story_ids])
+
+                conn.executemany("""
+                    INSERT INTO uat_test_cases (test_id, story_id, program_id, title, test_status)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [(f"{prefix}-T{t:06d}", story_ids[t % stories] if stories else None,
+                       program_id, "Test", rng.choice(TEST_STATUSES))
+                      for t in range(tests)])
+
+    db.close()
+    return {
+        'clients': clients,
+        'programs': clients * programs_per_client,
+        'stories': clients * programs_per_client * stories,
+        'tests': clients * programs_per_client * tests,
+        'build_seconds': round(time.perf_counter() - start, 2),
+    }
+
+
+# ============================================================================
+# PREVIOUS IMPLEMENTATION (reference)
+# ============================================================================
+
+def legacy_client_program_tree(db) -> list:
+    """get_client_program_tree() as it was: one fan-out query per client."""
+    conn = db.get_connection()
+
+    clients_cursor = conn.execute("""
+        SELECT client_id, name, description, status
+        FROM clients
+        WHERE status = 'Active'
+        ORDER BY name
+    """)
+
+    result = []
+    for client_row in clients_cursor.fetchall():
+        client = dict(client_row)
+        programs_cursor = conn.execute("""
+            SELECT
+                p.program_id,
+                p.name,
+                p.prefix,
+                p.status,
+                COUNT(DISTINCT s.story_id) as story_count,
+                COUNT(DISTINCT CASE WHEN s.status = 'Approved' THEN s.story_id END) as approved_count,
+                COUNT(DISTINCT t.test_id) as test_count
+            FROM programs p
+            LEFT JOIN user_stories s ON p.program_id = s.program_id
+            LEFT JOIN uat_test_cases t ON p.program_id = t.program_id
+            WHERE p.client_id = ?
+            GROUP BY p.program_id
+            ORDER BY p.name
+        """, (client['client_id'],))
+        client['programs'] = [dict(row) for row in programs_cursor.fetchall()]
+        result.append(client)
+
+    return result
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def time_call(func, db, runs: int) -> tuple:
+    """Return (median seconds, last result) over `runs` calls."""
+    samples = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(db)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark get_client_program_tree() on a synthetic database"
+    )
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--programs-per-client', type=int, default=10)
+    parser.add_argument('--stories', type=int, default=50,
+                        help="User stories per program (default: 50)")
+    parser.add_argument('--tests', type=int, default=500,
+                        help="Test cases per program (default: 500)")
+    parser.add_argument('--runs', type=int, default=3,
+                        help="Timed calls of the current implementation (median is "
+                             "reported; the previous one is called once)")
+    parser.add_argument('--db', type=str,
+                        help="Database path (default: a temporary file)")
+    parser.add_argument('--keep', action='store_true',
+                        help="Keep the database, and reuse it if it already exists")
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help="Only time the current implementation")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix='client_tree_'), 'bench.db')
+    build = None
+    if not (args.keep and os.path.exists(db_path)):
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        build = build_database(db_path, args.clients, args.programs_per_client,
+                               args.stories, args.tests)
+
+    db = ClientProductDatabase(db_path)
+    runs = max(1, args.runs)
+    results = {'db': db_path, 'build': build, 'runs': runs}
+
+    seconds, tree = time_call(get_client_program_tree, db, runs)
+    results['current_ms'] = round(seconds * 1000, 2)
+    results['clients_returned'] = len(tree)
+    results['programs_returned'] = sum(len(c['programs']) for c in tree)
+
+    if not args.skip_legacy:
+        # One call: the fan-out query takes seconds at the default size
+        legacy_seconds, legacy_tree = time_call(legacy_client_program_tree, db, 1)
+        results['legacy_ms'] = round(legacy_seconds * 1000, 2)
+        results['speedup'] = round(legacy_seconds / seconds, 1) if seconds else None
+        results['same_result'] = tree == legacy_tree
+
+    db.close()
+    if not args.keep and not args.db:
+        os.remove(db_path)
+        os.rmdir(os.path.dirname(db_path))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        if build:
+            print(f"Built {build['clients']} clients / {build['programs']} programs / "
+                  f"{build['stories']:,} stories / {build['tests']:,} tests "
+                  f"in {build['build_seconds']:.1f}s")
+        print(f"get_client_program_tree:  {results['current_ms']:>10.2f} ms "
+              f"({results['programs_returned']} programs)")
+        if 'legacy_ms' in results:
+            print(f"previous implementation:  {results['legacy_ms']:>10.2f} ms "
+                  f"({results['speedup']}x slower)")
+            print(f"same result:              {results['same_result']}")
+
+    return 0 if results.get('same_result', True) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# benchmarks/flag_detection.py
+# ============================================================================
+# FLAG DETECTION MICRO-BENCHMARK
+# ============================================================================
+#
+# PURPOSE:
+#     Measure the per-requirement cost of UserStoryGenerator's vague-language
+#     and uncertainty checks against the implementation they replaced, and
+#     check that both flag the same requirements - on synthetic text, on
+#     hand-picked edge cases, and (for custom term lists) against one
+#     re.search() per pattern.
+#
+# AVIATION ANALOGY:
+#     Timing one instrument scan: the old way read each gauge in turn, the
+#     new way takes in the whole panel at a glance. Same readings required.
+#
+# WHY: _identify_flags() runs once per story. It used to re.search() 16
+#     patterns one by one over the lowercased text; it now makes one pass
+#     per flag with a regex compiled when the generator is created
+#     (FlagDetector, term lists in config/flag_terms.yaml).
+#
+# USAGE:
+#     python3 benchmarks/flag_detection.py                  # 10,000 requirements
+#     python3 benchmarks/flag_detection.py --size 50000 --runs 5
+#     python3 benchmarks/flag_detection.py --json
+#
+# ============================================================================
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.synthetic_inputs import make_requirements
+from generators.user_story_generator import FlagDetector, UserStoryGenerator
+
+# Extra wording mixed into some requirements so every flag fires sometimes
+HEDGES = [
+    "The screen should be fast and intuitive.",
+    "Retention period TBD with the sponsor.",
+    "Do we need this for declined patients?",
+    "Maybe also show the site name, etc.",
+    "We probably need to discuss the export format.",
+    "Must be scalable and robust.",
+]
+
+# Texts where terms overlap, repeat or sit at word edges, checked against
+# the previous implementation with the shipped config/flag_terms.yaml
+EDGE_CASES = [
+    "Is it simple or complex?",
+    "Fast, faster, fastest.",
+    "etc. etc",
+    "TBD - to be determined, maybe",
+    "We need to clarify; need to discuss",
+    "easyjet is not easy",
+    "probably?",
+    "SEAMLESS and Scalable",
+    "efficiently robustness",
+    "",
+]
+
+# Custom term lists, checked against one re.search() per pattern: terms
+# shared between flags, and a pattern with a top-level alternation
+CUSTOM_CASES = [
+    ({'vague_language': {'patterns': [r'\bsimple\b']},
+      'needs_clarification': {'patterns': [r'\bsimple or complex\b']}},
+     "is it simple or complex"),
+    ({'vague_language': {'patterns': [r'\bfoo|xbar']}}, "axbar"),
+    ({'vague_language': {'patterns': [r'\b(fast|quick)\b', r'\b(?:easy)\b']}},
+     "quick and easy"),
+]
+
+
+# ============================================================================
+# PREVIOUS IMPLEMENTATION (reference)
+# ============================================================================
+
+def legacy_flags(text: str) -> list[str]:
+    """The vague-language and uncertainty checks as they were."""
+    flags = []
+
+    vague_patterns = [
+        r'\bfast(?:er)?\b', r'\beasy\b', r'\bsimple\b',
+        r'\bintuitive\b', r'\befficient\b', r'\brobust\b',
+        r'\bseamless\b', r'\bscalable\b', r'\betc\.?\b',
+    ]
+    found = []
+    text_lower = text.lower()
+    for pattern in vague_patterns:
+        match = re.search(pattern, text_lower)
+        if match:
+            found.append(match.group(0))
+    if found:
+        flags.append('vague_language')
+
+    uncertainty_patterns = [
+        r'\?', r'\btbd\b', r'\bto be determined\b',
+        r'\bneed to clarify\b', r'\bneed to discuss\b',
+        r'\bprobably\b', r'\bmaybe\b'
+    ]
+    text_lower = text.lower()
+    if any(re.search(p, text_lower) for p in uncertainty_patterns):
+        flags.append('needs_clarification')
+
+    return flags
+
+
+def reference_flags(flag_terms: dict, text: str) -> list[str]:
+    """Flags for a custom term list, one re.search() per pattern."""
+    text_lower = text.lower()
+    return [flag for flag, spec in flag_terms.items()
+            if any(re.search(pattern, text_lower) for pattern in spec.get('patterns') or [])]
+
+
+def detector_flags(detector: FlagDetector, text: str) -> list[str]:
+    """Flags FlagDetector finds in text, in config order."""
+    hits = detector.scan(text)
+    return [flag for flag in detector.flags if hits[flag]]
+
+
+def check_edge_cases(detector: FlagDetector) -> list[str]:
+    """Return a description of every edge case where the flags differ."""
+    mismatches = []
+    for text in EDGE_CASES:
+        if detector_flags(detector, text) != legacy_flags(text):
+            mismatches.append(f"shipped config: {text!r}")
+    for flag_terms, text in CUSTOM_CASES:
+        if detector_flags(FlagDetector(flag_terms), text) != reference_flags(flag_terms, text):
+            mismatches.append(f"custom config {flag_terms}: {text!r}")
+    return mismatches
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def build_contexts(size: int, seed: int = 42) -> list[str]:
+    """Full-context strings, as _identify_flags() sees them, for `size` requirements."""
+    rng = random.Random(seed)
+    generator = UserStoryGenerator()
+    contexts = []
+    for rec in make_requirements(size, seed):
+        notes = rec['notes']
+        if rng.random() < 0.25:
+            notes = f"{notes} {rng.choice(HEDGES)}".strip()
+        req = {
+            'title': rec['title'],
+            'description': rec['description'],
+            'priority': rec['priority'],
+            'status': rec['status'],
+            'context_columns': {'Impact': rec['impact'], 'Notes': notes,
+                                'Dependencies': rec['dependencies']},
+        }
+        contexts.append(generator._build_full_context(req))
+    return contexts
+
+
+def time_per_item(func, contexts: list, runs: int) -> tuple:
+    """Return (median microseconds per context, results of the last run)."""
+    samples = []
+    results = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = [func(text) for text in contexts]
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) / len(contexts) * 1e6, results
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark UserStoryGenerator flag detection per requirement"
+    )
+    parser.add_argument('--size', type=int, default=10000,
+                        help="Number of requirements (default: 10000)")
+    parser.add_argument('--runs', type=int, default=3, help="Timed passes (median is reported)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    contexts = build_contexts(args.size, args.seed)
+    runs = max(1, args.runs)
+
+    start = time.perf_counter()
+    generator = UserStoryGenerator()
+    build_ms = (time.perf_counter() - start) * 1000
+    detector = generator._flag_detector
+
+    current_us, current = time_per_item(
+        lambda text: detector_flags(detector, text), contexts, runs
+    )
+    legacy_us, legacy = time_per_item(legacy_flags, contexts, runs)
+    edge_mismatches = check_edge_cases(detector)
+
+    results = {
+        'requirements': len(contexts),
+        'runs': runs,
+        'generator_init_ms': round(build_ms, 2),
+        'current_us_per_requirement': round(current_us, 2),
+        'legacy_us_per_requirement': round(legacy_us, 2),
+        'speedup': round(legacy_us / current_us, 1) if current_us else None,
+        'flagged': {flag: sum(flag in flags for flags in current) for flag in detector.flags},
+        'edge_case_mismatches': edge_mismatches,
+        'same_result': current == legacy and not edge_mismatches,
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{results['requirements']:,} requirements, median of {runs} runs")
+        print(f"FlagDetector.scan:         {current_us:>8.2f} us/requirement")
+        print(f"previous implementation:   {legacy_us:>8.2f} us/requirement "
+              f"({results['speedup']}x slower)")
+        for flag, count in results['flagged'].items():
+            print(f"  {flag:<24} {count:>8,} flagged")
+        for mismatch in edge_mismatches:
+            print(f"  edge case differs: {mismatch}")
+        print(f"same result:               {results['same_result']}")
+
+    return 0 if results['same_result'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
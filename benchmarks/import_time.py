@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# benchmarks/import_time.py
+# ============================================================================
+# IMPORT-TIME BENCHMARK
+# ============================================================================
+#
+# PURPOSE:
+#     Measure how long run.py takes to start for each command and file type,
+#     using `python -X importtime`, and fail if the audit commands go over
+#     their startup budget.
+#
+# AVIATION ANALOGY:
+#     Like timing the engine start on every preflight. A start that creeps
+#     from 10 seconds to 30 is a problem long before the engine fails to
+#     start at all - so you log the number every time.
+#
+# WHY: run.py imports each parser, generator and formatter inside the
+#     function that needs it (see "IMPORTS" in run.py). One stray top-level
+#     import of openpyxl or python-docx quietly puts ~100 ms back on every
+#     command. This script makes that visible.
+#
+# USAGE:
+#     python3 benchmarks/import_time.py                  # All scenarios
+#     python3 benchmarks/import_time.py --scenario audit # Just one
+#     python3 benchmarks/import_time.py --runs 10 --top 15
+#     python3 benchmarks/import_time.py --json           # Machine-readable
+#
+#     Exit code is 1 if a budgeted scenario exceeds its budget.
+#
+# ============================================================================
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+# Each scenario imports what the matching run.py code path imports.
+# budget_ms applies to the median import time (modules only, not interpreter
+# startup); None means "report only".
+
+SCENARIOS = {
+    'cli': {
+        'description': "run.py startup (argument parsing, --help)",
+        'code': "import run",
+        'budget_ms': None,
+    },
+    'audit': {
+        'description': "--audit-history / --audit-report / --recent-changes",
+        'code': "import run, database.db_manager, database.audit_queries",
+        'budget_ms': 200.0,
+    },
+    'excel': {
+        'description': "Excel input, full pipeline, markdown + Excel output",
+        'code': ("import run, parsers.excel_parser, generators.user_story_generator, "
+                 "generators.uat_generator, generators.traceability_generator, "
+                 "formatters.github_markdown, formatters.excel_formatter"),
+        'budget_ms': None,
+    },
+    'word': {
+        'description': "Word input, full pipeline, markdown output",
+        'code': ("import run, parsers.word_parser, generators.user_story_generator, "
+                 "generators.uat_generator, generators.traceability_generator, "
+                 "formatters.github_markdown"),
+        'budget_ms': None,
+    },
+    'lucidchart': {
+        'description': "Lucidchart CSV/SVG input, full pipeline, markdown output",
+        'code': ("import run, parsers.lucidchart_parser, generators.user_story_generator, "
+                 "generators.uat_generator, generators.traceability_generator, "
+                 "formatters.github_markdown"),
+        'budget_ms': None,
+    },
+}
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """
+    PURPOSE:
+        Parse `-X importtime` output into one record per imported module.
+
+    PARAMETERS:
+        stderr (str): stderr of a `python -X importtime` run
+
+    RETURNS:
+        list[dict]: {'module', 'depth', 'self_us', 'cumulative_us'}
+
+    WHY THIS APPROACH:
+        Each line reads "import time: self | cumulative | <indent>name".
+        Nesting is shown by two spaces of indent per level; depth 0 modules
+        are the ones imported directly by the scenario code (or by the
+        interpreter itself, e.g. site).
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip(' ')
+        records.append({
+            'module': stripped,
+            'depth': (len(name) - len(stripped) - 1) // 2,
+            'self_us': int(parts[0]),
+            'cumulative_us': int(parts[1]),
+        })
+    return records
+
+
+def run_scenario(name: str, runs: int = 5, top: int = 10) -> dict:
+    """
+    PURPOSE:
+        Import a scenario's modules in fresh interpreters and summarise.
+
+    PARAMETERS:
+        name (str): Key in SCENARIOS
+        runs (int): Number of fresh interpreter runs (median is reported)
+        top (int): Number of slowest top-level imports to list
+
+    RETURNS:
+        dict: import_ms (median), wall_ms (median, includes interpreter
+            startup), module_count, slowest (from the median run), budget
+    """
+    scenario = SCENARIOS[name]
+    # Modules already imported by the interpreter before the scenario runs
+    startup = {'site', 'encodings', 'codecs', 'io', 'abc', 'stat', 'os',
+               'posixpath', 'genericpath', '_collections_abc', '_sitebuiltins',
+               'zipimport', '_codecs', 'encodings.aliases', 'encodings.utf_8'}
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', scenario['code']],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+
+        if proc.returncode != 0:
+            error_lines = [l for l in proc.stderr.splitlines()
+                           if not l.startswith('import time:')]
+            raise RuntimeError(f"Scenario '{name}' failed: {' '.join(error_lines[-3:])}")
+
+        records = [r for r in parse_importtime(proc.stderr)
+                   if not (r['depth'] == 0 and r['module'] in startup)]
+        top_level = [r for r in records if r['depth'] == 0]
+        samples.append({
+            'import_ms': sum(r['cumulative_us'] for r in top_level) / 1000,
+            'wall_ms': wall_ms,
+            'module_count': len(records),
+            'records': records,
+        })
+
+    samples.sort(key=lambda s: s['import_ms'])
+    median_sample = samples[len(samples) // 2]
+
+    # Slowest third-level-or-shallower imports, so packages like openpyxl
+    # show up by name instead of as one opaque "run" entry
+    candidates = [r for r in median_sample['records'] if r['depth'] <= 2]
+    slowest = sorted(candidates, key=lambda r: r['cumulative_us'], reverse=True)[:top]
+
+    import_ms = statistics.median(s['import_ms'] for s in samples)
+    budget = scenario['budget_ms']
+
+    return {
+        'scenario': name,
+        'description': scenario['description'],
+        'runs': runs,
+        'import_ms': round(import_ms, 1),
+        'wall_ms': round(statistics.median(s['wall_ms'] for s in samples), 1),
+        'module_count': median_sample['module_count'],
+        'budget_ms': budget,
+        'within_budget': budget is None or import_ms <= budget,
+        'slowest': [
+            {'module': r['module'], 'depth': r['depth'],
+             'cumulative_ms': round(r['cumulative_us'] / 1000, 1)}
+            for r in slowest
+        ],
+    }
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def print_report(results: list[dict]) -> None:
+    """Print a human-readable table plus the slowest imports per scenario."""
+    print(f"{'Scenario':<12} {'Import ms':>10} {'Wall ms':>9} {'Modules':>8}  Budget")
+    print("-" * 56)
+    for r in results:
+        if r['budget_ms'] is None:
+            budget = "-"
+        else:
+            status = "OK" if r['within_budget'] else "OVER"
+            budget = f"{r['budget_ms']:.0f} ms {status}"
+        print(f"{r['scenario']:<12} {r['import_ms']:>10.1f} {r['wall_ms']:>9.1f} "
+              f"{r['module_count']:>8}  {budget}")
+
+    for r in results:
+        print()
+        print(f"{r['scenario']}: {r['description']}")
+        for item in r['slowest']:
+            indent = "  " * item['depth']
+            print(f"  {item['cumulative_ms']:>8.1f} ms  {indent}{item['module']}")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure run.py import time per command/file type (python -X importtime)"
+    )
+    parser.add_argument('--scenario', choices=sorted(SCENARIOS), action='append',
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument('--runs', type=int, default=5,
+                        help="Fresh interpreter runs per scenario (default: 5)")
+    parser.add_argument('--top', type=int, default=10,
+                        help="Slowest imports to list per scenario (default: 10)")
+    parser.add_argument('--json', action='store_true',
+                        help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    results = [run_scenario(name, runs=max(1, args.runs), top=args.top) for name in names]
+
+    if args.json:
+        print(json.dumps({'python': sys.version.split()[0], 'results': results}, indent=2))
+    else:
+        print_report(results)
+
+    return 0 if all(r['within_budget'] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
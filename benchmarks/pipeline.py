@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# benchmarks/pipeline.py
+# ============================================================================
+# PIPELINE BENCHMARK SUITE
+# ============================================================================
+#
+# PURPOSE:
+#     Time every run_pipeline() stage - parse, stories, tests, compliance,
+#     traceability, markdown and Excel export - on synthetic Excel, Word and
+#     Lucidchart CSV/SVG inputs at 1k/10k/100k requirements, both in
+#     isolation and as one end-to-end run. Records wall time, peak RSS and
+#     throughput per stage, and compares them with a stored baseline so a
+#     slower parser, generator, validator or formatter is caught before
+#     release.
+#
+# AVIATION ANALOGY:
+#     Engine run-up figures logged against the type certificate numbers.
+#     Each stage is a gauge; the baseline is the green arc. A reading
+#     outside the arc grounds the release until someone explains it.
+#
+# WHY: Each (format, size) case runs in a fresh Python process, so peak RSS
+#     (getrusage ru_maxrss) belongs to that case alone and no stage sees
+#     another case's warm caches. Isolated stages call the same helpers
+#     run_pipeline() uses (_parse_requirements, _run_compliance, ...), in
+#     order, each fed the previous stage's output; exports run in-process
+#     so the formatter's own cost is measured. The end-to-end run calls
+#     run_pipeline() itself in another fresh process and reports its
+#     results['stage_timings'].
+#
+# USAGE:
+#     python3 benchmarks/pipeline.py                         # 1k, all formats
+#     python3 benchmarks/pipeline.py --sizes 1000 10000 --formats excel word
+#     python3 benchmarks/pipeline.py --save-baseline          # Record the green arc
+#     python3 benchmarks/pipeline.py --tolerance 0.5 --json
+#     python3 benchmarks/pipeline.py --inputs-dir /tmp/bench_inputs   # Reuse inputs
+#
+#     Exit code is 1 if any stage is slower (or any case uses more memory)
+#     than the baseline allows, or a case fails.
+#
+#     Baselines are machine-specific: re-record them with --save-baseline on
+#     the machine that gates the release.
+#
+# ============================================================================
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import contextlib
+import subprocess
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.synthetic_inputs import FORMATS, generate_inputs
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, 'benchmarks', 'baselines', 'pipeline.json')
+DEFAULT_SIZES = [1000]
+PREFIX = "BENCH"
+
+# Stages in pipeline order; 'pipeline' is the end-to-end run
+STAGES = ['parse', 'stories', 'tests', 'compliance', 'traceability',
+          'export_markdown', 'export_excel']
+
+
+# ============================================================================
+# WORKER (runs in a fresh process per case)
+# ============================================================================
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _measure(timings: dict, stage: str, func, count):
+    """
+    PURPOSE:
+        Run one stage with console output suppressed and record seconds,
+        items, items/second and the RSS high-water mark after it.
+
+    PARAMETERS:
+        timings (dict): stage -> measurement, updated in place
+        stage (str): Stage name
+        func (callable): The stage, called with no arguments
+        count (callable): Maps the stage's return value to its item count
+
+    RETURNS:
+        The stage's return value
+    """
+    rss_before = _peak_rss_mb()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        value = func()
+    seconds = time.perf_counter() - start
+    items = count(value)
+    timings[stage] = {
+        'seconds': round(seconds, 4),
+        'items': items,
+        'items_per_second': round(items / seconds, 1) if seconds > 0 else None,
+        'peak_rss_mb': _peak_rss_mb(),
+        'rss_growth_mb': round(_peak_rss_mb() - rss_before, 1),
+    }
+    return value
+
+
+def run_stages(input_file: str, output_dir: str, compliance: str = 'all') -> dict:
+    """
+    PURPOSE:
+        Run each pipeline stage in isolation on one input file.
+
+    RETURNS:
+        dict: stages (per-stage measurements), counts, peak_rss_mb, errors
+    """
+    import run
+    from generators.user_story_generator import UserStoryGenerator
+    from generators.uat_generator import UATGenerator
+    from formatters.github_markdown import format_for_github
+    from formatters.excel_formatter import export_to_excel
+
+    results = run._new_results('all')
+    source = os.path.basename(input_file)
+    timings = {}
+
+    requirements = _measure(timings, 'parse', lambda: run._parse_requirements(
+        input_file, results, False, None, None, source
+    ), lambda value: len(value or []))
+    if not requirements:
+        return {'stages': timings, 'errors': results['errors'] or ["No requirements"]}
+
+    stories = _measure(timings, 'stories',
+                       lambda: UserStoryGenerator(prefix=PREFIX).generate(requirements), len)
+    test_cases = _measure(timings, 'tests',
+                          lambda: UATGenerator(test_id_prefix=PREFIX).generate(stories), len)
+
+    # Throughput is requirements validated per second, whatever the test count
+    compliance_tests = _measure(timings, 'compliance', lambda: run._run_compliance(
+        requirements, PREFIX, compliance, results, False, None, None
+    ), lambda value: len(requirements))
+    timings['compliance']['tests_generated'] = len(compliance_tests)
+    all_tests = test_cases + compliance_tests
+
+    matrix = _measure(timings, 'traceability', lambda: run._build_traceability(
+        requirements, stories, all_tests, 'all', results, False, None, None
+    ), lambda value: len(requirements))
+
+    exported = len(stories) + len(all_tests)
+    _measure(timings, 'export_markdown', lambda: format_for_github(
+        stories, all_tests, output_dir=os.path.join(output_dir, 'github'),
+        source_file=source, mode='single', filename='bench.md'
+    ), lambda value: exported)
+    _measure(timings, 'export_excel', lambda: export_to_excel(
+        stories, all_tests, output_dir=os.path.join(output_dir, 'excel'),
+        source_file=source, filename='bench.xlsx', traceability_matrix=matrix
+    ), lambda value: exported)
+
+    return {
+        'stages': timings,
+        'counts': {
+            'requirements': len(requirements),
+            'stories': len(stories),
+            'test_cases': len(test_cases),
+            'compliance_tests': len(compliance_tests),
+        },
+        'peak_rss_mb': _peak_rss_mb(),
+        'errors': results['errors'],
+    }
+
+
+def run_end_to_end(input_file: str, output_dir: str, compliance: str = 'all') -> dict:
+    """
+    PURPOSE:
+        Run run_pipeline() once, as the CLI would (markdown + Excel output,
+        Excel exported in a worker process).
+
+    RETURNS:
+        dict: seconds, stages (results['stage_timings']), peak_rss_mb, errors
+    """
+    import run
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = run.run_pipeline(input_file, prefix=PREFIX, output_format='both',
+                                   output_dir=output_dir, compliance=compliance)
+    seconds = time.perf_counter() - start
+
+    return {
+        'seconds': round(seconds, 4),
+        'stages': {stage: {'seconds': round(timing['seconds'], 4)}
+                   for stage, timing in results['stage_timings'].items()},
+        'requirements_per_second': (round(results['requirements_count'] / seconds, 1)
+                                    if seconds > 0 else None),
+        'peak_rss_mb': _peak_rss_mb(),
+        'errors': results['errors'],
+    }
+
+
+def _worker(mode: str, input_file: str, compliance: str) -> int:
+    """Entry point of a case subprocess: print one JSON result on stdout."""
+    output_dir = tempfile.mkdtemp(prefix='bench_pipeline_')
+    try:
+        if mode == 'stages':
+            result = run_stages(input_file, output_dir, compliance)
+        else:
+            result = run_end_to_end(input_file, output_dir, compliance)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    print(json.dumps(result))
+    return 0
+
+
+# ============================================================================
+# ORCHESTRATION
+# ============================================================================
+
+def run_case(mode: str, input_file: str, compliance: str,
+             timeout: Optional[float] = None) -> dict:
+    """
+    PURPOSE:
+        Run one worker subprocess and return its JSON result (or an
+        'errors' entry if it failed or timed out).
+    """
+    command = [sys.executable, os.path.abspath(__file__), '--worker', mode,
+               '--input', input_file, '--compliance', compliance]
+    try:
+        proc = subprocess.run(command, capture_output=True, text=True,
+                              timeout=timeout, cwd=REPO_ROOT)
+    except subprocess.TimeoutExpired:
+        return {'errors': [f"Timed out after {timeout:g}s"]}
+
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or [f"exit code {proc.returncode}"]
+        return {'errors': [f"Worker failed: {tail[0]}"]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def case_name(fmt: str, size: int) -> str:
+    return f"{fmt}-{size}"
+
+
+def compare(current: dict, baseline: dict, tolerance: float,
+            min_seconds: float, memory_tolerance: float) -> list[dict]:
+    """
+    PURPOSE:
+        Compare measured cases with the baseline.
+
+    PARAMETERS:
+        current (dict): case -> {'stages': ..., 'pipeline': ...}
+        baseline (dict): Same shape, from the baseline file
+        tolerance (float): Allowed slowdown (0.25 = 25% slower)
+        min_seconds (float): Ignore slowdowns smaller than this in absolute
+            terms (timer noise on sub-100 ms stages)
+        memory_tolerance (float): Allowed growth of a case's peak RSS
+
+    RETURNS:
+        list[dict]: One row per compared metric: case, metric, baseline,
+            current, ratio, regression (bool)
+
+    WHY THIS APPROACH:
+        A relative threshold alone flags 20 ms -> 30 ms as a 50% regression
+        on every noisy run; requiring both a relative and an absolute
+        slowdown only flags changes worth investigating.
+    """
+    rows = []
+
+    def add(case, metric, base, value, limit, floor):
+        if base is None or value is None:
+            return
+        ratio = value / base if base else None
+        regression = value > base * (1 + limit) and value - base > floor
+        rows.append({'case': case, 'metric': metric, 'baseline': base, 'current': value,
+                     'ratio': round(ratio, 2) if ratio else None, 'regression': regression})
+
+    for case, result in current.items():
+        base = baseline.get(case)
+        if not base:
+            continue
+        for mode in ('stages', 'pipeline'):
+            measured = result.get(mode) or {}
+            expected = base.get(mode) or {}
+            for stage, timing in (measured.get('stages') or {}).items():
+                base_timing = (expected.get('stages') or {}).get(stage)
+                if base_timing:
+                    add(case, f"{mode}/{stage}", base_timing['seconds'], timing['seconds'],
+                        tolerance, min_seconds)
+            if mode == 'pipeline':
+                add(case, 'pipeline/total', expected.get('seconds'), measured.get('seconds'),
+                    tolerance, min_seconds)
+            add(case, f"{mode}/peak_rss_mb", expected.get('peak_rss_mb'),
+                measured.get('peak_rss_mb'), memory_tolerance, 10.0)
+
+    return rows
+
+
+def print_report(cases: dict, comparison: list[dict]) -> None:
+    """Print per-case stage tables, then any regressions."""
+    for case, result in cases.items():
+        print(f"\n{case}")
+        staged = result.get('stages') or {}
+        for error in (staged.get('errors') or []) + ((result.get('pipeline') or {}).get('errors') or []):
+            print(f"  ERROR: {error}")
+        if staged.get('counts'):
+            counts = staged['counts']
+            print(f"  {counts['requirements']:,} requirements -> {counts['stories']:,} stories, "
+                  f"{counts['test_cases']:,} tests + {counts['compliance_tests']:,} compliance tests")
+        for stage, timing in (staged.get('stages') or {}).items():
+            rate = timing['items_per_second']
+            print(f"  {stage:<16} {timing['seconds']:>9.3f}s {timing['items']:>9,} items "
+                  f"{rate or 0:>12,.0f}/s   peak RSS {timing['peak_rss_mb']:>7.1f} MB")
+        pipeline = result.get('pipeline') or {}
+        if pipeline.get('seconds') is not None:
+            stages = " | ".join(f"{s} {t['seconds']:.2f}s" for s, t in pipeline['stages'].items())
+            print(f"  {'end-to-end':<16} {pipeline['seconds']:>9.3f}s   peak RSS "
+                  f"{pipeline['peak_rss_mb']:.1f} MB   ({stages})")
+
+    regressions = [row for row in comparison if row['regression']]
+    if comparison:
+        print(f"\nCompared {len(comparison)} metrics with the baseline: "
+              f"{len(regressions)} regression(s)")
+    for row in regressions:
+        print(f"  REGRESSION {row['case']} {row['metric']}: "
+              f"{row['baseline']} -> {row['current']} ({row['ratio']}x)")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark run_pipeline() stages on synthetic inputs"
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Requirement counts (default: 1000; also try 10000 100000)")
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument('--compliance', default='all',
+                        choices=['all', 'part11', 'hipaa', 'soc2', 'none'])
+    parser.add_argument('--skip-stages', action='store_true',
+                        help="Only run the end-to-end pipeline")
+    parser.add_argument('--skip-pipeline', action='store_true',
+                        help="Only run the isolated stages")
+    parser.add_argument('--inputs-dir', type=str,
+                        help="Where to write (and reuse) inputs (default: a temporary directory)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float,
+                        help="Seconds allowed per case and mode (default: no limit)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help="Baseline JSON (default: benchmarks/baselines/pipeline.json)")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Write these results to the baseline file (merged with "
+                             "existing cases) instead of comparing")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed slowdown per stage (default: 0.25 = 25%%)")
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help="Ignore slowdowns smaller than this (default: 0.05)")
+    parser.add_argument('--memory-tolerance', type=float, default=0.25,
+                        help="Allowed peak RSS growth per case (default: 0.25)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    parser.add_argument('--worker', choices=['stages', 'pipeline'], help=argparse.SUPPRESS)
+    parser.add_argument('--input', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return _worker(args.worker, args.input, args.compliance)
+
+    inputs_dir = args.inputs_dir or tempfile.mkdtemp(prefix='bench_inputs_')
+    cases = {}
+    try:
+        for size in args.sizes:
+            paths = generate_inputs(inputs_dir, size, args.formats, args.seed)
+            for fmt in args.formats:
+                name = case_name(fmt, size)
+                if not args.json:
+                    print(f"Running {name}...", file=sys.stderr)
+                cases[name] = {'format': fmt, 'size': size}
+                if not args.skip_stages:
+                    cases[name]['stages'] = run_case('stages', paths[fmt], args.compliance,
+                                                     args.timeout)
+                if not args.skip_pipeline:
+                    cases[name]['pipeline'] = run_case('pipeline', paths[fmt], args.compliance,
+                                                       args.timeout)
+    finally:
+        if not args.inputs_dir:
+            shutil.rmtree(inputs_dir, ignore_errors=True)
+
+    failed = [name for name, result in cases.items()
+              if any((result.get(mode) or {}).get('errors') for mode in ('stages', 'pipeline'))]
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    comparison = []
+    if args.save_baseline:
+        baseline.setdefault('cases', {}).update(
+            {name: result for name, result in cases.items() if name not in failed}
+        )
+        baseline['environment'] = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.machine(),
+            'compliance': args.compliance,
+            'seed': args.seed,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+    elif baseline:
+        comparison = compare(cases, baseline.get('cases', {}), args.tolerance,
+                             args.min_seconds, args.memory_tolerance)
+
+    regressions = [row for row in comparison if row['regression']]
+    if args.json:
+        print(json.dumps({'cases': cases, 'comparison': comparison,
+                          'regressions': len(regressions), 'failed': failed}, indent=2))
+    else:
+        print_report(cases, comparison)
+        if args.save_baseline:
+            print(f"\nBaseline written: {args.baseline}")
+        elif not baseline:
+            print(f"\nNo baseline at {args.baseline} (record one with --save-baseline)")
+
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# benchmarks/query_plans.py
+# ============================================================================
+# QUERY WORKLOAD HARNESS (EXPLAIN QUERY PLAN)
+# ============================================================================
+#
+# PURPOSE:
+#     Run every query function in database/queries.py and
+#     database/audit_queries.py (plus the hot ClientProductDatabase reads) on
+#     a large synthetic database, time each one, and capture the
+#     EXPLAIN QUERY PLAN of every SQL statement it executes. Flags full table
+#     scans and temporary sort B-trees - the two things an index fixes.
+#
+# AVIATION ANALOGY:
+#     Like a flight-test card that flies every maneuver the airplane will
+#     actually see in service, with the data recorder running, instead of
+#     judging the design from the drawings.
+#
+# WHY: Which index helps depends on the queries that actually run, with the
+#     filters they actually combine. The "WORKLOAD INDEXES" section of
+#     database/schema.sql was chosen from this report; --compare shows each
+#     query with the previous index set and with the current one.
+#
+# USAGE:
+#     python3 benchmarks/query_plans.py                  # 300k audit rows
+#     python3 benchmarks/query_plans.py --scale 1        # 1M audit rows
+#     python3 benchmarks/query_plans.py --compare        # Previous vs current indexes
+#     python3 benchmarks/query_plans.py --plans          # Print every plan
+#     python3 benchmarks/query_plans.py --db /tmp/w.db --keep --json
+#
+#     Exit code is 1 if a query function has no workload entry.
+#
+# ============================================================================
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import tempfile
+from datetime import datetime, timedelta
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from database.db_manager import ClientProductDatabase
+from database import queries, audit_queries
+from benchmarks.synthetic_db import generate_database, DEFAULT_SIZES
+
+# Indexes the "WORKLOAD INDEXES" migration in schema.sql replaced or added.
+# --compare restores PREVIOUS_INDEXES and drops WORKLOAD_INDEXES to measure
+# the queries as they were.
+PREVIOUS_INDEXES = {
+    'idx_requirements_program': "requirements(program_id)",
+    'idx_stories_program': "user_stories(program_id)",
+    'idx_tests_program': "uat_test_cases(program_id)",
+    'idx_trace_program': "traceability(program_id)",
+    'idx_compliance_program': "compliance_gaps(program_id)",
+    'idx_audit_record': "audit_history(record_type, record_id)",
+}
+WORKLOAD_INDEXES = [
+    'idx_requirements_program_row',
+    'idx_stories_program_status',
+    'idx_tests_program_status_type',
+    'idx_trace_program_requirement',
+    'idx_compliance_program_status',
+    'idx_audit_record_date',
+    'idx_audit_record_id',
+    'idx_audit_type_date',
+    'idx_audit_story_reviewer',
+]
+
+
+# ============================================================================
+# WORKLOAD
+# ============================================================================
+
+def workload_context(db) -> dict:
+    """Pick realistic arguments: a large program, a busy story, an active reviewer."""
+    conn = db.get_connection()
+    program_id = conn.execute("""
+        SELECT program_id FROM program_stats WHERE metric = 'requirements'
+        ORDER BY record_count DESC LIMIT 1 OFFSET 4
+    """).fetchone()[0]
+    return {
+        'program_id': program_id,
+        'client_id': conn.execute("SELECT client_id FROM programs WHERE program_id = ?",
+                                  (program_id,)).fetchone()[0],
+        'story_id': conn.execute("""
+            SELECT record_id FROM audit_history WHERE record_type = 'user_story'
+            GROUP BY record_id ORDER BY COUNT(*) DESC LIMIT 1
+        """).fetchone()[0],
+        'reviewer': 'analyst03',
+        'start': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
+        'end': datetime.now().strftime('%Y-%m-%d'),
+    }
+
+
+# name -> callable(db, ctx). Every public query function appears here;
+# check_coverage() fails the run if one is added without a workload entry.
+WORKLOAD = {
+    # database/queries.py
+    'queries.get_client_program_tree': lambda db, c: queries.get_client_program_tree(db),
+    'queries.get_stories_pending_client_review':
+        lambda db, c: queries.get_stories_pending_client_review(db, c['client_id']),
+    'queries.get_approval_pipeline': lambda db, c: queries.get_approval_pipeline(db, c['program_id']),
+    'queries.get_test_execution_summary':
+        lambda db, c: queries.get_test_execution_summary(db, c['program_id']),
+    'queries.get_compliance_dashboard':
+        lambda db, c: queries.get_compliance_dashboard(db, c['program_id']),
+    'queries.search_stories_global': lambda db, c: queries.search_stories_global(db, 'referral'),
+    'queries.find_similar_stories':
+        lambda db, c: queries.find_similar_stories(db, 'Export screening report', 'provider portal'),
+    'queries.get_program_health_score':
+        lambda db, c: queries.get_program_health_score(db, c['program_id']),
+    'queries.get_recent_activity': lambda db, c: queries.get_recent_activity(db, 7),
+    'queries.export_audit_report':
+        lambda db, c: queries.export_audit_report(db, c['program_id'], c['start'], c['end']),
+    'queries.get_stories_by_reviewer': lambda db, c: queries.get_stories_by_reviewer(db, c['reviewer']),
+    'queries.get_orphan_requirements': lambda db, c: queries.get_orphan_requirements(db, c['program_id']),
+    'queries.get_stories_without_tests':
+        lambda db, c: queries.get_stories_without_tests(db, c['program_id']),
+
+    # database/audit_queries.py
+    'audit_queries.get_record_audit_trail':
+        lambda db, c: audit_queries.get_record_audit_trail(db, 'user_story', c['story_id']),
+    'audit_queries.get_program_audit_report':
+        lambda db, c: audit_queries.get_program_audit_report(db, c['program_id'], c['start'], c['end']),
+    'audit_queries.get_recent_changes': lambda db, c: audit_queries.get_recent_changes(db, 7),
+    'audit_queries.get_recent_changes(type)':
+        lambda db, c: audit_queries.get_recent_changes(db, 7, record_type='test_case'),
+
+    # ClientProductDatabase reads behind the pipeline and dashboards
+    'db.get_requirements': lambda db, c: db.get_requirements(c['program_id']),
+    'db.get_stories(status)': lambda db, c: db.get_stories(c['program_id'], status_filter='Approved'),
+    'db.get_test_cases(status,type)':
+        lambda db, c: db.get_test_cases(c['program_id'], status_filter='Fail', test_type='negative'),
+    'db.get_traceability_matrix': lambda db, c: db.get_traceability_matrix(c['program_id']),
+    'db.iter_stories(page)':
+        lambda db, c: list(db.iter_stories(c['program_id'], status_filter='Draft', limit=50,
+                                           columns=['story_id', 'title', 'status'])),
+    'db.get_audit_trail': lambda db, c: db.get_audit_trail('user_story', c['story_id']),
+}
+
+# Functions that take a database but only format results (nothing to plan)
+NOT_QUERIES = {'format_audit_for_display', 'format_recent_changes_table', 'format_audit_summary'}
+
+
+def check_coverage() -> list:
+    """Return public query functions that have no WORKLOAD entry."""
+    covered = {name.split('(')[0] for name in WORKLOAD}
+    missing = [f"queries.{name}" for name in queries.__all__
+               if f"queries.{name}" not in covered]
+    for name in dir(audit_queries):
+        func = getattr(audit_queries, name)
+        if (callable(func) and not name.startswith('_') and name not in NOT_QUERIES
+                and getattr(func, '__module__', None) == audit_queries.__name__
+                and f"audit_queries.{name}" not in covered):
+            missing.append(f"audit_queries.{name}")
+    return missing
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def explain(conn, sql: str) -> list:
+    """Return the EXPLAIN QUERY PLAN detail lines, indented by depth."""
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+
+def plan_flags(plan: list) -> list:
+    """Full table scans and temp B-trees (sorts) in a plan."""
+    flags = []
+    for line in plan:
+        detail = line.strip()
+        if detail.startswith('SCAN ') and 'USING' not in detail and 'CONSTANT ROW' not in detail:
+            flags.append(detail)
+        elif detail.startswith('USE TEMP B-TREE'):
+            flags.append(detail)
+    return flags
+
+
+def run_workload(db, ctx: dict, runs: int) -> list:
+    """
+    PURPOSE:
+        Time each workload entry and capture the plan of every statement.
+
+    RETURNS:
+        list[dict]: name, ms (median), statements, plans [{sql, plan, flags}]
+
+    WHY THIS APPROACH:
+        sqlite3's trace callback sees the statements a function really runs
+        (with parameters expanded), so the harness needs no knowledge of
+        each function's SQL and keeps working as the queries change.
+    """
+    conn = db.get_connection()
+    results = []
+
+    for name, call in WORKLOAD.items():
+        statements = []
+        conn.set_trace_callback(statements.append)
+        call(db, ctx)  # Warm-up run, also captures the SQL
+        conn.set_trace_callback(None)
+
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            call(db, ctx)
+            samples.append(time.perf_counter() - start)
+
+        plans = []
+        seen = set()
+        for sql in statements:
+            head = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ''
+            if head not in ('SELECT', 'WITH') or sql in seen:
+                continue
+            seen.add(sql)
+            plan = explain(conn, sql)
+            plans.append({
+                'sql': " ".join(sql.split())[:300],
+                'plan': plan,
+                'flags': plan_flags(plan),
+            })
+
+        results.append({
+            'name': name,
+            'ms': round(statistics.median(samples) * 1000, 2),
+            'statements': len(statements),
+            'plans': plans,
+        })
+
+    return results
+
+
+def use_previous_indexes(db) -> None:
+    """Put the database back on the index set from before the workload migration."""
+    conn = db.get_connection()
+    with conn:
+        for name in WORKLOAD_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        for name, target in PREVIOUS_INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def print_report(results: list, previous: Optional[list], show_plans: bool) -> None:
+    """Print one line per workload entry (and its flagged plan steps)."""
+    before = {r['name']: r for r in previous or []}
+    header = f"{'Workload':<46} {'ms':>10}"
+    if previous:
+        header += f" {'before ms':>10} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for r in results:
+        line = f"{r['name']:<46} {r['ms']:>10.2f}"
+        if r['name'] in before:
+            old = before[r['name']]['ms']
+            speedup = f"{old / r['ms']:.1f}x" if r['ms'] else "-"
+            line += f" {old:>10.2f} {speedup:>8}"
+        print(line)
+
+        for p in r['plans']:
+            if show_plans:
+                print(f"    {p['sql'][:110]}")
+                for step in p['plan']:
+                    print(f"      {step}")
+            else:
+                for flag in p['flags']:
+                    print(f"    ! {flag}")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the database query workload and capture EXPLAIN QUERY PLAN"
+    )
+    parser.add_argument('--db', type=str, help="Database path (default: a temporary file)")
+    parser.add_argument('--keep', action='store_true',
+                        help="Keep the database, and reuse it if it already exists")
+    parser.add_argument('--scale', type=float, default=0.3,
+                        help="Size relative to synthetic_db's default database "
+                             "(default: 0.3 = 300k audit rows)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--runs', type=int, default=3,
+                        help="Timed calls per workload entry (median is reported)")
+    parser.add_argument('--compare', action='store_true',
+                        help="Also run with the previous index set and show the speedup")
+    parser.add_argument('--plans', action='store_true', help="Print every query plan")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    missing = check_coverage()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix='query_plans_'), 'workload.db')
+    build = None
+    if not (args.keep and os.path.exists(db_path)):
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        sizes = {name: max(1, int(value * args.scale)) for name, value in DEFAULT_SIZES.items()}
+        build = generate_database(db_path, seed=args.seed, **sizes)
+
+    runs = max(1, args.runs)
+    previous = None
+    if args.compare:
+        db = ClientProductDatabase(db_path)
+        use_previous_indexes(db)
+        previous = run_workload(db, workload_context(db), runs)
+        db.close()
+
+    # Opening the database applies schema.sql, which (re)creates the
+    # workload indexes
+    db = ClientProductDatabase(db_path)
+    results = run_workload(db, workload_context(db), runs)
+    db.close()
+
+    if not args.keep and not args.db:
+        os.remove(db_path)
+        os.rmdir(os.path.dirname(db_path))
+
+    if args.json:
+        print(json.dumps({'db': db_path, 'build': build, 'runs': runs, 'missing': missing,
+                          'results': results, 'previous': previous}, indent=2))
+    else:
+        if build:
+            print("Built " + ", ".join(f"{v:,} {k}" for k, v in build.items()
+                                       if isinstance(v, int))
+                  + f" in {build['seconds']['total']}s")
+        print_report(results, previous, args.plans)
+        total = sum(r['ms'] for r in results)
+        print(f"\nTotal: {total:.1f} ms" + (
+            f" (before: {sum(r['ms'] for r in previous):.1f} ms)" if previous else ""))
+        for name in missing:
+            print(f"No workload entry for {name}")
+
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
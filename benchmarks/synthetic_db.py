@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+# benchmarks/synthetic_db.py
+# ============================================================================
+# SYNTHETIC LARGE-DATABASE GENERATOR
+# ============================================================================
+#
+# PURPOSE:
+#     Build a client_product_database.db at production scale - clients,
+#     programs, requirements, stories, test cases, UAT cycles, compliance
+#     gaps, traceability and audit history - for testing the database layer
+#     and verifying performance changes.
+#
+# AVIATION ANALOGY:
+#     The simulator's scenario generator. You can't wait for a real airport
+#     to get busy to see whether the new procedure copes with traffic, so
+#     you script a realistic rush hour - and the same seed replays the
+#     same rush hour for every run.
+#
+# SHAPE (what "realistic" means here):
+#     - Program size is Zipf-skewed: a few programs hold most requirements,
+#       most programs are small; clients own a skewed number of programs.
+#     - Stories: ~2 per requirement, ~5% with no requirement; mostly
+#       Approved or Draft. Tests: ~3 per story, skewed towards a few
+#       heavily-tested stories; mostly Not Run or Pass.
+#     - UAT cycles belong to programs; ~60% of tests are assigned to one.
+#     - Gaps: mostly Closed or Open, due dates around the as-of date.
+#     - Audit history: recent-heavy (most changes in the last few weeks),
+#       concentrated on a minority of hot records and a few busy users,
+#       in chronological audit_id order as a real log would be.
+#
+# DETERMINISM:
+#     The same seed and --as-of date produce an identical database. Dates
+#     are relative to --as-of (default: today) so "last 7 days" dashboards
+#     have data.
+#
+# USAGE:
+#     python3 benchmarks/synthetic_db.py /tmp/large.db              # ~1M audit rows
+#     python3 benchmarks/synthetic_db.py /tmp/small.db --scale 0.1
+#     python3 benchmarks/synthetic_db.py /tmp/x.db --audit-rows 5000000 --seed 7
+#     python3 benchmarks/synthetic_db.py /tmp/x.db --as-of 2026-01-31 --check
+#
+#     from benchmarks.synthetic_db import generate_database
+#     stats = generate_database('/tmp/large.db', programs=50, audit_rows=200_000)
+#
+# ============================================================================
+
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+from datetime import date, timedelta
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from database.db_manager import ClientProductDatabase
+
+# Default size: the 1M-audit-row database
+DEFAULT_SIZES = {
+    'clients': 25,
+    'programs': 150,
+    'requirements': 50_000,
+    'stories': 100_000,
+    'tests': 300_000,
+    'uat_cycles': 450,
+    'gaps': 20_000,
+    'audit_rows': 1_000_000,
+}
+
+STORY_STATUSES = ['Draft', 'Internal Review', 'Pending Client Review',
+                  'Approved', 'Needs Discussion', 'Out of Scope']
+STORY_STATUS_WEIGHTS = [30, 10, 8, 45, 5, 2]
+PRIORITIES = ['Critical', 'High', 'Medium', 'Low']
+PRIORITY_WEIGHTS = [5, 25, 50, 20]
+CATEGORIES = ['RECRUIT', 'DASH', 'MSG', 'WF', 'EXPORT', 'AUTH', 'DATA', 'CONSENT']
+CATEGORY_WEIGHTS = [20, 18, 12, 15, 10, 8, 12, 5]
+REQUIREMENT_TYPES = ['Technical', 'Workflow', 'Process', 'Integration']
+REQUIREMENT_TYPE_WEIGHTS = [60, 20, 12, 8]
+TEST_TYPES = ['happy_path', 'validation', 'negative', 'edge_case']
+TEST_TYPE_WEIGHTS = [40, 25, 20, 15]
+TEST_STATUSES = ['Not Run', 'Pass', 'Fail', 'Blocked', 'Skipped']
+TEST_STATUS_WEIGHTS = [50, 35, 8, 4, 3]
+FRAMEWORKS = ['Part11', 'HIPAA', 'SOC2']
+SEVERITIES = ['Critical', 'High', 'Medium', 'Low']
+SEVERITY_WEIGHTS = [8, 22, 45, 25]
+GAP_STATUSES = ['Open', 'In Progress', 'Mitigated', 'Accepted', 'Closed']
+GAP_STATUS_WEIGHTS = [30, 15, 10, 5, 40]
+CYCLE_TYPES = ['feature', 'rule_validation', 'regression']
+CYCLE_STATUSES = ['planning', 'validation', 'kickoff', 'testing', 'review',
+                  'retesting', 'decision', 'complete', 'cancelled']
+CYCLE_STATUS_WEIGHTS = [8, 5, 3, 12, 5, 4, 3, 55, 5]
+COVERAGE = ['Full', 'Partial', 'None']
+COVERAGE_WEIGHTS = [60, 30, 10]
+AUDIT_TYPES = ['user_story', 'test_case', 'requirement', 'compliance_gap',
+               'traceability', 'program', 'client']
+AUDIT_TYPE_WEIGHTS = [45, 30, 12, 5, 5, 2, 1]
+AUDIT_ACTIONS = ['Created', 'Updated', 'Status Changed', 'Approved', 'Imported']
+AUDIT_ACTION_WEIGHTS = [20, 50, 20, 5, 5]
+AUDIT_FIELDS = ['status', 'title', 'acceptance_criteria', 'priority', 'test_status', None]
+
+WORDS = ('patient consent dashboard export report screening provider referral '
+         'message portal audit schedule record review approve filter invite '
+         'eligibility genetic risk assessment clinic coordinator analyst '
+         'notification summary status workflow upload download search').split()
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _zipf_weights(n: int, exponent: float = 0.8) -> list:
+    return [1 / (i + 1) ** exponent for i in range(n)]
+
+
+def _split(rng: random.Random, total: int, n: int, minimum: int = 1) -> list:
+    """Split `total` rows over n buckets with a shuffled Zipf skew."""
+    weights = _zipf_weights(n)
+    rng.shuffle(weights)
+    scale = total / sum(weights)
+    return [max(minimum, int(w * scale)) for w in weights]
+
+
+def _hot_indexes(rng: random.Random, n: int, count: int) -> list:
+    """`count` indexes into range(n), favouring low ones (a few hot records)."""
+    rand = rng.random
+    return [int(n * rand() ** 3) for _ in range(count)]
+
+
+def _prefix(p: int) -> str:
+    """Program prefix: P + three letters (PAAA, PAAB, ...), like PROP or GRX."""
+    letters = ""
+    for _ in range(3):
+        p, r = divmod(p, 26)
+        letters = chr(65 + r) + letters
+    return "P" + letters
+
+
+def _text_pool(rng: random.Random, size: int, words: int) -> list:
+    return [" ".join(rng.choices(WORDS, k=words)).capitalize() for _ in range(size)]
+
+
+class _Clock:
+    """Recent-heavy timestamps relative to the as-of date, formatted fast."""
+
+    def __init__(self, rng: random.Random, as_of: date, horizon_days: int = 730):
+        self.rng = rng
+        self.as_of = as_of
+        self.horizon = horizon_days
+        self.days = [(as_of - timedelta(days=d)).isoformat() for d in range(horizon_days + 1)]
+
+    def offsets(self, count: int, mean_days: float = 30.0) -> list:
+        """Seconds before the end of the as-of day, sorted oldest first."""
+        expo, rand = self.rng.expovariate, self.rng.random
+        limit = self.horizon * 86400
+        values = [min(limit, int(expo(1 / mean_days) * 86400 + rand() * 86400))
+                  for _ in range(count)]
+        values.sort(reverse=True)
+        return values
+
+    def stamp(self, offset: int) -> str:
+        days, seconds = divmod(offset, 86400)
+        seconds = 86399 - seconds
+        return (f"{self.days[days]} {seconds // 3600:02d}:"
+                f"{seconds // 60 % 60:02d}:{seconds % 60:02d}")
+
+    def day(self, offset_days: int) -> str:
+        """The date offset_days before the as-of date (negative: after it)."""
+        if offset_days < 0:
+            return (self.as_of - timedelta(days=offset_days)).isoformat()
+        return self.days[min(self.horizon, offset_days)]
+
+
+# ============================================================================
+# GENERATOR
+# ============================================================================
+
+def generate_database(
+    db_path: str,
+    seed: int = 42,
+    as_of: Optional[date] = None,
+    overwrite: bool = True,
+    **sizes
+) -> dict:
+    """
+    PURPOSE:
+        Create a synthetic database at db_path.
+
+    PARAMETERS:
+        db_path (str): Output file (replaced if overwrite=True)
+        seed (int): Random seed - same seed and as_of, same database
+        as_of (date): "Today" for generated dates (default: today)
+        overwrite (bool): Replace an existing file (otherwise raise)
+        **sizes: Any of DEFAULT_SIZES (clients, programs, requirements,
+            stories, tests, uat_cycles, gaps, audit_rows)
+
+    RETURNS:
+        dict: Row counts per table, plus seconds per phase
+
+    WHY THIS APPROACH:
+        The schema comes from ClientProductDatabase so it is always current.
+        Rows are then loaded on a raw connection with journaling off, the
+        secondary indexes and program_stats triggers dropped, and one
+        executemany() per table; the indexes are rebuilt afterwards (a
+        sort, much faster than maintaining them row by row) and reopening
+        through ClientProductDatabase restores the triggers and backfills
+        program_stats. Random values are drawn in bulk and text comes from
+        pre-built pools, so Python work per row stays small.
+    """
+    unknown = set(sizes) - set(DEFAULT_SIZES)
+    if unknown:
+        raise ValueError(f"Unknown size(s): {sorted(unknown)}")
+    n = {**DEFAULT_SIZES, **sizes}
+    n['clients'] = max(1, min(n['clients'], n['programs']))
+
+    if os.path.exists(db_path):
+        if not overwrite:
+            raise FileExistsError(db_path)
+        os.remove(db_path)
+
+    timings = {}
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    clock = _Clock(rng, as_of or date.today())
+
+    # Schema, then strip what slows bulk loading down
+    ClientProductDatabase(db_path).close()
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA cache_size = -200000")
+    index_sql = [row[0] for row in conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")]
+    for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL").fetchall():
+        conn.execute(f"DROP INDEX {name}")
+    for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+            "AND name LIKE 'trg_program_stats_%'").fetchall():
+        conn.execute(f"DROP TRIGGER {name}")
+    timings['schema'] = time.perf_counter() - start
+
+    titles = _text_pool(rng, 4000, 5)
+    sentences = _text_pool(rng, 4000, 18)
+    criteria = ["\n".join(f"- {s}" for s in rng.sample(sentences, 4)) for _ in range(2000)]
+    users = [f"analyst{u:02d}" for u in range(30)] + ['system']
+    user_weights = _zipf_weights(30, 1.0) + [3.0]
+    pick = rng.choice
+
+    # --- Clients and programs ---------------------------------------------
+    phase = time.perf_counter()
+    client_ids = [f"CLI-{c:04d}" for c in range(n['clients'])]
+    conn.executemany("""
+        INSERT INTO clients (client_id, name, status, created_date, updated_date)
+        VALUES (?, ?, ?, ?, ?)
+    """, [(cid, f"Client {c:04d}", 'Active' if rng.random() < 0.9 else 'Inactive',
+           clock.day(700), clock.day(rng.randrange(400)))
+          for c, cid in enumerate(client_ids)])
+
+    # Every client gets a program; the rest go to a few large clients
+    owners = list(range(n['clients'])) + _hot_indexes(rng, n['clients'], n['programs'] - n['clients'])
+    rng.shuffle(owners)
+    prefixes = [_prefix(p) for p in range(n['programs'])]
+    program_ids = [f"PRG-{prefix}" for prefix in prefixes]
+    conn.executemany("""
+        INSERT INTO programs (program_id, client_id, name, prefix, program_type, status,
+                              created_date, updated_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, [(pid, client_ids[owners[p]], f"{pick(titles)} ({prefixes[p]})", prefixes[p],
+           pick(['Analytics', 'Consent', 'Integration', 'Reporting']),
+           rng.choices(['Active', 'Completed', 'On Hold'], [80, 15, 5])[0],
+           clock.day(600), clock.day(rng.randrange(200)))
+          for p, pid in enumerate(program_ids)])
+
+    # --- Per-program rows -----------------------------------------------------
+    req_sizes = _split(rng, n['requirements'], n['programs'])
+    total_req = sum(req_sizes)
+    ids = {kind: [] for kind in AUDIT_TYPES}
+    ids['program'] = program_ids
+    ids['client'] = client_ids
+    cycle_sizes = _split(rng, n['uat_cycles'], n['programs'], minimum=0)
+
+    req_rows, story_rows, test_rows, trace_rows, gap_rows, cycle_rows = [], [], [], [], [], []
+    gap_id = 0
+    trace_id = 0
+
+    for p, program_id in enumerate(program_ids):
+        prefix = prefixes[p]
+        n_req = req_sizes[p]
+        n_story = max(1, round(n_req * n['stories'] / total_req))
+        n_test = max(1, round(n_req * n['tests'] / total_req))
+        n_gap = round(n_req * n['gaps'] / total_req)
+
+        req_ids = [f"REQ-{prefix}-{i + 1:04d}" for i in range(n_req)]
+        req_types = rng.choices(REQUIREMENT_TYPES, REQUIREMENT_TYPE_WEIGHTS, k=n_req)
+        req_rows.extend(
+            (rid, program_id, f"{prefix}_requirements.xlsx", i + 2, pick(sentences),
+             pick(titles), pick(sentences), pick(PRIORITIES), req_types[i],
+             clock.day(500), clock.day(rng.randrange(120)))
+            for i, rid in enumerate(req_ids)
+        )
+
+        cycle_ids = [f"CYC-{prefix}-{c + 1:02d}" for c in range(cycle_sizes[p])]
+        for cid in cycle_ids:
+            launch = rng.randrange(-60, 400)
+            cycle_rows.append((
+                cid, program_id, f"{prefix} {pick(titles)}", rng.choice(CYCLE_TYPES),
+                clock.day(launch),
+                rng.choices(CYCLE_STATUSES, CYCLE_STATUS_WEIGHTS)[0], pick(users),
+                clock.day(launch + 60), clock.day(launch)
+            ))
+
+        categories = rng.choices(CATEGORIES, CATEGORY_WEIGHTS, k=n_story)
+        statuses = rng.choices(STORY_STATUSES, STORY_STATUS_WEIGHTS, k=n_story)
+        seq = {}
+        story_ids, story_reqs = [], []
+        for i in range(n_story):
+            seq[categories[i]] = seq.get(categories[i], 0) + 1
+            story_id = f"{prefix}-{categories[i]}-{seq[categories[i]]:03d}"
+            req_id = req_ids[int(n_req * rng.random())] if rng.random() >= 0.05 else None
+            created = rng.randrange(20, 500)
+            story_ids.append(story_id)
+            story_reqs.append(req_id)
+            story_rows.append((
+                story_id, req_id, program_id, pick(titles), pick(sentences), pick(criteria),
+                rng.choices(PRIORITIES, PRIORITY_WEIGHTS)[0], categories[i], statuses[i],
+                1 if rng.random() < 0.85 else 0, 1 + int(rng.expovariate(1.0)),
+                clock.day(created), clock.day(rng.randrange(created + 1)),
+                clock.day(rng.randrange(created)) if statuses[i] == 'Approved' else None,
+                pick(users) if statuses[i] == 'Approved' else None,
+            ))
+
+        test_stories = _hot_indexes(rng, n_story, n_test)
+        test_statuses = rng.choices(TEST_STATUSES, TEST_STATUS_WEIGHTS, k=n_test)
+        test_types = rng.choices(TEST_TYPES, TEST_TYPE_WEIGHTS, k=n_test)
+        test_ids = []
+        for i in range(n_test):
+            story_index = test_stories[i]
+            test_id = f"{story_ids[story_index]}-TC{i + 1:05d}"
+            status = test_statuses[i]
+            run = status != 'Not Run'
+            test_ids.append(test_id)
+            test_rows.append((
+                test_id, story_ids[story_index], program_id, pick(titles), categories[story_index],
+                test_types[i], pick(criteria), pick(sentences), status,
+                pick(users) if run else None, clock.day(rng.randrange(90)) if run else None,
+                pick(cycle_ids) if cycle_ids and rng.random() < 0.6 else None,
+                pick(users) if rng.random() < 0.5 else None,
+                pick(FRAMEWORKS) if rng.random() < 0.1 else None,
+                story_rows[-n_story + story_index][11], clock.day(rng.randrange(90)),
+            ))
+
+        # Traceability: one row per story with a requirement
+        first_test = {}
+        for i, story_index in enumerate(test_stories):
+            first_test.setdefault(story_index, test_ids[i])
+        trace_start = trace_id
+        for i, req_id in enumerate(story_reqs):
+            if req_id:
+                trace_id += 1
+                trace_rows.append((
+                    trace_id, program_id, req_id, story_ids[i], first_test.get(i),
+                    rng.choices(COVERAGE, COVERAGE_WEIGHTS)[0] if i in first_test else 'None',
+                    story_rows[-n_story + i][11], story_rows[-n_story + i][12],
+                ))
+
+        for _ in range(n_gap):
+            gap_id += 1
+            status = rng.choices(GAP_STATUSES, GAP_STATUS_WEIGHTS)[0]
+            due = rng.randrange(-90, 120)
+            gap_rows.append((
+                gap_id, pick(req_ids), program_id, pick(FRAMEWORKS), pick(sentences),
+                rng.choices(SEVERITIES, SEVERITY_WEIGHTS)[0], status, pick(users),
+                clock.day(-due),
+                clock.stamp(rng.randrange(120 * 86400)) if status == 'Closed' else None,
+                clock.day(rng.randrange(150, 400)), clock.day(rng.randrange(150)),
+            ))
+
+        ids['requirement'].extend(req_ids)
+        ids['user_story'].extend(story_ids)
+        ids['test_case'].extend(test_ids)
+        ids['traceability'].extend(str(t) for t in range(trace_start + 1, trace_id + 1))
+    ids['compliance_gap'] = [str(g) for g in range(1, gap_id + 1)]
+
+    conn.executemany("""
+        INSERT INTO requirements (requirement_id, program_id, source_file, source_row, raw_text,
+                                  title, description, priority, requirement_type,
+                                  created_date, updated_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, req_rows)
+    conn.executemany("""
+        INSERT INTO uat_cycles (cycle_id, program_id, name, uat_type, target_launch_date,
+                                status, clinical_pm, created_date, updated_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, cycle_rows)
+    conn.executemany("""
+        INSERT INTO user_stories (story_id, requirement_id, program_id, title, user_story,
+                                  acceptance_criteria, priority, category, status, is_technical,
+                                  version, created_date, updated_date, approved_date, approved_by)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, story_rows)
+    conn.executemany("""
+        INSERT INTO uat_test_cases (test_id, story_id, program_id, title, category, test_type,
+                                    test_steps, expected_results, test_status, tested_by,
+                                    tested_date, uat_cycle_id, assigned_to, compliance_framework,
+                                    created_date, updated_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, test_rows)
+    conn.executemany("""
+        INSERT INTO traceability (trace_id, program_id, requirement_id, story_id, test_id,
+                                  coverage_status, created_date, updated_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, trace_rows)
+    conn.executemany("""
+        INSERT INTO compliance_gaps (gap_id, requirement_id, program_id, framework,
+                                     gap_description, severity, status, owner, due_date,
+                                     closed_date, created_date, updated_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, gap_rows)
+    counts = {
+        'clients': len(client_ids), 'programs': len(program_ids),
+        'requirements': len(req_rows), 'user_stories': len(story_rows),
+        'uat_test_cases': len(test_rows), 'uat_cycles': len(cycle_rows),
+        'traceability': len(trace_rows), 'compliance_gaps': len(gap_rows),
+    }
+    del req_rows, story_rows, test_rows, trace_rows, gap_rows, cycle_rows
+    timings['records'] = time.perf_counter() - phase
+
+    # --- Audit history --------------------------------------------------------
+    phase = time.perf_counter()
+    count = n['audit_rows']
+    types = rng.choices(AUDIT_TYPES, AUDIT_TYPE_WEIGHTS, k=count)
+    actions = rng.choices(AUDIT_ACTIONS, AUDIT_ACTION_WEIGHTS, k=count)
+    changed_by = rng.choices(users, user_weights, k=count)
+    fields = rng.choices(AUDIT_FIELDS, k=count)
+    offsets = clock.offsets(count)
+    rand = rng.random
+    # Shuffled so the hot records are spread over programs, not all in the first
+    pools = {}
+    for kind, values in ids.items():
+        values = list(values)
+        rng.shuffle(values)
+        pools[kind] = (values, len(values))
+    stamp = clock.stamp
+
+    def audit_rows():
+        session = 0
+        for i in range(count):
+            values, size = pools[types[i]]
+            if rand() < 0.2:
+                session += 1  # ~5 changes per session
+            field = fields[i]
+            yield (
+                types[i], values[int(size * rand() ** 3)], actions[i], field,
+                'Draft' if field == 'status' else None,
+                'Approved' if field == 'status' else None,
+                changed_by[i], stamp(offsets[i]), f"{session:08x}",
+            )
+
+    conn.executemany("""
+        INSERT INTO audit_history (record_type, record_id, action, field_changed, old_value,
+                                   new_value, changed_by, changed_date, session_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, audit_rows())
+    counts['audit_history'] = count
+    conn.commit()
+    timings['audit'] = time.perf_counter() - phase
+
+    # --- Indexes, triggers, statistics ----------------------------------------
+    phase = time.perf_counter()
+    for sql in index_sql:
+        conn.execute(sql)
+    conn.commit()
+    conn.execute("PRAGMA journal_mode = DELETE")
+    conn.close()
+    db = ClientProductDatabase(db_path)  # Recreates triggers, backfills program_stats
+    db.close()
+    timings['indexes'] = time.perf_counter() - phase
+
+    counts['seconds'] = {phase: round(seconds, 2) for phase, seconds in timings.items()}
+    counts['seconds']['total'] = round(time.perf_counter() - start, 2)
+    counts['size_mb'] = round(os.path.getsize(db_path) / 1024 / 1024, 1)
+    return counts
+
+
+def check_database(db_path: str) -> dict:
+    """
+    PURPOSE:
+        Verify a generated database: foreign keys resolve and program_stats
+        matches the tables.
+
+    RETURNS:
+        dict: {'foreign_key_errors': int, 'stats_mismatches': int}
+    """
+    with ClientProductDatabase(db_path) as db:
+        fk_errors = db.get_connection().execute("PRAGMA foreign_key_check").fetchall()
+        return {
+            'foreign_key_errors': len(fk_errors),
+            'stats_mismatches': len(db.check_program_stats()),
+        }
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate a large synthetic client_product_database.db"
+    )
+    parser.add_argument('db_path', help="Output database file (replaced if it exists)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--as-of', type=date.fromisoformat,
+                        help="Date the data is generated relative to (default: today)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Multiply every default size (default: 1.0 = 1M audit rows)")
+    for name, default in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int,
+                            help=f"Default: {default:,} x scale")
+    parser.add_argument('--check', action='store_true',
+                        help="Verify foreign keys and program_stats afterwards")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    sizes = {}
+    for name, default in DEFAULT_SIZES.items():
+        value = getattr(args, name)
+        sizes[name] = value if value is not None else max(1, int(default * args.scale))
+
+    result = generate_database(args.db_path, seed=args.seed, as_of=args.as_of, **sizes)
+    if args.check:
+        result['check'] = check_database(args.db_path)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        seconds = result.pop('seconds')
+        check = result.pop('check', None)
+        size_mb = result.pop('size_mb')
+        print(f"Generated {args.db_path} ({size_mb} MB) in {seconds['total']}s")
+        for table, rows in result.items():
+            print(f"  {table:<16} {rows:>12,}")
+        print("  " + " | ".join(f"{phase} {s}s" for phase, s in seconds.items() if phase != 'total'))
+        if check:
+            print(f"  check: {check['foreign_key_errors']} foreign key errors, "
+                  f"{check['stats_mismatches']} program_stats mismatches")
+            return 1 if any(check.values()) else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
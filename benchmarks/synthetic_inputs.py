@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# benchmarks/synthetic_inputs.py
+# ============================================================================
+# SYNTHETIC PIPELINE INPUTS
+# ============================================================================
+#
+# PURPOSE:
+#     Write realistic requirement documents of any size - an Excel workbook,
+#     a Word document and Lucidchart CSV/SVG exports - so the parsers,
+#     generators, compliance validators and formatters can be measured at
+#     1k, 10k and 100k requirements instead of the 15 rows in inputs/excel.
+#
+# AVIATION ANALOGY:
+#     A simulator scenario generator: the same weather, traffic and failures
+#     every time you load scenario 42, at whatever intensity you dial in.
+#
+# WHY: Every format is written from the same list of requirement records
+#     (make_requirements), laid out the way each parser expects to find
+#     them: the sample workbook's columns, Word headings / "shall"
+#     paragraphs / numbered lists / ID tables, and Lucidchart swimlanes,
+#     shapes and connectors. Text is drawn from weighted vocabularies with
+#     compliance terms (audit trail, PHI, e-signature...) in the mix, so
+#     validators and the story generator do realistic work. Output depends
+#     only on size and seed.
+#
+# USAGE:
+#     python3 benchmarks/synthetic_inputs.py /tmp/inputs --size 10000
+#     python3 benchmarks/synthetic_inputs.py /tmp/inputs --size 1000 --formats excel word
+#
+#     from benchmarks.synthetic_inputs import generate_inputs
+#     paths = generate_inputs("/tmp/inputs", size=1000)   # {'excel': ..., 'word': ...}
+#
+# ============================================================================
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+import argparse
+from typing import Optional
+from xml.sax.saxutils import escape
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+FORMATS = ('excel', 'word', 'lucidchart_csv', 'lucidchart_svg')
+
+FILE_NAMES = {
+    'excel': 'requirements_{size}.xlsx',
+    'word': 'requirements_{size}.docx',
+    'lucidchart_csv': 'diagram_{size}.csv',
+    'lucidchart_svg': 'diagram_{size}.svg',
+}
+
+# ============================================================================
+# VOCABULARY
+# ============================================================================
+# (value, weight) pairs. Weights follow the mix in the sample inputs: mostly
+# system capabilities, a minority of user actions, a few compliance items.
+
+SUBJECTS = [
+    (("The system", "shall"), 40),
+    (("The portal", "shall"), 10),
+    (("Users", "must be able to"), 15),
+    (("Coordinators", "must be able to"), 10),
+    (("Administrators", "shall be able to"), 10),
+    (("Genetic counselors", "should be able to"), 8),
+    (("The platform", "should"), 7),
+]
+
+VERBS = [
+    ("track", 8), ("display", 8), ("export", 6), ("record", 6), ("validate", 5),
+    ("send", 5), ("filter", 5), ("calculate", 4), ("compare", 4), ("archive", 3),
+    ("import", 3), ("flag", 3), ("approve", 3), ("schedule", 3), ("notify users about", 3),
+    ("generate reports on", 4), ("reconcile", 2), ("search", 4), ("assign", 2), ("lock", 1),
+]
+
+OBJECTS = [
+    ("patient invitations", 6), ("consent decisions", 6), ("enrollment counts", 5),
+    ("assessment responses", 5), ("reminder emails", 4), ("lab orders", 4),
+    ("genetic test results", 4), ("referral requests", 3), ("appointment slots", 3),
+    ("participant profiles", 4), ("program channels", 3), ("recruitment metrics", 4),
+    ("survey completions", 3), ("declined invitations", 2), ("site activity logs", 2),
+    ("family history records", 3), ("risk scores", 3), ("counseling notes", 2),
+    ("billing codes", 2), ("eligibility criteria", 3), ("user accounts", 3),
+    ("role assignments", 2), ("dashboard widgets", 2), ("data extracts", 2),
+]
+
+QUALIFIERS = [
+    ("by program", 6), ("by clinic site", 5), ("for the current quarter", 4),
+    ("within 24 hours", 4), ("on the analytics dashboard", 5), ("per coordinator", 3),
+    ("with an audit trail of every change", 3), ("using an electronic signature", 2),
+    ("without exposing PHI", 2), ("with encryption at rest", 2),
+    ("after a password reset", 1), ("subject to role-based access control", 2),
+    ("in a downloadable Excel file", 3), ("for declined patients", 2),
+    ("across all enrollment channels", 3), ("when the assessment is incomplete", 3),
+    ("before the reminder is sent", 2), ("in real time", 2), ("on mobile devices", 2),
+    ("with a timestamp and user ID", 2), ("for each health system", 3),
+]
+
+REASONS = [
+    "so staff can follow up with patients who have not responded",
+    "so program leads can compare recruitment performance",
+    "to meet the sponsor's reporting commitments",
+    "to reduce manual reconciliation in spreadsheets",
+    "so that coordinators can prioritise outreach",
+    "to support the quarterly compliance review",
+    "because clinics currently track this by hand",
+    "",
+    "",
+    "",
+]
+
+CATEGORIES = [
+    ("Recruitment Analytics", 5), ("Patient Engagement", 4), ("Clinical Workflow", 4),
+    ("Reporting", 3), ("Administration", 2), ("Security", 2), ("Integrations", 2),
+]
+
+PRIORITIES = [("High", 4), ("Medium", 5), ("Low", 2), ("Critical", 1)]
+STATUSES = [("Planned", 12), ("In Progress", 4), ("Completed", 1), ("Out of Scope", 1)]
+TIMELINES = ["2025 Q4", "2026 Q1", "2026 Q2", "2026 Q3", "2026 Q4", "TBD"]
+SHAPES = [("Process", 10), ("Decision", 2), ("Data", 1), ("Document", 1), ("Manual Input", 1)]
+ROLES = ["Patient", "Coordinator", "System", "Counselor", "Laboratory", "Administrator",
+         "Sponsor", "Clinic"]
+
+
+def _weighted(rng: random.Random, choices: list):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+# ============================================================================
+# REQUIREMENT RECORDS
+# ============================================================================
+
+def make_requirements(size: int, seed: int = 42) -> list[dict]:
+    """
+    PURPOSE:
+        Build `size` requirement records shared by every writer.
+
+    PARAMETERS:
+        size (int): Number of requirements
+        seed (int): Random seed (same size + seed = same records)
+
+    RETURNS:
+        list[dict]: id, title, description, impact, dependencies, priority,
+            timeline, category, status, notes, shape, role
+
+    WHY THIS APPROACH:
+        Descriptions are unique after whitespace/case normalisation, so the
+        parsers' exact-text deduplication keeps every row; near-duplicates
+        (same verb and object, different qualifier) still occur at the rate
+        a real backlog has them, which is what the story generator's
+        similarity check is there for.
+    """
+    rng = random.Random(seed)
+    seen = set()
+    records = []
+
+    for i in range(size):
+        verb = _weighted(rng, VERBS)
+        obj = _weighted(rng, OBJECTS)
+        qualifier = _weighted(rng, QUALIFIERS)
+        subject, modal = _weighted(rng, SUBJECTS)
+
+        description = f"{subject} {modal} {verb} {obj} {qualifier}"
+        reason = rng.choice(REASONS)
+        if reason:
+            description += f" {reason}"
+        if description.lower() in seen:
+            description += f" for cohort {i + 1}"
+        seen.add(description.lower())
+
+        title = f"{verb.split()[0].capitalize()} {obj} {qualifier.split(' ', 1)[-1]}"
+        status = _weighted(rng, STATUSES)
+        records.append({
+            'id': f"REQ-{i + 1:06d}",
+            'title': title[:80],
+            'description': description + ".",
+            'impact': rng.choice(["Core metric for outreach effectiveness",
+                                  "Reduces coordinator workload",
+                                  "Required for sponsor reporting",
+                                  "Improves patient experience", ""]),
+            'dependencies': (f"Depends on REQ-{rng.randint(1, max(1, i)):06d}"
+                             if i and rng.random() < 0.2 else ""),
+            'priority': _weighted(rng, PRIORITIES),
+            'timeline': rng.choice(TIMELINES),
+            'category': _weighted(rng, CATEGORIES),
+            'status': status,
+            'notes': (f"Clarify with the program lead whether {obj} should include "
+                      f"historical data." if rng.random() < 0.3 else ""),
+            'shape': _weighted(rng, SHAPES),
+            'role': rng.choice(ROLES),
+        })
+
+    return records
+
+
+# ============================================================================
+# WRITERS
+# ============================================================================
+
+def write_excel(path: str, records: list[dict]) -> str:
+    """Write records as a workbook with the sample input's columns (Sheet1)."""
+    from openpyxl import Workbook
+
+    # write_only keeps memory flat at 100k rows
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    sheet.append(['Functionality', 'Description', 'Impact', 'Dependencies', 'Ranking',
+                  'Timelines', 'Type', 'Status', 'Notes', 'Supplemental notes',
+                  'Discover Review'])
+    for rec in records:
+        sheet.append([rec['title'], rec['description'], rec['impact'] or None,
+                      rec['dependencies'] or None, rec['priority'], rec['timeline'],
+                      rec['category'], rec['status'], rec['notes'] or None, None, None])
+    workbook.save(path)
+    return path
+
+
+def write_word(path: str, records: list[dict], section_size: int = 20) -> str:
+    """
+    PURPOSE:
+        Write records as a Word document laid out like inputs/word: numbered
+        Heading 1/Heading 2 sections holding "shall" paragraphs, numbered
+        list items and ID/Description/Priority/Notes tables.
+
+    WHY THIS APPROACH:
+        Each section puts half its requirements in paragraphs, a quarter in
+        a numbered list and a quarter in a table, so every WordParser code
+        path is exercised in proportion.
+    """
+    from docx import Document
+
+    document = Document()
+    document.add_heading("Synthetic Requirements Document", level=0)
+    document.add_heading("1. Overview", level=1)
+    document.add_paragraph(f"This document lists {len(records):,} requirements "
+                           "generated for performance testing.")
+
+    chapter_size = section_size * 5
+    for start in range(0, len(records), section_size):
+        chunk = records[start:start + section_size]
+        chapter = start // chapter_size + 2
+        if start % chapter_size == 0:
+            document.add_heading(f"{chapter}. {chunk[0]['category']} Requirements", level=1)
+        section = (start % chapter_size) // section_size + 1
+        document.add_heading(f"{chapter}.{section} {chunk[0]['title']}", level=2)
+
+        paragraphs = chunk[:len(chunk) // 2]
+        listed = chunk[len(chunk) // 2:len(chunk) * 3 // 4]
+        tabled = chunk[len(chunk) * 3 // 4:]
+
+        for rec in paragraphs:
+            document.add_paragraph(rec['description'])
+        for number, rec in enumerate(listed, 1):
+            document.add_paragraph(f"{number}. {rec['description']}", style='List Number')
+        if tabled:
+            table = document.add_table(rows=len(tabled) + 1, cols=4)
+            for cell, header in zip(table.rows[0].cells, ['ID', 'Description', 'Priority', 'Notes']):
+                cell.text = header
+            for row, rec in zip(table.rows[1:], tabled):
+                cells = row.cells
+                cells[0].text = rec['id']
+                cells[1].text = rec['description']
+                cells[2].text = rec['priority']
+                cells[3].text = rec['notes']
+
+    document.save(path)
+    return path
+
+
+def _lanes(records: list[dict]) -> list[str]:
+    """Swimlane names in first-use order."""
+    return list(dict.fromkeys(rec['role'] for rec in records))
+
+
+def write_lucidchart_csv(path: str, records: list[dict]) -> str:
+    """
+    PURPOSE:
+        Write records as a Lucidchart CSV export: a page row, one Swimlane
+        row per role, one shape per requirement (Text Area 2 holds the REQ
+        ID, Comments the priority) and Line rows joining consecutive shapes
+        in the same lane, with decisions branching to the next two shapes.
+    """
+    lanes = {name: f"lane_{i + 1}" for i, name in enumerate(_lanes(records))}
+    last_in_lane = {}
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Id', 'Name', 'Shape Library', 'Page ID', 'Contained By',
+                         'Line Source', 'Line Destination', 'Text Area 1',
+                         'Text Area 2', 'Comments'])
+        writer.writerow(['page_1', 'Page', '', '', '', '', '', 'Synthetic Diagram', '', ''])
+        for name, lane_id in lanes.items():
+            writer.writerow([lane_id, 'Swimlane', 'Flowchart Shapes', 'page_1', '',
+                             '', '', name, '', ''])
+
+        line_number = 0
+        for i, rec in enumerate(records):
+            shape_id = f"shape_{i + 1}"
+            destination = ''
+            if rec['shape'] == 'Decision' and i + 2 < len(records):
+                destination = f"shape_{i + 2},shape_{i + 3}"
+            writer.writerow([shape_id, rec['shape'], 'Flowchart Shapes', 'page_1',
+                             lanes[rec['role']], '', destination, rec['description'],
+                             rec['id'], f"{rec['priority']} priority"])
+
+            previous = last_in_lane.get(rec['role'])
+            if previous:
+                line_number += 1
+                writer.writerow([f"line_{line_number}", 'Line', '', 'page_1', '',
+                                 previous, shape_id, '', '', ''])
+            last_in_lane[rec['role']] = shape_id
+
+    return path
+
+
+def write_lucidchart_svg(path: str, records: list[dict], per_row: int = 8) -> str:
+    """
+    PURPOSE:
+        Write records as a Lucidchart SVG export: horizontal swimlane bands
+        (a rect plus a one-word label), one <g> per shape with a rect or
+        diamond polygon and its text, and arrow paths between consecutive
+        shapes in a lane.
+
+    WHY THIS APPROACH:
+        Shapes sit inside their lane's band geometrically but not in its
+        <g>, as in real exports - containment has to be worked out from
+        coordinates.
+    """
+    lane_names = _lanes(records)
+    by_lane = {name: [] for name in lane_names}
+    for rec in records:
+        by_lane[rec['role']].append(rec)
+
+    shape_w, shape_h, gap = 220, 80, 40
+    width = 200 + per_row * (shape_w + gap)
+    lane_top = {}
+    y = 0
+    for name in lane_names:
+        rows = max(1, -(-len(by_lane[name]) // per_row))
+        lane_top[name] = (y, rows * (shape_h + gap) + gap)
+        y += lane_top[name][1]
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" '
+                f'xmlns:xlink="http://www.w3.org/1999/xlink" width="{width}" height="{y}">\n')
+        f.write('<defs><marker id="arrow-end" markerWidth="10" markerHeight="10">'
+                '<path d="M0,0 L10,5 L0,10 z"/></marker></defs>\n')
+
+        for name in lane_names:
+            top, height = lane_top[name]
+            f.write(f'<g id="lane_{escape(name)}"><rect x="0" y="{top}" width="{width}" '
+                    f'height="{height}" fill="none" stroke="#999"/>'
+                    f'<text x="10" y="{top + 20}">{escape(name)}</text></g>\n')
+
+        shape_number = 0
+        for name in lane_names:
+            top, _ = lane_top[name]
+            previous = None
+            for n, rec in enumerate(by_lane[name]):
+                shape_number += 1
+                x = 200 + (n % per_row) * (shape_w + gap)
+                sy = top + gap + (n // per_row) * (shape_h + gap)
+                if rec['shape'] == 'Decision':
+                    cx, cy = x + shape_w // 2, sy + shape_h // 2
+                    outline = (f'<polygon points="{cx},{sy} {x + shape_w},{cy} '
+                               f'{cx},{sy + shape_h} {x},{cy}"/>')
+                else:
+                    outline = f'<rect x="{x}" y="{sy}" width="{shape_w}" height="{shape_h}"/>'
+                f.write(f'<g id="shape_{shape_number}">{outline}'
+                        f'<text x="{x + 10}" y="{sy + 30}">{escape(rec["description"])}</text></g>\n')
+                if previous:
+                    px, py = previous
+                    f.write(f'<path d="M{px},{py} L{x},{sy + shape_h // 2}" '
+                            f'marker-end="url(#arrow-end)"/>\n')
+                previous = (x + shape_w, sy + shape_h // 2)
+
+        f.write('</svg>\n')
+
+    return path
+
+
+WRITERS = {
+    'excel': write_excel,
+    'word': write_word,
+    'lucidchart_csv': write_lucidchart_csv,
+    'lucidchart_svg': write_lucidchart_svg,
+}
+
+
+def generate_inputs(
+    output_dir: str,
+    size: int,
+    formats: Optional[list] = None,
+    seed: int = 42,
+    overwrite: bool = False
+) -> dict:
+    """
+    PURPOSE:
+        Write one input file per format for `size` requirements.
+
+    PARAMETERS:
+        output_dir (str): Directory for the files (created if needed)
+        size (int): Number of requirements
+        formats (list, optional): Subset of FORMATS (default: all)
+        seed (int): Random seed
+        overwrite (bool): Rewrite files that already exist (by default an
+            existing file of the same name is reused - names include the size)
+
+    RETURNS:
+        dict: format -> file path
+    """
+    formats = list(formats or FORMATS)
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown format(s): {', '.join(sorted(unknown))}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    records = None
+    paths = {}
+    for fmt in formats:
+        path = os.path.join(output_dir, FILE_NAMES[fmt].format(size=size))
+        if overwrite or not os.path.exists(path):
+            if records is None:
+                records = make_requirements(size, seed)
+            WRITERS[fmt](path, records)
+        paths[fmt] = path
+    return paths
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Write synthetic Excel, Word and Lucidchart requirement inputs"
+    )
+    parser.add_argument('output_dir', help="Directory to write the files to")
+    parser.add_argument('--size', type=int, default=1000,
+                        help="Number of requirements (default: 1000)")
+    parser.add_argument('--formats', nargs='+', choices=FORMATS,
+                        help="Formats to write (default: all)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    paths = generate_inputs(args.output_dir, args.size, args.formats, args.seed,
+                            overwrite=True)
+    seconds = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps({'size': args.size, 'seconds': round(seconds, 2),
+                          'files': paths}, indent=2))
+    else:
+        for fmt, path in paths.items():
+            print(f"{fmt:<16} {os.path.getsize(path) / 1024:>10,.0f} KB  {path}")
+        print(f"Wrote {len(paths)} files for {args.size:,} requirements in {seconds:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,11 +20,46 @@
 # ============================================================================
 
 import re
+import sys
 from abc import ABC, abstractmethod
 from typing import Optional
 from datetime import datetime
 from pathlib import Path
-import yaml
+
+# Control files are loaded, validated and compiled once per process by the
+# shared registry (config_registry.py at the repo root)
+try:
+    from config_registry import get_registry, register_compiler, require, require_str_list
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from config_registry import get_registry, register_compiler, require, require_str_list
+
+
+@register_compiler('compliance_controls', version=1)
+def _compile_controls(data: dict, path: str) -> dict:
+    """
+    PURPOSE:
+        Validate a compliance control file (compliance/config/*_controls.yaml).
+
+    WHY THIS APPROACH:
+        A control without an ID or category, or with keywords that aren't
+        a list of strings, would otherwise fail deep inside a scan - or
+        worse, silently never match.
+    """
+    require(isinstance(data, dict), path, "top level must be a mapping")
+    controls = data.get('controls') or []
+    require(isinstance(controls, list), path, "'controls' must be a list")
+
+    for index, control in enumerate(controls):
+        where = f"controls[{index}]"
+        require(isinstance(control, dict), path, f"{where} must be a mapping")
+        for field in ('control_id', 'category'):
+            require(isinstance(control.get(field), str) and control.get(field), path,
+                    f"{where}.{field} is required")
+        require_str_list(control.get('keywords_to_detect'), path,
+                         f"{control['control_id']}.keywords_to_detect")
+
+    return data
 
 
 class BaseValidator(ABC):
@@ -425,17 +460,22 @@ class BaseValidator(ABC):
             path (str): Path to YAML file
 
         RETURNS:
-            dict: Parsed YAML content
+            dict: Parsed YAML content (a private copy), or {} if the file
+                doesn't exist
+
+        RAISES:
+            ConfigError: If the file isn't a valid control file
 
         WHY THIS APPROACH:
             YAML is human-readable and easy to edit for customizing controls.
+            The shared config registry parses and validates each file once
+            per process (and caches the result on disk between processes).
         """
         path = Path(path)
         if not path.exists():
             return {}
 
-        with open(path, 'r') as f:
-            return yaml.safe_load(f) or {}
+        return get_registry().load(path, 'compliance_controls')
 
     def _report_to_markdown(self, report: dict) -> str:
         """Convert report to markdown format."""
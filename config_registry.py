@@ -0,0 +1,361 @@
+# config_registry.py
+# ============================================================================
+# Config Registry - load, validate and compile each YAML config once
+# ============================================================================
+#
+# PURPOSE:
+#     One process-wide place that reads the toolkit's YAML config
+#     (config/*.yaml, compliance/config/*.yaml), validates it, and turns it
+#     into the structure its consumer actually uses - split templates,
+#     keyword indexes, compiled regexes. The story generator and every
+#     compliance validator get their config from here.
+#
+# AVIATION ANALOGY:
+#     The navigation database. It's loaded and checked once per cycle, not
+#     re-keyed by every pilot before every flight - and when the cycle
+#     changes (the file is edited), everyone gets the new one.
+#
+# R EQUIVALENT:
+#     Like memoise::memoise(function(path) compile(yaml::read_yaml(path)))
+#     with memoise::cache_filesystem() as the cache, keyed on file.info().
+#
+# WHY: PyYAML takes ~160 ms to parse the six config files, in every process
+#     (each CLI run, each spawned batch worker). The compiled result is
+#     pickled to a __pycache__ directory next to the YAML file - the same
+#     idea, and the same place, as Python's .pyc files - so later processes
+#     unpickle it in well under a millisecond. A pickle is only reused by
+#     the same compiler code that wrote it (see _code_fingerprint()).
+#
+# USAGE:
+#     from config_registry import get_registry, register_compiler
+#
+#     @register_compiler('flag_terms', version=2)
+#     def compile_flag_terms(data, path):
+#         ...validate, raise ConfigError on bad input...
+#         return {'terms': data, 'detector': FlagDetector(data)}
+#
+#     compiled = get_registry().get("config/flag_terms.yaml", 'flag_terms')
+#     raw_copy = get_registry().load("config/flag_terms.yaml")   # Private copy
+#
+# ============================================================================
+
+import os
+import sys
+import copy
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+import yaml
+
+# libyaml's C loader parses ~10x faster; same results for safe YAML
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Bump when the pickled entry layout changes (compilers have their own version)
+CACHE_FORMAT = 2
+
+# Compiler name -> (function(data, path) -> compiled value, version, code fingerprint)
+_COMPILERS: dict[str, tuple[Callable, int, str]] = {}
+
+
+class ConfigError(ValueError):
+    """A config file is not valid for the compiler reading it."""
+
+
+def register_compiler(name: str, version: int = 1):
+    """
+    PURPOSE:
+        Decorator that registers a compiler: a function taking the parsed
+        YAML and the file path and returning the ready-to-use structure.
+
+    PARAMETERS:
+        name (str): Compiler name passed to ConfigRegistry.get()
+        version (int): Bump whenever the compiled structure changes, so
+            pickles written by older code are ignored. Editing the compiler
+            or its module also invalidates them (see _code_fingerprint()),
+            so this is a belt-and-braces marker, not the only guard.
+
+    WHY THIS APPROACH:
+        Compilers live next to the code that uses their output (the story
+        generator's in its module, the validators' in base_validator), so
+        the registry itself knows nothing about any particular file.
+    """
+    def decorator(func):
+        _COMPILERS[name] = (func, version, _code_fingerprint(func))
+        return func
+    return decorator
+
+
+def _code_fingerprint(func: Callable) -> str:
+    """
+    PURPOSE:
+        Identify the code that builds a compiler's output: the function's
+        bytecode, constants and names (nested functions included), plus the
+        mtime and size of the module file it is defined in.
+
+    WHY THIS APPROACH:
+        Pickled compiled values can be live objects (the flag_terms entry
+        is a whole FlagDetector), so a pickle is only valid for the code
+        that wrote it. The bytecode catches edits to the compiler itself;
+        the module file's stat catches edits to anything it builds from
+        that module (FlagDetector lives next to its compiler). Like a .pyc,
+        a touched file just costs one recompile.
+    """
+    digest = hashlib.sha256()
+
+    def add_code(code) -> None:
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                add_code(const)
+            else:
+                digest.update(repr(const).encode())
+
+    add_code(func.__code__)
+    try:
+        stat = os.stat(func.__code__.co_filename)
+        digest.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode())
+    except OSError:
+        pass
+    return digest.hexdigest()
+
+
+def require(condition: bool, path: str, message: str) -> None:
+    """Raise ConfigError("<file>: message") unless condition holds."""
+    if not condition:
+        raise ConfigError(f"{os.path.basename(path)}: {message}")
+
+
+def require_str_list(value, path: str, where: str) -> None:
+    """Require value to be a list of strings (None counts as empty)."""
+    require(value is None or (isinstance(value, list) and all(isinstance(v, str) for v in value)),
+            path, f"{where} must be a list of strings")
+
+
+@register_compiler('yaml')
+def _compile_yaml(data, path: str):
+    """Default compiler: the parsed YAML (a mapping) as is."""
+    require(isinstance(data, dict), path, "top level must be a mapping")
+    return data
+
+
+class ConfigRegistry:
+    """
+    PURPOSE:
+        Cache compiled config per (file, compiler), in memory and on disk.
+
+    WHY THIS APPROACH:
+        - get() stats the file on every call: if the mtime or size changed
+          (watch mode, someone editing a YAML file mid-session) the file is
+          recompiled, otherwise the shared compiled value is returned.
+        - The on-disk pickle is reused if it was written by the same
+          compiler code (version and _code_fingerprint()) and the YAML's
+          recorded mtime and size still match, or failing that its SHA-256
+          does (a checkout or copy that touched the mtime but not the
+          content).
+        - Compiled values are shared by every caller in the process and
+          must be treated as read-only. load() hands out a deep copy for
+          callers that keep a config they may modify.
+        - Disk cache problems (read-only directory, corrupt pickle) are
+          counted in stats and otherwise ignored - the YAML is the source
+          of truth. Like .pyc files, nothing is written when Python runs
+          with -B / PYTHONDONTWRITEBYTECODE.
+    """
+
+    def __init__(self, disk_cache: bool = True) -> None:
+        """
+        PARAMETERS:
+            disk_cache (bool): Read and write pickled compiled config
+        """
+        self.disk_cache = disk_cache
+        # (absolute path, compiler) -> (mtime_ns, size, compiled value)
+        self._entries: dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'compiled': 0,
+            'disk_writes': 0,
+            'disk_errors': 0,
+        }
+
+    # ========================================================================
+    # PUBLIC API
+    # ========================================================================
+
+    def get(self, path, compiler: str = 'yaml'):
+        """
+        PURPOSE:
+            Return the compiled config for a file (shared - don't modify).
+
+        PARAMETERS:
+            path (str or Path): YAML file
+            compiler (str): Registered compiler name (default: the parsed
+                mapping as is)
+
+        RETURNS:
+            The compiler's output
+
+        RAISES:
+            FileNotFoundError: If the file doesn't exist
+            ConfigError: If the file fails the compiler's validation
+            yaml.YAMLError: If the YAML is malformed
+            KeyError: If no such compiler is registered
+        """
+        if compiler not in _COMPILERS:
+            raise KeyError(f"No config compiler registered as '{compiler}'")
+
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (path, compiler)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            self.stats['memory_hits'] += 1
+            return entry[2]
+
+        with self._lock:
+            value = self._load(path, stat, compiler)
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, value)
+        return value
+
+    def load(self, path, compiler: str = 'yaml'):
+        """Return a private deep copy of get(path, compiler)."""
+        return copy.deepcopy(self.get(path, compiler))
+
+    def clear(self) -> None:
+        """Forget everything cached in memory (disk caches are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Return registry statistics."""
+        return self.stats.copy()
+
+    # ========================================================================
+    # LOADING
+    # ========================================================================
+
+    @staticmethod
+    def _cache_file(path: str, compiler: str) -> str:
+        """config/x.yaml -> config/__pycache__/x.<compiler>.pickle"""
+        directory, name = os.path.split(path)
+        return os.path.join(directory, '__pycache__', f"{name}.{compiler}.pickle")
+
+    def _load(self, path: str, stat: os.stat_result, compiler: str):
+        """Compile a file, or reuse a valid pickle of its compiled form."""
+        func, version, code = _COMPILERS[compiler]
+        cache_file = self._cache_file(path, compiler)
+        content = None
+
+        cached = self._read_cache(cache_file) if self.disk_cache else None
+        if (cached and cached.get('format') == CACHE_FORMAT
+                and cached.get('compiler') == compiler
+                and cached.get('version') == version
+                and cached.get('code') == code):
+            if (cached.get('mtime_ns'), cached.get('size')) == (stat.st_mtime_ns, stat.st_size):
+                self.stats['disk_hits'] += 1
+                return cached['value']
+
+            with open(path, 'rb') as f:
+                content = f.read()
+            if cached.get('sha256') == hashlib.sha256(content).hexdigest():
+                self.stats['disk_hits'] += 1
+                self._write_cache(cache_file, compiler, version, code, stat, content,
+                                  cached['value'])
+                return cached['value']
+
+        if content is None:
+            with open(path, 'rb') as f:
+                content = f.read()
+
+        data = yaml.load(content, Loader=_YAML_LOADER)
+        value = func({} if data is None else data, path)
+        self.stats['compiled'] += 1
+
+        if self.disk_cache:
+            self._write_cache(cache_file, compiler, version, code, stat, content, value)
+        return value
+
+    def _read_cache(self, cache_file: str) -> Optional[dict]:
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            return cached if isinstance(cached, dict) else None
+        except Exception:
+            # Corrupt, truncated or written by incompatible code: recompile
+            self.stats['disk_errors'] += 1
+            return None
+
+    def _write_cache(self, cache_file: str, compiler: str, version: int, code: str,
+                     stat: os.stat_result, content: bytes, value) -> None:
+        if sys.dont_write_bytecode:
+            return
+        entry = {
+            'format': CACHE_FORMAT,
+            'compiler': compiler,
+            'version': version,
+            'code': code,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': hashlib.sha256(content).hexdigest(),
+            'value': value,
+        }
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(temp_file, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic: concurrent batch workers never see a half-written file
+            os.replace(temp_file, cache_file)
+            self.stats['disk_writes'] += 1
+        except Exception:
+            self.stats['disk_errors'] += 1
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+
+# ============================================================================
+# PROCESS-WIDE INSTANCE
+# ============================================================================
+
+_REGISTRY: Optional[ConfigRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_registry() -> ConfigRegistry:
+    """Return the process-wide registry (created on first use)."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = ConfigRegistry()
+    return _REGISTRY
+
+
+# ============================================================================
+# EXAMPLE USAGE
+# ============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    config_dirs = [Path(__file__).parent / "config",
+                   Path(__file__).parent / "compliance" / "config"]
+    files = [p for d in config_dirs for p in sorted(d.glob("*.yaml"))]
+
+    for label in ("first load", "same process"):
+        start = time.perf_counter()
+        for path in files:
+            get_registry().get(path)
+        print(f"{label:<14} {len(files)} files in {(time.perf_counter() - start) * 1000:7.2f} ms")
+
+    print(get_registry().get_stats())
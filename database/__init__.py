@@ -35,9 +35,14 @@
 #
 # ============================================================================
 
+# LAZY LOADING: db_manager, queries and audit_queries only need sqlite3 and
+# are imported here. import_stories needs openpyxl (~100 ms to import), so
+# its functions load on first access - audit commands never pay for it.
+
+from lazy_exports import lazy_exports
+
 from .db_manager import ClientProductDatabase, get_database
 from . import queries
-from .import_stories import import_stories_from_excel, quick_import
 from . import audit_queries
 from .audit_queries import (
     get_record_audit_trail,
@@ -64,3 +69,12 @@ __all__ = [
     'format_audit_summary',
     'VALID_RECORD_TYPES',
 ]
+
+# Public name -> submodule that defines it (imported on first access)
+_LAZY_IMPORTS = {
+    'import_stories_from_excel': '.import_stories',
+    'quick_import': '.import_stories',
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
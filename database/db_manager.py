@@ -28,6 +28,7 @@ import os
 import sqlite3
 import json
 import uuid
+import time
 from datetime import datetime
 from typing import Optional, Dict, List, Any, Tuple
 
@@ -93,6 +94,8 @@ class ClientProductDatabase:
             conn.executescript(schema_sql)
             conn.commit()
 
+            self._ensure_program_stats()
+
     def get_connection(self) -> sqlite3.Connection:
         """
         PURPOSE:
@@ -499,10 +502,7 @@ class ClientProductDatabase:
 
         for req in requirements:
             # Generate requirement ID if not present
-            req_id = req.get('requirement_id')
-            if not req_id:
-                row_num = req.get('row_number', 0)
-                req_id = f"REQ-{program_id[-8:]}-{row_num:03d}"
+            req_id = self.requirement_db_id(program_id, req)
 
             # Check if exists
             cursor = conn.execute(
@@ -1347,22 +1347,18 @@ class ClientProductDatabase:
 
         return [dict(row) for row in cursor.fetchall()]
 
-    def get_coverage_summary(self, program_id: str) -> Dict:
-        """Get coverage summary for a program."""
-        conn = self.get_connection()
-        cursor = conn.execute("""
-            SELECT
-                coverage_status,
-                COUNT(*) as count
-            FROM traceability
-            WHERE program_id = ?
-            GROUP BY coverage_status
-        """, (program_id,))
+    def get_coverage_summary(self, program_id: str, stats: Optional[Dict] = None) -> Dict:
+        """
+        Get coverage summary for a program (from program_stats).
+
+        stats: get_program_stats() output, if the caller already has it
+        """
+        stats = stats or self.get_program_stats(program_id)
 
         summary = {'Full': 0, 'Partial': 0, 'None': 0, 'total': 0}
-        for row in cursor.fetchall():
-            summary[row['coverage_status']] = row['count']
-            summary['total'] += row['count']
+        for coverage_status, count in stats['coverage'].items():
+            summary[coverage_status] = count
+            summary['total'] += count
 
         # Calculate percentages
         if summary['total'] > 0:
@@ -1374,6 +1370,1097 @@ class ClientProductDatabase:
 
         return summary
 
+    # ========================================================================
+    # STREAMING READS (KEYSET PAGINATION)
+    # ========================================================================
+    # WHY: get_requirements / get_stories / get_test_cases /
+    # get_traceability_matrix build every row of a program as a dict, with
+    # every TEXT column, before returning. A UI showing 50 stories at a time
+    # or an export writing rows as it goes doesn't need that. The iter_*
+    # methods below:
+    #   - yield rows page by page. Each page is its own query continuing
+    #     after the last key seen ("keyset pagination"), so page 1,000 costs
+    #     the same as page 1 and no read transaction is held open between
+    #     pages - unlike OFFSET, which re-reads every skipped row
+    #   - resume after a given record: after=<id>, limit=N is one UI page
+    #   - select only the columns asked for (skip acceptance_criteria etc.)
+    #   - can return plain tuples or namedtuples instead of dicts
+    #
+    # R EQUIVALENT:
+    #     Like dbSendQuery() + dbFetch(res, n = 500) in a loop, instead of
+    #     dbGetQuery() pulling the whole table into a data frame.
+
+    ROW_MODES = ('dict', 'tuple', 'namedtuple')
+
+    def _table_columns(self, table: str) -> List[str]:
+        """Column names of a table, in schema order (cached per instance)."""
+        if not hasattr(self, '_column_cache'):
+            self._column_cache = {}
+        if table not in self._column_cache:
+            cursor = self.get_connection().execute(f"PRAGMA table_info({table})")
+            self._column_cache[table] = [row['name'] for row in cursor.fetchall()]
+        return self._column_cache[table]
+
+    def _iter_keyset(
+        self,
+        source: str,
+        available: Dict[str, str],
+        order_by: List[str],
+        id_column: str,
+        filters: List[str],
+        params: list,
+        columns: Optional[List[str]],
+        after: Optional[str],
+        limit: Optional[int],
+        row_mode: str,
+        page_size: int,
+        row_name: str,
+        convert=None
+    ):
+        """
+        PURPOSE:
+            Shared keyset-pagination loop behind the iter_* methods.
+
+        PARAMETERS:
+            source: FROM clause (table, or table plus joins)
+            available: Column name -> SQL expression callers may select
+            order_by: SQL expressions that together form a unique sort key
+            id_column: SQL expression of the record ID that `after` names
+            filters, params: WHERE conditions and their parameters
+            columns: Names from `available` to return (default: all)
+            after: Resume after this record ID
+            limit: Stop after this many rows (default: no limit)
+            row_mode: 'dict', 'tuple' or 'namedtuple'
+            page_size: Rows fetched per query
+            row_name: namedtuple type name
+            convert: Optional dict-mode row fixup (e.g., split lists)
+
+        YIELDS:
+            One row per record, in sort-key order
+
+        WHY THIS APPROACH:
+            The sort key is selected as extra leading columns so the next
+            page can start "> last key" without another lookup; they are
+            sliced off before the row is returned. A multi-column key is
+            compared as a row value: (a, b) > (?, ?).
+        """
+        if row_mode not in self.ROW_MODES:
+            raise ValueError(f"row_mode must be one of {self.ROW_MODES}, got {row_mode!r}")
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        names = list(columns) if columns else list(available)
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValueError(f"Unknown column(s) {unknown}; choose from {list(available)}")
+
+        conn = self.get_connection()
+        key_count = len(order_by)
+        select = ", ".join(
+            [f"{expr} AS _key{i}" for i, expr in enumerate(order_by)]
+            + [f"{available[name]} AS {name}" for name in names]
+        )
+        key_sql = order_by[0] if key_count == 1 else f"({', '.join(order_by)})"
+        key_placeholders = "?" if key_count == 1 else f"({', '.join('?' * key_count)})"
+        where = " AND ".join(filters) or "1=1"
+
+        # Starting key: for a single-column key the ID is the key itself
+        # (so resuming still works if that record was deleted since)
+        last_key = None
+        if after is not None:
+            if key_count == 1 and order_by[0] == id_column:
+                last_key = (after,)
+            else:
+                row = conn.execute(
+                    f"SELECT {', '.join(order_by)} FROM {source} WHERE {id_column} = ?",
+                    (after,)
+                ).fetchone()
+                if row is None:
+                    raise ValueError(f"after={after!r} not found")
+                last_key = tuple(row)
+
+        if row_mode == 'namedtuple':
+            from collections import namedtuple
+            row_type = namedtuple(row_name, names)
+
+        remaining = limit
+        while remaining is None or remaining > 0:
+            batch = page_size if remaining is None else min(page_size, remaining)
+            sql = f"SELECT {select} FROM {source} WHERE {where}"
+            page_params = list(params)
+            if last_key is not None:
+                sql += f" AND {key_sql} > {key_placeholders}"
+                page_params.extend(last_key)
+            sql += f" ORDER BY {', '.join(order_by)} LIMIT ?"
+            page_params.append(batch)
+
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples - no sqlite3.Row per row
+            rows = cursor.execute(sql, page_params).fetchall()
+            cursor.close()
+
+            for row in rows:
+                values = row[key_count:]
+                if row_mode == 'tuple':
+                    yield values
+                elif row_mode == 'namedtuple':
+                    yield row_type._make(values)
+                else:
+                    record = dict(zip(names, values))
+                    yield convert(record) if convert else record
+
+            if len(rows) < batch:
+                return
+            last_key = rows[-1][:key_count]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def iter_requirements(
+        self,
+        program_id: str,
+        requirement_type: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        row_mode: str = 'dict',
+        page_size: int = 500
+    ):
+        """
+        PURPOSE:
+            Iterate over a program's requirements in source-row order
+            (like get_requirements), a page at a time.
+
+        PARAMETERS:
+            program_id: Program ID
+            requirement_type: Optional type filter
+            after: Resume after this requirement_id
+            limit: Maximum rows to return
+            columns: Columns to select (default: all requirements columns)
+            row_mode: 'dict' (adds context_columns, as get_requirements
+                does), 'tuple' or 'namedtuple' (raw column values)
+            page_size: Rows per query
+
+        RETURNS:
+            Iterator of rows
+        """
+        filters, params = ["program_id = ?"], [program_id]
+        if requirement_type:
+            filters.append("requirement_type = ?")
+            params.append(requirement_type)
+
+        def convert(req):
+            if req.get('context_json'):
+                req['context_columns'] = json.loads(req['context_json'])
+            return req
+
+        return self._iter_keyset(
+            'requirements',
+            {name: name for name in self._table_columns('requirements')},
+            ["COALESCE(source_row, 0)", "requirement_id"], "requirement_id",
+            filters, params, columns, after, limit, row_mode, page_size,
+            'RequirementRow', convert
+        )
+
+    def iter_stories(
+        self,
+        program_id: str,
+        status_filter: Optional[str] = None,
+        category_filter: Optional[str] = None,
+        include_non_technical: bool = True,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        row_mode: str = 'dict',
+        page_size: int = 500
+    ):
+        """
+        PURPOSE:
+            Iterate over a program's stories in story_id order (like
+            get_stories), a page at a time.
+
+        PARAMETERS:
+            program_id, status_filter, category_filter,
+            include_non_technical: As get_stories()
+            after: Resume after this story_id (one UI page:
+                after=<last id shown>, limit=50)
+            limit: Maximum rows to return
+            columns: Columns to select, e.g. ['story_id', 'title', 'status']
+                (default: all user_stories columns)
+            row_mode: 'dict' (acceptance_criteria/flags split into lists,
+                as get_stories does), 'tuple' or 'namedtuple' (raw values)
+            page_size: Rows per query
+
+        RETURNS:
+            Iterator of rows
+
+        EXAMPLE:
+            for story_id, title in db.iter_stories(pid, columns=['story_id', 'title'],
+                                                   row_mode='tuple'):
+                ...
+        """
+        filters, params = ["program_id = ?"], [program_id]
+        if status_filter:
+            filters.append("status = ?")
+            params.append(status_filter)
+        if category_filter:
+            filters.append("category = ?")
+            params.append(category_filter)
+        if not include_non_technical:
+            filters.append("is_technical = 1")
+
+        def convert(story):
+            if story.get('acceptance_criteria'):
+                story['acceptance_criteria'] = story['acceptance_criteria'].split('\n')
+            if 'flags' in story:
+                story['flags'] = story['flags'].split(',') if story['flags'] else []
+            return story
+
+        return self._iter_keyset(
+            'user_stories',
+            {name: name for name in self._table_columns('user_stories')},
+            ["story_id"], "story_id",
+            filters, params, columns, after, limit, row_mode, page_size,
+            'StoryRow', convert
+        )
+
+    def iter_test_cases(
+        self,
+        program_id: Optional[str] = None,
+        story_id: Optional[str] = None,
+        status_filter: Optional[str] = None,
+        test_type: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        row_mode: str = 'dict',
+        page_size: int = 500
+    ):
+        """
+        PURPOSE:
+            Iterate over test cases in test_id order (like get_test_cases),
+            a page at a time.
+
+        PARAMETERS:
+            program_id, story_id, status_filter, test_type: As get_test_cases()
+            after: Resume after this test_id
+            limit: Maximum rows to return
+            columns: Columns to select (default: all uat_test_cases columns)
+            row_mode: 'dict', 'tuple' or 'namedtuple'
+            page_size: Rows per query
+
+        RETURNS:
+            Iterator of rows
+        """
+        filters, params = [], []
+        for column, value in (('program_id', program_id), ('story_id', story_id),
+                              ('test_status', status_filter), ('test_type', test_type)):
+            if value:
+                filters.append(f"{column} = ?")
+                params.append(value)
+
+        return self._iter_keyset(
+            'uat_test_cases',
+            {name: name for name in self._table_columns('uat_test_cases')},
+            ["test_id"], "test_id",
+            filters, params, columns, after, limit, row_mode, page_size,
+            'TestCaseRow'
+        )
+
+    def iter_traceability(
+        self,
+        program_id: str,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        row_mode: str = 'dict',
+        page_size: int = 500
+    ):
+        """
+        PURPOSE:
+            Iterate over a program's traceability rows in requirement order,
+            with the same joined requirement/story fields as
+            get_traceability_matrix(), a page at a time.
+
+        PARAMETERS:
+            program_id: Program ID
+            after: Resume after this trace_id
+            limit: Maximum rows to return
+            columns: Columns to select - any traceability column plus
+                req_title, req_description, story_title, story_status
+            row_mode: 'dict', 'tuple' or 'namedtuple'
+            page_size: Rows per query
+
+        RETURNS:
+            Iterator of rows
+        """
+        available = {name: f"t.{name}" for name in self._table_columns('traceability')}
+        available.update({
+            'req_title': 'r.title',
+            'req_description': 'r.description',
+            'story_title': 's.title',
+            'story_status': 's.status',
+        })
+
+        return self._iter_keyset(
+            """traceability t
+               LEFT JOIN requirements r ON t.requirement_id = r.requirement_id
+               LEFT JOIN user_stories s ON t.story_id = s.story_id""",
+            available,
+            ["COALESCE(t.requirement_id, '')", "t.trace_id"], "t.trace_id",
+            ["t.program_id = ?"], [program_id], columns, after, limit,
+            row_mode, page_size, 'TraceabilityRow'
+        )
+
+    # ========================================================================
+    # PIPELINE RUN PERSISTENCE (UNIT OF WORK)
+    # ========================================================================
+    # WHY: The save_* methods above commit as they go - every log_audit()
+    # call is its own commit, and every record costs a SELECT plus an INSERT
+    # or UPDATE. A large run makes thousands of round trips and fsyncs, and
+    # if the test case save fails after the requirements and stories were
+    # committed, the program is left half-imported. persist_run() writes a
+    # whole pipeline run in one transaction: existing IDs are looked up once
+    # per table, rows go in with executemany(), and any failure rolls the
+    # entire run back.
+    #
+    # AVIATION ANALOGY:
+    #     Like filing the complete flight plan in one message instead of
+    #     radioing in each waypoint - ATC either has the whole plan or none
+    #     of it, never a route that stops halfway.
+
+    # Keep IN (...) lookups under SQLite's default 999 host parameters
+    _LOOKUP_CHUNK = 500
+
+    @staticmethod
+    def requirement_db_id(program_id: str, req: Dict) -> str:
+        """
+        PURPOSE:
+            Return the requirement_id a parsed requirement is stored under.
+
+        PARAMETERS:
+            program_id: Program the requirement belongs to
+            req: Requirement dict from a parser
+
+        RETURNS:
+            str: The requirement's own ID, or REQ-{program}-{row} if it has none
+
+        WHY THIS APPROACH:
+            The traceability generator labels requirements that have no ID
+            "REQ-ROW{n}" and writes that label back onto the dict. The label
+            is only unique within one file, so it's treated as "no ID" -
+            otherwise every program's row 3 would share one primary key.
+        """
+        row_num = req.get('row_number', 0) or 0
+        req_id = req.get('requirement_id')
+        if not req_id or req_id == f"REQ-ROW{row_num}":
+            req_id = f"REQ-{program_id[-8:]}-{row_num:03d}"
+        return req_id
+
+    def _fetch_existing(
+        self,
+        table: str,
+        key_column: str,
+        ids,
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, sqlite3.Row]:
+        """
+        PURPOSE:
+            Look up which of many IDs already exist, in a few IN (...)
+            queries instead of one SELECT per record.
+
+        PARAMETERS:
+            table, key_column: Table and its ID column (internal names only)
+            ids: IDs to look up (None/empty values are ignored)
+            columns: Extra columns to return (e.g., ['version'])
+
+        RETURNS:
+            Dict[str, sqlite3.Row]: id -> row, for the IDs that exist
+        """
+        conn = self.get_connection()
+        ids = [value for value in dict.fromkeys(ids) if value]
+        select = ", ".join([key_column] + list(columns or []))
+        found = {}
+
+        for start in range(0, len(ids), self._LOOKUP_CHUNK):
+            chunk = ids[start:start + self._LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"SELECT {select} FROM {table} WHERE {key_column} IN ({placeholders})",
+                chunk
+            )
+            for row in cursor.fetchall():
+                found[row[0]] = row
+
+        return found
+
+    def persist_run(
+        self,
+        program_id: str,
+        requirements: Optional[List[Dict]] = None,
+        stories: Optional[List[Dict]] = None,
+        test_cases: Optional[List[Dict]] = None,
+        compliance_gaps: Optional[List[Dict]] = None,
+        traceability_matrix: Optional[Dict] = None,
+        source_file: Optional[str] = None,
+        batch_id: Optional[str] = None,
+        changed_by: str = 'system',
+        import_type: str = 'pipeline_run'
+    ) -> Dict[str, Any]:
+        """
+        PURPOSE:
+            Save one pipeline run - requirements, user stories, test cases,
+            compliance gaps, traceability, the import batch and every audit
+            row - as a single transaction.
+
+        PARAMETERS:
+            program_id: Program to save under (must already exist)
+            requirements: Requirement dicts from a parser
+            stories: Story dicts from UserStoryGenerator
+            test_cases: UAT and compliance test case dicts
+            compliance_gaps: Gap dicts from the compliance validators
+            traceability_matrix: Matrix dict from TraceabilityGenerator
+                (replaces the program's traceability rows; None leaves them)
+            source_file: Original file name
+            batch_id: Optional batch ID for grouping (default: generated)
+            changed_by: Who made the change, for the audit trail
+            import_type: import_batches.import_type label (e.g. 'stories'
+                for a direct story import)
+
+        RETURNS:
+            Dict[str, Any]: {
+                'batch_id': str,
+                'requirements' / 'stories' / 'test_cases':
+                    {'inserted': int, 'updated': int},
+                'compliance_gaps': int, 'traceability': int,
+                'audit_rows': int,
+                'timings': {step: seconds}, 'total_seconds': float
+            }
+
+        RAISES:
+            sqlite3.Error (or anything else raised mid-save), after rolling
+            back - nothing from the run is left in the database.
+
+        WHY THIS APPROACH:
+            Records point at each other by the IDs the generators gave them,
+            which aren't always the IDs they're stored under (see
+            requirement_db_id). References are resolved here - against this
+            run first, then the database - and one that resolves to nothing
+            is stored as NULL rather than failing a foreign key and losing
+            the whole run. Compliance tests name the requirement they cover
+            in source_story_id, so they're linked to that requirement's
+            first story.
+
+            Inserts, updates, version bumps and audit entries match the
+            individual save_* methods, so a program saved either way looks
+            the same.
+        """
+        conn = self.get_connection()
+        batch_id = batch_id or str(uuid.uuid4())[:8]
+        requirements = requirements or []
+        stories = stories or []
+        test_cases = test_cases or []
+        compliance_gaps = compliance_gaps or []
+        matrix = (traceability_matrix or {}).get('matrix', [])
+
+        summary: Dict[str, Any] = {'batch_id': batch_id}
+        timings: Dict[str, float] = {}
+        audit_rows = []
+        run_start = step_start = time.perf_counter()
+
+        def lap(step: str) -> None:
+            nonlocal step_start
+            now = time.perf_counter()
+            timings[step] = round(now - step_start, 4)
+            step_start = now
+
+        def audit(record_type, record_id, action, field=None, old_val=None, new_val=None):
+            audit_rows.append((record_type, record_id, action, field, old_val,
+                               new_val, changed_by, None, self._session_id))
+
+        def join_lines(value, sep='\n'):
+            return sep.join(value) if isinstance(value, list) else str(value)
+
+        def story_source(story: Dict) -> Dict:
+            source = story.get('source_requirement') or {}
+            return source if isinstance(source, dict) else {}
+
+        # Anything still pending on this connection belongs to an earlier
+        # call - settle it so this run's BEGIN starts clean
+        if conn.in_transaction:
+            conn.commit()
+
+        try:
+            # Take the write lock now, not at the first INSERT, so another
+            # writer can't slip in between the lookups and the writes
+            conn.execute("BEGIN IMMEDIATE")
+
+            # ================================================================
+            # LOOKUPS: existing records and reference resolution
+            # ================================================================
+            req_ids = [self.requirement_db_id(program_id, req) for req in requirements]
+            story_ids = [story.get('story_id', story.get('generated_id')) for story in stories]
+            test_ids = [test.get('test_id') for test in test_cases]
+
+            existing_reqs = self._fetch_existing('requirements', 'requirement_id', req_ids)
+            existing_stories = self._fetch_existing('user_stories', 'story_id', story_ids,
+                                                    ['version'])
+            existing_tests = self._fetch_existing('uat_test_cases', 'test_id', test_ids)
+
+            # Every name this run uses for a requirement -> its stored ID
+            req_alias = {}
+            req_by_row = {}
+            for req, req_id in zip(requirements, req_ids):
+                row_num = req.get('row_number', 0) or 0
+                aliases = [req_id, req.get('requirement_id')]
+                if req_id != req.get('requirement_id'):
+                    aliases.append(f"REQ-ROW{row_num}")  # Traceability label
+                for alias in aliases:
+                    if alias:
+                        req_alias.setdefault(alias, req_id)
+                if row_num:
+                    req_by_row.setdefault(row_num, req_id)
+
+            # References to requirements saved by earlier runs
+            outside_reqs = [ref for ref in
+                            [story_source(s).get('requirement_id') for s in stories]
+                            + [gap.get('requirement_id') for gap in compliance_gaps]
+                            + [entry.get('requirement_id') for entry in matrix]
+                            if ref and ref not in req_alias]
+            for ref in self._fetch_existing('requirements', 'requirement_id', outside_reqs):
+                req_alias[ref] = ref
+
+            def resolve_requirement(ref, row_num=None):
+                if ref:
+                    return req_alias.get(ref)
+                return req_by_row.get(row_num)
+
+            known_stories = set(story_ids)
+            first_story_by_req = {}
+            for story, story_id in zip(stories, story_ids):
+                source = story_source(story)
+                req_id = resolve_requirement(source.get('requirement_id'), source.get('row_number'))
+                if req_id and story_id:
+                    first_story_by_req.setdefault(req_id, story_id)
+
+            outside_stories = [ref for ref in
+                               [test.get('source_story_id') for test in test_cases]
+                               + [gap.get('story_id') for gap in compliance_gaps]
+                               + [entry.get('user_story_id') for entry in matrix]
+                               if ref and ref not in known_stories and ref not in req_alias]
+            known_stories.update(self._fetch_existing('user_stories', 'story_id', outside_stories))
+
+            def resolve_story(ref):
+                if not ref:
+                    return None
+                if ref in known_stories:
+                    return ref
+                if ref in req_alias:
+                    return first_story_by_req.get(req_alias[ref])
+                return None
+
+            lap('lookup')
+
+            # ================================================================
+            # IMPORT BATCH (first, so records can reference it)
+            # ================================================================
+            conn.execute("""
+                INSERT INTO import_batches
+                (batch_id, program_id, source_file, import_type, imported_by)
+                VALUES (?, ?, ?, ?, ?)
+            """, (batch_id, program_id, source_file or '', import_type, changed_by))
+
+            # ================================================================
+            # REQUIREMENTS
+            # ================================================================
+            inserts, updates = [], []
+            stored = set(existing_reqs)
+            for req, req_id in zip(requirements, req_ids):
+                fields = (
+                    req.get('raw_text', req.get('description', '')),
+                    req.get('title', ''),
+                    req.get('description', ''),
+                    req.get('priority', 'Medium'),
+                    req.get('status', ''),
+                    req.get('type', req.get('requirement_type', '')),
+                    json.dumps(req.get('context_columns', {})),
+                )
+                if req_id in stored:
+                    updates.append(fields + (req_id,))
+                    audit('requirement', req_id, 'Updated',
+                          new_val=f"Re-imported from {source_file}")
+                else:
+                    stored.add(req_id)
+                    inserts.append((req_id, program_id, source_file,
+                                    req.get('row_number', 0)) + fields + (batch_id,))
+                    audit('requirement', req_id, 'Created',
+                          new_val=f"Imported from {source_file}")
+
+            conn.executemany("""
+                INSERT INTO requirements
+                (requirement_id, program_id, source_file, source_row,
+                 raw_text, title, description, priority, source_status,
+                 requirement_type, context_json, import_batch)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, inserts)
+            conn.executemany("""
+                UPDATE requirements SET
+                    raw_text = ?, title = ?, description = ?, priority = ?,
+                    source_status = ?, requirement_type = ?, context_json = ?,
+                    updated_date = CURRENT_TIMESTAMP
+                WHERE requirement_id = ?
+            """, updates)
+            summary['requirements'] = {'inserted': len(inserts), 'updated': len(updates)}
+            lap('requirements')
+
+            # ================================================================
+            # USER STORIES (updates bump the version)
+            # ================================================================
+            inserts, updates = [], []
+            versions = {sid: row['version'] for sid, row in existing_stories.items()}
+            for story, story_id in zip(stories, story_ids):
+                fields = (
+                    story.get('title', ''),
+                    story.get('user_story', ''),
+                    story.get('role', ''),
+                    story.get('capability', ''),
+                    story.get('benefit', ''),
+                    join_lines(story.get('acceptance_criteria', [])),
+                    story.get('success_metrics', ''),
+                    story.get('priority', 'Medium'),
+                    story.get('category_abbrev', story.get('category', '')),
+                    story.get('category_full', ''),
+                    1 if story.get('is_technical', True) else 0,
+                    join_lines(story.get('flags', []), ','),
+                )
+                if story_id in versions:
+                    old_version = versions[story_id]
+                    versions[story_id] = old_version + 1
+                    updates.append(fields + (old_version + 1, story_id))
+                    audit('user_story', story_id, 'Updated', field='version',
+                          old_val=str(old_version), new_val=str(old_version + 1))
+                else:
+                    versions[story_id] = 1
+                    source = story_source(story)
+                    req_id = resolve_requirement(source.get('requirement_id'),
+                                                 source.get('row_number'))
+                    inserts.append((story_id, req_id, program_id) + fields)
+                    audit('user_story', story_id, 'Created',
+                          new_val=f"Story: {story.get('title', '')[:50]}")
+
+            conn.executemany("""
+                INSERT INTO user_stories
+                (story_id, requirement_id, program_id, title, user_story,
+                 role, capability, benefit, acceptance_criteria,
+                 success_metrics, priority, category, category_full,
+                 is_technical, flags, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'Draft')
+            """, inserts)
+            conn.executemany("""
+                UPDATE user_stories SET
+                    title = ?, user_story = ?, role = ?, capability = ?,
+                    benefit = ?, acceptance_criteria = ?, success_metrics = ?,
+                    priority = ?, category = ?, category_full = ?,
+                    is_technical = ?, flags = ?, version = ?,
+                    updated_date = CURRENT_TIMESTAMP
+                WHERE story_id = ?
+            """, updates)
+            summary['stories'] = {'inserted': len(inserts), 'updated': len(updates)}
+            lap('stories')
+
+            # ================================================================
+            # TEST CASES (UAT and compliance)
+            # ================================================================
+            inserts, updates = [], []
+            stored = set(existing_tests)
+            for test, test_id in zip(test_cases, test_ids):
+                fields = (
+                    test.get('title', ''),
+                    test.get('category', ''),
+                    test.get('test_type', ''),
+                    join_lines(test.get('prerequisites', [])),
+                    join_lines(test.get('test_steps', [])),
+                    join_lines(test.get('expected_results', [])),
+                    test.get('moscow', test.get('priority', '')),
+                    test.get('est_time', test.get('estimated_time', '')),
+                    test.get('compliance_framework'),
+                    test.get('notes', ''),
+                )
+                if test_id in stored:
+                    updates.append(fields + (test_id,))
+                else:
+                    stored.add(test_id)
+                    inserts.append((test_id, resolve_story(test.get('source_story_id')),
+                                    program_id) + fields)
+                    audit('test_case', test_id, 'Created',
+                          new_val=f"Test: {test.get('title', '')[:50]}")
+
+            conn.executemany("""
+                INSERT INTO uat_test_cases
+                (test_id, story_id, program_id, title, category, test_type,
+                 prerequisites, test_steps, expected_results, priority,
+                 estimated_time, compliance_framework, notes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, inserts)
+            conn.executemany("""
+                UPDATE uat_test_cases SET
+                    title = ?, category = ?, test_type = ?, prerequisites = ?,
+                    test_steps = ?, expected_results = ?, priority = ?,
+                    estimated_time = ?, compliance_framework = ?, notes = ?,
+                    updated_date = CURRENT_TIMESTAMP
+                WHERE test_id = ?
+            """, updates)
+            summary['test_cases'] = {'inserted': len(inserts), 'updated': len(updates)}
+            lap('test_cases')
+
+            # ================================================================
+            # COMPLIANCE GAPS
+            # ================================================================
+            conn.executemany("""
+                INSERT INTO compliance_gaps
+                (requirement_id, story_id, program_id, framework, control_id,
+                 category, gap_description, recommendation, severity)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(
+                resolve_requirement(gap.get('requirement_id')),
+                resolve_story(gap.get('story_id')),
+                program_id,
+                gap.get('framework', ''),
+                gap.get('control_id', ''),
+                gap.get('category', ''),
+                gap.get('description', gap.get('gap_description', '')),
+                gap.get('recommendation', ''),
+                gap.get('severity', 'Medium'),
+            ) for gap in compliance_gaps])
+            summary['compliance_gaps'] = len(compliance_gaps)
+            lap('compliance_gaps')
+
+            # ================================================================
+            # TRACEABILITY (replaces the program's matrix)
+            # ================================================================
+            summary['traceability'] = 0
+            if traceability_matrix is not None:
+                conn.execute("DELETE FROM traceability WHERE program_id = ?", (program_id,))
+                conn.executemany("""
+                    INSERT INTO traceability
+                    (program_id, requirement_id, story_id, coverage_status,
+                     gap_notes, compliance_coverage)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [(
+                    program_id,
+                    resolve_requirement(entry.get('requirement_id')),
+                    resolve_story(entry.get('user_story_id')),
+                    entry.get('coverage_status', 'None'),
+                    '\n'.join(entry.get('gaps', [])),
+                    ','.join(entry.get('compliance_coverage', [])),
+                ) for entry in matrix])
+                summary['traceability'] = len(matrix)
+                audit('traceability', program_id, 'Updated',
+                      new_val=f"Saved {len(matrix)} traceability records")
+            lap('traceability')
+
+            # ================================================================
+            # IMPORT BATCH TOTALS + AUDIT TRAIL
+            # ================================================================
+            counted = [summary[key] for key in ('requirements', 'stories', 'test_cases')]
+            conn.execute("""
+                UPDATE import_batches SET
+                    records_imported = ?, records_updated = ?, notes = ?
+                WHERE batch_id = ?
+            """, (
+                sum(c['inserted'] for c in counted),
+                sum(c['updated'] for c in counted),
+                f"{len(requirements)} requirements, {len(stories)} stories, "
+                f"{len(test_cases)} test cases, {len(compliance_gaps)} gaps, "
+                f"{summary['traceability']} traceability rows",
+                batch_id
+            ))
+
+            conn.executemany("""
+                INSERT INTO audit_history
+                (record_type, record_id, action, field_changed, old_value,
+                 new_value, changed_by, change_reason, session_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, audit_rows)
+            summary['audit_rows'] = len(audit_rows)
+            lap('audit')
+
+            conn.commit()
+            lap('commit')
+
+        except BaseException:
+            # Includes KeyboardInterrupt: a half-written run is never kept
+            conn.rollback()
+            raise
+
+        summary['timings'] = timings
+        summary['total_seconds'] = round(time.perf_counter() - run_start, 4)
+        return summary
+
+    # ========================================================================
+    # PROGRAM STATISTICS (materialised counts)
+    # ========================================================================
+    # WHY: Dashboard queries (get_program_summary, get_coverage_summary,
+    # queries.get_program_health_score, ...) each ran several GROUP BY scans
+    # over the largest tables, and a dashboard calls many of them per program.
+    # The program_stats table (schema.sql) holds those counts already
+    # grouped. Triggers on the source tables keep it current on every insert,
+    # update and delete - whichever code path makes the change - so readers
+    # only fetch one program's few dozen rows.
+    #
+    # AVIATION ANALOGY:
+    #     Like a fuel totaliser: instead of dipping every tank before each
+    #     decision, the gauge is updated continuously as fuel flows - and
+    #     you still cross-check it against the dipsticks now and then
+    #     (check_program_stats).
+
+    # metric -> (source table, dim1 column, dim2 column)
+    PROGRAM_STATS_SOURCES = {
+        'requirements': ('requirements', None, None),
+        'stories': ('user_stories', 'status', None),
+        'tests': ('uat_test_cases', 'test_type', 'test_status'),
+        'gaps': ('compliance_gaps', 'severity', 'status'),
+        'coverage': ('traceability', 'coverage_status', None),
+    }
+
+    # How a NULL source value is stored (dimensions are part of the key)
+    STATS_NULL = '(null)'
+
+    def _stats_dim_sql(self, row: str, column: Optional[str]) -> str:
+        """SQL for one dimension value of NEW/OLD (or a table alias)."""
+        if column is None:
+            return "''"
+        return f"COALESCE({row}.{column}, '{self.STATS_NULL}')"
+
+    def _program_stats_trigger_sql(self) -> str:
+        """
+        PURPOSE:
+            Build the CREATE TRIGGER statements that maintain program_stats.
+
+        RETURNS:
+            str: SQL script (three triggers per source table)
+
+        WHY THIS APPROACH:
+            Generated from PROGRAM_STATS_SOURCES so the triggers, the rebuild
+            and the consistency check can't disagree about what is counted.
+            An UPDATE only fires when program_id or a counted column
+            actually changes, so editing a story's title costs nothing.
+        """
+        statements = []
+
+        for metric, (table, dim1, dim2) in self.PROGRAM_STATS_SOURCES.items():
+            def add(row):
+                return f"""
+                    INSERT INTO program_stats (program_id, metric, dim1, dim2, record_count)
+                    VALUES ({row}.program_id, '{metric}', {self._stats_dim_sql(row, dim1)},
+                            {self._stats_dim_sql(row, dim2)}, 1)
+                    ON CONFLICT (program_id, metric, dim1, dim2)
+                    DO UPDATE SET record_count = record_count + 1;"""
+
+            def remove(row):
+                match = (f"program_id = {row}.program_id AND metric = '{metric}' "
+                         f"AND dim1 = {self._stats_dim_sql(row, dim1)} "
+                         f"AND dim2 = {self._stats_dim_sql(row, dim2)}")
+                return f"""
+                    UPDATE program_stats SET record_count = record_count - 1
+                    WHERE {match};
+                    DELETE FROM program_stats WHERE {match} AND record_count <= 0;"""
+
+            columns = ['program_id'] + [c for c in (dim1, dim2) if c]
+            changed = " OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in columns)
+
+            statements.append(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_program_stats_{metric}_insert
+                AFTER INSERT ON {table}
+                BEGIN{add('NEW')}
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_program_stats_{metric}_delete
+                AFTER DELETE ON {table}
+                BEGIN{remove('OLD')}
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_program_stats_{metric}_update
+                AFTER UPDATE OF {', '.join(columns)} ON {table}
+                WHEN {changed}
+                BEGIN{remove('OLD')}{add('NEW')}
+                END;
+            """)
+
+        return "\n".join(statements)
+
+    def _ensure_program_stats(self):
+        """
+        PURPOSE:
+            Create the program_stats triggers, and fill the table the first
+            time it is used on a database that already has data.
+        """
+        conn = self.get_connection()
+        conn.executescript(self._program_stats_trigger_sql())
+
+        has_stats = conn.execute("SELECT EXISTS (SELECT 1 FROM program_stats)").fetchone()[0]
+        if not has_stats:
+            has_data = any(
+                conn.execute(f"SELECT EXISTS (SELECT 1 FROM {table})").fetchone()[0]
+                for table, _, _ in self.PROGRAM_STATS_SOURCES.values()
+            )
+            if has_data:
+                self.rebuild_program_stats()
+
+    def _program_stats_source_sql(self, metric: str, program_id: Optional[str]) -> Tuple[str, list]:
+        """SELECT that computes one metric's counts from its source table."""
+        table, dim1, dim2 = self.PROGRAM_STATS_SOURCES[metric]
+        sql = f"""
+            SELECT program_id, '{metric}', {self._stats_dim_sql(table, dim1)} AS d1,
+                   {self._stats_dim_sql(table, dim2)} AS d2, COUNT(*)
+            FROM {table}
+        """
+        params = []
+        if program_id:
+            sql += " WHERE program_id = ?"
+            params.append(program_id)
+        sql += " GROUP BY program_id, d1, d2"
+        return sql, params
+
+    def rebuild_program_stats(self, program_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        PURPOSE:
+            Recompute program_stats from the source tables.
+
+        PARAMETERS:
+            program_id: Rebuild one program (default: all programs)
+
+        RETURNS:
+            Dict: {'rows': stats rows written, 'programs': programs covered,
+                   'seconds': elapsed}
+
+        WHY THIS APPROACH:
+            One transaction: readers see the old counts or the new ones,
+            never a half-rebuilt table. Use it after restoring a backup,
+            bulk-editing with an outside tool, or when check_program_stats()
+            reports drift.
+        """
+        conn = self.get_connection()
+        start = time.perf_counter()
+
+        if conn.in_transaction:
+            conn.commit()
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            if program_id:
+                conn.execute("DELETE FROM program_stats WHERE program_id = ?", (program_id,))
+            else:
+                conn.execute("DELETE FROM program_stats")
+
+            for metric in self.PROGRAM_STATS_SOURCES:
+                sql, params = self._program_stats_source_sql(metric, program_id)
+                conn.execute(f"""
+                    INSERT INTO program_stats (program_id, metric, dim1, dim2, record_count)
+                    {sql}
+                """, params)
+
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        query = "SELECT COUNT(*), COUNT(DISTINCT program_id) FROM program_stats"
+        params = []
+        if program_id:
+            query += " WHERE program_id = ?"
+            params.append(program_id)
+        rows, programs = conn.execute(query, params).fetchone()
+
+        return {
+            'rows': rows,
+            'programs': programs,
+            'seconds': round(time.perf_counter() - start, 4)
+        }
+
+    def check_program_stats(self, program_id: Optional[str] = None) -> List[Dict]:
+        """
+        PURPOSE:
+            Compare program_stats with counts computed from the source tables.
+
+        PARAMETERS:
+            program_id: Check one program (default: all programs)
+
+        RETURNS:
+            List[Dict]: One entry per mismatch - program_id, metric, dim1,
+                dim2, stored, actual. Empty when everything agrees.
+        """
+        conn = self.get_connection()
+
+        actual = {}
+        for metric in self.PROGRAM_STATS_SOURCES:
+            sql, params = self._program_stats_source_sql(metric, program_id)
+            for row in conn.execute(sql, params).fetchall():
+                actual[tuple(row[:4])] = row[4]
+
+        query = "SELECT program_id, metric, dim1, dim2, record_count FROM program_stats"
+        params = []
+        if program_id:
+            query += " WHERE program_id = ?"
+            params.append(program_id)
+        stored = {tuple(row[:4]): row[4] for row in conn.execute(query, params).fetchall()}
+
+        mismatches = []
+        for key in sorted(set(actual) | set(stored)):
+            if actual.get(key, 0) != stored.get(key, 0):
+                mismatches.append({
+                    'program_id': key[0],
+                    'metric': key[1],
+                    'dim1': key[2],
+                    'dim2': key[3],
+                    'stored': stored.get(key, 0),
+                    'actual': actual.get(key, 0),
+                })
+
+        return mismatches
+
+    def get_program_stats(self, program_id: str) -> Dict[str, Any]:
+        """
+        PURPOSE:
+            Read one program's materialised counts.
+
+        RETURNS:
+            Dict: {
+                'requirements': int,
+                'stories': {status: count},
+                'tests': {(test_type, test_status): count},
+                'gaps': {(severity, status): count},
+                'coverage': {coverage_status: count}
+            }
+            NULL source values come back as None, as they would from a
+            GROUP BY on the source table.
+        """
+        conn = self.get_connection()
+        cursor = conn.execute("""
+            SELECT metric, dim1, dim2, record_count
+            FROM program_stats
+            WHERE program_id = ?
+            ORDER BY metric, dim1, dim2
+        """, (program_id,))
+
+        def decode(value):
+            return None if value == self.STATS_NULL else value
+
+        stats: Dict[str, Any] = {'requirements': 0}
+        for metric, (_, dim1, dim2) in self.PROGRAM_STATS_SOURCES.items():
+            if dim1:
+                stats[metric] = {}
+
+        for metric, value1, value2, count in cursor.fetchall():
+            _, dim1, dim2 = self.PROGRAM_STATS_SOURCES[metric]
+            if dim2:
+                stats[metric][(decode(value1), decode(value2))] = count
+            elif dim1:
+                stats[metric][decode(value1)] = count
+            else:
+                stats[metric] = count
+
+        return stats
+
     # ========================================================================
     # REPORTING OPERATIONS
     # ========================================================================
@@ -1390,49 +2477,41 @@ class ClientProductDatabase:
             - tests_by_status
             - compliance_gaps_by_severity
             - coverage_percentage
+
+        WHY THIS APPROACH:
+            Reads the materialised program_stats counts (one indexed lookup)
+            instead of grouping each source table.
         """
-        conn = self.get_connection()
+        stats = self.get_program_stats(program_id)
         summary = {}
 
         # Requirements count
-        cursor = conn.execute(
-            "SELECT COUNT(*) FROM requirements WHERE program_id = ?",
-            (program_id,)
-        )
-        summary['requirement_count'] = cursor.fetchone()[0]
+        summary['requirement_count'] = stats['requirements']
 
         # Stories by status
-        cursor = conn.execute("""
-            SELECT status, COUNT(*) as count
-            FROM user_stories WHERE program_id = ?
-            GROUP BY status
-        """, (program_id,))
-        summary['stories_by_status'] = {row['status']: row['count']
-                                        for row in cursor.fetchall()}
+        summary['stories_by_status'] = dict(stats['stories'])
         summary['story_count'] = sum(summary['stories_by_status'].values())
 
         # Tests by status
-        cursor = conn.execute("""
-            SELECT test_status, COUNT(*) as count
-            FROM uat_test_cases WHERE program_id = ?
-            GROUP BY test_status
-        """, (program_id,))
-        summary['tests_by_status'] = {row['test_status']: row['count']
-                                      for row in cursor.fetchall()}
+        tests_by_status = {}
+        for (_, test_status), count in stats['tests'].items():
+            tests_by_status[test_status] = tests_by_status.get(test_status, 0) + count
+        # Same order as GROUP BY test_status (NULL first)
+        summary['tests_by_status'] = dict(sorted(
+            tests_by_status.items(), key=lambda item: (item[0] is not None, str(item[0]))
+        ))
         summary['test_count'] = sum(summary['tests_by_status'].values())
 
-        # Compliance gaps by severity
-        cursor = conn.execute("""
-            SELECT severity, COUNT(*) as count
-            FROM compliance_gaps
-            WHERE program_id = ? AND status != 'Closed'
-            GROUP BY severity
-        """, (program_id,))
-        summary['open_gaps_by_severity'] = {row['severity']: row['count']
-                                            for row in cursor.fetchall()}
+        # Compliance gaps by severity (status != 'Closed'; NULL status
+        # doesn't count as open, as in SQL)
+        open_gaps = {}
+        for (severity, status), count in stats['gaps'].items():
+            if status is not None and status != 'Closed':
+                open_gaps[severity] = open_gaps.get(severity, 0) + count
+        summary['open_gaps_by_severity'] = open_gaps
 
         # Coverage
-        summary['coverage'] = self.get_coverage_summary(program_id)
+        summary['coverage'] = self.get_coverage_summary(program_id, stats)
 
         return summary
 
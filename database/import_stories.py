@@ -277,6 +277,80 @@ def _generate_story_id(prefix: str, category: str, sequence: int) -> str:
     return f"{prefix.upper()}-{category.upper()}-{sequence:03d}"
 
 
+# ============================================================================
+# NORMALISATION LOOKUP TABLES
+# ============================================================================
+# WHY: Status and priority are matched case-insensitively. Building the
+# lowercase -> canonical tables once turns the per-row scan over every
+# valid value into a single dict lookup.
+
+VALID_STATUSES = ['Draft', 'Internal Review', 'Pending Client Review',
+                  'Approved', 'Needs Discussion', 'Out of Scope']
+VALID_PRIORITIES = ['Critical', 'High', 'Medium', 'Low']
+
+_STATUS_LOOKUP = {status.lower(): status for status in VALID_STATUSES}
+_PRIORITY_LOOKUP = {priority.lower(): priority for priority in VALID_PRIORITIES}
+
+# Trailing "-CATEGORY-SEQ" of a story ID, e.g. PROP-RECRUIT-007 → (RECRUIT, 7)
+_CATEGORY_SEQ_RE = re.compile(r'-([^-]+)-(\d+)$')
+
+
+def _normalize_status(value: Any, default_status: str) -> str:
+    """
+    PURPOSE:
+        Map a status cell to its canonical spelling ('approved' → 'Approved').
+        Blank or unrecognised values fall back to default_status.
+    """
+    if not value:
+        return default_status
+    return _STATUS_LOOKUP.get(str(value).strip().lower(), default_status)
+
+
+def _normalize_priority(value: Any) -> str:
+    """
+    PURPOSE:
+        Map a priority cell to its canonical spelling ('high' → 'High').
+        Blank values become 'Medium'; unrecognised values are kept as written.
+    """
+    if not value:
+        return 'Medium'
+    priority = str(value).strip()
+    return _PRIORITY_LOOKUP.get(priority.lower(), priority)
+
+
+def _build_sequence_index(story_ids) -> Dict[str, int]:
+    """
+    PURPOSE:
+        Find the highest sequence number already used in each category.
+
+    PARAMETERS:
+        story_ids: Iterable of story IDs (existing and/or from the sheet)
+
+    RETURNS:
+        dict: {category: max_sequence}, e.g. {'RECRUIT': 12, 'GEN': 3}
+
+    WHY THIS APPROACH:
+        Auto-generated IDs continue from max + 1 in their category. One pass
+        over the IDs replaces a count-by-substring scan per new category, and
+        using the highest suffix rather than a count never reissues an ID
+        when earlier stories were deleted or numbered with gaps.
+
+    R EQUIVALENT:
+        tapply(as.integer(seq), category, max)
+    """
+    index: Dict[str, int] = {}
+    for story_id in story_ids:
+        if not story_id:
+            continue
+        match = _CATEGORY_SEQ_RE.search(str(story_id).strip())
+        if match:
+            category = match.group(1).upper()
+            sequence = int(match.group(2))
+            if sequence > index.get(category, 0):
+                index[category] = sequence
+    return index
+
+
 def import_stories_from_excel(
     db_manager,
     excel_path: str,
@@ -450,23 +524,29 @@ def import_stories_from_excel(
         return result
 
     # ========================================================================
-    # READ EXCEL FILE
+    # READ EXCEL FILE (one bulk pass)
     # ========================================================================
+    # Read-only mode streams the sheet XML once; rows arrive as plain tuples.
     try:
-        wb = openpyxl.load_workbook(excel_path, data_only=True)
-
-        # Select sheet
-        if sheet_name:
-            if sheet_name not in wb.sheetnames:
-                result['errors'].append(f"Sheet not found: {sheet_name}")
-                return result
-            ws = wb[sheet_name]
-        else:
-            # Use first sheet
-            ws = wb.active
+        wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
 
-        if verbose:
-            print(f"  → Reading sheet: {ws.title}")
+        try:
+            # Select sheet
+            if sheet_name:
+                if sheet_name not in wb.sheetnames:
+                    result['errors'].append(f"Sheet not found: {sheet_name}")
+                    return result
+                ws = wb[sheet_name]
+            else:
+                # Use first sheet
+                ws = wb.active
+
+            if verbose:
+                print(f"  → Reading sheet: {ws.title}")
+
+            rows = list(ws.iter_rows(values_only=True))
+        finally:
+            wb.close()
 
     except Exception as e:
         result['errors'].append(f"Failed to open Excel file: {e}")
@@ -476,9 +556,7 @@ def import_stories_from_excel(
     # MAP COLUMNS
     # ========================================================================
     # Get headers from first row
-    headers = []
-    for cell in ws[1]:
-        headers.append(cell.value if cell.value else '')
+    headers = [value if value else '' for value in (rows[0] if rows else ())]
 
     column_map = _build_column_map(headers)
 
@@ -492,42 +570,67 @@ def import_stories_from_excel(
         result['errors'].append("Required column 'Title' not found in Excel")
         return result
 
+    # Rows can be shorter than the header when trailing cells are empty;
+    # padding once lets every field be a direct index (missing → None)
+    width = len(headers)
+
+    def column(field_name: str):
+        return column_map.get(field_name, width)
+
+    idx_story_id = column('story_id')
+    idx_title = column('title')
+    idx_category = column('category')
+    idx_user_story = column('user_story')
+    idx_role = column('role')
+    idx_ac = column('acceptance_criteria')
+    idx_metrics = column('success_metrics')
+    idx_priority = column('priority')
+    idx_status = column('status')
+    idx_technical = column('is_technical')
+    idx_notes = column('internal_notes')
+    idx_meeting = column('meeting_context')
+    idx_feedback = column('client_feedback')
+    idx_source = column('source_requirement')
+    idx_source_row = column('source_row')
+
+    def text(value: Any, default: str = '') -> str:
+        return str(value).strip() if value else default
+
     # ========================================================================
-    # PROCESS ROWS
+    # SEQUENCE INDEX (once, for auto-generated IDs)
     # ========================================================================
-    # Track sequences by category for auto-generated IDs
-    category_sequences = {}
-
-    # Get existing story IDs to detect updates
-    existing_stories = {
-        s['story_id']: s
-        for s in db_manager.get_stories(program_id, status_filter=None)
+    # Existing IDs plus the explicit IDs in this sheet, so a generated ID
+    # never lands on a story that is being imported alongside it
+    existing_ids = {
+        story_id for (story_id,) in db_manager.iter_stories(
+            program_id, columns=['story_id'], row_mode='tuple'
+        )
     }
+    sheet_ids = [row[idx_story_id] for row in rows[1:]
+                 if idx_story_id < len(row) and row[idx_story_id]]
+    category_sequences = _build_sequence_index(
+        list(existing_ids) + [str(sid).strip() for sid in sheet_ids]
+    )
 
+    # ========================================================================
+    # PROCESS ROWS
+    # ========================================================================
     stories_to_save = []
-    row_num = 1  # Header is row 1
-
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        row_num += 1
+    padding = (None,) * width
 
+    for row_num, row in enumerate(rows[1:], start=2):  # Header is row 1
         # Skip empty rows
         if not any(row):
             continue
 
-        # Helper to get cell value by field name
-        def get_value(field_name: str, default: Any = None) -> Any:
-            if field_name not in column_map:
-                return default
-            idx = column_map[field_name]
-            if idx < len(row):
-                val = row[idx]
-                return val if val is not None else default
-            return default
+        if len(row) < width:
+            row = row + padding[len(row):]
+        row = row + (None,)  # Slot for unmapped fields (index == width)
 
         # ----------------------------------------------------------------
         # Extract core fields
         # ----------------------------------------------------------------
-        title = get_value('title', '')
+        title = row[idx_title]
         if not title or not str(title).strip():
             result['errors'].append(f"Row {row_num}: Missing title (skipped)")
             result['skipped'] += 1
@@ -536,27 +639,13 @@ def import_stories_from_excel(
         title = str(title).strip()
 
         # Story ID (auto-generate if not present)
-        story_id = get_value('story_id', '')
-        category = get_value('category', '')
+        story_id = row[idx_story_id]
+        category = row[idx_category]
 
         if not story_id:
             # Auto-generate story ID
-            if not category:
-                category = 'GEN'
-            else:
-                category = str(category).upper()[:10]
-
-            # Get next sequence for this category
-            if category not in category_sequences:
-                # Count existing stories in this category
-                existing_count = sum(
-                    1 for sid in existing_stories.keys()
-                    if sid and f"-{category}-" in sid
-                )
-                category_sequences[category] = existing_count + 1
-            else:
-                category_sequences[category] += 1
-
+            category = str(category).upper()[:10] if category else 'GEN'
+            category_sequences[category] = category_sequences.get(category, 0) + 1
             story_id = _generate_story_id(prefix, category, category_sequences[category])
 
         else:
@@ -568,44 +657,10 @@ def import_stories_from_excel(
         # ----------------------------------------------------------------
         # Extract other fields
         # ----------------------------------------------------------------
-        user_story = get_value('user_story', '')
-        role = get_value('role', 'user')
-        acceptance_criteria = get_value('acceptance_criteria', '')
-        success_metrics = get_value('success_metrics', '')
-        priority = get_value('priority', 'Medium')
-        status = get_value('status', default_status)
-        is_technical = _parse_is_technical(get_value('is_technical', True))
-        internal_notes = get_value('internal_notes', '')
-        meeting_context = get_value('meeting_context', '')
-        client_feedback = get_value('client_feedback', '')
-        source_requirement = get_value('source_requirement', '')
-        source_row = get_value('source_row', row_num)
-
-        # Normalize status
-        status = str(status).strip() if status else default_status
-        valid_statuses = ['Draft', 'Internal Review', 'Pending Client Review',
-                         'Approved', 'Needs Discussion', 'Out of Scope']
-        if status not in valid_statuses:
-            # Try case-insensitive match
-            status_lower = status.lower()
-            matched = False
-            for vs in valid_statuses:
-                if vs.lower() == status_lower:
-                    status = vs
-                    matched = True
-                    break
-            if not matched:
-                status = default_status
-
-        # Normalize priority
-        priority = str(priority).strip() if priority else 'Medium'
-        valid_priorities = ['Critical', 'High', 'Medium', 'Low']
-        if priority not in valid_priorities:
-            priority_lower = priority.lower()
-            for vp in valid_priorities:
-                if vp.lower() == priority_lower:
-                    priority = vp
-                    break
+        status = _normalize_status(row[idx_status], default_status)
+        source_row = row[idx_source_row]
+        if source_row is None:
+            source_row = row_num
 
         # ----------------------------------------------------------------
         # Build story dict
@@ -614,41 +669,46 @@ def import_stories_from_excel(
             'story_id': story_id,
             'generated_id': story_id,  # Alias for compatibility
             'title': title,
-            'user_story': str(user_story).strip() if user_story else '',
-            'role': str(role).strip() if role else 'user',
-            'acceptance_criteria': str(acceptance_criteria).strip() if acceptance_criteria else '',
-            'success_metrics': str(success_metrics).strip() if success_metrics else '',
-            'priority': priority,
+            'user_story': text(row[idx_user_story]),
+            'role': text(row[idx_role], 'user'),
+            'acceptance_criteria': text(row[idx_ac]),
+            'success_metrics': text(row[idx_metrics]),
+            'priority': _normalize_priority(row[idx_priority]),
             'status': status,
             'category_abbrev': category,
             'category': category,
-            'is_technical': is_technical,
-            'internal_notes': str(internal_notes).strip() if internal_notes else '',
-            'meeting_context': str(meeting_context).strip() if meeting_context else '',
-            'client_feedback': str(client_feedback).strip() if client_feedback else '',
+            'is_technical': _parse_is_technical(row[idx_technical]),
+            'internal_notes': text(row[idx_notes]),
+            'meeting_context': text(row[idx_meeting]),
+            'client_feedback': text(row[idx_feedback]),
             'source_requirement': {
-                'description': str(source_requirement).strip() if source_requirement else '',
+                'description': text(row[idx_source]),
                 'row_number': source_row
             },
             'flags': []  # No flags for imported stories
         }
 
-        # Check if this is an update or insert
-        is_update = story_id in existing_stories
-
         stories_to_save.append(story)
         result['story_ids'].append(story_id)
 
         if verbose:
-            action = "Update" if is_update else "Import"
+            # Check if this is an update or insert
+            action = "Update" if story_id in existing_ids else "Import"
             print(f"      {action}: {story_id} - {title[:40]}...")
 
     # ========================================================================
-    # SAVE TO DATABASE
+    # SAVE TO DATABASE (one batch, one transaction)
     # ========================================================================
     if stories_to_save:
         try:
-            inserted, updated = db_manager.save_user_stories(program_id, stories_to_save)
+            saved = db_manager.persist_run(
+                program_id,
+                stories=stories_to_save,
+                source_file=os.path.basename(excel_path),
+                import_type='stories'
+            )
+            inserted = saved['stories']['inserted']
+            updated = saved['stories']['updated']
             result['imported'] = inserted
             result['updated'] = updated
 
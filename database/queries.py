@@ -43,41 +43,76 @@ def get_client_program_tree(db) -> List[Dict]:
                 ]
             }
         ]
+
+    WHY THIS APPROACH:
+        One query for the whole tree. Counts come from program_stats,
+        pre-aggregated per program in subqueries before the join. Joining
+        user_stories and uat_test_cases directly would pair every story
+        with every test of its program (500 stories x 5,000 tests = 2.5M
+        rows) before COUNT(DISTINCT ...) threw the duplicates away - and
+        did it in one query per client.
+        benchmarks/client_tree.py compares the two on a synthetic database.
     """
     conn = db.get_connection()
 
-    # Get all active clients
-    clients_cursor = conn.execute("""
-        SELECT client_id, name, description, status
-        FROM clients
-        WHERE status = 'Active'
-        ORDER BY name
+    cursor = conn.execute("""
+        SELECT
+            c.client_id,
+            c.name AS client_name,
+            c.description,
+            c.status AS client_status,
+            p.program_id,
+            p.name,
+            p.prefix,
+            p.status,
+            COALESCE(s.story_count, 0) AS story_count,
+            COALESCE(s.approved_count, 0) AS approved_count,
+            COALESCE(t.test_count, 0) AS test_count
+        FROM clients c
+        LEFT JOIN programs p ON p.client_id = c.client_id
+        LEFT JOIN (
+            SELECT
+                program_id,
+                SUM(record_count) AS story_count,
+                SUM(CASE WHEN dim1 = 'Approved' THEN record_count ELSE 0 END) AS approved_count
+            FROM program_stats
+            WHERE metric = 'stories'
+            GROUP BY program_id
+        ) s ON s.program_id = p.program_id
+        LEFT JOIN (
+            SELECT program_id, SUM(record_count) AS test_count
+            FROM program_stats
+            WHERE metric = 'tests'
+            GROUP BY program_id
+        ) t ON t.program_id = p.program_id
+        WHERE c.status = 'Active'
+        ORDER BY c.name, c.client_id, p.name
     """)
 
+    # Rows arrive grouped by client: start a new client whenever it changes
     result = []
-    for client_row in clients_cursor.fetchall():
-        client = dict(client_row)
-
-        # Get programs for this client
-        programs_cursor = conn.execute("""
-            SELECT
-                p.program_id,
-                p.name,
-                p.prefix,
-                p.status,
-                COUNT(DISTINCT s.story_id) as story_count,
-                COUNT(DISTINCT CASE WHEN s.status = 'Approved' THEN s.story_id END) as approved_count,
-                COUNT(DISTINCT t.test_id) as test_count
-            FROM programs p
-            LEFT JOIN user_stories s ON p.program_id = s.program_id
-            LEFT JOIN uat_test_cases t ON p.program_id = t.program_id
-            WHERE p.client_id = ?
-            GROUP BY p.program_id
-            ORDER BY p.name
-        """, (client['client_id'],))
-
-        client['programs'] = [dict(row) for row in programs_cursor.fetchall()]
-        result.append(client)
+    client = None
+    for row in cursor.fetchall():
+        if client is None or client['client_id'] != row['client_id']:
+            client = {
+                'client_id': row['client_id'],
+                'name': row['client_name'],
+                'description': row['description'],
+                'status': row['client_status'],
+                'programs': []
+            }
+            result.append(client)
+
+        if row['program_id'] is not None:  # Client with no programs yet
+            client['programs'].append({
+                'program_id': row['program_id'],
+                'name': row['name'],
+                'prefix': row['prefix'],
+                'status': row['status'],
+                'story_count': row['story_count'],
+                'approved_count': row['approved_count'],
+                'test_count': row['test_count']
+            })
 
     return result
 
@@ -123,12 +158,16 @@ def get_stories_pending_client_review(
     return [dict(row) for row in cursor.fetchall()]
 
 
-def get_approval_pipeline(db, program_id: str) -> Dict:
+def get_approval_pipeline(db, program_id: str, counts_only: bool = False) -> Dict:
     """
     PURPOSE:
         Kanban-style view of story statuses for a program.
         Shows how many stories are in each workflow stage.
 
+    PARAMETERS:
+        counts_only: Return {status: count} from program_stats instead of
+                     story lists (for column headers/badges - no story scan)
+
     RETURNS:
         {
             "Draft": [story1, story2, ...],
@@ -138,6 +177,7 @@ def get_approval_pipeline(db, program_id: str) -> Dict:
             "Needs Discussion": [...],
             "Out of Scope": [...]
         }
+        or, with counts_only, {"Draft": 12, "Internal Review": 3, ...}
     """
     conn = db.get_connection()
 
@@ -150,6 +190,14 @@ def get_approval_pipeline(db, program_id: str) -> Dict:
         'Out of Scope'
     ]
 
+    if counts_only:
+        counts = {status: 0 for status in statuses}
+        for status, count in db.get_program_stats(program_id)['stories'].items():
+            # Unknown statuses go to Draft, as in the full view
+            key = status if status in counts else 'Draft'
+            counts[key] += count
+        return counts
+
     pipeline = {status: [] for status in statuses}
 
     cursor = conn.execute("""
@@ -196,9 +244,11 @@ def get_test_execution_summary(db, program_id: str) -> Dict:
             "pass_rate": 92.3,
             "execution_rate": 58.3
         }
-    """
-    conn = db.get_connection()
 
+    WHY THIS APPROACH:
+        Counts come from the materialised program_stats table (one indexed
+        lookup) instead of two GROUP BY scans of uat_test_cases.
+    """
     summary = {
         'total': 0,
         'by_status': {},
@@ -207,39 +257,32 @@ def get_test_execution_summary(db, program_id: str) -> Dict:
         'execution_rate': 0
     }
 
-    # Overall by status
-    cursor = conn.execute("""
-        SELECT test_status, COUNT(*) as count
-        FROM uat_test_cases
-        WHERE program_id = ?
-        GROUP BY test_status
-    """, (program_id,))
+    # program_stats holds (test_type, test_status) -> count
+    tests = db.get_program_stats(program_id)['tests']
 
-    executed = 0
-    passed = 0
-    for row in cursor.fetchall():
-        summary['by_status'][row['test_status']] = row['count']
-        summary['total'] += row['count']
-        if row['test_status'] in ['Pass', 'Fail', 'Blocked']:
-            executed += row['count']
-        if row['test_status'] == 'Pass':
-            passed = row['count']
+    # Overall by status
+    by_status = {}
+    for (_, test_status), count in tests.items():
+        by_status[test_status] = by_status.get(test_status, 0) + count
+    # Same order as GROUP BY test_status (NULL first)
+    summary['by_status'] = dict(sorted(
+        by_status.items(), key=lambda item: (item[0] is not None, str(item[0]))
+    ))
+    summary['total'] = sum(by_status.values())
+
+    executed = sum(count for status, count in by_status.items()
+                   if status in ['Pass', 'Fail', 'Blocked'])
+    passed = by_status.get('Pass', 0)
 
     # By test type
-    cursor = conn.execute("""
-        SELECT test_type, test_status, COUNT(*) as count
-        FROM uat_test_cases
-        WHERE program_id = ?
-        GROUP BY test_type, test_status
-    """, (program_id,))
-
-    for row in cursor.fetchall():
-        test_type = row['test_type'] or 'unknown'
+    for (test_type, test_status), count in tests.items():
+        test_type = test_type or 'unknown'
         if test_type not in summary['by_type']:
             summary['by_type'][test_type] = {'total': 0}
 
-        summary['by_type'][test_type][row['test_status']] = row['count']
-        summary['by_type'][test_type]['total'] += row['count']
+        type_counts = summary['by_type'][test_type]
+        type_counts[test_status] = type_counts.get(test_status, 0) + count
+        type_counts['total'] += count
 
     # Calculate rates
     if executed > 0:
@@ -449,9 +492,11 @@ def get_program_health_score(db, program_id: str) -> Dict:
             },
             "recommendations": [...]
         }
-    """
-    conn = db.get_connection()
 
+    WHY THIS APPROACH:
+        All three components are computed from the materialised
+        program_stats counts - one indexed lookup instead of three scans.
+    """
     health = {
         'score': 0,
         'grade': 'F',
@@ -459,15 +504,13 @@ def get_program_health_score(db, program_id: str) -> Dict:
         'recommendations': []
     }
 
+    stats = db.get_program_stats(program_id)
+
     # Story approval rate (weight: 0.3)
-    cursor = conn.execute("""
-        SELECT
-            COUNT(*) as total,
-            COUNT(CASE WHEN status = 'Approved' THEN 1 END) as approved
-        FROM user_stories
-        WHERE program_id = ?
-    """, (program_id,))
-    row = cursor.fetchone()
+    row = {
+        'total': sum(stats['stories'].values()),
+        'approved': stats['stories'].get('Approved', 0),
+    }
     if row['total'] > 0:
         story_score = round(100 * row['approved'] / row['total'])
         if story_score < 50:
@@ -482,15 +525,13 @@ def get_program_health_score(db, program_id: str) -> Dict:
     health['components']['story_approval'] = {'score': story_score, 'weight': 0.3}
 
     # Test pass rate (weight: 0.4)
-    cursor = conn.execute("""
-        SELECT
-            COUNT(*) as total,
-            COUNT(CASE WHEN test_status = 'Pass' THEN 1 END) as passed,
-            COUNT(CASE WHEN test_status IN ('Pass', 'Fail', 'Blocked') THEN 1 END) as executed
-        FROM uat_test_cases
-        WHERE program_id = ?
-    """, (program_id,))
-    row = cursor.fetchone()
+    row = {'total': 0, 'passed': 0, 'executed': 0}
+    for (_, test_status), count in stats['tests'].items():
+        row['total'] += count
+        if test_status == 'Pass':
+            row['passed'] += count
+        if test_status in ('Pass', 'Fail', 'Blocked'):
+            row['executed'] += count
     if row['executed'] > 0:
         test_score = round(100 * row['passed'] / row['executed'])
         if test_score < 80:
@@ -510,16 +551,16 @@ def get_program_health_score(db, program_id: str) -> Dict:
 
     health['components']['test_pass_rate'] = {'score': test_score, 'weight': 0.4}
 
-    # Compliance (weight: 0.3)
-    cursor = conn.execute("""
-        SELECT
-            COUNT(*) as total,
-            COUNT(CASE WHEN severity = 'Critical' THEN 1 END) as critical,
-            COUNT(CASE WHEN severity = 'High' THEN 1 END) as high
-        FROM compliance_gaps
-        WHERE program_id = ? AND status NOT IN ('Closed', 'Accepted')
-    """, (program_id,))
-    row = cursor.fetchone()
+    # Compliance (weight: 0.3) - open gaps: status NOT IN ('Closed', 'Accepted')
+    row = {'total': 0, 'critical': 0, 'high': 0}
+    for (severity, status), count in stats['gaps'].items():
+        if status is None or status in ('Closed', 'Accepted'):
+            continue
+        row['total'] += count
+        if severity == 'Critical':
+            row['critical'] += count
+        elif severity == 'High':
+            row['high'] += count
     if row['total'] == 0:
         compliance_score = 100
     else:
@@ -638,11 +679,15 @@ def export_audit_report(
     placeholders = ','.join(['?' for _ in story_ids + test_ids])
     all_ids = story_ids + test_ids + [program_id]
 
+    # The unary + keeps SQLite from range-scanning idx_audit_date over every
+    # record's changes in the period; looking up each record ID in
+    # idx_audit_record_id reads only this program's rows
+    # (see benchmarks/query_plans.py)
     query = f"""
         SELECT *
         FROM audit_history
         WHERE record_id IN ({placeholders}, ?)
-        AND changed_date BETWEEN ? AND ?
+        AND +changed_date BETWEEN ? AND ?
         ORDER BY changed_date DESC
     """
 
@@ -179,6 +179,30 @@ CREATE TABLE IF NOT EXISTS uat_test_cases (
     defect_id TEXT,          -- Link to defect if failed
     defect_description TEXT,
 
+    -- UAT cycle tracking and tester assignment
+    -- (existing databases: see the ALTER TABLE statements further down)
+    uat_cycle_id TEXT,
+    assigned_to TEXT,
+    assignment_type TEXT,    -- 'primary', 'overlap', 'backup'
+    persona TEXT,            -- 'provider_screening', 'patient', 'provider_dashboard', NULL
+
+    -- NCCN rule validation (all nullable for feature tests)
+    profile_id TEXT,
+    platform TEXT,           -- 'P4M', 'Px4M'
+    change_id TEXT,
+    target_rule TEXT,
+    change_type TEXT,        -- 'NEW', 'MODIFIED', 'DEPRECATED'
+    patient_conditions TEXT,
+    cross_trigger_check TEXT,
+
+    -- Retest tracking and developer feedback
+    retest_status TEXT,
+    retest_date TIMESTAMP,
+    retest_by TEXT,
+    retest_notes TEXT,
+    dev_notes TEXT,
+    dev_status TEXT,
+
     -- Metadata
     notes TEXT,
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -325,7 +349,7 @@ CREATE TABLE IF NOT EXISTS import_batches (
     batch_id TEXT PRIMARY KEY,
     program_id TEXT NOT NULL,
     source_file TEXT NOT NULL,
-    import_type TEXT,          -- requirements, stories, test_cases
+    import_type TEXT,          -- requirements, stories, test_cases, pipeline_run
     records_imported INTEGER,
     records_updated INTEGER,
     records_skipped INTEGER,
@@ -337,6 +361,37 @@ CREATE TABLE IF NOT EXISTS import_batches (
 );
 
 
+-- ============================================================================
+-- PROGRAM STATS TABLE (materialised counts)
+-- ============================================================================
+-- Per-program record counts, kept current by triggers on the source tables,
+-- so dashboard queries read a handful of rows instead of re-scanning and
+-- grouping user_stories, uat_test_cases, compliance_gaps and traceability
+-- on every call.
+--
+-- One row per (program, metric, dimension values):
+--   requirements  -                      -
+--   stories       status                 -
+--   tests         test_type              test_status
+--   gaps          severity               status
+--   coverage      coverage_status        -
+-- Unused dimensions are ''; NULL source values are stored as '(null)'.
+--
+-- The triggers are created from ClientProductDatabase.PROGRAM_STATS_SOURCES
+-- (db_manager.py), which also drives rebuild_program_stats() and
+-- check_program_stats() (run.py --rebuild-stats / --check-stats).
+
+CREATE TABLE IF NOT EXISTS program_stats (
+    program_id TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    dim1 TEXT NOT NULL DEFAULT '',
+    dim2 TEXT NOT NULL DEFAULT '',
+    record_count INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (program_id, metric, dim1, dim2)
+) WITHOUT ROWID;
+
+
 -- ============================================================================
 -- INDEXES
 -- ============================================================================
@@ -348,37 +403,31 @@ CREATE INDEX IF NOT EXISTS idx_programs_prefix ON programs(prefix);
 CREATE INDEX IF NOT EXISTS idx_programs_status ON programs(status);
 
 -- Requirements
-CREATE INDEX IF NOT EXISTS idx_requirements_program ON requirements(program_id);
 CREATE INDEX IF NOT EXISTS idx_requirements_type ON requirements(requirement_type);
 
 -- User Stories
-CREATE INDEX IF NOT EXISTS idx_stories_program ON user_stories(program_id);
 CREATE INDEX IF NOT EXISTS idx_stories_requirement ON user_stories(requirement_id);
 CREATE INDEX IF NOT EXISTS idx_stories_status ON user_stories(status);
 CREATE INDEX IF NOT EXISTS idx_stories_category ON user_stories(category);
 CREATE INDEX IF NOT EXISTS idx_stories_technical ON user_stories(is_technical);
 
 -- UAT Test Cases
-CREATE INDEX IF NOT EXISTS idx_tests_program ON uat_test_cases(program_id);
 CREATE INDEX IF NOT EXISTS idx_tests_story ON uat_test_cases(story_id);
 CREATE INDEX IF NOT EXISTS idx_tests_status ON uat_test_cases(test_status);
 CREATE INDEX IF NOT EXISTS idx_tests_type ON uat_test_cases(test_type);
 CREATE INDEX IF NOT EXISTS idx_tests_compliance ON uat_test_cases(compliance_framework);
 
 -- Traceability
-CREATE INDEX IF NOT EXISTS idx_trace_program ON traceability(program_id);
 CREATE INDEX IF NOT EXISTS idx_trace_requirement ON traceability(requirement_id);
 CREATE INDEX IF NOT EXISTS idx_trace_story ON traceability(story_id);
 CREATE INDEX IF NOT EXISTS idx_trace_coverage ON traceability(coverage_status);
 
 -- Compliance Gaps
-CREATE INDEX IF NOT EXISTS idx_compliance_program ON compliance_gaps(program_id);
 CREATE INDEX IF NOT EXISTS idx_compliance_framework ON compliance_gaps(framework);
 CREATE INDEX IF NOT EXISTS idx_compliance_status ON compliance_gaps(status);
 CREATE INDEX IF NOT EXISTS idx_compliance_severity ON compliance_gaps(severity);
 
 -- Audit History
-CREATE INDEX IF NOT EXISTS idx_audit_record ON audit_history(record_type, record_id);
 CREATE INDEX IF NOT EXISTS idx_audit_date ON audit_history(changed_date);
 CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_history(action);
 CREATE INDEX IF NOT EXISTS idx_audit_session ON audit_history(session_id);
@@ -388,6 +437,66 @@ CREATE INDEX IF NOT EXISTS idx_reference_category ON story_reference(category);
 CREATE INDEX IF NOT EXISTS idx_reference_quality ON story_reference(quality_score);
 
 
+-- ============================================================================
+-- WORKLOAD INDEXES
+-- ============================================================================
+-- Composite, covering and partial indexes for the filter combinations the
+-- query functions actually use, chosen from the EXPLAIN QUERY PLAN report of
+-- benchmarks/query_plans.py (--compare shows each query before and after).
+-- The composites lead with the column the single-column indexes they
+-- replace were on, so those are dropped: they only slowed down writes.
+--
+-- This file runs on every open, so existing databases are migrated the
+-- first time they are opened with this schema.
+
+-- Requirements in source order per program (get_requirements)
+CREATE INDEX IF NOT EXISTS idx_requirements_program_row
+    ON requirements(program_id, source_row);
+
+-- Stories by program and status, already in story_id order
+-- (get_stories / iter_stories status filters, approval pipeline,
+-- stories without tests)
+CREATE INDEX IF NOT EXISTS idx_stories_program_status
+    ON user_stories(program_id, status, story_id);
+
+-- Test cases by program, status and type (get_test_cases filters)
+CREATE INDEX IF NOT EXISTS idx_tests_program_status_type
+    ON uat_test_cases(program_id, test_status, test_type);
+
+-- Traceability rows per program in requirement order (get_traceability_matrix)
+CREATE INDEX IF NOT EXISTS idx_trace_program_requirement
+    ON traceability(program_id, requirement_id);
+
+-- Gaps by program, status and severity (compliance dashboard)
+CREATE INDEX IF NOT EXISTS idx_compliance_program_status
+    ON compliance_gaps(program_id, status, severity);
+
+-- One record's history, already newest first (audit trail)
+CREATE INDEX IF NOT EXISTS idx_audit_record_date
+    ON audit_history(record_type, record_id, changed_date);
+
+-- Program audit reports look records up by ID only, within a date range
+CREATE INDEX IF NOT EXISTS idx_audit_record_id
+    ON audit_history(record_id, changed_date);
+
+-- Recent changes of one record type, newest first
+CREATE INDEX IF NOT EXISTS idx_audit_type_date
+    ON audit_history(record_type, changed_date);
+
+-- Story edits per reviewer; covers the query (audit_id is the rowid)
+CREATE INDEX IF NOT EXISTS idx_audit_story_reviewer
+    ON audit_history(changed_by, record_id, changed_date)
+    WHERE record_type = 'user_story';
+
+-- Superseded by the composites above
+DROP INDEX IF EXISTS idx_requirements_program;
+DROP INDEX IF EXISTS idx_stories_program;
+DROP INDEX IF EXISTS idx_tests_program;
+DROP INDEX IF EXISTS idx_trace_program;
+DROP INDEX IF EXISTS idx_compliance_program;
+DROP INDEX IF EXISTS idx_audit_record;
+
+
 -- ============================================================================
 -- VIEWS
 -- ============================================================================
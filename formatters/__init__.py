@@ -1,10 +1,21 @@
 # formatters/__init__.py
 # Makes this directory a Python package
 # R EQUIVALENT: Like how R packages use NAMESPACE to export functions
+#
+# LAZY LOADING: Formatters are imported on first use, so a markdown-only
+# run never loads openpyxl and nothing loads notion-client unless asked.
 
-from .github_markdown import GitHubMarkdownFormatter, format_for_github
-from .excel_formatter import ExcelFormatter, export_to_excel
-from .notion_formatter import NotionFormatter, export_to_notion
+from lazy_exports import lazy_exports
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "GitHubMarkdownFormatter": ".github_markdown",
+    "format_for_github": ".github_markdown",
+    "ExcelFormatter": ".excel_formatter",
+    "export_to_excel": ".excel_formatter",
+    "NotionFormatter": ".notion_formatter",
+    "export_to_notion": ".notion_formatter",
+}
 
 __all__ = [
     "GitHubMarkdownFormatter",
@@ -14,3 +25,6 @@ __all__ = [
     "NotionFormatter",
     "export_to_notion"
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
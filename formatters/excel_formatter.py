@@ -31,6 +31,12 @@
 #     formatter = ExcelFormatter(output_dir='outputs/excel')
 #     filepath = formatter.export(stories, test_cases)
 #
+#     # Or stream it chunk by chunk (bounded memory, same workbook):
+#     formatter.begin_stream("uat_package.xlsx", trailing_tests=compliance_tests)
+#     for story_chunk, test_chunk in chunks:
+#         formatter.write_chunk(story_chunk, test_chunk)
+#     filepath = formatter.end_stream(traceability_matrix=rtm)
+#
 # ============================================================================
 
 import os
@@ -41,6 +47,7 @@ from typing import Optional
 # WHY: openpyxl is the standard Python library for .xlsx files
 # R EQUIVALENT: Like the openxlsx package in R
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import (
     Font,
     PatternFill,
@@ -50,6 +57,40 @@ from openpyxl.styles import (
 )
 from openpyxl.utils import get_column_letter
 
+# Column headers of the one-record-per-row sheets
+TEST_CASE_HEADERS = [
+    'Test ID',
+    'Source Story',  # NEW: Links back to user story
+    'Category',
+    'Title',
+    'Test Type',
+    'Pre-Requisites',
+    'Test Steps',
+    'Expected Results',
+    'MoSCoW',
+    'Est. Time',
+    'Notes',
+]
+
+USER_STORY_HEADERS = [
+    'Story ID',
+    'Title',
+    'User Story',
+    'Priority',
+    'Role',
+    'Acceptance Criteria',
+    'Quality Flags',
+    'Source Row'
+]
+
+# test_type -> Summary sheet label
+SUMMARY_TEST_TYPES = {
+    'happy_path': 'Happy Path',
+    'negative': 'Negative',
+    'edge_case': 'Edge Case',
+    'boundary': 'Boundary'
+}
+
 
 class ExcelFormatter:
     """
@@ -162,6 +203,13 @@ class ExcelFormatter:
             'Won\'t Have': PatternFill(start_color="CED4DA", end_color="CED4DA", fill_type="solid")
         }
 
+        # Flagged story fill — pale amber for items needing attention
+        self.flag_fill = PatternFill(
+            start_color="FFF3CD",
+            end_color="FFF3CD",
+            fill_type="solid"
+        )
+
         # Data cell style — left aligned with wrap
         self.data_alignment = Alignment(
             horizontal="left",
@@ -300,6 +348,204 @@ class ExcelFormatter:
 
         return filepath
 
+    # ====================================================================
+    # STREAMING (INCREMENTAL) EXPORT
+    # ====================================================================
+
+    def begin_stream(
+        self,
+        filename: str = "uat_package.xlsx",
+        trailing_tests: Optional[list[dict]] = None
+    ) -> None:
+        """
+        PURPOSE:
+            Start an incremental workbook write. Stories and tests arrive in
+            chunks via write_chunk() and the file is saved by end_stream().
+
+        PARAMETERS:
+            filename (str): Output filename. Default: "uat_package.xlsx"
+            trailing_tests (list[dict], optional): Tests that come AFTER all
+                streamed tests in batch order (e.g. compliance tests, which
+                run.py appends to the UAT list). Written at the end of the
+                Test Case Master sheet and counted in the summary.
+
+        RETURNS:
+            None
+
+        WHY THIS APPROACH:
+            openpyxl's write-only mode spools each sheet's rows to a temp
+            file as they are appended, so no row is held in memory once it
+            is written. Its sheets can only be written top to bottom, which
+            is why every sheet here is built with append(): the Summary sheet
+            is created first (so it opens first) but its rows - which depend
+            on every story and test - are appended in end_stream(). Only the
+            summary counters and the flagged-story titles are kept. The
+            sheets match export() cell for cell.
+        """
+        wb = Workbook(write_only=True)
+
+        self._stream = {
+            'workbook': wb,
+            'filename': filename,
+            'trailing_tests': trailing_tests or [],
+            'summary_sheet': self._add_summary_sheet(wb),
+            'test_sheet': self._add_table_sheet(
+                wb, "Test Case Master", TEST_CASE_HEADERS, self.test_case_column_widths
+            ),
+            'story_sheet': self._add_table_sheet(
+                wb, "User Stories", USER_STORY_HEADERS, self.story_column_widths
+            ),
+            'counts': self._new_summary_counts(),
+        }
+
+    def write_chunk(
+        self,
+        user_stories: list[dict],
+        test_cases: list[dict]
+    ) -> None:
+        """
+        PURPOSE:
+            Append one chunk of stories (and the tests generated for them)
+            to the open workbook.
+
+        PARAMETERS:
+            user_stories (list[dict]): Stories in this chunk, in output order
+            test_cases (list[dict]): Tests generated for these stories
+
+        RETURNS:
+            None
+
+        RAISES:
+            RuntimeError: If begin_stream() has not been called
+        """
+        if not getattr(self, '_stream', None):
+            raise RuntimeError("write_chunk() called before begin_stream()")
+
+        state = self._stream
+        counts = state['counts']
+
+        for story in user_stories:
+            self._count_summary_story(counts, story)
+            state['story_sheet'].append(self._user_story_row(state['story_sheet'], story))
+
+        for tc in test_cases:
+            self._count_summary_test(counts, tc)
+            state['test_sheet'].append(self._test_case_row(state['test_sheet'], tc))
+
+    def end_stream(self, traceability_matrix: Optional[dict] = None) -> str:
+        """
+        PURPOSE:
+            Write the trailing tests, the Summary and Traceability Matrix
+            sheets, and save the workbook.
+
+        PARAMETERS:
+            traceability_matrix (dict, optional): RTM from
+                TraceabilityGenerator. If provided, adds a Traceability
+                Matrix sheet.
+
+        RETURNS:
+            str: Path to created file
+        """
+        if not getattr(self, '_stream', None):
+            raise RuntimeError("end_stream() called before begin_stream()")
+
+        state = self._stream
+        self._stream = None
+        counts = state['counts']
+
+        for tc in state['trailing_tests']:
+            self._count_summary_test(counts, tc)
+            state['test_sheet'].append(self._test_case_row(state['test_sheet'], tc))
+
+        self._finish_table_sheet(state['test_sheet'], TEST_CASE_HEADERS, counts['tests'])
+        self._finish_table_sheet(state['story_sheet'], USER_STORY_HEADERS, counts['stories'])
+        self._write_summary(state['summary_sheet'], counts)
+
+        wb = state['workbook']
+        if traceability_matrix:
+            self._create_traceability_sheet(wb, traceability_matrix)
+
+        filepath = os.path.join(self.output_dir, state['filename'])
+        wb.save(filepath)
+
+        return filepath
+
+    # ====================================================================
+    # SHEET BUILDERS
+    # ====================================================================
+    # Every sheet is written row by row with append() so the same code
+    # serves export() and the write-only workbook of the streaming export.
+
+    def _cell(self, ws, value, font=None, fill=None, alignment=None, border=None):
+        """
+        PURPOSE:
+            Build a styled cell for ws.append().
+
+        WHY THIS APPROACH:
+            Write-only sheets can't be styled after a row is written, so
+            styles go on the cell before it is appended. WriteOnlyCell
+            works with ordinary worksheets too.
+        """
+        cell = WriteOnlyCell(ws, value=value)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if alignment:
+            cell.alignment = alignment
+        if border:
+            cell.border = border
+        return cell
+
+    def _new_summary_counts(self) -> dict:
+        """Return zeroed counters for the Summary sheet."""
+        return {
+            'stories': 0,
+            'tests': 0,
+            'priority': {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0},
+            'test_type': {
+                'Happy Path': 0,
+                'Negative': 0,
+                'Edge Case': 0,
+                'Boundary': 0
+            },
+            'moscow': {
+                'Must Have': 0,
+                'Should Have': 0,
+                'Could Have': 0,
+                'Won\'t Have': 0
+            },
+            # (title, flags) for "Items Requiring Attention"
+            'flagged': [],
+        }
+
+    def _count_summary_story(self, counts: dict, story: dict) -> None:
+        """Add one user story to the Summary sheet counters."""
+        counts['stories'] += 1
+
+        priority = story.get('priority', 'Medium')
+        if priority in counts['priority']:
+            counts['priority'][priority] += 1
+
+        if story.get('flags'):
+            counts['flagged'].append((
+                story.get('title', 'Untitled')[:50],
+                ', '.join(story.get('flags', []))
+            ))
+
+    def _count_summary_test(self, counts: dict, tc: dict) -> None:
+        """Add one test case to the Summary sheet counters."""
+        counts['tests'] += 1
+
+        test_type = tc.get('test_type', 'unknown')
+        display_type = SUMMARY_TEST_TYPES.get(test_type, test_type)
+        if display_type in counts['test_type']:
+            counts['test_type'][display_type] += 1
+
+        moscow = tc.get('moscow', 'Should Have')
+        if moscow in counts['moscow']:
+            counts['moscow'][moscow] += 1
+
     def _create_summary_sheet(
         self,
         wb: Workbook,
@@ -319,138 +565,146 @@ class ExcelFormatter:
             Summary sheet provides quick overview for stakeholders.
             Placed first so it's visible when file is opened.
         """
-        # Create the sheet
+        counts = self._new_summary_counts()
+        for story in user_stories:
+            self._count_summary_story(counts, story)
+        for tc in test_cases:
+            self._count_summary_test(counts, tc)
+
+        ws = self._add_summary_sheet(wb)
+        self._write_summary(ws, counts)
+
+    def _add_summary_sheet(self, wb: Workbook):
+        """Create the (empty) Summary sheet and set its column widths."""
         # R EQUIVALENT: addWorksheet(wb, "Summary")
         ws = wb.create_sheet("Summary")
 
+        ws.column_dimensions['A'].width = 35
+        ws.column_dimensions['B'].width = 40
+        ws.column_dimensions['C'].width = 20
+        ws.column_dimensions['D'].width = 20
+
+        return ws
+
+    def _write_summary(self, ws, counts: dict) -> None:
+        """
+        PURPOSE:
+            Write the Summary sheet rows from counters built by
+            _count_summary_story() / _count_summary_test().
+        """
+        section_font = Font(bold=True, size=14)
+
         # ================================================================
         # DOCUMENT HEADER
         # ================================================================
-        ws['A1'] = "UAT Test Package Summary"
-        ws['A1'].font = Font(bold=True, size=16)
-        ws.merge_cells('A1:D1')
+        ws.append([self._cell(ws, "UAT Test Package Summary", font=Font(bold=True, size=16))])
+        ws.merged_cells.add('A1:D1')
+        ws.append([])
 
-        ws['A3'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        ws['A4'] = f"Source: {self.source_file}"
+        ws.append([f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"])
+        ws.append([f"Source: {self.source_file}"])
+        ws.append([])
 
         # ================================================================
         # OVERVIEW COUNTS
         # ================================================================
-        ws['A6'] = "Overview"
-        ws['A6'].font = Font(bold=True, size=14)
-
-        ws['A7'] = "Total User Stories:"
-        ws['B7'] = len(user_stories)
-        ws['A8'] = "Total Test Cases:"
-        ws['B8'] = len(test_cases)
+        ws.append([self._cell(ws, "Overview", font=section_font)])
+        ws.append(["Total User Stories:", counts['stories']])
+        ws.append(["Total Test Cases:", counts['tests']])
+        ws.append([])
 
         # ================================================================
         # PRIORITY BREAKDOWN
         # ================================================================
-        ws['A10'] = "Stories by Priority"
-        ws['A10'].font = Font(bold=True, size=14)
-
-        priority_counts = {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0}
-        for story in user_stories:
-            priority = story.get('priority', 'Medium')
-            if priority in priority_counts:
-                priority_counts[priority] += 1
-
-        row = 11
-        for priority, count in priority_counts.items():
-            ws[f'A{row}'] = priority
-            ws[f'B{row}'] = count
-            if priority in self.priority_fills:
-                ws[f'A{row}'].fill = self.priority_fills[priority]
-            row += 1
+        ws.append([self._cell(ws, "Stories by Priority", font=section_font)])
+        for priority, count in counts['priority'].items():
+            ws.append([self._cell(ws, priority, fill=self.priority_fills.get(priority)), count])
+        ws.append([])
 
         # ================================================================
         # TEST TYPE BREAKDOWN
         # ================================================================
-        ws['A16'] = "Test Cases by Type"
-        ws['A16'].font = Font(bold=True, size=14)
-
-        test_type_counts = {
-            'Happy Path': 0,
-            'Negative': 0,
-            'Edge Case': 0,
-            'Boundary': 0
-        }
-        type_mapping = {
-            'happy_path': 'Happy Path',
-            'negative': 'Negative',
-            'edge_case': 'Edge Case',
-            'boundary': 'Boundary'
-        }
-        for tc in test_cases:
-            test_type = tc.get('test_type', 'unknown')
-            display_type = type_mapping.get(test_type, test_type)
-            if display_type in test_type_counts:
-                test_type_counts[display_type] += 1
-
-        row = 17
-        for test_type, count in test_type_counts.items():
-            ws[f'A{row}'] = test_type
-            ws[f'B{row}'] = count
-            row += 1
+        ws.append([self._cell(ws, "Test Cases by Type", font=section_font)])
+        for test_type, count in counts['test_type'].items():
+            ws.append([test_type, count])
+        ws.append([])
 
         # ================================================================
         # MOSCOW BREAKDOWN
         # ================================================================
-        ws['A22'] = "Test Cases by MoSCoW"
-        ws['A22'].font = Font(bold=True, size=14)
-
-        moscow_counts = {
-            'Must Have': 0,
-            'Should Have': 0,
-            'Could Have': 0,
-            'Won\'t Have': 0
-        }
-        for tc in test_cases:
-            moscow = tc.get('moscow', 'Should Have')
-            if moscow in moscow_counts:
-                moscow_counts[moscow] += 1
-
-        row = 23
-        for moscow, count in moscow_counts.items():
-            ws[f'A{row}'] = moscow
-            ws[f'B{row}'] = count
-            if moscow in self.priority_fills:
-                ws[f'A{row}'].fill = self.priority_fills[moscow]
-            row += 1
+        ws.append([self._cell(ws, "Test Cases by MoSCoW", font=section_font)])
+        for moscow, count in counts['moscow'].items():
+            ws.append([self._cell(ws, moscow, fill=self.priority_fills.get(moscow)), count])
+        ws.append([])
 
         # ================================================================
         # FLAGGED ITEMS
         # ================================================================
-        flagged_stories = [s for s in user_stories if s.get('flags')]
-
-        ws['A28'] = "Items Requiring Attention"
-        ws['A28'].font = Font(bold=True, size=14)
-
-        if flagged_stories:
-            row = 29
-            for story in flagged_stories:
-                title = story.get('title', 'Untitled')[:50]
-                flags = ', '.join(story.get('flags', []))
-                ws[f'A{row}'] = title
-                ws[f'B{row}'] = flags
-                ws[f'A{row}'].fill = PatternFill(
-                    start_color="FFF3CD",
-                    end_color="FFF3CD",
-                    fill_type="solid"
-                )
-                row += 1
+        ws.append([self._cell(ws, "Items Requiring Attention", font=section_font)])
+
+        if counts['flagged']:
+            for title, flags in counts['flagged']:
+                ws.append([self._cell(ws, title, fill=self.flag_fill), flags])
         else:
-            ws['A29'] = "No flagged items - all stories passed quality checks"
-            ws['A29'].font = Font(italic=True, color="666666")
+            ws.append([self._cell(
+                ws, "No flagged items - all stories passed quality checks",
+                font=Font(italic=True, color="666666")
+            )])
+
+    def _add_table_sheet(
+        self,
+        wb: Workbook,
+        title: str,
+        headers: list[str],
+        column_widths: dict
+    ):
+        """
+        PURPOSE:
+            Create a one-record-per-row sheet: column widths, frozen
+            header row and the styled header.
+
+        RETURNS:
+            The worksheet, ready for data rows to be appended
+        """
+        ws = wb.create_sheet(title)
 
         # ================================================================
         # COLUMN WIDTHS
         # ================================================================
-        ws.column_dimensions['A'].width = 35
-        ws.column_dimensions['B'].width = 40
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 20
+        for col_letter, width in column_widths.items():
+            ws.column_dimensions[col_letter].width = width
+
+        # ================================================================
+        # FREEZE HEADER ROW
+        # ================================================================
+        # WHY: Keeps headers visible when scrolling through many rows
+        # R EQUIVALENT: freezePane(wb, "Test Case Master", firstRow = TRUE)
+        ws.freeze_panes = 'A2'
+
+        # ================================================================
+        # HEADER ROW
+        # ================================================================
+        ws.append([
+            self._cell(ws, header, font=self.header_font, fill=self.header_fill,
+                       alignment=self.header_alignment, border=self.cell_border)
+            for header in headers
+        ])
+
+        return ws
+
+    def _finish_table_sheet(self, ws, headers: list[str], row_count: int) -> None:
+        """
+        PURPOSE:
+            Add the auto-filter over the header and row_count data rows.
+
+        WHY: Allows easy filtering by category, type, or priority
+        """
+        ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{row_count + 1}"
+
+    def _data_cell(self, ws, value, fill=None):
+        """A data cell: left aligned, wrapped, thin border."""
+        return self._cell(ws, value, fill=fill,
+                          alignment=self.data_alignment, border=self.cell_border)
 
     def _create_test_case_sheet(
         self,
@@ -469,124 +723,57 @@ class ExcelFormatter:
             This is the main sheet QA teams will use for execution.
             Formatted for easy reading and printing.
         """
-        # Create the sheet
-        ws = wb.create_sheet("Test Case Master")
-
-        # ================================================================
-        # HEADER ROW
-        # ================================================================
-        headers = [
-            'Test ID',
-            'Source Story',  # NEW: Links back to user story
-            'Category',
-            'Title',
-            'Test Type',
-            'Pre-Requisites',
-            'Test Steps',
-            'Expected Results',
-            'MoSCoW',
-            'Est. Time',
-            'Notes',
-        ]
-
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-            cell.border = self.cell_border
-
-        # ================================================================
-        # DATA ROWS
-        # ================================================================
-        for row_idx, tc in enumerate(test_cases, 2):
-            col = 1
-
-            # Test ID (col 1)
-            ws.cell(row=row_idx, column=col, value=tc.get('test_id', 'N/A'))
-            col += 1
-
-            # Source Story (col 2) - NEW
-            ws.cell(row=row_idx, column=col, value=tc.get('source_story_id', 'N/A'))
-            col += 1
-
-            # Category (col 3)
-            ws.cell(row=row_idx, column=col, value=tc.get('category', 'General'))
-            col += 1
-
-            # Title (col 4)
-            ws.cell(row=row_idx, column=col, value=tc.get('title', 'Untitled'))
-            col += 1
-
-            # Test Type (col 5) — with readable format
-            test_type = tc.get('test_type', 'unknown')
-            type_display = {
-                'happy_path': 'Happy Path',
-                'negative': 'Negative',
-                'edge_case': 'Edge Case',
-                'boundary': 'Boundary',
-                'validation': 'Validation',
-            }.get(test_type, test_type.replace('_', ' ').title())
-            ws.cell(row=row_idx, column=col, value=type_display)
-            col += 1
-
-            # Pre-Requisites (col 6) — join list with newlines
-            prereqs = tc.get('prerequisites', [])
-            prereqs_text = '\n'.join([f"• {p}" for p in prereqs])
-            ws.cell(row=row_idx, column=col, value=prereqs_text)
-            col += 1
-
-            # Test Steps (col 7) — already numbered, join with newlines
-            steps = tc.get('test_steps', [])
-            steps_text = '\n'.join(steps)
-            ws.cell(row=row_idx, column=col, value=steps_text)
-            col += 1
-
-            # Expected Results (col 8) — join with newlines
-            expected = tc.get('expected_results', [])
-            expected_text = '\n'.join(expected)
-            ws.cell(row=row_idx, column=col, value=expected_text)
-            col += 1
-
-            # MoSCoW (col 9) — with color coding
-            moscow = tc.get('moscow', 'Should Have')
-            cell = ws.cell(row=row_idx, column=col, value=moscow)
-            if moscow in self.priority_fills:
-                cell.fill = self.priority_fills[moscow]
-            col += 1
-
-            # Est. Time (col 10)
-            ws.cell(row=row_idx, column=col, value=tc.get('est_time', '5 min'))
-            col += 1
-
-            # Notes (col 11)
-            ws.cell(row=row_idx, column=col, value=tc.get('notes', ''))
-            col += 1
-
-            # Apply data formatting to all cells in this row
-            for c in range(1, col):
-                cell = ws.cell(row=row_idx, column=c)
-                cell.alignment = self.data_alignment
-                cell.border = self.cell_border
+        ws = self._add_table_sheet(
+            wb, "Test Case Master", TEST_CASE_HEADERS, self.test_case_column_widths
+        )
 
-        # ================================================================
-        # COLUMN WIDTHS
-        # ================================================================
-        for col_letter, width in self.test_case_column_widths.items():
-            ws.column_dimensions[col_letter].width = width
+        for tc in test_cases:
+            ws.append(self._test_case_row(ws, tc))
 
-        # ================================================================
-        # FREEZE HEADER ROW
-        # ================================================================
-        # WHY: Keeps headers visible when scrolling through many test cases
-        # R EQUIVALENT: freezePane(wb, "Test Case Master", firstRow = TRUE)
-        ws.freeze_panes = 'A2'
+        self._finish_table_sheet(ws, TEST_CASE_HEADERS, len(test_cases))
 
-        # ================================================================
-        # AUTO-FILTER
-        # ================================================================
-        # WHY: Allows easy filtering by category, type, or priority
-        ws.auto_filter.ref = ws.dimensions
+    def _test_case_row(self, ws, tc: dict) -> list:
+        """
+        PURPOSE:
+            Build the Test Case Master cells for one test case, in
+            TEST_CASE_HEADERS order.
+        """
+        # Test Type — with readable format
+        test_type = tc.get('test_type', 'unknown')
+        type_display = {
+            'happy_path': 'Happy Path',
+            'negative': 'Negative',
+            'edge_case': 'Edge Case',
+            'boundary': 'Boundary',
+            'validation': 'Validation',
+        }.get(test_type, test_type.replace('_', ' ').title())
+
+        # Pre-Requisites — join list with newlines
+        prereqs = tc.get('prerequisites', [])
+        prereqs_text = '\n'.join([f"• {p}" for p in prereqs])
+
+        # Test Steps — already numbered, join with newlines
+        steps_text = '\n'.join(tc.get('test_steps', []))
+
+        # Expected Results — join with newlines
+        expected_text = '\n'.join(tc.get('expected_results', []))
+
+        # MoSCoW — with color coding
+        moscow = tc.get('moscow', 'Should Have')
+
+        return [
+            self._data_cell(ws, tc.get('test_id', 'N/A')),
+            self._data_cell(ws, tc.get('source_story_id', 'N/A')),
+            self._data_cell(ws, tc.get('category', 'General')),
+            self._data_cell(ws, tc.get('title', 'Untitled')),
+            self._data_cell(ws, type_display),
+            self._data_cell(ws, prereqs_text),
+            self._data_cell(ws, steps_text),
+            self._data_cell(ws, expected_text),
+            self._data_cell(ws, moscow, fill=self.priority_fills.get(moscow)),
+            self._data_cell(ws, tc.get('est_time', '5 min')),
+            self._data_cell(ws, tc.get('notes', '')),
+        ]
 
     def _create_user_stories_sheet(
         self,
@@ -605,100 +792,52 @@ class ExcelFormatter:
             Provides context for the test cases. QA can reference
             the original story when executing tests.
         """
-        # Create the sheet
-        ws = wb.create_sheet("User Stories")
-
-        # ================================================================
-        # HEADER ROW
-        # ================================================================
-        headers = [
-            'Story ID',
-            'Title',
-            'User Story',
-            'Priority',
-            'Role',
-            'Acceptance Criteria',
-            'Quality Flags',
-            'Source Row'
-        ]
-
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-            cell.border = self.cell_border
+        ws = self._add_table_sheet(
+            wb, "User Stories", USER_STORY_HEADERS, self.story_column_widths
+        )
 
-        # ================================================================
-        # DATA ROWS
-        # ================================================================
-        for row_idx, story in enumerate(user_stories, 2):
-            # Story ID
-            ws.cell(row=row_idx, column=1, value=story.get('generated_id', 'N/A'))
-
-            # Title
-            ws.cell(row=row_idx, column=2, value=story.get('title', 'Untitled'))
-
-            # User Story (full format)
-            ws.cell(row=row_idx, column=3, value=story.get('user_story', 'N/A'))
-
-            # Priority — with color coding
-            priority = story.get('priority', 'Medium')
-            cell = ws.cell(row=row_idx, column=4, value=priority)
-            if priority in self.priority_fills:
-                cell.fill = self.priority_fills[priority]
-
-            # Role
-            ws.cell(row=row_idx, column=5, value=story.get('role', 'user'))
-
-            # Acceptance Criteria — join with newlines
-            criteria = story.get('acceptance_criteria', [])
-            # Clean up bullet prefixes
-            clean_criteria = []
-            for c in criteria:
-                clean = c.strip()
-                if clean.startswith('•'):
-                    clean = clean[1:].strip()
-                clean_criteria.append(f"• {clean}")
-            criteria_text = '\n'.join(clean_criteria)
-            ws.cell(row=row_idx, column=6, value=criteria_text)
-
-            # Quality Flags
-            flags = story.get('flags', [])
-            flags_text = ', '.join(flags) if flags else 'None'
-            cell = ws.cell(row=row_idx, column=7, value=flags_text)
-            if flags:
-                cell.fill = PatternFill(
-                    start_color="FFF3CD",
-                    end_color="FFF3CD",
-                    fill_type="solid"
-                )
-
-            # Source Row
-            source_row = story.get('source_requirement', {}).get('row_number', 'N/A')
-            ws.cell(row=row_idx, column=8, value=source_row)
-
-            # Apply data formatting to all cells in this row
-            for col in range(1, 9):
-                cell = ws.cell(row=row_idx, column=col)
-                cell.alignment = self.data_alignment
-                cell.border = self.cell_border
+        for story in user_stories:
+            ws.append(self._user_story_row(ws, story))
 
-        # ================================================================
-        # COLUMN WIDTHS
-        # ================================================================
-        for col_letter, width in self.story_column_widths.items():
-            ws.column_dimensions[col_letter].width = width
+        self._finish_table_sheet(ws, USER_STORY_HEADERS, len(user_stories))
 
-        # ================================================================
-        # FREEZE HEADER ROW
-        # ================================================================
-        ws.freeze_panes = 'A2'
-
-        # ================================================================
-        # AUTO-FILTER
-        # ================================================================
-        ws.auto_filter.ref = ws.dimensions
+    def _user_story_row(self, ws, story: dict) -> list:
+        """
+        PURPOSE:
+            Build the User Stories cells for one story, in
+            USER_STORY_HEADERS order.
+        """
+        # Priority — with color coding
+        priority = story.get('priority', 'Medium')
+
+        # Acceptance Criteria — join with newlines
+        criteria = story.get('acceptance_criteria', [])
+        # Clean up bullet prefixes
+        clean_criteria = []
+        for c in criteria:
+            clean = c.strip()
+            if clean.startswith('•'):
+                clean = clean[1:].strip()
+            clean_criteria.append(f"• {clean}")
+        criteria_text = '\n'.join(clean_criteria)
+
+        # Quality Flags
+        flags = story.get('flags', [])
+        flags_text = ', '.join(flags) if flags else 'None'
+
+        # Source Row
+        source_row = story.get('source_requirement', {}).get('row_number', 'N/A')
+
+        return [
+            self._data_cell(ws, story.get('generated_id', 'N/A')),
+            self._data_cell(ws, story.get('title', 'Untitled')),
+            self._data_cell(ws, story.get('user_story', 'N/A')),
+            self._data_cell(ws, priority, fill=self.priority_fills.get(priority)),
+            self._data_cell(ws, story.get('role', 'user')),
+            self._data_cell(ws, criteria_text),
+            self._data_cell(ws, flags_text, fill=self.flag_fill if flags else None),
+            self._data_cell(ws, source_row),
+        ]
 
     def _create_traceability_sheet(
         self,
@@ -722,58 +861,63 @@ class ExcelFormatter:
         """
         ws = wb.create_sheet("Traceability Matrix")
 
+        header_row = 11
+        matrix = rtm.get('matrix', [])
+
+        # ================================================================
+        # COLUMN WIDTHS / FREEZE HEADER ROW
+        # ================================================================
+        for col_letter, width in self.rtm_column_widths.items():
+            ws.column_dimensions[col_letter].width = width
+
+        ws.freeze_panes = f'A{header_row + 1}'
+
         # ================================================================
         # COVERAGE SUMMARY SECTION
         # ================================================================
-        ws['A1'] = "Requirements Traceability Matrix"
-        ws['A1'].font = Font(bold=True, size=16)
-        ws.merge_cells('A1:G1')
+        ws.append([self._cell(ws, "Requirements Traceability Matrix", font=Font(bold=True, size=16))])
+        ws.merged_cells.add('A1:G1')
+        ws.append([])
 
         summary = rtm.get('summary', {})
 
-        ws['A3'] = "Coverage Summary"
-        ws['A3'].font = Font(bold=True, size=14)
+        ws.append([self._cell(ws, "Coverage Summary", font=Font(bold=True, size=14))])
 
         # Coverage stats
-        ws['A4'] = "Total Requirements:"
-        ws['B4'] = summary.get('total_requirements', 0)
-        ws['C4'] = "Total Test Cases:"
-        ws['D4'] = summary.get('total_test_cases', 0)
+        ws.append([
+            "Total Requirements:", summary.get('total_requirements', 0),
+            "Total Test Cases:", summary.get('total_test_cases', 0),
+        ])
 
-        ws['A5'] = "Full Coverage:"
         full_count = summary.get('full_coverage_count', 0)
         full_pct = summary.get('full_coverage_pct', 0)
-        ws['B5'] = f"{full_count} ({full_pct}%)"
-        ws['B5'].fill = self.coverage_fills['Full']
-
-        ws['C5'] = "Partial Coverage:"
         partial_count = summary.get('partial_coverage_count', 0)
         partial_pct = summary.get('partial_coverage_pct', 0)
-        ws['D5'] = f"{partial_count} ({partial_pct}%)"
-        ws['D5'].fill = self.coverage_fills['Partial']
-
-        ws['E5'] = "No Coverage:"
         none_count = summary.get('no_coverage_count', 0)
         none_pct = summary.get('no_coverage_pct', 0)
-        ws['F5'] = f"{none_count} ({none_pct}%)"
-        ws['F5'].fill = self.coverage_fills['None']
+        ws.append([
+            "Full Coverage:",
+            self._cell(ws, f"{full_count} ({full_pct}%)", fill=self.coverage_fills['Full']),
+            "Partial Coverage:",
+            self._cell(ws, f"{partial_count} ({partial_pct}%)", fill=self.coverage_fills['Partial']),
+            "No Coverage:",
+            self._cell(ws, f"{none_count} ({none_pct}%)", fill=self.coverage_fills['None']),
+        ])
+        ws.append([])
 
         # Compliance coverage
-        ws['A7'] = "Compliance Test Coverage"
-        ws['A7'].font = Font(bold=True, size=12)
+        ws.append([self._cell(ws, "Compliance Test Coverage", font=Font(bold=True, size=12))])
 
-        compliance = summary.get('compliance_coverage', {})
-        col = 1
-        for framework, stats in compliance.items():
-            ws.cell(row=8, column=col, value=f"{framework}:")
-            ws.cell(row=8, column=col + 1, value=f"{stats.get('tests', 0)} tests")
-            col += 2
+        compliance_row = []
+        for framework, stats in summary.get('compliance_coverage', {}).items():
+            compliance_row.extend([f"{framework}:", f"{stats.get('tests', 0)} tests"])
+        ws.append(compliance_row)
+        ws.append([])
 
         # ================================================================
         # TRACEABILITY MATRIX TABLE
         # ================================================================
-        ws['A10'] = "Detailed Traceability"
-        ws['A10'].font = Font(bold=True, size=14)
+        ws.append([self._cell(ws, "Detailed Traceability", font=Font(bold=True, size=14))])
 
         # Header row
         headers = [
@@ -785,39 +929,26 @@ class ExcelFormatter:
             'Compliance',
             'Status'
         ]
-
-        header_row = 11
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=header_row, column=col, value=header)
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.header_alignment
-            cell.border = self.cell_border
+        ws.append([
+            self._cell(ws, header, font=self.header_font, fill=self.header_fill,
+                       alignment=self.header_alignment, border=self.cell_border)
+            for header in headers
+        ])
 
         # Data rows
-        matrix = rtm.get('matrix', [])
-        for row_idx, row_data in enumerate(matrix, header_row + 1):
-            # Req ID
-            ws.cell(row=row_idx, column=1, value=row_data.get('requirement_id', ''))
-
+        for row_data in matrix:
             # Requirement (truncated)
             req_text = row_data.get('requirement_text', '')
             if len(req_text) > 100:
                 req_text = req_text[:97] + '...'
-            ws.cell(row=row_idx, column=2, value=req_text)
-
-            # Story ID
-            ws.cell(row=row_idx, column=3, value=row_data.get('user_story_id', ''))
 
             # Story Title
             story_title = row_data.get('user_story_title', '')
             if len(story_title) > 50:
                 story_title = story_title[:47] + '...'
-            ws.cell(row=row_idx, column=4, value=story_title)
 
             # Test Cases - show count and first few IDs
             test_ids = row_data.get('test_case_ids', [])
-            test_count = row_data.get('test_case_count', 0)
             if test_ids:
                 # Show first 3 test IDs, then count
                 display_ids = test_ids[:3]
@@ -827,56 +958,48 @@ class ExcelFormatter:
                     test_display = ', '.join(display_ids)
             else:
                 test_display = 'None'
-            ws.cell(row=row_idx, column=5, value=test_display)
 
             # Compliance frameworks
             compliance_coverage = row_data.get('compliance_coverage', [])
             compliance_display = ', '.join(compliance_coverage) if compliance_coverage else 'None'
-            ws.cell(row=row_idx, column=6, value=compliance_display)
 
-            # Status - with color coding
+            # Status - with color coding; uncovered rows get a subtle
+            # colour across the whole row instead
             status = row_data.get('coverage_status', 'None')
-            cell = ws.cell(row=row_idx, column=7, value=status)
-            if status in self.coverage_fills:
-                cell.fill = self.coverage_fills[status]
-
-            # Apply row fill based on status (entire row gets subtle color)
-            for col in range(1, 8):
-                cell = ws.cell(row=row_idx, column=col)
-                cell.alignment = self.data_alignment
-                cell.border = self.cell_border
-                # Apply subtle row coloring
-                if status == 'None':
-                    cell.fill = PatternFill(start_color="FFEEEE", end_color="FFEEEE", fill_type="solid")
-                elif status == 'Partial':
-                    cell.fill = PatternFill(start_color="FFFBEE", end_color="FFFBEE", fill_type="solid")
+            if status == 'None':
+                row_fill = PatternFill(start_color="FFEEEE", end_color="FFEEEE", fill_type="solid")
+                status_fill = row_fill
+            elif status == 'Partial':
+                row_fill = PatternFill(start_color="FFFBEE", end_color="FFFBEE", fill_type="solid")
+                status_fill = row_fill
+            else:
+                row_fill = None
+                status_fill = self.coverage_fills.get(status)
+
+            ws.append([
+                self._data_cell(ws, row_data.get('requirement_id', ''), fill=row_fill),
+                self._data_cell(ws, req_text, fill=row_fill),
+                self._data_cell(ws, row_data.get('user_story_id', ''), fill=row_fill),
+                self._data_cell(ws, story_title, fill=row_fill),
+                self._data_cell(ws, test_display, fill=row_fill),
+                self._data_cell(ws, compliance_display, fill=row_fill),
+                self._data_cell(ws, status, fill=status_fill),
+            ])
 
         # ================================================================
         # GAPS SECTION
         # ================================================================
         gaps = rtm.get('gaps', [])
         if gaps:
-            gaps_start_row = header_row + len(matrix) + 3
-
-            ws.cell(row=gaps_start_row, column=1, value="Identified Gaps")
-            ws.cell(row=gaps_start_row, column=1).font = Font(bold=True, size=14)
-
-            for idx, gap in enumerate(gaps, gaps_start_row + 1):
-                ws.cell(row=idx, column=1, value=gap.get('requirement_id', ''))
-                ws.cell(row=idx, column=2, value=', '.join(gap.get('gaps', [])))
-                ws.cell(row=idx, column=1).fill = self.coverage_fills['None']
-                ws.cell(row=idx, column=2).fill = self.coverage_fills['None']
-
-        # ================================================================
-        # COLUMN WIDTHS
-        # ================================================================
-        for col_letter, width in self.rtm_column_widths.items():
-            ws.column_dimensions[col_letter].width = width
-
-        # ================================================================
-        # FREEZE HEADER ROW
-        # ================================================================
-        ws.freeze_panes = f'A{header_row + 1}'
+            ws.append([])
+            ws.append([])
+            ws.append([self._cell(ws, "Identified Gaps", font=Font(bold=True, size=14))])
+
+            for gap in gaps:
+                ws.append([
+                    self._cell(ws, gap.get('requirement_id', ''), fill=self.coverage_fills['None']),
+                    self._cell(ws, ', '.join(gap.get('gaps', [])), fill=self.coverage_fills['None']),
+                ])
 
         # ================================================================
         # AUTO-FILTER
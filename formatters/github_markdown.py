@@ -30,10 +30,18 @@
 #     formatter = GitHubMarkdownFormatter(output_dir='outputs/github')
 #     formatter.format(stories, test_cases, mode='separate')
 #
+#     # Or stream stories in chunks (single-file output only):
+#     formatter.begin_stream('user_stories.md')
+#     for story_chunk, test_chunk in chunks:
+#         formatter.write_chunk(story_chunk, test_chunk)
+#     filepath = formatter.end_stream()
+#
 # ============================================================================
 
 import os
 import re
+import shutil
+import tempfile
 from datetime import datetime
 from typing import Optional, Literal
 
@@ -218,16 +226,10 @@ class GitHubMarkdownFormatter:
             - Pasting into wiki pages
             - Review before creating individual issues
         """
-        lines = []
-
         # ================================================================
         # DOCUMENT HEADER
         # ================================================================
-        lines.append("# User Stories & UAT Test Cases")
-        lines.append("")
-        lines.append(f"**Generated:** {self.generated_date}")
-        lines.append(f"**Source:** {self.source_file}")
-        lines.append("")
+        lines = self._document_header()
 
         # ================================================================
         # SUMMARY SECTION
@@ -239,16 +241,13 @@ class GitHubMarkdownFormatter:
         # ================================================================
         # TABLE OF CONTENTS
         # ================================================================
-        lines.append("## Table of Contents")
-        lines.append("")
+        toc_lines = []
         for i, story in enumerate(user_stories, 1):
             title = story.get('title', 'Untitled')
             # Create anchor link (GitHub auto-generates anchors from headers)
             anchor = self._create_anchor(title)
-            lines.append(f"{i}. [{title}](#{anchor})")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+            toc_lines.append(f"{i}. [{title}](#{anchor})")
+        lines.extend(self._table_of_contents(toc_lines))
 
         # ================================================================
         # INDIVIDUAL STORIES
@@ -268,6 +267,187 @@ class GitHubMarkdownFormatter:
 
         return filepath
 
+    def _document_header(self) -> list[str]:
+        """Return the title/generated/source lines at the top of a single file."""
+        return [
+            "# User Stories & UAT Test Cases",
+            "",
+            f"**Generated:** {self.generated_date}",
+            f"**Source:** {self.source_file}",
+            "",
+        ]
+
+    def _table_of_contents(self, toc_lines: list[str]) -> list[str]:
+        """Wrap numbered TOC entries with the section header and separator."""
+        lines = ["## Table of Contents", ""]
+        lines.extend(toc_lines)
+        lines.append("")
+        lines.append("---")
+        lines.append("")
+        return lines
+
+    # ====================================================================
+    # STREAMING (INCREMENTAL) SINGLE-FILE OUTPUT
+    # ====================================================================
+
+    def begin_stream(
+        self,
+        filename: str = "user_stories.md",
+        trailing_tests: Optional[list[dict]] = None
+    ) -> None:
+        """
+        PURPOSE:
+            Start an incremental single-file write. Stories arrive in chunks
+            via write_chunk() and the file is finalised by end_stream().
+
+        PARAMETERS:
+            filename (str): Output filename. Default: "user_stories.md"
+            trailing_tests (list[dict], optional): Tests that come AFTER all
+                streamed tests in batch order (e.g. compliance tests, which
+                run.py appends to the UAT list). They are counted in the
+                summary and attached to any story whose ID they reference,
+                exactly as format() would do.
+
+        RETURNS:
+            None
+
+        WHY THIS APPROACH:
+            The summary and table of contents sit above the story sections
+            but depend on every story. We keep only the small pieces they
+            need (counts, TOC lines, flagged lines) and spool the rendered
+            story sections to a temp file, then stitch header + body together
+            at the end. The result is byte-for-byte what format() writes.
+        """
+        self._stream = {
+            'filename': filename,
+            'body': tempfile.TemporaryFile(mode='w+', encoding='utf-8'),
+            'story_count': 0,
+            'test_count': 0,
+            'priority_counts': {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0},
+            'test_type_counts': {
+                'happy_path': 0,
+                'negative': 0,
+                'edge_case': 0,
+                'boundary': 0
+            },
+            'toc_lines': [],
+            'flagged_lines': [],
+            'trailing_index': {},
+        }
+
+        for tc in trailing_tests or []:
+            self._count_stream_test(tc)
+            self._stream['trailing_index'].setdefault(
+                tc.get('source_story_id'), []
+            ).append(tc)
+
+    def write_chunk(
+        self,
+        user_stories: list[dict],
+        test_cases: list[dict]
+    ) -> None:
+        """
+        PURPOSE:
+            Render one chunk of stories (and the tests generated for them)
+            into the open stream.
+
+        PARAMETERS:
+            user_stories (list[dict]): Stories in this chunk, in output order
+            test_cases (list[dict]): Tests generated for these stories
+
+        RETURNS:
+            None
+
+        RAISES:
+            RuntimeError: If begin_stream() has not been called
+        """
+        if not getattr(self, '_stream', None):
+            raise RuntimeError("write_chunk() called before begin_stream()")
+
+        state = self._stream
+
+        # Group this chunk's tests by story, preserving generation order
+        tests_by_story: dict = {}
+        for tc in test_cases:
+            self._count_stream_test(tc)
+            tests_by_story.setdefault(tc.get('source_story_id'), []).append(tc)
+
+        for story in user_stories:
+            state['story_count'] += 1
+
+            priority = story.get('priority', 'Medium')
+            if priority in state['priority_counts']:
+                state['priority_counts'][priority] += 1
+
+            title = story.get('title', 'Untitled')
+            anchor = self._create_anchor(title)
+            state['toc_lines'].append(
+                f"{state['story_count']}. [{title}](#{anchor})"
+            )
+
+            flags = story.get('flags', [])
+            if flags:
+                flag_str = ', '.join([self._describe_flag(f) for f in flags])
+                state['flagged_lines'].append(f"- **{title}**: {flag_str}")
+
+            story_id = story.get('generated_id', '')
+            story_tests = (
+                tests_by_story.get(story_id, [])
+                + state['trailing_index'].get(story_id, [])
+            )
+            story_md = self._format_story(story, story_tests)
+
+            # Each line is written with its leading newline so that the
+            # final file matches "\n".join(header_lines + body_lines)
+            for line in story_md:
+                state['body'].write("\n" + line)
+            state['body'].write("\n")
+
+    def end_stream(self) -> str:
+        """
+        PURPOSE:
+            Write header, summary and TOC, append the spooled story sections
+            and close the stream.
+
+        RETURNS:
+            str: Path to created file
+        """
+        if not getattr(self, '_stream', None):
+            raise RuntimeError("end_stream() called before begin_stream()")
+
+        state = self._stream
+        self._stream = None
+
+        lines = self._document_header()
+        lines.extend(self._render_summary(
+            state['story_count'],
+            state['test_count'],
+            state['priority_counts'],
+            state['test_type_counts'],
+            state['flagged_lines']
+        ))
+        lines.append("")
+        lines.extend(self._table_of_contents(state['toc_lines']))
+
+        filepath = os.path.join(self.output_dir, state['filename'])
+        body = state['body']
+        body.seek(0)
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+            shutil.copyfileobj(body, f)
+
+        body.close()
+        self.stats['files_created'] += 1
+        return filepath
+
+    def _count_stream_test(self, tc: dict) -> None:
+        """Add one test case to the running summary counters."""
+        self._stream['test_count'] += 1
+        test_type = tc.get('test_type', 'unknown')
+        if test_type in self._stream['test_type_counts']:
+            self._stream['test_type_counts'][test_type] += 1
+
     def _format_story_file(
         self,
         story: dict,
@@ -608,6 +788,56 @@ class GitHubMarkdownFormatter:
             Summary gives readers a quick overview before diving into
             details. Priority breakdown helps with planning.
         """
+        priority_counts = {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0}
+        for story in user_stories:
+            priority = story.get('priority', 'Medium')
+            if priority in priority_counts:
+                priority_counts[priority] += 1
+
+        test_type_counts = {
+            'happy_path': 0,
+            'negative': 0,
+            'edge_case': 0,
+            'boundary': 0
+        }
+        for tc in test_cases:
+            test_type = tc.get('test_type', 'unknown')
+            if test_type in test_type_counts:
+                test_type_counts[test_type] += 1
+
+        flagged_lines = []
+        for story in user_stories:
+            flags = story.get('flags', [])
+            if flags:
+                title = story.get('title', 'Untitled')
+                flag_str = ', '.join([self._describe_flag(f) for f in flags])
+                flagged_lines.append(f"- **{title}**: {flag_str}")
+
+        return self._render_summary(
+            len(user_stories),
+            len(test_cases),
+            priority_counts,
+            test_type_counts,
+            flagged_lines
+        )
+
+    def _render_summary(
+        self,
+        story_count: int,
+        test_count: int,
+        priority_counts: dict,
+        test_type_counts: dict,
+        flagged_lines: list[str]
+    ) -> list[str]:
+        """
+        PURPOSE:
+            Render the summary section from pre-computed counters.
+
+        WHY THIS APPROACH:
+            Shared by format() (counts computed from full lists) and the
+            streaming writer (counts accumulated chunk by chunk), so both
+            produce identical summary markdown.
+        """
         lines = []
 
         lines.append("## Summary")
@@ -618,19 +848,13 @@ class GitHubMarkdownFormatter:
         # ================================================================
         lines.append("### Overview")
         lines.append("")
-        lines.append(f"- **Total User Stories:** {len(user_stories)}")
-        lines.append(f"- **Total UAT Test Cases:** {len(test_cases)}")
+        lines.append(f"- **Total User Stories:** {story_count}")
+        lines.append(f"- **Total UAT Test Cases:** {test_count}")
         lines.append("")
 
         # ================================================================
         # PRIORITY BREAKDOWN
         # ================================================================
-        priority_counts = {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0}
-        for story in user_stories:
-            priority = story.get('priority', 'Medium')
-            if priority in priority_counts:
-                priority_counts[priority] += 1
-
         lines.append("### By Priority")
         lines.append("")
         lines.append("| Priority | Count |")
@@ -644,17 +868,6 @@ class GitHubMarkdownFormatter:
         # ================================================================
         # TEST TYPE BREAKDOWN
         # ================================================================
-        test_type_counts = {
-            'happy_path': 0,
-            'negative': 0,
-            'edge_case': 0,
-            'boundary': 0
-        }
-        for tc in test_cases:
-            test_type = tc.get('test_type', 'unknown')
-            if test_type in test_type_counts:
-                test_type_counts[test_type] += 1
-
         lines.append("### Test Coverage")
         lines.append("")
         lines.append("| Test Type | Count |")
@@ -668,15 +881,10 @@ class GitHubMarkdownFormatter:
         # ================================================================
         # FLAGGED ITEMS (requiring attention)
         # ================================================================
-        flagged_stories = [s for s in user_stories if s.get('flags')]
-        if flagged_stories:
+        if flagged_lines:
             lines.append("### ⚠️ Items Requiring Attention")
             lines.append("")
-            for story in flagged_stories:
-                title = story.get('title', 'Untitled')
-                flags = story.get('flags', [])
-                flag_str = ', '.join([self._describe_flag(f) for f in flags])
-                lines.append(f"- **{title}**: {flag_str}")
+            lines.extend(flagged_lines)
             lines.append("")
 
         lines.append("---")
@@ -1,10 +1,19 @@
 # generators/__init__.py
 # Makes this directory a Python package
 # R EQUIVALENT: Like how R packages use NAMESPACE to export functions
+#
+# LAZY LOADING: Generators are imported on first use, so importing one
+# (or a sibling package) doesn't load the rest.
 
-from .user_story_generator import UserStoryGenerator
-from .uat_generator import UATGenerator
-from .traceability_generator import TraceabilityGenerator, generate_traceability_matrix
+from lazy_exports import lazy_exports
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "UserStoryGenerator": ".user_story_generator",
+    "UATGenerator": ".uat_generator",
+    "TraceabilityGenerator": ".traceability_generator",
+    "generate_traceability_matrix": ".traceability_generator",
+}
 
 __all__ = [
     "UserStoryGenerator",
@@ -12,3 +21,6 @@ __all__ = [
     "TraceabilityGenerator",
     "generate_traceability_matrix"
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
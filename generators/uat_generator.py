@@ -149,10 +149,34 @@ class UATGenerator:
         RETURNS:
             list[dict]: List of test case dictionaries
         """
-        all_tests = []
+        all_tests = list(self.iter_generate(user_stories))
+
         self.stats['total_stories_processed'] = len(user_stories)
+        self.stats['total_tests_generated'] = len(all_tests)
+        return all_tests
+
+    def iter_generate(self, user_stories):
+        """
+        PURPOSE:
+            Lazily generate UAT test cases, yielding each story's tests as
+            soon as that story is processed.
+
+        PARAMETERS:
+            user_stories (iterable of dict): User stories - a list, a
+                generator, or one chunk of a larger run. Test IDs keep
+                counting across calls because test_counter lives on the
+                instance, so chunked runs number tests exactly like batch.
 
+        RETURNS:
+            Iterator[dict]: Test case dictionaries in story order
+
+        WHY THIS APPROACH:
+            Lets run.py --stream hand tests to the formatter story by story
+            instead of holding the full test list. generate() wraps this.
+        """
         for story in user_stories:
+            self.stats['total_stories_processed'] += 1
+
             # Skip non-technical items
             if not story.get('is_technical', True):
                 self.stats['non_technical_skipped'] += 1
@@ -162,10 +186,8 @@ class UATGenerator:
 
             # Generate tests from this story's acceptance criteria
             tests = self._generate_tests_for_story(story)
-            all_tests.extend(tests)
-
-        self.stats['total_tests_generated'] = len(all_tests)
-        return all_tests
+            self.stats['total_tests_generated'] += len(tests)
+            yield from tests
 
     def _generate_tests_for_story(self, story: dict) -> list[dict]:
         """
@@ -26,15 +26,242 @@
 
 import re
 import os
+import sys
+import copy
 from pathlib import Path
 from typing import Optional
 from difflib import SequenceMatcher
 
-# YAML for loading config files
+# Config is loaded, validated and compiled once per process by the shared
+# registry (config_registry.py at the repo root)
 try:
-    import yaml
+    from config_registry import ConfigError, get_registry, register_compiler, require, require_str_list
 except ImportError:
-    raise ImportError("PyYAML required. Install with: pip3 install pyyaml")
+    # Run as a script (python generators/user_story_generator.py)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from config_registry import ConfigError, get_registry, register_compiler, require, require_str_list
+
+# Default config directory (flag terms fall back to it when a custom
+# config_dir doesn't provide flag_terms.yaml)
+DEFAULT_CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+# Placeholders in acceptance pattern text. re.split() with this capturing
+# group turns "Loads in {X} seconds" into ['Loads in ', 'X', ' seconds'].
+_PLACEHOLDER_RE = re.compile(
+    r'\{(metric|dimension|patient_status|notification_type|format|'
+    r'time_period|start_stage|end_stage|X|N)\}'
+)
+
+
+class FlagDetector:
+    """
+    PURPOSE:
+        Find every flag-worthy term (vague language, open questions) in a
+        requirement's text with one pass per flag.
+
+    R EQUIVALENT:
+        # pattern <- paste0("(?:", flag_terms$vague_language, ")", collapse = "|")
+        # hits <- regmatches(text, gregexpr(pattern, tolower(text), perl = TRUE))
+
+    WHY THIS APPROACH:
+        The term lists live in config/flag_terms.yaml. Each flag's patterns
+        are compiled into one alternation, once, so a single finditer() per
+        flag replaces one re.search() per pattern. Flags get a regex each -
+        in one shared alternation a match for one flag could consume the
+        text another flag's term needed, and that flag would be missed.
+        Within a flag that can't happen: a match for any of its patterns is
+        enough. Patterns are wrapped as (?:...), never edited, so a top-level
+        | keeps its meaning. When every pattern's first character can be
+        read off it, a lookahead on those characters lets the engine skip
+        ahead instead of trying each branch at every position.
+
+    USAGE:
+        detector = FlagDetector(get_registry().load("config/flag_terms.yaml"))
+        detector.scan("Easy to use, TBD")
+        # {'vague_language': ['easy'], 'needs_clarification': ['tbd']}
+    """
+
+    # Backreferences (\1, (?P=name)) would point at another pattern's group
+    # once a flag's patterns share one regex
+    _GROUP_REFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+    def __init__(self, flag_terms: dict) -> None:
+        """
+        PURPOSE:
+            Compile the flag patterns.
+
+        PARAMETERS:
+            flag_terms (dict): flag name -> {'patterns': [regex, ...]}, as
+                loaded from flag_terms.yaml
+
+        RAISES:
+            ValueError: If a pattern isn't a valid regex or refers to a
+                group (backreferences can't be combined safely)
+        """
+        self.flags: list[str] = []
+        self._regexes: dict[str, re.Pattern] = {}
+
+        for flag, spec in flag_terms.items():
+            self.flags.append(flag)
+            patterns = (spec or {}).get('patterns') or []
+
+            for pattern in patterns:
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"Invalid pattern for flag '{flag}': {pattern!r} ({e})")
+                if self._GROUP_REFERENCE_RE.search(pattern):
+                    raise ValueError(
+                        f"Pattern for flag '{flag}' refers to a group: {pattern!r} "
+                        f"(backreferences aren't supported)"
+                    )
+
+            if not patterns:
+                continue
+
+            combined = "|".join(f"(?:{pattern})" for pattern in patterns)
+            first_chars = {self._first_char(pattern) for pattern in patterns}
+            if None not in first_chars:
+                # Only try the alternation where a term could start
+                charset = "".join(re.escape(c) for c in sorted(first_chars))
+                combined = f"(?=[{charset}])(?:{combined})"
+
+            try:
+                self._regexes[flag] = re.compile(combined)
+            except re.error as e:
+                # e.g. two patterns defining the same named group
+                raise ValueError(f"Patterns for flag '{flag}' can't be combined ({e})")
+
+    @staticmethod
+    def _first_char(pattern: str) -> Optional[str]:
+        """
+        PURPOSE:
+            Return the character every match of a pattern starts with, or
+            None if that can't be read off the pattern simply (alternation,
+            character class, optional first character...). A leading \\b
+            is looked past; the pattern itself is not changed.
+
+        WHY THIS APPROACH:
+            Python's re engine can't skip ahead through an alternation of
+            \\b-anchored groups, so without a hint it tries every pattern at
+            every position. A (?=[...]) lookahead on the possible first
+            characters restores the skipping. When in doubt there's no
+            hint, which is slower but never wrong.
+        """
+        if '|' in pattern:
+            return None
+        body = pattern[2:] if pattern.startswith('\\b') else pattern
+        if len(body) >= 2 and body[0] == '\\' and not body[1].isalnum():
+            first, rest = body[1], body[2:]
+        elif body[:1].isalnum():
+            first, rest = body[0], body[1:]
+        else:
+            return None
+        if rest[:1] in ('?', '*', '{'):
+            return None
+        return first
+
+    def scan(self, text: str) -> dict[str, list[str]]:
+        """
+        PURPOSE:
+            Return the distinct terms found for each flag.
+
+        PARAMETERS:
+            text (str): Text to scan (matched in lowercase)
+
+        RETURNS:
+            dict: flag -> matched terms in order of appearance (empty list
+                if none); every configured flag is present
+        """
+        hits = {flag: [] for flag in self.flags}
+        if not text:
+            return hits
+
+        text_lower = text.lower()
+        for flag, regex in self._regexes.items():
+            terms = hits[flag]
+            for match in regex.finditer(text_lower):
+                term = match.group(0)
+                if term not in terms:
+                    terms.append(term)
+        return hits
+
+
+# ============================================================================
+# CONFIG COMPILERS (see config_registry.py)
+# ============================================================================
+# Each returns the validated YAML plus the structures the generator uses
+# directly. Bump a compiler's version when its output changes shape.
+
+# Keyword detection order for requirement templates: more specific first
+TEMPLATE_PRIORITY = [
+    'recruitment_analytics',  # Very specific
+    'consent_management',
+    'messaging_notifications',
+    'integration',
+    'authentication_access',
+    'workflow_change',
+    'reporting',
+    'search_filter',
+    'admin_settings',
+    'dashboard_reporting',
+    'data_management',
+    'general',  # Fallback last
+]
+
+
+@register_compiler('acceptance_patterns', version=1)
+def _compile_acceptance_patterns(data: dict, path: str) -> dict:
+    """acceptance_patterns.yaml -> {'patterns': ..., 'template_parts': {text: parts}}"""
+    require(isinstance(data, dict), path, "top level must map pattern names to patterns")
+
+    template_parts = {}
+    for name, pattern in data.items():
+        require(isinstance(pattern, dict), path, f"pattern '{name}' must be a mapping")
+        for field in ('testable_statements', 'success_metrics'):
+            require_str_list(pattern.get(field), path, f"{name}.{field}")
+            for text in pattern.get(field) or []:
+                template_parts[text] = _PLACEHOLDER_RE.split(text)
+
+    return {'patterns': data, 'template_parts': template_parts}
+
+
+@register_compiler('requirement_templates', version=1)
+def _compile_requirement_templates(data: dict, path: str) -> dict:
+    """
+    requirement_templates.yaml -> {'templates': ..., 'keyword_index': [...]},
+    keyword_index holding (template name, lowercase keywords) in
+    TEMPLATE_PRIORITY order.
+    """
+    require(isinstance(data, dict), path, "top level must map template names to templates")
+
+    for name, template in data.items():
+        require(isinstance(template, dict), path, f"template '{name}' must be a mapping")
+        for field in ('keywords_to_detect', 'acceptance_patterns', 'typical_roles'):
+            require_str_list(template.get(field), path, f"{name}.{field}")
+        require(isinstance(template.get('category_abbrev', ''), str), path,
+                f"{name}.category_abbrev must be a string")
+
+    keyword_index = [
+        (name, tuple(keyword.lower() for keyword in data[name].get('keywords_to_detect') or []))
+        for name in TEMPLATE_PRIORITY if name in data
+    ]
+    return {'templates': data, 'keyword_index': keyword_index}
+
+
+@register_compiler('flag_terms', version=2)
+def _compile_flag_terms(data: dict, path: str) -> dict:
+    """flag_terms.yaml -> {'terms': ..., 'detector': FlagDetector}"""
+    require(isinstance(data, dict), path, "top level must map flag names to term lists")
+    for flag, spec in data.items():
+        require(isinstance(spec, dict), path, f"flag '{flag}' must be a mapping")
+        require_str_list(spec.get('patterns'), path, f"{flag}.patterns")
+
+    try:
+        detector = FlagDetector(data)
+    except ValueError as e:
+        raise ConfigError(f"{os.path.basename(path)}: {e}")
+    return {'terms': data, 'detector': detector}
 
 
 class UserStoryGenerator:
@@ -109,18 +336,35 @@ class UserStoryGenerator:
             self.config_dir = Path(config_dir)
         else:
             # Default: config/ relative to this file's parent directory
-            self.config_dir = Path(__file__).parent.parent / "config"
+            self.config_dir = DEFAULT_CONFIG_DIR
 
-        # Load configuration files
-        self.acceptance_patterns = self._load_yaml("acceptance_patterns.yaml")
-        self.requirement_templates = self._load_yaml("requirement_templates.yaml")
+        # Load configuration files. The compiled forms come from the shared
+        # config registry (parsed once per process); the public dicts are
+        # copies so one generator can't change another's config.
+        patterns = self._load_config("acceptance_patterns.yaml", 'acceptance_patterns')
+        templates = self._load_config("requirement_templates.yaml", 'requirement_templates')
+        flag_config = self._load_flag_config()
 
-        # Track stories for duplicate detection
-        self._all_stories: list[dict] = []
+        self.acceptance_patterns = copy.deepcopy(patterns['patterns'])
+        self.requirement_templates = copy.deepcopy(templates['templates'])
+        self.flag_terms = copy.deepcopy(flag_config['terms'])
+
+        # Shared, read-only: _identify_flags() runs on every story
+        self._flag_detector = flag_config['detector']
+        self._keyword_index = templates['keyword_index']
+
+        # Track capability+title text of every story emitted so far for
+        # duplicate detection. Only the compared text is kept (not the full
+        # story dict) so streaming runs don't retain every story in memory.
+        self._seen_story_texts: list[str] = []
 
         # Track sequence numbers per category
         self._category_sequences: dict[str, int] = {}
 
+        # Pattern text -> split template (see _fill_placeholders), seeded
+        # with every statement in acceptance_patterns.yaml
+        self._template_parts: dict[str, list[str]] = dict(patterns['template_parts'])
+
         # Statistics
         self.stats = {
             'total_input': 0,
@@ -135,6 +379,17 @@ class UserStoryGenerator:
     # CONFIG LOADING
     # ========================================================================
 
+    def _config_path(self, filename: str) -> Path:
+        """Path of a config file in config_dir (FileNotFoundError if missing)."""
+        filepath = self.config_dir / filename
+
+        if not filepath.exists():
+            raise FileNotFoundError(
+                f"Config file not found: {filepath}\n"
+                f"Expected in: {self.config_dir}"
+            )
+        return filepath
+
     def _load_yaml(self, filename: str) -> dict:
         """
         PURPOSE:
@@ -144,24 +399,45 @@ class UserStoryGenerator:
             filename (str): Name of the YAML file in config_dir
 
         RETURNS:
-            dict: Parsed YAML content
+            dict: Parsed YAML content (a private copy)
 
         RAISES:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If YAML is malformed
         """
-        filepath = self.config_dir / filename
+        return get_registry().load(self._config_path(filename))
 
-        if not filepath.exists():
-            raise FileNotFoundError(
-                f"Config file not found: {filepath}\n"
-                f"Expected in: {self.config_dir}"
-            )
+    def _load_config(self, filename: str, compiler: str):
+        """
+        PURPOSE:
+            Return the shared compiled form of a config file.
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = yaml.safe_load(f)
+        PARAMETERS:
+            filename (str): Name of the YAML file in config_dir
+            compiler (str): Config compiler registered in this module
 
-        return content or {}
+        RAISES:
+            FileNotFoundError: If config file doesn't exist
+            ConfigError: If the file's structure is invalid
+            yaml.YAMLError: If YAML is malformed
+        """
+        return get_registry().get(self._config_path(filename), compiler)
+
+    def _load_flag_config(self) -> dict:
+        """
+        PURPOSE:
+            Load the flag term lists (flag_terms.yaml) from config_dir, or
+            from the default config directory if config_dir has none.
+
+        WHY THIS APPROACH:
+            Custom config directories written before the term lists moved
+            to YAML only have the pattern and template files; they keep
+            working with the default terms.
+        """
+        filepath = self.config_dir / "flag_terms.yaml"
+        if not filepath.exists():
+            filepath = DEFAULT_CONFIG_DIR / "flag_terms.yaml"
+        return get_registry().get(filepath, 'flag_terms')
 
     # ========================================================================
     # MAIN GENERATION METHOD
@@ -178,10 +454,36 @@ class UserStoryGenerator:
         RETURNS:
             list[dict]: List of user story dictionaries
         """
+        stories = list(self.iter_generate(requirements))
+
         self.stats['total_input'] = len(requirements)
-        stories = []
+        self.stats['total_output'] = len(stories)
+        return stories
 
+    def iter_generate(self, requirements):
+        """
+        PURPOSE:
+            Lazily transform requirements into user stories, one at a time.
+
+        PARAMETERS:
+            requirements (iterable of dict): Requirements from parsers. Can be
+                any iterable - a list, a generator, or one chunk of a larger
+                run. Calling this repeatedly on successive chunks produces
+                exactly the same stories as one generate() call on the whole
+                list, because the ID sequences and duplicate index live on
+                the generator instance.
+
+        RETURNS:
+            Iterator[dict]: User story dictionaries in input order
+
+        WHY THIS APPROACH:
+            The streaming pipeline (run.py --stream) feeds requirements through
+            in chunks so downstream stages can start before the whole input
+            is transformed. generate() is a thin wrapper around this method,
+            so batch and streaming runs share one code path.
+        """
         for req in requirements:
+            self.stats['total_input'] += 1
             story = self._transform_requirement(req)
             if story:
                 # Check for duplicates
@@ -189,11 +491,11 @@ class UserStoryGenerator:
                     self.stats['duplicates_found'] += 1
                     story['flags'].append('potential_duplicate')
 
-                stories.append(story)
-                self._all_stories.append(story)
-
-        self.stats['total_output'] = len(stories)
-        return stories
+                self._seen_story_texts.append(
+                    story.get('capability', '') + story.get('title', '')
+                )
+                self.stats['total_output'] += 1
+                yield story
 
     def _transform_requirement(self, req: dict) -> Optional[dict]:
         """
@@ -320,33 +622,16 @@ class UserStoryGenerator:
 
         # STEP 2: Keyword matching on full context
         # ================================================================
-        # Check each template's keywords (in order of specificity)
-        # More specific templates should be checked first
-        priority_order = [
-            'recruitment_analytics',  # Very specific
-            'consent_management',
-            'messaging_notifications',
-            'integration',
-            'authentication_access',
-            'workflow_change',
-            'reporting',
-            'search_filter',
-            'admin_settings',
-            'dashboard_reporting',
-            'data_management',
-            'general',  # Fallback last
-        ]
-
-        for template_name in priority_order:
+        # Check each template's keywords in order of specificity (more
+        # specific templates first - see TEMPLATE_PRIORITY). Keywords were
+        # lowercased when the config was compiled.
+        for template_name, keywords in self._keyword_index:
             if template_name not in self.requirement_templates:
                 continue
 
-            template = self.requirement_templates[template_name]
-            keywords = template.get('keywords_to_detect', [])
-
             for keyword in keywords:
-                if keyword.lower() in context_lower:
-                    return (template_name, template)
+                if keyword in context_lower:
+                    return (template_name, self.requirement_templates[template_name])
 
         # STEP 3: Default to general
         # ================================================================
@@ -413,6 +698,9 @@ class UserStoryGenerator:
         # Get pattern names from template
         pattern_names = template.get('acceptance_patterns', ['dashboard_display'])
 
+        # One scan of the context per requirement, shared by every statement
+        values = self._placeholder_values(req, full_context)
+
         # Collect testable statements and metrics from all patterns
         for pattern_name in pattern_names:
             pattern = self.acceptance_patterns.get(pattern_name, {})
@@ -421,13 +709,13 @@ class UserStoryGenerator:
             statements = pattern.get('testable_statements', [])
             for stmt in statements:
                 # Fill placeholders
-                filled = self._fill_placeholders(stmt, req, full_context)
+                filled = self._fill_placeholders(stmt, req, full_context, values)
                 criteria.append(f"• {filled}")
 
             # Get success metrics
             metrics = pattern.get('success_metrics', [])
             for metric in metrics:
-                filled = self._fill_placeholders(metric, req, full_context)
+                filled = self._fill_placeholders(metric, req, full_context, values)
                 if filled not in success_metrics:  # Dedupe
                     success_metrics.append(filled)
 
@@ -451,7 +739,13 @@ class UserStoryGenerator:
 
         return output
 
-    def _fill_placeholders(self, text: str, req: dict, full_context: str) -> str:
+    def _fill_placeholders(
+        self,
+        text: str,
+        req: dict,
+        full_context: str,
+        values: Optional[dict] = None
+    ) -> str:
         """
         PURPOSE:
             Fill placeholders in pattern text with context from requirement.
@@ -466,12 +760,45 @@ class UserStoryGenerator:
             {patient_status} - from context
             {notification_type} - email, SMS
 
+        PARAMETERS:
+            text (str): Pattern text
+            req (dict): The requirement
+            full_context (str): From _build_full_context(req)
+            values (dict, optional): _placeholder_values(req, full_context),
+                if the caller already has it
+
         APPROACH:
             Try to extract actual values from context, fall back to sensible defaults.
+
+        WHY THIS APPROACH:
+            Each pattern text is split on its placeholders once per
+            generator and cached, and the values are extracted once per
+            requirement, so filling a statement is a single join. Values
+            are substituted in one pass: a title that happens to contain
+            "{X}" is left as written.
+        """
+        parts = self._template_parts.get(text)
+        if parts is None:
+            parts = _PLACEHOLDER_RE.split(text)
+            self._template_parts[text] = parts
+        if len(parts) == 1:
+            return text
+
+        if values is None:
+            values = self._placeholder_values(req, full_context)
+        # Odd positions are placeholder names
+        return "".join(values[part] if i % 2 else part for i, part in enumerate(parts))
+
+    def _placeholder_values(self, req: dict, full_context: str) -> dict:
+        """
+        PURPOSE:
+            Extract every placeholder value for one requirement.
+
+        RETURNS:
+            dict: placeholder name (without braces) -> value
         """
         context_lower = full_context.lower()
         title = req.get('title', '')
-        description = req.get('description', '')
 
         # Extract metric name from title
         metric = title if len(title) < 50 else title[:50]
@@ -508,27 +835,28 @@ class UserStoryGenerator:
         elif "excel" in context_lower:
             export_format = "Excel"
 
-        # Extract any numbers from context for {X} and {N}
-        # Avoid years (2020-2030) and very large numbers
-        numbers = re.findall(r'\b(\d+)\b', full_context)
-        valid_numbers = [n for n in numbers if not (2020 <= int(n) <= 2030) and int(n) < 10000]
-        x_value = valid_numbers[0] if valid_numbers else "3"  # Default 3 seconds
-        n_value = valid_numbers[1] if len(valid_numbers) > 1 else "1000"
-
-        # Fill placeholders
-        result = text
-        result = result.replace("{metric}", metric)
-        result = result.replace("{dimension}", dimension)
-        result = result.replace("{patient_status}", patient_status)
-        result = result.replace("{notification_type}", notification_type)
-        result = result.replace("{format}", export_format)
-        result = result.replace("{time_period}", "daily/weekly")
-        result = result.replace("{start_stage}", "invitation")
-        result = result.replace("{end_stage}", "enrollment")
-        result = result.replace("{X}", x_value)
-        result = result.replace("{N}", n_value)
-
-        return result
+        # Extract numbers from context for {X} and {N}: the first two,
+        # skipping years (2020-2030) and very large numbers
+        valid_numbers = []
+        for n in re.findall(r'\b(\d+)\b', full_context):
+            value = int(n)
+            if not (2020 <= value <= 2030) and value < 10000:
+                valid_numbers.append(n)
+                if len(valid_numbers) == 2:
+                    break
+
+        return {
+            'metric': metric,
+            'dimension': dimension,
+            'patient_status': patient_status,
+            'notification_type': notification_type,
+            'format': export_format,
+            'time_period': "daily/weekly",
+            'start_stage': "invitation",
+            'end_stage': "enrollment",
+            'X': valid_numbers[0] if valid_numbers else "3",  # Default 3 seconds
+            'N': valid_numbers[1] if len(valid_numbers) > 1 else "1000",
+        }
 
     def _generate_non_technical_criteria(
         self,
@@ -821,44 +1149,22 @@ class UserStoryGenerator:
         if any(kw in status for kw in ['out of scope', 'deferred', 'cancelled']):
             flags.append('out_of_scope')
 
-        # Check for vague language
-        vague_terms = self._check_vague_language(full_context)
-        if vague_terms:
-            flags.append('vague_language')
-
-        # Check for questions/uncertainties
-        if self._has_uncertainties(full_context):
-            flags.append('needs_clarification')
+        # Vague language and open questions, in one scan of the text.
+        # Flags follow the order of config/flag_terms.yaml.
+        hits = self._flag_detector.scan(full_context)
+        for flag in self._flag_detector.flags:
+            if hits[flag]:
+                flags.append(flag)
 
         return flags
 
     def _check_vague_language(self, text: str) -> list[str]:
-        """Check for vague/non-testable language."""
-        vague_patterns = [
-            r'\bfast(?:er)?\b', r'\beasy\b', r'\bsimple\b',
-            r'\bintuitive\b', r'\befficient\b', r'\brobust\b',
-            r'\bseamless\b', r'\bscalable\b', r'\betc\.?\b',
-        ]
-
-        found = []
-        text_lower = text.lower()
-        for pattern in vague_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                found.append(match.group(0))
-
-        return found
+        """Return the vague/non-testable terms found in text."""
+        return self._flag_detector.scan(text).get('vague_language', [])
 
     def _has_uncertainties(self, text: str) -> bool:
         """Check if text contains uncertainties/questions."""
-        uncertainty_patterns = [
-            r'\?', r'\btbd\b', r'\bto be determined\b',
-            r'\bneed to clarify\b', r'\bneed to discuss\b',
-            r'\bprobably\b', r'\bmaybe\b'
-        ]
-
-        text_lower = text.lower()
-        return any(re.search(p, text_lower) for p in uncertainty_patterns)
+        return bool(self._flag_detector.scan(text).get('needs_clarification'))
 
     # ========================================================================
     # DUPLICATE DETECTION
@@ -866,13 +1172,12 @@ class UserStoryGenerator:
 
     def _is_duplicate(self, story: dict) -> bool:
         """Check if story is similar to existing ones."""
-        if not self._all_stories:
+        if not self._seen_story_texts:
             return False
 
         story_text = story.get('capability', '') + story.get('title', '')
 
-        for existing in self._all_stories:
-            existing_text = existing.get('capability', '') + existing.get('title', '')
+        for existing_text in self._seen_story_texts:
             similarity = SequenceMatcher(None, story_text, existing_text).ratio()
             if similarity >= self.similarity_threshold:
                 return True
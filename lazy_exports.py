@@ -0,0 +1,72 @@
+# lazy_exports.py
+# ============================================================================
+# Lazy Package Exports - import a submodule only when its name is used
+# ============================================================================
+#
+# PURPOSE:
+#     Build the module-level __getattr__ / __dir__ pair (PEP 562) that lets
+#     a package list its public names in __init__.py without importing the
+#     submodules that define them. The first `package.Name` lookup imports
+#     the submodule; later lookups are plain attribute reads.
+#
+# AVIATION ANALOGY:
+#     Systems stay off until the checklist calls for them. The APU isn't
+#     started just because it's on the panel - only when something needs
+#     its power.
+#
+# R EQUIVALENT:
+#     Like delayedAssign("WordParser", { source("word_parser.R"); WordParser })
+#     for each exported name.
+#
+# USAGE:
+#     # parsers/__init__.py
+#     from lazy_exports import lazy_exports
+#
+#     _LAZY_IMPORTS = {"WordParser": ".word_parser"}   # name -> submodule
+#     __all__ = ["WordParser"]
+#
+#     __getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
+#
+# ============================================================================
+
+import sys
+from importlib import import_module
+from typing import Callable
+
+
+def lazy_exports(module_name: str, lazy_imports: dict[str, str],
+                 all_names: list[str]) -> tuple[Callable, Callable]:
+    """
+    PURPOSE:
+        Return the __getattr__ and __dir__ functions for a package whose
+        public names are imported on first use.
+
+    PARAMETERS:
+        module_name (str): The package's __name__
+        lazy_imports (dict): Public name -> relative submodule that defines
+            it (".word_parser")
+        all_names (list[str]): The package's __all__, so dir() and tab
+            completion list names that haven't been imported yet
+
+    RETURNS:
+        tuple: (__getattr__, __dir__) to assign at the package's top level
+
+    WHY THIS APPROACH:
+        Python only calls a module's __getattr__ for names it can't find, so
+        the imported value is stored in the package's namespace and later
+        lookups never reach the hook. Every package shares this one copy
+        instead of pasting its own.
+    """
+    namespace = vars(sys.modules[module_name])
+
+    def __getattr__(name):
+        if name in lazy_imports:
+            value = getattr(import_module(lazy_imports[name], module_name), name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(namespace) | set(all_names))
+
+    return __getattr__, __dir__
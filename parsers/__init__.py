@@ -1,9 +1,22 @@
 # parsers/__init__.py
 # Makes this directory a Python package (like how R uses NAMESPACE files)
 # This allows imports like: from parsers.excel_parser import ExcelParser
+#
+# LAZY LOADING: Each parser pulls in a heavy library (openpyxl, python-docx),
+# so nothing is imported until a name is first used. `from parsers import
+# WordParser` loads word_parser only - the Excel stack stays unloaded.
 
-from .excel_parser import ExcelParser
-from .lucidchart_parser import LucidchartParser
-from .word_parser import WordParser
+from lazy_exports import lazy_exports
 
-__all__ = ["ExcelParser", "LucidchartParser", "WordParser"]
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "ExcelParser": ".excel_parser",
+    "FlowGraph": ".flow_graph",
+    "LucidchartParser": ".lucidchart_parser",
+    "WordParser": ".word_parser",
+}
+
+__all__ = ["ExcelParser", "FlowGraph", "LucidchartParser", "WordParser"]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, __all__)
@@ -114,7 +114,8 @@ class ExcelParser:
     def __init__(
         self,
         file_path: str,
-        include_completed: bool = False
+        include_completed: bool = False,
+        file_format: Optional[str] = None
     ) -> None:
         """
         PURPOSE:
@@ -124,6 +125,9 @@ class ExcelParser:
             file_path (str): Path to the Excel file
             include_completed (bool): Whether to include completed requirements
                                      Default: False (skip completed items)
+            file_format (str, optional): 'xlsx' when the content is already
+                                     known to be a workbook (parsers.registry
+                                     sniffed it), so the extension isn't checked
 
         WHY include_completed DEFAULT FALSE:
             Most users want to work on active requirements. Completed items
@@ -132,6 +136,7 @@ class ExcelParser:
         """
         self.file_path = Path(file_path)
         self.include_completed = include_completed
+        self.file_format = file_format
         self.workbook = None
 
         # Will be populated during parsing
@@ -206,14 +211,17 @@ class ExcelParser:
             raise FileNotFoundError(f"Excel file not found: {self.file_path}")
 
         valid_extensions = ['.xlsx', '.xlsm', '.xls']
-        if self.file_path.suffix.lower() not in valid_extensions:
+        labelled = self.file_path.suffix.lower() in valid_extensions
+        if not labelled and self.file_format != 'xlsx':
             raise ValueError(f"Not an Excel file: {self.file_path.suffix}")
 
         try:
-            self.workbook = openpyxl.load_workbook(
-                self.file_path,
-                data_only=True
-            )
+            if labelled:
+                self.workbook = openpyxl.load_workbook(self.file_path, data_only=True)
+            else:
+                # openpyxl checks a path's extension; a file object skips that
+                with open(self.file_path, 'rb') as f:
+                    self.workbook = openpyxl.load_workbook(f, data_only=True)
         except Exception as e:
             raise RuntimeError(f"Failed to open Excel file: {e}")
 
@@ -29,6 +29,7 @@
 #        - Visual representation, requires XML parsing
 #        - Text content extracted from <text> elements
 #        - Shape types inferred from path/rect elements
+#        - Swimlanes found by geometric containment (bounding boxes)
 #
 # USAGE:
 #     from parsers.lucidchart_parser import LucidchartParser
@@ -41,10 +42,248 @@
 import os
 import re
 import csv
+import math
 import hashlib
+from itertools import count
 from typing import Optional
 from xml.etree import ElementTree as ET
 
+from parsers.flow_graph import FlowGraph
+
+
+# CSV "Name" values that are shapes, even when the row also carries Line
+# Source / Line Destination (anything else with both is a connector)
+CSV_SHAPE_NAMES = frozenset([
+    'process', 'decision', 'terminator', 'data', 'document',
+    'subprocess', 'predefined process', 'manual operation',
+    'preparation', 'display', 'manual input', 'note', 'swimlane', 'page'
+])
+
+# ============================================================================
+# SVG GEOMETRY
+# ============================================================================
+# Small helpers for the SVG reader: affine transforms as 6-tuples
+# (a, b, c, d, e, f) - the same order as SVG's matrix() - and boxes as
+# (min_x, min_y, max_x, max_y).
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# Outline element -> (rank, shape type). Lower rank wins when a group has
+# several outlines, matching the order shapes were always inferred in.
+_SVG_OUTLINE_TYPES = {
+    'rect': (0, 'process'),
+    'ellipse': (1, 'terminator'),
+    'circle': (2, 'terminator'),
+}
+
+_NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+_TRANSFORM_RE = re.compile(r'(matrix|translate|scale)\s*\(([^)]*)\)')
+_PATH_TOKEN_RE = re.compile(r'[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+# Path command -> numbers per segment (the end point is the last pair)
+_PATH_ARITY = {'M': 2, 'L': 2, 'T': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'A': 7, 'Z': 0}
+
+
+def _float(value, default: float = 0.0) -> float:
+    """Leading number of an SVG length ("12.5px" -> 12.5)."""
+    match = _NUMBER_RE.match((value or '').strip())
+    return float(match.group()) if match else default
+
+
+def _compose(outer: tuple, inner: tuple) -> tuple:
+    """Matrix product outer × inner (apply inner first)."""
+    if inner is _IDENTITY:
+        return outer
+    a1, b1, c1, d1, e1, f1 = outer
+    a2, b2, c2, d2, e2, f2 = inner
+    return (a1 * a2 + c1 * b2, b1 * a2 + d1 * b2,
+            a1 * c2 + c1 * d2, b1 * c2 + d1 * d2,
+            a1 * e2 + c1 * f2 + e1, b1 * e2 + d1 * f2 + f1)
+
+
+def _parse_transform(value: Optional[str]) -> tuple:
+    """
+    Matrix for an SVG transform attribute. translate, scale and matrix are
+    supported; rotate/skew (rare on diagram shapes) are ignored.
+    """
+    if not value:
+        return _IDENTITY
+
+    matrix = _IDENTITY
+    for name, args in _TRANSFORM_RE.findall(value):
+        numbers = [float(n) for n in _NUMBER_RE.findall(args)]
+        if name == 'matrix' and len(numbers) == 6:
+            step = tuple(numbers)
+        elif name == 'translate' and numbers:
+            step = (1.0, 0.0, 0.0, 1.0, numbers[0], numbers[1] if len(numbers) > 1 else 0.0)
+        elif name == 'scale' and numbers:
+            step = (numbers[0], 0.0, 0.0, numbers[1] if len(numbers) > 1 else numbers[0], 0.0, 0.0)
+        else:
+            continue
+        matrix = _compose(matrix, step)
+    return matrix
+
+
+def _apply(matrix: tuple, x: float, y: float) -> tuple:
+    """Transform one point."""
+    a, b, c, d, e, f = matrix
+    return (a * x + c * y + e, b * x + d * y + f)
+
+
+def _union(box: Optional[tuple], other: Optional[tuple]) -> Optional[tuple]:
+    """Smallest box covering both (either may be None)."""
+    if box is None:
+        return other
+    if other is None:
+        return box
+    return (min(box[0], other[0]), min(box[1], other[1]),
+            max(box[2], other[2]), max(box[3], other[3]))
+
+
+def _bounds(points: list) -> Optional[tuple]:
+    """Bounding box of a list of (x, y) points."""
+    if not points:
+        return None
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _path_points(d: str) -> list:
+    """
+    End points of each segment of an SVG path (absolute coordinates).
+    Curve control points are skipped - close enough for a bounding box and
+    exact for a connector's start and end.
+    """
+    points = []
+    x = y = start_x = start_y = 0.0
+    command = None
+    args = []
+
+    for token in _PATH_TOKEN_RE.findall(d or ''):
+        if token.isalpha():
+            command, args = token, []
+            if command in 'Zz':
+                x, y = start_x, start_y
+                points.append((x, y))
+            continue
+        if command is None:
+            continue
+
+        args.append(float(token))
+        arity = _PATH_ARITY[command.upper()]
+        if arity == 0 or len(args) < arity:
+            continue
+
+        relative = command.islower()
+        upper = command.upper()
+        if upper == 'H':
+            x = x + args[0] if relative else args[0]
+        elif upper == 'V':
+            y = y + args[0] if relative else args[0]
+        else:
+            end_x, end_y = args[-2], args[-1]
+            x, y = (x + end_x, y + end_y) if relative else (end_x, end_y)
+        points.append((x, y))
+
+        if upper == 'M':
+            start_x, start_y = x, y
+            command = 'l' if relative else 'L'  # Extra pairs after M are lines
+        args = []
+
+    return points
+
+
+def _svg_points(tag: str, elem) -> list:
+    """Untransformed outline points of an SVG drawing element."""
+    get = elem.get
+    if tag == 'rect':
+        x, y = _float(get('x')), _float(get('y'))
+        return [(x, y), (x + _float(get('width')), y + _float(get('height')))]
+    if tag in ('ellipse', 'circle'):
+        cx, cy = _float(get('cx')), _float(get('cy'))
+        rx = _float(get('rx') if tag == 'ellipse' else get('r'))
+        ry = _float(get('ry') if tag == 'ellipse' else get('r'))
+        return [(cx - rx, cy - ry), (cx + rx, cy + ry)]
+    if tag == 'line':
+        return [(_float(get('x1')), _float(get('y1'))), (_float(get('x2')), _float(get('y2')))]
+    if tag in ('polygon', 'polyline'):
+        numbers = [float(n) for n in _NUMBER_RE.findall(get('points', ''))]
+        return list(zip(numbers[0::2], numbers[1::2]))
+    if tag == 'path':
+        return _path_points(get('d'))
+    return []
+
+
+class _BoxIndex:
+    """
+    PURPOSE:
+        Uniform-grid spatial index over bounding boxes, for "which box
+        contains this point" queries.
+
+    WHY THIS APPROACH:
+        Each box is registered in the grid cells it overlaps, with the
+        cell size taken from the typical (median) box. A query looks at one
+        cell, so finding containers for n shapes is ~O(n) rather than
+        comparing every pair. Swimlanes span many cells but there are few
+        of them; shapes span one or two.
+    """
+
+    def __init__(self, boxes: list):
+        self.boxes = boxes
+        self.areas = [
+            (box[2] - box[0]) * (box[3] - box[1]) if box else 0.0 for box in boxes
+        ]
+
+        sizes = sorted(max(box[2] - box[0], box[3] - box[1])
+                       for box, area in zip(boxes, self.areas) if area > 0)
+        self.cell = sizes[len(sizes) // 2] if sizes else 1.0
+
+        self.grid = {}
+        for position, (box, area) in enumerate(zip(boxes, self.areas)):
+            if area <= 0:
+                continue  # Points and lines can't contain anything
+            for cell in self._cells(box):
+                self.grid.setdefault(cell, []).append(position)
+
+    def _cells(self, box: tuple):
+        size = self.cell
+        for gx in range(math.floor(box[0] / size), math.floor(box[2] / size) + 1):
+            for gy in range(math.floor(box[1] / size), math.floor(box[3] / size) + 1):
+                yield (gx, gy)
+
+    def smallest_container(self, position: int) -> Optional[int]:
+        """Smallest box larger than box `position` that holds its centre."""
+        box = self.boxes[position]
+        if box is None:
+            return None
+
+        x, y = (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+        return self.smallest_at(x, y, larger_than=self.areas[position], exclude=position)
+
+    def smallest_at(self, x: float, y: float, margin: float = 0.0,
+                    larger_than: float = 0.0, exclude: Optional[int] = None) -> Optional[int]:
+        """
+        Smallest box (with area above larger_than) holding the point, each
+        box grown by `margin` on every side. A margin up to one cell only
+        needs the neighbouring cells.
+        """
+        gx, gy = math.floor(x / self.cell), math.floor(y / self.cell)
+        reach = 1 if margin > 0 else 0
+        best = None
+
+        for cx in range(gx - reach, gx + reach + 1):
+            for cy in range(gy - reach, gy + reach + 1):
+                for other in self.grid.get((cx, cy), ()):
+                    other_box = self.boxes[other]
+                    if (other != exclude and self.areas[other] > larger_than
+                            and other_box[0] - margin <= x <= other_box[2] + margin
+                            and other_box[1] - margin <= y <= other_box[3] + margin
+                            and (best is None or self.areas[other] < self.areas[best])):
+                        best = other
+
+        return best
+
 
 class LucidchartParser:
     """
@@ -72,9 +311,11 @@ class LucidchartParser:
     ATTRIBUTES:
         file_path (str): Path to the Lucidchart export file
         file_format (str): Detected format ('csv' or 'svg')
+        order (str): Requirement order - 'document' or 'flow'
         shapes (list): Parsed shape data
         connections (list): Parsed connection data
         swimlanes (list): Parsed swimlane/container data
+        flow_graph (FlowGraph): Connection graph, built by parse()
 
     WHY THIS CLASS:
         Diagrams are fundamentally different from spreadsheets.
@@ -83,7 +324,8 @@ class LucidchartParser:
         all the diagram-specific parsing logic.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, order: str = 'document',
+                 file_format: Optional[str] = None):
         """
         PURPOSE:
             Initialize the parser with a file path.
@@ -94,6 +336,11 @@ class LucidchartParser:
         PARAMETERS:
             file_path (str): Path to the Lucidchart export file.
                 Supported formats: .csv, .svg
+            order (str): 'document' (export/row order, default) or 'flow'
+                (follow the connectors: each step after the steps that
+                lead to it; loops kept together)
+            file_format (str, optional): 'csv' or 'svg' to override the
+                extension (parsers.registry passes the sniffed format)
 
         RETURNS:
             None (constructor)
@@ -108,10 +355,10 @@ class LucidchartParser:
 
         self.file_path = file_path
 
-        # Detect file format from extension
+        # Detect file format from extension (unless already known)
         # WHY: Different formats need different parsing strategies
         _, ext = os.path.splitext(file_path)
-        self.file_format = ext.lower().lstrip('.')
+        self.file_format = file_format or ext.lower().lstrip('.')
 
         if self.file_format not in ['csv', 'svg']:
             raise ValueError(
@@ -119,11 +366,16 @@ class LucidchartParser:
                 "Supported formats: .csv, .svg"
             )
 
+        if order not in ('document', 'flow'):
+            raise ValueError(f"Unknown order: {order}. Choose 'document' or 'flow'")
+        self.order = order
+
         # Storage for parsed elements
         # WHY: We parse in stages - first extract shapes, then process
         self.shapes: list[dict] = []
         self.connections: list[dict] = []
         self.swimlanes: list[dict] = []
+        self.flow_graph: Optional[FlowGraph] = None
 
         # Shape type mappings for requirement generation
         # WHY: Different shape types become different requirement types
@@ -180,7 +432,8 @@ class LucidchartParser:
             'connections_parsed': 0,
             'swimlanes_found': 0,
             'requirements_generated': 0,
-            'empty_shapes_skipped': 0
+            'empty_shapes_skipped': 0,
+            'flow_cycles': 0
         }
 
     def parse(self) -> list[dict]:
@@ -245,140 +498,149 @@ class LucidchartParser:
             - Each row represents a shape or connection
             - Columns include: Id, Name, Shape Library, Text Area 1, etc.
             - We extract shape data and build relationships
+
+            Rows are streamed as plain tuples and dropped once converted, so
+            memory holds only the shapes, swimlanes and connections kept -
+            not a dict per row on top of them. Column positions are looked
+            up once from the header. A shape whose swimlane row comes later
+            in the file waits in a pending map keyed by swimlane ID and is
+            filled in when that row arrives, instead of a second pass over
+            all shapes.
         """
         with open(self.file_path, 'r', encoding='utf-8-sig') as f:
-            # Use csv.DictReader for named column access
-            # WHY: Lucidchart CSVs have headers, DictReader is cleaner
-            reader = csv.DictReader(f)
-
-            # Store rows for processing
-            rows = list(reader)
-
-        # Get column names (they vary by Lucidchart version)
-        if not rows:
-            return
-
-        # Identify relevant columns
-        # WHY: Lucidchart column names aren't always consistent
-        columns = rows[0].keys()
-        id_col = self._find_column(columns, ['Id', 'ID', 'id', 'Shape Id'])
-        name_col = self._find_column(columns, ['Name', 'name', 'Shape Name'])
-        type_col = self._find_column(columns, ['Shape Library', 'Type', 'Shape Type'])
-        text_cols = self._find_text_columns(columns)
-        container_col = self._find_column(columns, ['Contained By', 'Container', 'Parent', 'Swimlane'])
-        source_col = self._find_column(columns, ['Line Source', 'Source', 'From'])
-        target_col = self._find_column(columns, ['Line Destination', 'Target', 'To'])
-        comments_col = self._find_column(columns, ['Comments', 'Notes', 'Comment'])
-
-        # Also find specific text area columns for requirement IDs
-        text_area_1 = self._find_column(columns, ['Text Area 1'])
-        text_area_2 = self._find_column(columns, ['Text Area 2'])
-
-        # First pass: identify swimlanes by their IDs for mapping
-        swimlane_id_to_name = {}
-
-        # Process each row
-        for idx, row in enumerate(rows):
-            # Extract shape ID
-            shape_id = row.get(id_col, '') if id_col else f"shape_{idx}"
-
-            # Extract shape name (determines shape type in Lucidchart exports)
-            # WHY: In Lucidchart CSV, "Name" column contains shape type like "Swimlane", "Process", "Decision"
-            shape_name = row.get(name_col, '') if name_col else ''
-
-            # Extract shape library (usually "Flowchart")
-            shape_type = row.get(type_col, '') if type_col else ''
-
-            # Extract text from Text Area 1 (main text)
-            primary_text = row.get(text_area_1, '') if text_area_1 else ''
-
-            # Extract Text Area 2 (often contains requirement IDs like REQ-ONB-001)
-            secondary_text = row.get(text_area_2, '') if text_area_2 else ''
-
-            # Extract comments (often contains priority hints like "Must have", "Should have")
-            comments = row.get(comments_col, '') if comments_col else ''
-
-            # Check if this is a connection (line) vs a shape
-            # WHY: In Lucidchart CSV, "Line" shapes are pure connectors,
-            # while Process/Decision/etc shapes may HAVE connection info but ARE shapes
-            source_id = row.get(source_col, '') if source_col else ''
-            target_id = row.get(target_col, '') if target_col else ''
-
-            # Determine if this is a connector line vs a shape with connection info
-            # Shape types that are actual shapes (not connectors)
-            shape_types = ['process', 'decision', 'terminator', 'data', 'document',
-                          'subprocess', 'predefined process', 'manual operation',
-                          'preparation', 'display', 'manual input', 'note', 'swimlane', 'page']
-            is_shape = shape_name.lower() in shape_types
-
-            # If it's a line/connector (not a shape type) and has source/target, it's a connection
-            if source_id and target_id and not is_shape:
-                # This is a connection/line
-                self.connections.append({
-                    'id': shape_id,
-                    'source': source_id,
-                    'target': target_id,
-                    'text': primary_text
-                })
-                self.stats['connections_parsed'] += 1
-
-            elif shape_name.lower() == 'swimlane':
-                # This is a swimlane - use Text Area 1 as the swimlane name
-                swimlane_name = primary_text or 'Unknown'
-                self.swimlanes.append({
-                    'id': shape_id,
-                    'name': swimlane_name,
-                    'type': 'swimlane',
-                    'comments': comments
-                })
-                swimlane_id_to_name[shape_id] = swimlane_name
-                self.stats['swimlanes_found'] += 1
-
-            elif shape_name.lower() == 'page':
-                # This is a page container, skip it but note the title
-                pass  # Page is just container metadata
-
-            elif primary_text or shape_name:
-                # This is a regular shape (Process, Decision, Terminator, etc.)
-                container_id = row.get(container_col, '') if container_col else ''
-
-                # Map container ID to swimlane name
-                swimlane_name = swimlane_id_to_name.get(container_id, '')
-
-                self.shapes.append({
-                    'id': shape_id,
-                    'text': primary_text,
-                    'type': shape_name,  # Use shape_name (Process, Decision, etc.) as type
-                    'name': shape_name,
-                    'container': container_id,
-                    'swimlane': swimlane_name,
-                    'requirement_id': secondary_text,  # Text Area 2 often has REQ-XXX
-                    'comments': comments,  # Comments often has priority
-                    'row_index': idx + 2  # +2 for 1-based + header
-                })
-                self.stats['shapes_parsed'] += 1
-
-                # Also record connections FROM this shape if present
-                # WHY: In Lucidchart CSV, shapes have Line Destination showing what they connect to
-                if target_id:
-                    # Target may be comma-separated (e.g., "8,12" for decision branches)
-                    targets = [t.strip() for t in target_id.split(',') if t.strip()]
-                    for target in targets:
-                        self.connections.append({
-                            'id': f'conn_{shape_id}_{target}',
-                            'source': shape_id,
-                            'target': target,
-                            'text': ''
-                        })
-                        self.stats['connections_parsed'] += 1
-            else:
-                self.stats['empty_shapes_skipped'] += 1
-
-        # Second pass: resolve swimlane names for shapes that reference swimlanes
-        # parsed after their containing shape
-        for shape in self.shapes:
-            if not shape.get('swimlane') and shape.get('container'):
-                shape['swimlane'] = swimlane_id_to_name.get(shape['container'], '')
+            reader = csv.reader(f)
+
+            # Get column names (they vary by Lucidchart version)
+            header = next(reader, None)
+            if not header:
+                return
+
+            # Identify relevant columns (position in each row, or None)
+            # WHY: Lucidchart column names aren't always consistent
+            position = {name: i for i, name in enumerate(header)}  # Last duplicate wins
+
+            def column(candidates: list[str]) -> Optional[int]:
+                name = self._find_column(header, candidates)
+                return position[name] if name is not None else None
+
+            id_col = column(['Id', 'ID', 'id', 'Shape Id'])
+            name_col = column(['Name', 'name', 'Shape Name'])
+            container_col = column(['Contained By', 'Container', 'Parent', 'Swimlane'])
+            source_col = column(['Line Source', 'Source', 'From'])
+            target_col = column(['Line Destination', 'Target', 'To'])
+            comments_col = column(['Comments', 'Notes', 'Comment'])
+
+            # Also find specific text area columns for requirement IDs
+            text_area_1 = column(['Text Area 1'])
+            text_area_2 = column(['Text Area 2'])
+
+            # Swimlane ID -> name, and shapes waiting for a swimlane row
+            # that hasn't been read yet
+            swimlane_id_to_name = {}
+            pending_swimlane = {}
+
+            def value(row: list, col: Optional[int]) -> str:
+                return row[col] if col is not None and col < len(row) else ''
+
+            idx = -1
+            for row in reader:
+                if not row:
+                    continue  # Blank line (DictReader skipped these too)
+                idx += 1
+
+                # Extract shape ID
+                shape_id = value(row, id_col) if id_col is not None else f"shape_{idx}"
+
+                # Extract shape name (determines shape type in Lucidchart exports)
+                # WHY: In Lucidchart CSV, "Name" column contains shape type like "Swimlane", "Process", "Decision"
+                shape_name = value(row, name_col)
+                shape_kind = shape_name.lower()
+
+                # Extract text from Text Area 1 (main text)
+                primary_text = value(row, text_area_1)
+
+                # Extract Text Area 2 (often contains requirement IDs like REQ-ONB-001)
+                secondary_text = value(row, text_area_2)
+
+                # Extract comments (often contains priority hints like "Must have", "Should have")
+                comments = value(row, comments_col)
+
+                # Check if this is a connection (line) vs a shape
+                # WHY: In Lucidchart CSV, "Line" shapes are pure connectors,
+                # while Process/Decision/etc shapes may HAVE connection info but ARE shapes
+                source_id = value(row, source_col)
+                target_id = value(row, target_col)
+
+                # If it's a line/connector (not a shape type) and has source/target, it's a connection
+                if source_id and target_id and shape_kind not in CSV_SHAPE_NAMES:
+                    # This is a connection/line
+                    self.connections.append({
+                        'id': shape_id,
+                        'source': source_id,
+                        'target': target_id,
+                        'text': primary_text
+                    })
+                    self.stats['connections_parsed'] += 1
+
+                elif shape_kind == 'swimlane':
+                    # This is a swimlane - use Text Area 1 as the swimlane name
+                    swimlane_name = primary_text or 'Unknown'
+                    self.swimlanes.append({
+                        'id': shape_id,
+                        'name': swimlane_name,
+                        'type': 'swimlane',
+                        'comments': comments
+                    })
+                    swimlane_id_to_name[shape_id] = swimlane_name
+                    self.stats['swimlanes_found'] += 1
+
+                    # Shapes listed before their swimlane
+                    for shape in pending_swimlane.pop(shape_id, ()):
+                        shape['swimlane'] = swimlane_name
+
+                elif shape_kind == 'page':
+                    # This is a page container, skip it but note the title
+                    pass  # Page is just container metadata
+
+                elif primary_text or shape_name:
+                    # This is a regular shape (Process, Decision, Terminator, etc.)
+                    container_id = value(row, container_col)
+
+                    # Map container ID to swimlane name
+                    swimlane_name = swimlane_id_to_name.get(container_id, '')
+
+                    shape = {
+                        'id': shape_id,
+                        'text': primary_text,
+                        'type': shape_name,  # Use shape_name (Process, Decision, etc.) as type
+                        'name': shape_name,
+                        'container': container_id,
+                        'swimlane': swimlane_name,
+                        'requirement_id': secondary_text,  # Text Area 2 often has REQ-XXX
+                        'comments': comments,  # Comments often has priority
+                        'row_index': idx + 2  # +2 for 1-based + header
+                    }
+                    self.shapes.append(shape)
+                    self.stats['shapes_parsed'] += 1
+
+                    if container_id and not swimlane_name:
+                        pending_swimlane.setdefault(container_id, []).append(shape)
+
+                    # Also record connections FROM this shape if present
+                    # WHY: In Lucidchart CSV, shapes have Line Destination showing what they connect to
+                    if target_id:
+                        # Target may be comma-separated (e.g., "8,12" for decision branches)
+                        targets = [t.strip() for t in target_id.split(',') if t.strip()]
+                        for target in targets:
+                            self.connections.append({
+                                'id': f'conn_{shape_id}_{target}',
+                                'source': shape_id,
+                                'target': target,
+                                'text': ''
+                            })
+                            self.stats['connections_parsed'] += 1
+                else:
+                    self.stats['empty_shapes_skipped'] += 1
 
     def _find_column(self, columns, candidates: list[str]) -> Optional[str]:
         """
@@ -462,6 +724,20 @@ class LucidchartParser:
     # ========================================================================
     # SVG PARSING
     # ========================================================================
+    # WHY: An SVG export has no shape records - just nested <g> groups of
+    # outlines and text, positioned by coordinates. Lanes are drawn as
+    # large rectangles, and the shapes inside them are usually siblings of
+    # the lane, not its children, so containment has to come from geometry.
+    #
+    # The file is read once with iterparse. Each open <g> gets a frame that
+    # collects its own text and outline; when the group closes it becomes
+    # a diagram item with a bounding box. Swimlanes are then the items whose
+    # box contains other items, found through a grid index (_BoxIndex).
+    #
+    # AVIATION ANALOGY:
+    #     Like plotting waypoints on a sectional chart and reading off
+    #     which airspace each one falls in - position decides the sector,
+    #     not the label's wording.
 
     def _parse_svg(self):
         """
@@ -478,128 +754,244 @@ class LucidchartParser:
             # }
 
         WHY THIS APPROACH:
-            SVG is less structured than CSV but sometimes it's the only
-            export option. We extract text from <text> elements and
-            infer shape types from surrounding elements.
+            Every element is visited once (start/end events), so a diagram
+            with thousands of shapes parses in linear time; nested groups
+            aren't re-scanned by descendant searches. Text and outlines
+            belong to their nearest enclosing group. A group holding only
+            an outline or only a label hands it to its parent, so shapes
+            exported as <g><g>outline</g><g>label</g></g> come out whole.
         """
-        # Parse the SVG as XML
-        # WHY: SVG is XML-based, so we use ElementTree
-        tree = ET.parse(self.file_path)
-        root = tree.getroot()
-
-        # SVG namespace handling
-        # WHY: SVG elements are namespaced, we need to handle that
-        namespaces = {
-            'svg': 'http://www.w3.org/2000/svg',
-            'xlink': 'http://www.w3.org/1999/xlink'
+        items = []
+        group_order = count()   # Document order of each <g> start tag
+        open_groups = []        # Frames for the <g> elements being read
+        transforms = [_IDENTITY]
+        in_defs = 0             # Depth inside <defs> (markers, gradients)
+        root = None
+
+        for event, elem in ET.iterparse(self.file_path, events=('start', 'end')):
+            tag = elem.tag.rpartition('}')[2]
+
+            if event == 'start':
+                if root is None:
+                    root = elem
+                transforms.append(
+                    _compose(transforms[-1], _parse_transform(elem.get('transform')))
+                )
+                if tag == 'defs':
+                    in_defs += 1
+                elif tag == 'g' and not in_defs:
+                    open_groups.append(self._new_svg_frame(elem, next(group_order)))
+                continue
+
+            # ---- end event ----
+            matrix = transforms.pop()
+
+            if tag == 'defs':
+                in_defs -= 1
+            elif in_defs:
+                pass
+            elif tag == 'g':
+                frame = open_groups.pop()
+                parent = open_groups[-1] if open_groups else None
+                item = self._close_svg_frame(frame, parent)
+                if item:
+                    items.append(item)
+            elif tag == 'text':
+                fragments = [t.strip() for t in elem.itertext() if t.strip()]
+                if fragments and open_groups:
+                    frame = open_groups[-1]
+                    frame['texts'].append(' '.join(fragments))
+                    point = _apply(matrix, _float(elem.get('x')), _float(elem.get('y')))
+                    frame['text_box'] = _union(frame['text_box'], point + point)
+            elif tag in ('line', 'path', 'rect', 'ellipse', 'circle', 'polygon', 'polyline'):
+                self._read_svg_geometry(tag, elem, matrix, open_groups)
+
+            # Free what has been read
+            if tag in ('g', 'text') or len(open_groups) == 0:
+                elem.clear()
+            if root is not None and elem is not root and not open_groups and not in_defs:
+                root.clear()
+
+        self._assign_svg_containers(items)
+        self._resolve_svg_connections()
+
+    def _new_svg_frame(self, elem, order: int) -> dict:
+        """Empty collection frame for an SVG <g> element."""
+        return {
+            'id': elem.get('id'),
+            'order': order,
+            'texts': [],
+            'outline_rank': None,   # Lower rank wins (see _SVG_OUTLINE_TYPES)
+            'outline_type': None,
+            'outline_box': None,
+            'text_box': None,
         }
 
-        # Try to extract namespace from root if different
-        ns_match = re.match(r'\{(.+)\}', root.tag)
-        if ns_match:
-            namespaces['svg'] = ns_match.group(1)
-
-        # Find all groups (g elements) - these often represent shapes
-        # In Lucidchart SVGs, shapes are typically wrapped in <g> elements
-        groups = root.findall('.//{%s}g' % namespaces['svg'])
-
-        shape_index = 0
-        for group in groups:
-            # Extract text from this group
-            text_elements = group.findall('.//{%s}text' % namespaces['svg'])
-            tspan_elements = group.findall('.//{%s}tspan' % namespaces['svg'])
-
-            texts = []
-            for elem in text_elements + tspan_elements:
-                if elem.text and elem.text.strip():
-                    texts.append(elem.text.strip())
-                # Also check tail text
-                if elem.tail and elem.tail.strip():
-                    texts.append(elem.tail.strip())
-
-            # Combine all text in this group
-            combined_text = ' '.join(texts)
-
-            if not combined_text:
-                continue
+    def _read_svg_geometry(self, tag: str, elem, matrix: tuple, open_groups: list):
+        """
+        PURPOSE:
+            Record a drawing element: connectors become connections, other
+            outlines extend the bounding box of their group.
+
+        WHY THIS APPROACH:
+            Connector lines and arrow paths are recorded with their start
+            and end points so they can later be matched to shapes. Shape
+            type follows the old inference order: rect (process), ellipse /
+            circle (terminator), 4-point polygon or 4+ segment path
+            (decision).
+        """
+        points = _svg_points(tag, elem)
+        points = [_apply(matrix, x, y) for x, y in points]
+
+        marker = elem.get('marker-end', '').lower()
+        if tag == 'line' or (tag == 'path' and ('arrow' in marker or 'end' in marker)):
+            index = self.stats['connections_parsed']
+            self.connections.append({
+                'id': f"connection_{index}",
+                'source': 'unknown',
+                'target': 'unknown',
+                'text': '',
+                'start': points[0] if points else None,
+                'end': points[-1] if points else None,
+            })
+            self.stats['connections_parsed'] += 1
+            return
+
+        if not open_groups:
+            return
+
+        frame = open_groups[-1]
+        if tag == 'polygon':
+            rank, shape_type = (3, 'decision') if len(points) == 4 else (5, None)
+        elif tag == 'path':
+            d = elem.get('d', '')
+            rank, shape_type = (4, 'decision') if d.count('L') >= 4 or d.count('l') >= 4 else (5, None)
+        else:
+            rank, shape_type = _SVG_OUTLINE_TYPES.get(tag, (5, None))
+
+        if frame['outline_rank'] is None or rank < frame['outline_rank']:
+            frame['outline_rank'], frame['outline_type'] = rank, shape_type
+        frame['outline_box'] = _union(frame['outline_box'], _bounds(points))
+
+    def _close_svg_frame(self, frame: dict, parent: Optional[dict]) -> Optional[dict]:
+        """
+        PURPOSE:
+            Turn a finished <g> frame into a diagram item, or hand its
+            partial content to the enclosing group.
+
+        RETURNS:
+            dict or None: {'id', 'order', 'text', 'type', 'box'}
+        """
+        has_outline = frame['outline_rank'] is not None
+
+        if parent is not None and has_outline and not frame['texts']:
+            # Outline-only group: part of the parent's shape
+            if parent['outline_rank'] is None or frame['outline_rank'] < parent['outline_rank']:
+                parent['outline_rank'] = frame['outline_rank']
+                parent['outline_type'] = frame['outline_type']
+            parent['outline_box'] = _union(parent['outline_box'], frame['outline_box'])
+            return None
+
+        if (parent is not None and frame['texts'] and not has_outline
+                and parent['outline_rank'] is not None):
+            # Label-only group inside an outlined group: the shape's text
+            parent['texts'].extend(frame['texts'])
+            parent['text_box'] = _union(parent['text_box'], frame['text_box'])
+            return None
+
+        if not frame['texts']:
+            return None
+
+        return {
+            'id': frame['id'],
+            'order': frame['order'],
+            'text': ' '.join(frame['texts']),
+            'type': frame['outline_type'] or 'process',
+            'box': frame['outline_box'] or frame['text_box'],
+        }
+
+    def _assign_svg_containers(self, items: list[dict]):
+        """
+        PURPOSE:
+            Split diagram items into swimlanes and shapes by geometric
+            containment, and give each shape its swimlane.
+
+        PARAMETERS:
+            items (list[dict]): Items from _close_svg_frame()
+
+        WHY THIS APPROACH:
+            An item's container is the smallest larger item whose box
+            holds its centre (so a shape in a lane inside a pool gets the
+            lane). Any item that contains another is a swimlane. Only
+            loose items - not contained and containing nothing - fall back
+            to the _is_swimlane_text() wording heuristic (an empty lane).
+        """
+        items.sort(key=lambda item: item['order'])
+
+        index = _BoxIndex([item['box'] for item in items])
+        container_of = [index.smallest_container(i) for i in range(len(items))]
+        is_container = [False] * len(items)
+        for container in container_of:
+            if container is not None:
+                is_container[container] = True
 
-            # Try to determine shape type from element attributes or children
-            shape_type = self._infer_shape_type_from_svg(group, namespaces)
+        for position, item in enumerate(items):
+            item['id'] = item['id'] or f"svg_shape_{position}"
 
-            # Get group ID if available
-            group_id = group.get('id', f'svg_shape_{shape_index}')
+        for position, item in enumerate(items):
+            container = container_of[position]
+            container_id = items[container]['id'] if container is not None else ''
 
-            # Check if this looks like a swimlane label
-            if self._is_swimlane_text(combined_text, shape_type):
+            if is_container[position] or (
+                container is None and self._is_swimlane_text(item['text'], item['type'])
+            ):
                 self.swimlanes.append({
-                    'id': group_id,
-                    'name': combined_text,
-                    'type': 'swimlane'
+                    'id': item['id'],
+                    'name': item['text'],
+                    'type': 'swimlane',
+                    'container': container_id,
+                    'box': item['box'],
                 })
                 self.stats['swimlanes_found'] += 1
             else:
                 self.shapes.append({
-                    'id': group_id,
-                    'text': combined_text,
-                    'type': shape_type,
+                    'id': item['id'],
+                    'text': item['text'],
+                    'type': item['type'],
                     'name': '',
-                    'container': '',  # SVG doesn't easily expose containment
-                    'row_index': shape_index + 1
+                    'container': container_id,
+                    'swimlane': items[container]['text'] if container is not None else '',
+                    'box': item['box'],
+                    'row_index': position + 1
                 })
                 self.stats['shapes_parsed'] += 1
 
-            shape_index += 1
-
-        # Try to extract connections from path elements
-        self._extract_svg_connections(root, namespaces)
-
-    def _infer_shape_type_from_svg(self, group, namespaces: dict) -> str:
+    def _resolve_svg_connections(self):
         """
         PURPOSE:
-            Infer the shape type from SVG element structure.
-
-        PARAMETERS:
-            group: The SVG group element
-            namespaces (dict): XML namespaces
-
-        RETURNS:
-            str: Inferred shape type
+            Fill in the source and target shape of each SVG connector from
+            where its line starts and ends.
 
         WHY THIS APPROACH:
-            SVG doesn't explicitly label shapes. We look at the child
-            elements (rect, ellipse, polygon, path) to guess the type.
+            An SVG connector is just a line; which shapes it joins is only
+            visible from its end points. Each end point is looked up in a
+            box index of the shapes, with a small margin because arrows
+            usually stop just short of the outline. Connectors that don't
+            start and end on two different shapes stay 'unknown'.
         """
-        svg_ns = namespaces['svg']
-
-        # Check for specific shape elements
-        if group.find('.//{%s}rect' % svg_ns) is not None:
-            return 'process'  # Rectangles are usually process boxes
-
-        if group.find('.//{%s}ellipse' % svg_ns) is not None:
-            return 'terminator'  # Ellipses are usually start/end
-
-        if group.find('.//{%s}circle' % svg_ns) is not None:
-            return 'terminator'
-
-        # Check for polygon (could be diamond/decision)
-        polygon = group.find('.//{%s}polygon' % svg_ns)
-        if polygon is not None:
-            points = polygon.get('points', '')
-            # Diamond shapes typically have 4 points
-            point_count = len(points.split())
-            if point_count == 4:
-                return 'decision'
-
-        # Check path elements for specific shapes
-        path = group.find('.//{%s}path' % svg_ns)
-        if path is not None:
-            d = path.get('d', '')
-            # Look for diamond-like path commands
-            if d.count('L') >= 4 or d.count('l') >= 4:
-                return 'decision'
-
-        # Default to process
-        return 'process'
+        index = _BoxIndex([shape.get('box') for shape in self.shapes])
+        margin = index.cell * 0.1
+
+        for connection in self.connections:
+            start, end = connection.get('start'), connection.get('end')
+            if start is None or end is None:
+                continue
+
+            source = index.smallest_at(*start, margin=margin)
+            target = index.smallest_at(*end, margin=margin)
+            if source is not None and target is not None and source != target:
+                connection['source'] = self.shapes[source]['id']
+                connection['target'] = self.shapes[target]['id']
 
     def _is_swimlane_text(self, text: str, shape_type: str) -> bool:
         """
@@ -639,48 +1031,6 @@ class LucidchartParser:
 
         return False
 
-    def _extract_svg_connections(self, root, namespaces: dict):
-        """
-        PURPOSE:
-            Extract connections (lines/arrows) from SVG.
-
-        PARAMETERS:
-            root: SVG root element
-            namespaces (dict): XML namespaces
-
-        WHY THIS APPROACH:
-            Connections in SVG are typically <line> or <path> elements
-            with marker-end attributes (arrows). We try to find them.
-        """
-        svg_ns = namespaces['svg']
-
-        # Look for line elements
-        lines = root.findall('.//{%s}line' % svg_ns)
-        for idx, line in enumerate(lines):
-            # Lines have x1,y1 to x2,y2
-            # Without shape IDs, we can only note that connections exist
-            self.connections.append({
-                'id': f'connection_{idx}',
-                'source': 'unknown',
-                'target': 'unknown',
-                'text': ''
-            })
-            self.stats['connections_parsed'] += 1
-
-        # Look for paths that might be connectors
-        # (paths with marker-end are usually arrows)
-        paths = root.findall('.//{%s}path' % svg_ns)
-        for idx, path in enumerate(paths):
-            marker = path.get('marker-end', '')
-            if 'arrow' in marker.lower() or 'end' in marker.lower():
-                self.connections.append({
-                    'id': f'connection_path_{idx}',
-                    'source': 'unknown',
-                    'target': 'unknown',
-                    'text': ''
-                })
-                self.stats['connections_parsed'] += 1
-
     # ========================================================================
     # REQUIREMENT CONVERSION
     # ========================================================================
@@ -698,12 +1048,13 @@ class LucidchartParser:
             1. Using shape text as the requirement description
             2. Inferring priority from keywords or comments
             3. Using swimlane as category/role
-            4. Recording connections as dependencies
+            4. Recording connections as dependencies (from the flow graph)
         """
         requirements = []
+        shape_ids = []  # Parallel to requirements, for flow ordering
 
-        # Build a map of shape connections for dependency tracking
-        connection_map = self._build_connection_map()
+        # Index shape connections once for dependency tracking and ordering
+        graph = self._build_flow_graph()
 
         # Build swimlane lookup (for fallback when swimlane not directly on shape)
         swimlane_map = {s['id']: s['name'] for s in self.swimlanes}
@@ -748,7 +1099,7 @@ class LucidchartParser:
                 category = self._type_to_category(normalized_type)
 
             # Find connected shapes (dependencies)
-            connected_to = connection_map.get(shape['id'], [])
+            connected_to = graph.successors(shape['id'])
 
             # Build the requirement dictionary
             # WHY: This format matches ExcelParser output for pipeline compatibility
@@ -769,37 +1120,46 @@ class LucidchartParser:
             }
 
             requirements.append(requirement)
+            shape_ids.append(shape['id'])
             self.stats['requirements_generated'] += 1
 
+        if self.order == 'flow':
+            # Follow the connectors (row order breaks ties between branches)
+            position = {node_id: i for i, node_id in enumerate(graph.flow_order())}
+            ranked = sorted(
+                zip(shape_ids, requirements),
+                key=lambda pair: (position[pair[0]], pair[1].get('row_number', 0))
+            )
+            return [req for _, req in ranked]
+
         # Sort by row_number (or shape order) for consistent output
         requirements.sort(key=lambda r: r.get('row_number', 0))
 
         return requirements
 
-    def _build_connection_map(self) -> dict[str, list[str]]:
+    def _build_flow_graph(self) -> FlowGraph:
         """
         PURPOSE:
-            Build a map of shape_id -> [connected shape IDs].
+            Build the connection graph over all shapes.
 
         RETURNS:
-            dict: Mapping of source shapes to their targets
+            FlowGraph: Also stored on self.flow_graph
 
         WHY THIS APPROACH:
-            This lets us quickly look up what each shape connects to,
-            which we record as potential dependencies.
+            Shapes are the nodes in row/export order; every connection with
+            both ends known is an edge (repeats kept once). Endpoints that
+            aren't shapes (e.g. a line to a page or swimlane) become extra
+            nodes so paths through them are still followed.
         """
-        connection_map = {}
-
-        for conn in self.connections:
-            source = conn.get('source', '')
-            target = conn.get('target', '')
-
-            if source and target and source != 'unknown':
-                if source not in connection_map:
-                    connection_map[source] = []
-                connection_map[source].append(target)
-
-        return connection_map
+        edges = (
+            (conn['source'], conn['target'])
+            for conn in self.connections
+            if conn.get('source') and conn.get('target')
+            and 'unknown' not in (conn['source'], conn['target'])
+        )
+        self.flow_graph = FlowGraph((shape['id'] for shape in self.shapes), edges)
+        self.stats['flow_cycles'] = len(self.flow_graph.cycles())
+        return self.flow_graph
 
     def _normalize_shape_type(self, shape_type: str) -> str:
         """
@@ -1071,6 +1431,20 @@ class LucidchartParser:
         """
         return self.stats.copy()
 
+    def get_flow_graph(self) -> Optional[FlowGraph]:
+        """
+        PURPOSE:
+            Return the connection graph built by parse().
+
+        RETURNS:
+            FlowGraph or None: None before parse()
+
+        WHY THIS APPROACH:
+            Callers can ask flow questions (loops, what a step leads to,
+            the longest chain) without re-reading the diagram.
+        """
+        return self.flow_graph
+
     def get_swimlanes(self) -> list[dict]:
         """
         PURPOSE:
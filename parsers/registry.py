@@ -0,0 +1,306 @@
+# parsers/registry.py
+# ============================================================================
+# Parser Registry - pick the right parser for an input file
+# ============================================================================
+#
+# PURPOSE:
+#     One place that knows every input format the toolkit reads. Each
+#     parser backend declares the file extensions it claims, a cheap
+#     content sniffer, and where its parser class lives. The pipeline asks
+#     the registry for a parser instead of branching on the extension.
+#
+# AVIATION ANALOGY:
+#     Like a handling agent reading the cargo manifest rather than trusting
+#     the sticker on the crate - the label says where it should go, but the
+#     contents decide which hold it actually goes in.
+#
+# R EQUIVALENT:
+#     Like a named list of readers keyed by format, chosen with
+#     switch(detect_format(path), excel = readxl::read_excel, ...).
+#
+# WHY: The parser modules pull in heavy libraries (openpyxl, python-docx),
+#     so a backend only names its class as "module:Class"; the module is
+#     imported when a file of that format is actually parsed. Sniffers look
+#     at the first few KB (or a zip's file list), so a .csv that is really
+#     an SVG, or a .xlsx that is really a Word document, goes to the right
+#     parser without a failed parse first.
+#
+# USAGE:
+#     from parsers.registry import detect_format, register_parser
+#
+#     backend, mislabelled = detect_format("inputs/word/spec.docx")
+#     parser = backend.create("inputs/word/spec.docx", mislabelled)
+#     requirements = parser.parse()
+#
+#     # Adding a format (no changes to run.py needed):
+#     @register_parser('jira_json', label="Jira export (.json)",
+#                      extensions=('.json',), target='parsers.jira_parser:JiraParser',
+#                      sniff=lambda probe: probe.text.startswith('{'))
+#     def build_jira(parser_class, path, file_format, options):
+#         return parser_class(path)
+#
+# ============================================================================
+
+import os
+from importlib import import_module
+from typing import Callable, Optional
+
+# Bytes read from the start of a file for sniffing
+SNIFF_BYTES = 4096
+
+
+class FileProbe:
+    """
+    PURPOSE:
+        What the sniffers get to look at: the path, the first SNIFF_BYTES
+        bytes, and (for zip packages) the member names - each read at most
+        once, however many sniffers ask.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.extension = os.path.splitext(path)[1].lower()
+        with open(path, 'rb') as f:
+            self.head = f.read(SNIFF_BYTES)
+        self._zip_names = None
+
+    @property
+    def text(self) -> str:
+        """The head decoded as text (BOM and leading whitespace removed)."""
+        return self.head.decode('utf-8', errors='ignore').lstrip('\ufeff \t\r\n')
+
+    @property
+    def is_zip(self) -> bool:
+        return self.head.startswith(b'PK\x03\x04')
+
+    @property
+    def zip_names(self) -> set:
+        """Member names of a zip package (empty if not a readable zip)."""
+        if self._zip_names is None:
+            self._zip_names = set()
+            if self.is_zip:
+                import zipfile
+                try:
+                    with zipfile.ZipFile(self.path) as package:
+                        self._zip_names = set(package.namelist())
+                except zipfile.BadZipFile:
+                    pass
+        return self._zip_names
+
+
+class ParserBackend:
+    """
+    PURPOSE:
+        One input format: how to recognise it and how to build its parser.
+
+    ATTRIBUTES:
+        name (str): Registry key (e.g. "word")
+        label (str): Shown in console output (e.g. "Word document (.docx)")
+        extensions (tuple[str]): Extensions this backend claims (lowercase)
+        target (str): "module:Class" of the parser, imported on first use
+        sniff (callable): FileProbe -> bool, True if the content matches
+        build (callable): (parser_class, path, file_format, options) ->
+            parser. file_format is the backend name when the file was
+            routed here by content rather than extension, else None.
+    """
+
+    def __init__(self, name: str, label: str, extensions: tuple, target: str,
+                 sniff: Optional[Callable], build: Callable) -> None:
+        self.name = name
+        self.label = label
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.target = target
+        self.sniff = sniff
+        self.build = build
+
+    def load(self):
+        """Import and return the parser class."""
+        module_name, _, class_name = self.target.partition(':')
+        return getattr(import_module(module_name), class_name)
+
+    def create(self, path: str, mislabelled: bool = False, **options):
+        """
+        PURPOSE:
+            Build a parser for path.
+
+        PARAMETERS:
+            path (str): Input file
+            mislabelled (bool): The extension doesn't match this format
+                (from detect_format); the parser is told the real format
+            **options: Pipeline options (e.g. parse_jobs, word_backend,
+                lucidchart_order).
+                Each backend uses the ones it understands.
+        """
+        return self.build(self.load(), path, self.name if mislabelled else None, options)
+
+    def matches(self, probe: FileProbe) -> bool:
+        """Run the sniffer (a backend without one never matches by content)."""
+        if self.sniff is None:
+            return False
+        try:
+            return bool(self.sniff(probe))
+        except Exception:
+            return False
+
+    def __repr__(self) -> str:
+        return f"ParserBackend({self.name!r}, {self.target!r})"
+
+
+# Backend name -> ParserBackend, in registration (= sniffing) order
+_BACKENDS: dict[str, ParserBackend] = {}
+
+
+def register_parser(name: str, label: str, extensions: tuple, target: str,
+                    sniff: Optional[Callable] = None) -> Callable:
+    """
+    PURPOSE:
+        Decorator that registers a parser backend; the decorated function
+        builds the parser.
+
+    PARAMETERS:
+        name (str): Registry key
+        label (str): Console label
+        extensions (tuple[str]): Extensions claimed, with the dot
+        target (str): "module:Class" of the parser (imported lazily)
+        sniff (callable, optional): FileProbe -> bool
+
+    RETURNS:
+        Decorator returning the build function unchanged
+
+    WHY THIS APPROACH:
+        Same shape as config_registry.register_compiler: a format is added
+        by registering it next to its code, and nothing that dispatches on
+        formats needs to change.
+    """
+    def decorator(build: Callable) -> Callable:
+        _BACKENDS[name] = ParserBackend(name, label, extensions, target, sniff, build)
+        return build
+    return decorator
+
+
+def get_backends() -> list[ParserBackend]:
+    """Registered backends in sniffing order."""
+    return list(_BACKENDS.values())
+
+
+def supported_extensions() -> list[str]:
+    """Every extension some backend claims, in registration order."""
+    return list(dict.fromkeys(ext for backend in _BACKENDS.values() for ext in backend.extensions))
+
+
+def detect_format(path: str) -> tuple[ParserBackend, bool]:
+    """
+    PURPOSE:
+        Choose the backend for a file.
+
+    PARAMETERS:
+        path (str): Input file (must exist)
+
+    RETURNS:
+        tuple: (backend, mislabelled) - mislabelled is True when the
+            content belongs to a format the extension doesn't claim
+
+    RAISES:
+        ValueError: If neither the content nor the extension is supported
+
+    WHY THIS APPROACH:
+        The extension is the first guess and its backend's sniffer confirms
+        it. If it doesn't, every sniffer gets a look and the first match
+        wins. If nothing recognises the content (an empty file, a legacy
+        .xls), the extension decides and that parser reports the problem.
+    """
+    probe = FileProbe(path)
+    claimed = [b for b in _BACKENDS.values() if probe.extension in b.extensions]
+
+    for backend in claimed:
+        if backend.matches(probe):
+            return backend, False
+
+    for backend in _BACKENDS.values():
+        if backend not in claimed and backend.matches(probe):
+            return backend, True
+
+    if claimed:
+        return claimed[0], False
+
+    formats = "\n".join(
+        f"  {backend.label}: {', '.join(backend.extensions)}" for backend in _BACKENDS.values()
+    )
+    raise ValueError(
+        f"Unsupported file format: {probe.extension or '(no extension)'}\n"
+        f"Supported formats: {', '.join(supported_extensions())}\n{formats}"
+    )
+
+
+# ============================================================================
+# SNIFFERS
+# ============================================================================
+
+def _sniff_excel(probe: FileProbe) -> bool:
+    """Office Open XML workbook (.xlsx / .xlsm)."""
+    return 'xl/workbook.xml' in probe.zip_names
+
+
+def _sniff_word(probe: FileProbe) -> bool:
+    """Office Open XML document (.docx)."""
+    return 'word/document.xml' in probe.zip_names
+
+
+def _sniff_svg(probe: FileProbe) -> bool:
+    """XML whose opening text (declaration, comments, doctype) reaches <svg."""
+    text = probe.text
+    return text.startswith('<') and '<svg' in text
+
+
+def _sniff_lucidchart_csv(probe: FileProbe) -> bool:
+    """Text whose first line is a CSV header with Lucidchart's columns."""
+    if b'\x00' in probe.head or probe.is_zip:
+        return False
+
+    text = probe.text
+    if not text or text.startswith('<'):
+        return False
+
+    import csv
+    header = next(csv.reader([text.splitlines()[0]]), [])
+    columns = {column.strip().lower() for column in header}
+    has_id = bool(columns & {'id', 'shape id'})
+    has_shape = bool(columns & {'name', 'shape library', 'text area 1', 'line source'})
+    return len(header) > 1 and has_id and has_shape
+
+
+# ============================================================================
+# BUILT-IN BACKENDS
+# ============================================================================
+# Registration order is sniffing order: the zip formats first (their check
+# is exact), then SVG, then the looser CSV header check.
+
+@register_parser('excel', label="Excel file", extensions=('.xlsx', '.xls', '.xlsm'),
+                 target='parsers.excel_parser:ExcelParser', sniff=_sniff_excel)
+def _build_excel(parser_class, path: str, file_format: Optional[str], options: dict):
+    return parser_class(path, file_format='xlsx' if file_format else None)
+
+
+@register_parser('word', label="Word document (.docx)", extensions=('.docx',),
+                 target='parsers.word_parser:WordParser', sniff=_sniff_word)
+def _build_word(parser_class, path: str, file_format: Optional[str], options: dict):
+    return parser_class(
+        path,
+        jobs=options.get('parse_jobs'),
+        backend=options.get('word_backend') or 'docx',
+        file_format='docx' if file_format else None
+    )
+
+
+@register_parser('lucidchart_csv', label="Lucidchart export (.csv)", extensions=('.csv',),
+                 target='parsers.lucidchart_parser:LucidchartParser', sniff=_sniff_lucidchart_csv)
+def _build_lucidchart_csv(parser_class, path: str, file_format: Optional[str], options: dict):
+    return parser_class(path, order=options.get('lucidchart_order') or 'document',
+                        file_format='csv')
+
+
+@register_parser('lucidchart_svg', label="Lucidchart export (.svg)", extensions=('.svg',),
+                 target='parsers.lucidchart_parser:LucidchartParser', sniff=_sniff_svg)
+def _build_lucidchart_svg(parser_class, path: str, file_format: Optional[str], options: dict):
+    return parser_class(path, order=options.get('lucidchart_order') or 'document',
+                        file_format='svg')
@@ -23,7 +23,8 @@
 # ============================================================================
 
 import os
-from typing import Optional
+import re
+from typing import Iterator, Optional
 
 # openpyxl for Excel file reading
 try:
@@ -31,6 +32,11 @@ try:
 except ImportError:
     raise ImportError("openpyxl required. Install with: pip3 install openpyxl")
 
+# "As a X, I want to Y, so that Z" -> Y (compiled once, used for every row)
+_CAPABILITY_RE = re.compile(
+    r'I want(?:\s+to)?\s+(.+?)(?:,\s*so that|$)', re.IGNORECASE
+)
+
 
 class UserStoryParser:
     """
@@ -130,97 +136,128 @@ class UserStoryParser:
             - Exclude: Status = "Out of Scope"
             - Flag: Status = "Needs Discussion" (included but flagged)
         """
-        wb = load_workbook(self.filepath, data_only=True)
-
-        # Find the sheet
-        if self.sheet_name not in wb.sheetnames:
-            # Try to find a similar sheet
-            available = ', '.join(wb.sheetnames)
-            raise ValueError(
-                f"Sheet '{self.sheet_name}' not found.\n"
-                f"Available sheets: {available}"
-            )
-
-        ws = wb[self.sheet_name]
-
-        # Detect column mapping from header row
-        column_map = self._detect_columns(ws)
-
-        # Parse stories
-        stories = []
-
-        for row_idx in range(2, ws.max_row + 1):
-            story = self._parse_row(ws, row_idx, column_map)
-
-            if story is None:
-                continue
-
-            self.stats['total_rows'] += 1
-
-            # Filter by status
-            status = story.get('status', 'Draft')
+        return list(self.iter_parse())
 
-            if status == 'Out of Scope':
-                self.stats['stories_excluded'] += 1
-                self.stats['out_of_scope'] += 1
-                continue
-
-            # Include the story
-            self.stats['stories_included'] += 1
+    def iter_parse(self) -> Iterator[dict]:
+        """
+        PURPOSE:
+            Stream refined user stories from Excel, one included story at a
+            time, applying the same filter logic as parse().
 
-            if status == 'Approved':
-                self.stats['approved'] += 1
-            elif status == 'Draft':
-                self.stats['draft'] += 1
-            elif status == 'Pending Client Review':
-                self.stats['pending_client_review'] += 1
-                story['flags'].append('pending_client_review')
-            elif status == 'Needs Discussion':
-                self.stats['needs_discussion'] += 1
-                story['flags'].append('needs_discussion')
+        RETURNS:
+            Iterator[dict]: User story dictionaries in sheet order
 
-            # Track technical vs non-technical
-            if story.get('is_technical', True):
-                self.stats['technical'] += 1
-            else:
-                self.stats['non_technical'] += 1
+        WHY THIS APPROACH:
+            The workbook is opened read-only and rows come from
+            iter_rows(values_only=True) as plain tuples, indexed by the
+            positions _detect_columns() found in the header. Read-only mode
+            never builds the cell grid, so a 10k-story review workbook is
+            read in one forward pass with flat memory, and the UAT generator
+            can start on the first story while the rest are still being read.
 
-            stories.append(story)
+            Stats are updated as rows are read, so get_stats() is complete
+            once the iterator is exhausted.
 
-        return stories
+        R EQUIVALENT:
+            readxl::read_excel() row by row, with dplyr::filter(status != "Out of Scope")
+        """
+        wb = load_workbook(self.filepath, read_only=True, data_only=True)
 
-    def _detect_columns(self, ws) -> dict:
+        try:
+            # Find the sheet
+            if self.sheet_name not in wb.sheetnames:
+                available = ', '.join(wb.sheetnames)
+                raise ValueError(
+                    f"Sheet '{self.sheet_name}' not found.\n"
+                    f"Available sheets: {available}"
+                )
+
+            rows = wb[self.sheet_name].iter_rows(values_only=True)
+
+            # Detect column mapping from header row
+            header = next(rows, None)
+            if header is None:
+                return
+            column_map = self._detect_columns(header)
+
+            for row_idx, values in enumerate(rows, start=2):
+                story = self._parse_row(values, row_idx, column_map)
+
+                if story is None:
+                    continue
+
+                self.stats['total_rows'] += 1
+
+                # Filter by status
+                status = story.get('status', 'Draft')
+
+                if status == 'Out of Scope':
+                    self.stats['stories_excluded'] += 1
+                    self.stats['out_of_scope'] += 1
+                    continue
+
+                # Include the story
+                self.stats['stories_included'] += 1
+
+                if status == 'Approved':
+                    self.stats['approved'] += 1
+                elif status == 'Draft':
+                    self.stats['draft'] += 1
+                elif status == 'Pending Client Review':
+                    self.stats['pending_client_review'] += 1
+                    story['flags'].append('pending_client_review')
+                elif status == 'Needs Discussion':
+                    self.stats['needs_discussion'] += 1
+                    story['flags'].append('needs_discussion')
+
+                # Track technical vs non-technical
+                if story.get('is_technical', True):
+                    self.stats['technical'] += 1
+                else:
+                    self.stats['non_technical'] += 1
+
+                yield story
+        finally:
+            # Read-only workbooks keep the file handle open until closed
+            wb.close()
+
+    def _detect_columns(self, header: tuple) -> dict:
         """
         PURPOSE:
-            Detect column indices from header row.
+            Detect column positions from the header row values.
 
         RETURNS:
-            dict: Maps column name to column index (1-based)
+            dict: Maps column name to column index (0-based, for row tuples)
         """
         column_map = {}
-        header_row = 1
 
-        for col_idx in range(1, ws.max_column + 1):
-            header = ws.cell(row=header_row, column=col_idx).value
-            if header:
-                header = str(header).strip()
-                column_map[header] = col_idx
+        for col_idx, header_value in enumerate(header):
+            if header_value:
+                column_map[str(header_value).strip()] = col_idx
 
         return column_map
 
-    def _parse_row(self, ws, row_idx: int, column_map: dict) -> Optional[dict]:
+    def _parse_row(self, values: tuple, row_idx: int, column_map: dict) -> Optional[dict]:
         """
         PURPOSE:
-            Parse a single row into a user story dict.
+            Parse a single row of cell values into a user story dict.
+
+        PARAMETERS:
+            values (tuple): Cell values for the row (from iter_rows)
+            row_idx (int): 1-based sheet row number
+            column_map (dict): Column name -> 0-based index
 
         RETURNS:
             dict or None if row is empty
         """
+        row_len = len(values)
+
         def get_cell(col_name: str, default=''):
             """Helper to get cell value by column name."""
             col_idx = column_map.get(col_name)
-            if col_idx:
-                value = ws.cell(row=row_idx, column=col_idx).value
+            # Read-only rows can be shorter than the header when trailing cells are empty
+            if col_idx is not None and col_idx < row_len:
+                value = values[col_idx]
                 return value if value is not None else default
             return default
 
@@ -296,8 +333,7 @@ class UserStoryParser:
             Extract capability from user story text.
             "As a X, I want to Y, so that Z" → Y
         """
-        import re
-        match = re.search(r'I want(?:\s+to)?\s+(.+?)(?:,\s*so that|$)', user_story, re.IGNORECASE)
+        match = _CAPABILITY_RE.search(user_story)
         if match:
             return match.group(1).strip()
         return user_story[:50]  # Fallback to first 50 chars
@@ -13,9 +13,13 @@
 # authors use different structures. This module handles that chaos.
 # ============================================================================
 
+import math
+import os
 import re
+import zipfile
+from collections import Counter
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 from collections import defaultdict
 
 # python-docx is the go-to library for reading Word documents in Python
@@ -32,6 +36,71 @@ except ImportError:
     DOCX_AVAILABLE = False
     Document = None
 
+# lxml (a python-docx dependency) powers the streaming backend, which reads
+# word/document.xml directly and doesn't need python-docx at all
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+# ============================================================================
+# LIGHTWEIGHT BODY ELEMENTS
+# ============================================================================
+# WHY: Requirement extraction only reads a paragraph's text, style name and
+# list numbering, and a table's cell texts. Reducing the python-docx objects
+# to these plain tuples once lets the extraction logic run anywhere - in a
+# worker process (parallel mode), or on elements read by another backend -
+# and avoids re-walking the XML for every cell lookup.
+
+class DocParagraph(NamedTuple):
+    """A body paragraph: its text, style name and Word list numbering flag."""
+    text: str
+    style: str
+    numbered: bool
+
+
+class DocTable(NamedTuple):
+    """A body table as rows of cell texts (merged cells repeated per grid column)."""
+    rows: list
+
+
+# Body elements per parallel shard below which a pool costs more than it saves
+PARALLEL_MIN_ELEMENTS = 2000
+
+# Backends that turn a .docx into DocParagraph/DocTable items
+#   docx: python-docx object model (default)
+#   lxml: stream word/document.xml with iterparse, clearing as it goes
+WORD_BACKENDS = ('docx', 'lxml')
+
+# WordprocessingML / package namespaces for the lxml backend
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_RT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+
+# Run children with a fixed text equivalent (as python-docx renders them)
+_RUN_SYMBOLS = {
+    f'{_W}tab': '\t',
+    f'{_W}ptab': '\t',
+    f'{_W}cr': '\n',
+    f'{_W}noBreakHyphen': '-',
+}
+
+# Near-duplicate detection (see WordParser._deduplicate_requirements)
+#   Word bigrams, compared by Jaccard similarity. Canonicalisation already
+#   absorbs numbering, punctuation, articles and shall/must, so the default
+#   stays strict: one changed word in a typical sentence ("Users" vs
+#   "Coordinators", "PDF" vs "CSV") is a different requirement and is kept.
+DEFAULT_DEDUP_THRESHOLD = 0.95
+DEDUP_SHINGLE_SIZE = 2
+
+# Built-in styles whose styles.xml name is lowercase ("heading 1" → "Heading 1")
+_UI_STYLE_NAMES = {
+    'caption': 'Caption', 'footer': 'Footer', 'header': 'Header',
+    **{f'heading {n}': f'Heading {n}' for n in range(1, 10)},
+}
+
 
 class WordParser:
     """
@@ -74,7 +143,10 @@ class WordParser:
         4. MIXED FORMAT: Combination of all the above
     """
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, file_path: str, jobs: Optional[int] = None,
+                 backend: str = 'docx',
+                 dedup_threshold: float = DEFAULT_DEDUP_THRESHOLD,
+                 file_format: Optional[str] = None) -> None:
         """
         PURPOSE:
             Initialize the parser with a path to a Word document.
@@ -87,39 +159,81 @@ class WordParser:
         PARAMETERS:
             file_path (str): Path to the Word document
                             Example: "inputs/word/requirements.docx"
+            jobs (int, optional): Worker processes for parse(). With more
+                            than one, the body is split at top-level headings
+                            and the sections are parsed in parallel
+                            (default: 1, parse in this process)
+            backend (str): How the .docx is read - 'docx' (python-docx
+                            object model) or 'lxml' (stream the body XML,
+                            for very large documents). Both produce the
+                            same requirements.
+            dedup_threshold (float): Shingle similarity (0.0-1.0) at or
+                            above which a requirement is dropped as a
+                            near-duplicate of an earlier one (1.0 = only
+                            repeats that are identical once canonicalised)
+            file_format (str, optional): 'docx' when the content is already
+                            known to be a Word document (parsers.registry
+                            sniffed it), so the extension isn't checked
 
         RETURNS:
             None (constructor)
 
         RAISES:
             FileNotFoundError: If file doesn't exist
-            ValueError: If file is not a .docx file
+            ValueError: If file is not a .docx file, backend is unknown, or
+                        dedup_threshold is outside (0, 1]
 
         WHY THIS APPROACH:
             We validate early but don't parse yet — allows user to
             configure options before the expensive parsing operation.
         """
-        if not DOCX_AVAILABLE:
+        if backend not in WORD_BACKENDS:
+            raise ValueError(
+                f"Unknown Word backend: {backend}. "
+                f"Choose from: {', '.join(WORD_BACKENDS)}"
+            )
+
+        if backend == 'docx' and not DOCX_AVAILABLE:
             raise ImportError(
                 "python-docx is required for Word parsing. "
                 "Install with: pip install python-docx"
             )
 
+        if backend == 'lxml' and not LXML_AVAILABLE:
+            raise ImportError(
+                "lxml is required for the streaming Word backend. "
+                "Install with: pip install lxml"
+            )
+
+        if not 0.0 < dedup_threshold <= 1.0:
+            raise ValueError(
+                f"dedup_threshold must be between 0 and 1, got {dedup_threshold}"
+            )
+
         self.file_path = Path(file_path)
+        self.jobs = max(1, jobs or 1)
+        self.backend = backend
+        self.dedup_threshold = dedup_threshold
 
         # Validate file exists
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
-        # Validate extension
-        if self.file_path.suffix.lower() not in ['.docx', '.doc']:
+        # Validate extension (unless the content was already identified)
+        if file_format not in (None, 'docx'):
+            raise ValueError(
+                f"Invalid file type: {file_format}. "
+                "WordParser only supports .docx files."
+            )
+
+        if file_format is None and self.file_path.suffix.lower() not in ['.docx', '.doc']:
             raise ValueError(
                 f"Invalid file type: {self.file_path.suffix}. "
                 "WordParser only supports .docx files."
             )
 
         # Note: .doc (old Word format) requires different handling
-        if self.file_path.suffix.lower() == '.doc':
+        if file_format is None and self.file_path.suffix.lower() == '.doc':
             raise ValueError(
                 "Old .doc format not supported. Please save as .docx first."
             )
@@ -142,6 +256,7 @@ class WordParser:
             'requirements_from_lists': 0,
             'sections_found': 0,
             'comments_extracted': 0,
+            'duplicates_removed': 0,
             'total_requirements': 0
         }
 
@@ -192,6 +307,19 @@ class WordParser:
                      'rationale', 'justification']
         }
 
+        # Words treated as the same when comparing requirements for
+        # duplicates. WHY: "The system shall..." and "The system must..."
+        # in two parts of a spec are the same obligation.
+        self.dedup_equivalents = {
+            'must': 'shall',
+            'will': 'shall',
+            'required': 'shall',
+        }
+
+        # Words left out of that comparison ("the retention period" and
+        # "a retention period" are the same requirement)
+        self.dedup_stopwords = {'a', 'an', 'the'}
+
         # Priority keyword mappings (same as other parsers for consistency)
         self.priority_keywords = {
             'critical': ['critical', 'must have', 'must-have', 'essential',
@@ -236,32 +364,74 @@ class WordParser:
             We process the document in order, maintaining section context
             from headings. This preserves the document's organizational
             structure and gives us category information for free.
-        """
-        # Load the document
-        self.document = Document(str(self.file_path))
 
-        # Storage for extracted requirements
-        requirements = []
-
-        # Track paragraph number for reference
-        para_number = 0
-
-        # Track table number for reference
-        table_number = 0
+            With jobs > 1, the body is split into shards at top-level
+            headings (see _shard_elements) and each shard is parsed in a
+            worker process. Results are merged in document order, so the
+            output is the same as a serial parse.
 
+            With the lxml backend and a serial parse, body elements are
+            read and parsed one at a time, so memory holds the extracted
+            requirements rather than the whole document.
+        """
         # ====================================================================
         # PROCESS DOCUMENT BODY
         # ====================================================================
         # Word documents have a body containing paragraphs and tables
         # We iterate through in document order to maintain context
+        body_elements = self._iter_body_elements()
 
-        # Get all body elements (paragraphs and tables)
-        # WHY: python-docx provides separate iterators for each, but we need
-        # to process them in document order for section context
-        body_elements = self._get_body_elements()
+        # More workers than CPUs only adds process overhead
+        workers = min(self.jobs, os.cpu_count() or 1)
+        shards = []
+        if workers > 1:
+            body_elements = list(body_elements)
+            shards = self._shard_elements(body_elements, workers)
 
-        for element in body_elements:
-            if isinstance(element, Paragraph):
+        if len(shards) > 1:
+            requirements = self._parse_shards_parallel(shards, workers)
+        else:
+            requirements = self._parse_elements(body_elements)
+
+        # ====================================================================
+        # POST-PROCESSING
+        # ====================================================================
+
+        # Extract any comments from the document
+        comment_requirements = self._extract_comments()
+        requirements.extend(comment_requirements)
+
+        # Deduplicate requirements (sometimes same text appears multiple places)
+        requirements = self._deduplicate_requirements(requirements)
+
+        # Update stats
+        self.stats['total_requirements'] = len(requirements)
+
+        return requirements
+
+    def _parse_elements(self, elements: list, para_number: int = 0,
+                        table_number: int = 0) -> list[dict]:
+        """
+        PURPOSE:
+            Extract requirements from a run of body elements, in order.
+
+        PARAMETERS:
+            elements (list): DocParagraph / DocTable items
+            para_number (int): Paragraphs before the first element
+            table_number (int): Tables before the first element
+
+        RETURNS:
+            list[dict]: Requirements, in document order
+
+        WHY THIS APPROACH:
+            Paragraph and table numbers continue from the given offsets, so
+            a shard parsed on its own numbers its requirements exactly as a
+            full pass over the document would.
+        """
+        requirements = []
+
+        for element in elements:
+            if isinstance(element, DocParagraph):
                 para_number += 1
                 self.stats['paragraphs_parsed'] += 1
 
@@ -274,7 +444,7 @@ class WordParser:
                 para_requirements = self._parse_paragraph(element, para_number)
                 requirements.extend(para_requirements)
 
-            elif isinstance(element, Table):
+            else:
                 table_number += 1
                 self.stats['tables_parsed'] += 1
 
@@ -282,19 +452,89 @@ class WordParser:
                 table_requirements = self._parse_table(element, table_number)
                 requirements.extend(table_requirements)
 
-        # ====================================================================
-        # POST-PROCESSING
-        # ====================================================================
+        return requirements
 
-        # Extract any comments from the document
-        comment_requirements = self._extract_comments()
-        requirements.extend(comment_requirements)
+    # ========================================================================
+    # PARALLEL PARSING
+    # ========================================================================
 
-        # Deduplicate requirements (sometimes same text appears multiple places)
-        requirements = self._deduplicate_requirements(requirements)
+    def _shard_elements(self, elements: list, workers: int) -> list[tuple]:
+        """
+        PURPOSE:
+            Split the body into shards that can be parsed independently.
 
-        # Update stats
-        self.stats['total_requirements'] = len(requirements)
+        PARAMETERS:
+            elements (list): All DocParagraph / DocTable items in order
+            workers (int): Worker processes the shards will be spread over
+
+        RETURNS:
+            list[tuple]: (elements, para_offset, table_offset) per shard,
+                         or [] if the document is too small to be worth it
+
+        WHY THIS APPROACH:
+            A top-level heading clears the whole section stack in
+            _update_section_context, so a shard that starts at one begins
+            with exactly the context a serial pass would have there. Runs of
+            whole sections are grouped into roughly workers * 4 shards of
+            similar size, so one long chapter doesn't leave the other
+            workers idle for the whole parse.
+        """
+        if len(elements) < PARALLEL_MIN_ELEMENTS * 2:
+            return []
+
+        # Start index of every top-level section
+        starts = [0] + [
+            idx for idx, element in enumerate(elements)
+            if idx and isinstance(element, DocParagraph)
+            and self._is_heading(element) and element.text.strip()
+            and self._heading_level(element.style) == 1
+        ]
+
+        target = max(PARALLEL_MIN_ELEMENTS, len(elements) // (workers * 4))
+        shards = []
+        shard_start = 0
+        para_offset = table_offset = 0
+
+        for next_start in starts[1:] + [len(elements)]:
+            if next_start - shard_start < target and next_start < len(elements):
+                continue
+            shard = elements[shard_start:next_start]
+            shards.append((shard, para_offset, table_offset))
+            tables = sum(1 for element in shard if isinstance(element, DocTable))
+            para_offset += len(shard) - tables
+            table_offset += tables
+            shard_start = next_start
+
+        return shards
+
+    def _parse_shards_parallel(self, shards: list[tuple], workers: int) -> list[dict]:
+        """
+        PURPOSE:
+            Parse shards in a process pool and merge results and stats in
+            document order.
+
+        WHY THIS APPROACH:
+            Workers receive only the plain DocParagraph/DocTable tuples, not
+            python-docx objects, so shipping a shard is cheap. If a process
+            pool can't be started on this platform, the shards are parsed
+            here instead.
+        """
+        tasks = [(str(self.file_path), self.backend, shard, para_offset, table_offset)
+                 for shard, para_offset, table_offset in shards]
+
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                results = list(pool.map(_parse_word_shard, tasks))
+        except (OSError, NotImplementedError, ImportError):
+            results = [(self._parse_elements(shard, para_offset, table_offset), None)
+                       for shard, para_offset, table_offset in shards]
+
+        requirements = []
+        for shard_requirements, shard_stats in results:
+            requirements.extend(shard_requirements)
+            for key, value in (shard_stats or {}).items():
+                self.stats[key] += value
 
         return requirements
 
@@ -302,6 +542,23 @@ class WordParser:
     # DOCUMENT STRUCTURE HELPERS
     # ========================================================================
 
+    def _iter_body_elements(self):
+        """
+        PURPOSE:
+            Body elements (DocParagraph / DocTable) in document order, from
+            the configured backend.
+
+        RETURNS:
+            list (docx backend) or iterator (lxml backend)
+        """
+        if self.backend == 'lxml':
+            return self._stream_body_elements()
+
+        # Load the document
+        if self.document is None:
+            self.document = Document(str(self.file_path))
+        return self._get_body_elements()
+
     def _get_body_elements(self) -> list:
         """
         PURPOSE:
@@ -312,39 +569,255 @@ class WordParser:
             in a data frame with their positions.
 
         RETURNS:
-            list: Mixed list of Paragraph and Table objects
+            list: Mixed list of DocParagraph and DocTable items
 
         WHY THIS APPROACH:
             python-docx's Document.paragraphs and Document.tables give
             us elements separately. We need to interleave them in the
-            order they appear in the document to track section context.
+            order they appear in the document to track section context,
+            so we walk the body XML once and wrap each child directly.
+            Style names are resolved once per style ID.
         """
         # Access the document body XML directly
         # WHY: This gives us elements in document order
         body = self.document.element.body
+        parent = self.document._body
+        style_names = {}
         elements = []
 
         # Iterate through all child elements of the body
-        for child in body:
+        for child in body.iterchildren():
             # Check if it's a paragraph
             if child.tag == qn('w:p'):
-                # Find the corresponding Paragraph object
-                for para in self.document.paragraphs:
-                    if para._element is child:
-                        elements.append(para)
-                        break
+                paragraph = Paragraph(child, parent)
+                style_id = child.style
+                if style_id not in style_names:
+                    style = paragraph.style
+                    style_names[style_id] = (style.name or '') if style else ''
+
+                pPr = child.pPr
+                elements.append(DocParagraph(
+                    paragraph.text,
+                    style_names[style_id],
+                    pPr is not None and pPr.numPr is not None
+                ))
 
             # Check if it's a table
             elif child.tag == qn('w:tbl'):
-                # Find the corresponding Table object
-                for table in self.document.tables:
-                    if table._tbl is child:
-                        elements.append(table)
-                        break
+                table = Table(child, parent)
+                elements.append(DocTable([
+                    [self._get_cell_text(cell) for cell in row.cells]
+                    for row in table.rows
+                ]))
 
         return elements
 
-    def _is_heading(self, paragraph: Paragraph) -> bool:
+    # ========================================================================
+    # STREAMING BACKEND (lxml)
+    # ========================================================================
+    # WHY: python-docx parses the whole document into an object tree, and
+    # every paragraph/cell access re-runs XPath over it. For 300-page
+    # specifications that dominates parse time and memory. This backend
+    # reads the body XML straight out of the .docx zip with iterparse,
+    # converts each top-level paragraph or table as soon as it is complete,
+    # and then frees it. It reproduces python-docx's text rules (tabs,
+    # breaks, hyperlinks, merged cells, style names), so the extraction
+    # logic sees identical input.
+    #
+    # AVIATION ANALOGY:
+    #     Like reading a checklist item by item instead of photocopying the
+    #     whole manual first - you only hold the line you're on.
+
+    def _stream_body_elements(self):
+        """
+        PURPOSE:
+            Yield body paragraphs and tables from word/document.xml without
+            building the python-docx object model.
+
+        RETURNS:
+            Iterator of DocParagraph / DocTable, in document order
+
+        WHY THIS APPROACH:
+            iterparse fires an "end" event when an element is complete.
+            Paragraphs and tables nested inside a table are left for the
+            table's own event; top-level ones are converted, cleared, and
+            their processed siblings removed from the body, so the tree never
+            holds more than the element being read.
+        """
+        with zipfile.ZipFile(self.file_path) as package:
+            document_part = self._package_target(
+                package, '_rels/.rels', _RT + 'officeDocument', 'word/document.xml'
+            )
+            style_names, default_style = self._read_style_names(package, document_part)
+
+            body_tag = f'{_W}body'
+            p_tag = f'{_W}p'
+
+            with package.open(document_part) as stream:
+                for _, element in etree.iterparse(
+                    stream, events=('end',), tag=(p_tag, f'{_W}tbl')
+                ):
+                    parent = element.getparent()
+                    if parent is None or parent.tag != body_tag:
+                        continue  # Inside a table (or other container)
+
+                    if element.tag == p_tag:
+                        yield DocParagraph(
+                            self._xml_paragraph_text(element),
+                            style_names.get(self._xml_style_id(element), default_style),
+                            element.find(f'{_W}pPr/{_W}numPr') is not None
+                        )
+                    else:
+                        yield DocTable(self._xml_table_rows(element))
+
+                    # Free this element and everything before it
+                    element.clear(keep_tail=True)
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+    def _package_target(self, package: zipfile.ZipFile, rels_name: str,
+                        rel_type: str, default: str) -> str:
+        """
+        PURPOSE:
+            Resolve the zip member a relationship of rel_type points to.
+
+        RETURNS:
+            str: Member name (default if the relationship isn't found)
+        """
+        try:
+            rels = etree.fromstring(package.read(rels_name))
+        except (KeyError, etree.XMLSyntaxError):
+            return default
+
+        base = rels_name.split('_rels/')[0]
+        for rel in rels.iter(f'{_REL}Relationship'):
+            if rel.get('Type') == rel_type and rel.get('TargetMode') != 'External':
+                target = rel.get('Target', '')
+                if target.startswith('/'):
+                    return target.lstrip('/')
+                return os.path.normpath(base + target).replace(os.sep, '/')
+
+        return default
+
+    def _read_style_names(self, package: zipfile.ZipFile,
+                          document_part: str) -> tuple[dict, str]:
+        """
+        PURPOSE:
+            Map paragraph style IDs to display names from the styles part.
+
+        RETURNS:
+            tuple: ({style_id: name}, default paragraph style name)
+
+        WHY THIS APPROACH:
+            python-docx resolves a missing or unknown style ID to the
+            document's default paragraph style, and shows built-in names
+            like "heading 1" as "Heading 1". Both are reproduced here.
+        """
+        folder, _, filename = document_part.rpartition('/')
+        rels_name = f"{folder}/_rels/{filename}.rels" if folder else f"_rels/{filename}.rels"
+        styles_part = self._package_target(
+            package, rels_name, _RT + 'styles', 'word/styles.xml'
+        )
+
+        names = {}
+        default_name = ''
+        try:
+            styles = etree.fromstring(package.read(styles_part))
+        except (KeyError, etree.XMLSyntaxError):
+            return names, default_name
+
+        for style in styles.iter(f'{_W}style'):
+            if style.get(f'{_W}type', 'paragraph') != 'paragraph':
+                continue
+            name_element = style.find(f'{_W}name')
+            name = name_element.get(f'{_W}val') if name_element is not None else None
+            name = _UI_STYLE_NAMES.get(name, name) or ''
+            names[style.get(f'{_W}styleId')] = name
+            if style.get(f'{_W}default') in ('1', 'true', 'on'):
+                default_name = name
+
+        return names, default_name
+
+    def _xml_style_id(self, paragraph) -> Optional[str]:
+        """Style ID of a <w:p> element (None if it has no w:pStyle)."""
+        style = paragraph.find(f'{_W}pPr/{_W}pStyle')
+        return style.get(f'{_W}val') if style is not None else None
+
+    def _xml_run_text(self, run) -> str:
+        """Text of a <w:r> element, rendered the way python-docx's Run.text is."""
+        parts = []
+        for child in run:
+            tag = child.tag
+            if tag == f'{_W}t':
+                parts.append(child.text or '')
+            elif tag == f'{_W}br':
+                # Line breaks become newlines; page/column breaks are dropped
+                if child.get(f'{_W}type', 'textWrapping') == 'textWrapping':
+                    parts.append('\n')
+            elif tag in _RUN_SYMBOLS:
+                parts.append(_RUN_SYMBOLS[tag])
+        return ''.join(parts)
+
+    def _xml_paragraph_text(self, paragraph) -> str:
+        """Text of a <w:p> element: its runs, including runs inside hyperlinks."""
+        parts = []
+        for child in paragraph:
+            if child.tag == f'{_W}r':
+                parts.append(self._xml_run_text(child))
+            elif child.tag == f'{_W}hyperlink':
+                parts.extend(self._xml_run_text(run) for run in child.iterchildren(f'{_W}r'))
+        return ''.join(parts)
+
+    def _xml_cell_text(self, cell) -> str:
+        """Text of a <w:tc> element, as _get_cell_text() builds it."""
+        texts = []
+        for paragraph in cell.iterchildren(f'{_W}p'):
+            text = self._xml_paragraph_text(paragraph).strip()
+            if text:
+                texts.append(text)
+        return '\n'.join(texts)
+
+    def _xml_table_rows(self, table) -> list[list[str]]:
+        """
+        PURPOSE:
+            Cell texts for each row of a <w:tbl>, laid out like python-docx
+            _Row.cells.
+
+        WHY THIS APPROACH:
+            A cell spanning several grid columns (w:gridSpan) is repeated
+            once per column, and a vertically merged continuation cell
+            (w:vMerge without "restart") repeats the text of the cell above
+            it, so column indexes line up with the header row.
+        """
+        rows = []
+        above = {}  # grid offset -> (text, span) in the previous row
+
+        for row in table.iterchildren(f'{_W}tr'):
+            grid_before = row.find(f'{_W}trPr/{_W}gridBefore')
+            offset = int(grid_before.get(f'{_W}val', 0)) if grid_before is not None else 0
+
+            cells = []
+            current = {}
+            for cell in row.iterchildren(f'{_W}tc'):
+                span_element = cell.find(f'{_W}tcPr/{_W}gridSpan')
+                span = int(span_element.get(f'{_W}val', 1)) if span_element is not None else 1
+                merge = cell.find(f'{_W}tcPr/{_W}vMerge')
+
+                if merge is not None and merge.get(f'{_W}val', 'continue') == 'continue':
+                    text, span = above.get(offset, ('', span))
+                else:
+                    text = self._xml_cell_text(cell)
+
+                current[offset] = (text, span)
+                cells.extend([text] * span)
+                offset += span
+
+            rows.append(cells)
+            above = current
+
+        return rows
+
+    def _is_heading(self, paragraph: DocParagraph) -> bool:
         """
         PURPOSE:
             Check if a paragraph is a heading (Heading 1, Heading 2, Title, etc.)
@@ -354,7 +827,7 @@ class WordParser:
             or check the style name.
 
         PARAMETERS:
-            paragraph (Paragraph): The paragraph to check
+            paragraph (DocParagraph): The paragraph to check
 
         RETURNS:
             bool: True if this is a heading paragraph
@@ -364,11 +837,29 @@ class WordParser:
             We check the style name to identify them. This includes
             both "Heading X" styles and "Title"/"Subtitle" styles.
         """
-        style_name = paragraph.style.name.lower() if paragraph.style else ''
+        style_name = paragraph.style.lower()
         heading_styles = ['heading', 'title', 'subtitle', 'toc heading']
         return any(style_name.startswith(hs) for hs in heading_styles)
 
-    def _update_section_context(self, heading: Paragraph) -> None:
+    def _heading_level(self, style: str) -> Optional[int]:
+        """
+        PURPOSE:
+            Section level of a heading style ("Heading 2" → 2).
+
+        RETURNS:
+            int or None: Level (1 if the style has no number), or None for
+                         Title/Subtitle, which don't start a section
+        """
+        style_name = style.lower()
+
+        # Title and Subtitle are level 0 (document level, not section)
+        if style_name.startswith('title') or style_name.startswith('subtitle'):
+            return None
+
+        level_match = re.search(r'(\d+)', style_name)
+        return int(level_match.group(1)) if level_match else 1
+
+    def _update_section_context(self, heading: DocParagraph) -> None:
         """
         PURPOSE:
             Update the current section context based on a heading.
@@ -379,7 +870,7 @@ class WordParser:
             a document: current_section <- heading_text
 
         PARAMETERS:
-            heading (Paragraph): The heading paragraph
+            heading (DocParagraph): The heading paragraph
 
         WHY THIS APPROACH:
             Headings provide natural categorization for requirements.
@@ -393,17 +884,13 @@ class WordParser:
             return
 
         # Get heading level from style (Heading 1, Heading 2, etc.)
-        style_name = heading.style.name.lower() if heading.style else ''
+        level = self._heading_level(heading.style)
 
-        # Title and Subtitle are level 0 (document level, not section)
-        if style_name.startswith('title') or style_name.startswith('subtitle'):
+        if level is None:
             # Don't include document title in section context
             self.stats['sections_found'] += 1
             return
 
-        level_match = re.search(r'(\d+)', style_name)
-        level = int(level_match.group(1)) if level_match else 1
-
         # Clean the heading text (remove numbering like "3.1 ")
         clean_heading = re.sub(r'^[\d.]+\s*', '', heading_text)
         clean_heading = clean_heading.strip()
@@ -423,7 +910,7 @@ class WordParser:
     # PARAGRAPH PARSING
     # ========================================================================
 
-    def _parse_paragraph(self, paragraph: Paragraph, para_number: int) -> list[dict]:
+    def _parse_paragraph(self, paragraph: DocParagraph, para_number: int) -> list[dict]:
         """
         PURPOSE:
             Extract requirements from a single paragraph.
@@ -434,7 +921,7 @@ class WordParser:
             requirement sentences within a text block.
 
         PARAMETERS:
-            paragraph (Paragraph): The paragraph to parse
+            paragraph (DocParagraph): The paragraph to parse
             para_number (int): Paragraph number for reference
 
         RETURNS:
@@ -513,7 +1000,7 @@ class WordParser:
 
         return requirements
 
-    def _is_list_item(self, paragraph: Paragraph) -> bool:
+    def _is_list_item(self, paragraph: DocParagraph) -> bool:
         """
         PURPOSE:
             Check if a paragraph is a list item (numbered or bulleted).
@@ -522,7 +1009,7 @@ class WordParser:
             In officer, list items have specific style markers.
 
         PARAMETERS:
-            paragraph (Paragraph): The paragraph to check
+            paragraph (DocParagraph): The paragraph to check
 
         RETURNS:
             bool: True if this is a list item
@@ -531,15 +1018,12 @@ class WordParser:
             Word stores list items as regular paragraphs with special
             numbering properties. We check the XML for list markers.
         """
-        # Check for list numbering in the XML
-        pPr = paragraph._element.find(qn('w:pPr'))
-        if pPr is not None:
-            numPr = pPr.find(qn('w:numPr'))
-            if numPr is not None:
-                return True
+        # Check for list numbering in the XML (w:numPr, read with the text)
+        if paragraph.numbered:
+            return True
 
         # Also check style name for list styles
-        style_name = paragraph.style.name if paragraph.style else ''
+        style_name = paragraph.style
         list_styles = ['list', 'bullet', 'number']
         if any(ls in style_name.lower() for ls in list_styles):
             return True
@@ -631,7 +1115,7 @@ class WordParser:
     # TABLE PARSING
     # ========================================================================
 
-    def _parse_table(self, table: Table, table_number: int) -> list[dict]:
+    def _parse_table(self, table: DocTable, table_number: int) -> list[dict]:
         """
         PURPOSE:
             Extract requirements from a Word table.
@@ -642,7 +1126,7 @@ class WordParser:
             then cleaning it up with janitor::row_to_names().
 
         PARAMETERS:
-            table (Table): The Word table object
+            table (DocTable): The table's cell texts
             table_number (int): Table number for reference
 
         RETURNS:
@@ -677,9 +1161,8 @@ class WordParser:
             if row_idx <= header_row_idx:
                 continue
 
-            # Extract cell values
-            cells = row.cells
-            cell_texts = [self._get_cell_text(cell) for cell in cells]
+            # Cell values (already extracted)
+            cell_texts = row
 
             # Skip empty rows
             if not any(cell_texts):
@@ -696,13 +1179,13 @@ class WordParser:
 
         return requirements
 
-    def _identify_table_structure(self, table: Table) -> tuple[int, Optional[dict]]:
+    def _identify_table_structure(self, table: DocTable) -> tuple[int, Optional[dict]]:
         """
         PURPOSE:
             Identify the header row and map columns to requirement fields.
 
         PARAMETERS:
-            table (Table): The Word table
+            table (DocTable): The table's cell texts
 
         RETURNS:
             tuple: (header_row_index, column_mapping_dict or None)
@@ -714,9 +1197,7 @@ class WordParser:
         """
         # Check first few rows for header patterns
         for row_idx in range(min(3, len(table.rows))):
-            row = table.rows[row_idx]
-            cells = row.cells
-            cell_texts = [self._get_cell_text(cell).lower() for cell in cells]
+            cell_texts = [text.lower() for text in table.rows[row_idx]]
 
             # Try to map columns
             column_map = {}
@@ -737,14 +1218,14 @@ class WordParser:
         # No clear header found
         return 0, None
 
-    def _parse_unstructured_table(self, table: Table, table_number: int) -> list[dict]:
+    def _parse_unstructured_table(self, table: DocTable, table_number: int) -> list[dict]:
         """
         PURPOSE:
             Try to extract requirements from a table without clear structure.
             Falls back to treating each row as potential requirement text.
 
         PARAMETERS:
-            table (Table): The Word table
+            table (DocTable): The table's cell texts
             table_number (int): Table number for reference
 
         RETURNS:
@@ -759,7 +1240,7 @@ class WordParser:
 
         for row_idx, row in enumerate(table.rows):
             # Concatenate all cell text in the row
-            row_text = ' '.join(self._get_cell_text(cell) for cell in row.cells)
+            row_text = ' '.join(row)
             row_text = row_text.strip()
 
             # Skip short/empty rows
@@ -917,16 +1398,14 @@ class WordParser:
         try:
             # Access the comments part of the document
             # WHY: Comments are stored separately in the .docx package
-            comments_part = self.document.part.package.part_related_by(
-                'http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments'
-            )
+            comments_blob = self._read_comments_blob()
 
-            if comments_part is None:
+            if comments_blob is None:
                 return requirements
 
             # Parse the comments XML
             from lxml import etree
-            comments_xml = etree.fromstring(comments_part.blob)
+            comments_xml = etree.fromstring(comments_blob)
 
             # Namespace for Word comments
             w_ns = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
@@ -969,6 +1448,25 @@ class WordParser:
 
         return requirements
 
+    def _read_comments_blob(self) -> Optional[bytes]:
+        """
+        PURPOSE:
+            Raw XML of the comments part related to the package, if any.
+
+        RETURNS:
+            bytes or None
+
+        WHY THIS APPROACH:
+            Both backends look the relationship up the same way (from the
+            package relationships), so they find the same comments.
+        """
+        if self.backend == 'lxml':
+            with zipfile.ZipFile(self.file_path) as package:
+                member = self._package_target(package, '_rels/.rels', _RT + 'comments', '')
+                return package.read(member) if member else None
+
+        return self.document.part.package.part_related_by(_RT + 'comments').blob
+
     # ========================================================================
     # TEXT PROCESSING UTILITIES
     # ========================================================================
@@ -1168,32 +1666,179 @@ class WordParser:
     def _deduplicate_requirements(self, requirements: list[dict]) -> list[dict]:
         """
         PURPOSE:
-            Remove duplicate requirements (same text appearing multiple times).
+            Remove duplicate and near-duplicate requirements, keeping the
+            first occurrence and noting where the others were found.
 
         PARAMETERS:
             requirements (list[dict]): All extracted requirements
 
         RETURNS:
-            list[dict]: Deduplicated list
+            list[dict]: Deduplicated list. A kept requirement's notes list
+                the source locations of the copies that were dropped.
 
         WHY THIS APPROACH:
             Word documents sometimes repeat content (in summary tables,
-            appendices, etc.). We keep the first occurrence.
+            appendices, etc.), and the copies rarely match exactly: the
+            numbering, punctuation or "shall"/"must" changes. Each text is
+            canonicalised (_dedup_shingles) and compared to earlier kept
+            requirements by Jaccard similarity of its word shingles.
+
+            Comparing every pair is O(n²) - the cost the story generator
+            pays downstream. Instead this is the "AllPairs" prefix filter:
+            shingles are ordered rarest-first, and two sets with similarity
+            >= t must share one of the first len - ceil(t * len) + 1
+            shingles of each (_dedup_min_size() does the ceil). Only those prefixes go into the inverted
+            index, so a lookup touches a few short posting lists (rare
+            shingles) rather than every requirement that says "the system".
+            Candidates are then size-filtered and checked exactly.
+
+        R EQUIVALENT:
+            # Exact repeats only:
+            # requirements[!duplicated(tolower(requirements$description)), ]
         """
-        seen_texts = set()
-        unique_requirements = []
+        threshold = self.dedup_threshold
 
+        # Canonical shingle set per requirement (None = too short to keep).
+        # Text with no letters or digits has no shingles; it is matched on
+        # its normalised text instead, so only exact repeats are dropped.
+        shingle_sets = []
         for req in requirements:
-            # Normalize text for comparison
-            normalized = req['description'].lower().strip()
-            normalized = re.sub(r'\s+', ' ', normalized)
+            normalized = re.sub(r'\s+', ' ', req['description'].lower().strip())
+            if len(normalized) <= 10:
+                shingle_sets.append(None)
+            else:
+                shingle_sets.append(self._dedup_shingles(req['description']) or normalized)
+
+        # Rarest-first ordering for prefixes (document frequency, then text)
+        frequency = Counter(
+            shingle for shingles in shingle_sets
+            if isinstance(shingles, frozenset) for shingle in shingles
+        )
+
+        unique_requirements = []
+        kept_shingles = []             # Parallel to unique_requirements
+        exact_index = {}               # frozenset (or bare text) -> kept position
+        prefix_index = {}              # shingle -> [kept positions]
+        also_found_at = {}             # kept position -> [source locations]
+
+        for req, key in zip(requirements, shingle_sets):
+            if key is None:
+                continue
+
+            match = exact_index.get(key)
+
+            if isinstance(key, str):
+                # Nothing comparable (no letters or digits) - exact repeats only
+                shingles, prefix = frozenset(), []
+            else:
+                shingles = key
+                ordered = sorted(shingles, key=lambda shingle: (frequency[shingle], shingle))
+                prefix = ordered[:len(ordered) - self._dedup_min_size(threshold, len(ordered)) + 1]
+
+            if match is None and prefix and threshold < 1.0:
+                match = self._find_near_duplicate(
+                    shingles, prefix, prefix_index, kept_shingles, threshold
+                )
+
+            if match is not None:
+                also_found_at.setdefault(match, []).append(req.get('source_cell', ''))
+                self.stats['duplicates_removed'] += 1
+                continue
+
+            position = len(unique_requirements)
+            unique_requirements.append(req)
+            kept_shingles.append(shingles)
+            exact_index[key] = position
+            for shingle in prefix:
+                prefix_index.setdefault(shingle, []).append(position)
 
-            if normalized not in seen_texts and len(normalized) > 10:
-                seen_texts.add(normalized)
-                unique_requirements.append(req)
+        # Record where the suppressed copies came from
+        for position, locations in also_found_at.items():
+            req = unique_requirements[position]
+            note = "Also found at: " + "; ".join(loc for loc in locations if loc)
+            req['notes'] = f"{req['notes']}; {note}" if req.get('notes') else note
 
         return unique_requirements
 
+    def _dedup_shingles(self, text: str) -> frozenset:
+        """
+        PURPOSE:
+            Canonicalise requirement text and split it into word shingles.
+
+        PARAMETERS:
+            text (str): Requirement description
+
+        RETURNS:
+            frozenset[str]: Word n-grams (DEDUP_SHINGLE_SIZE words each, or
+                the single words if the text is shorter than that)
+
+        WHY THIS APPROACH:
+            Canonicalisation removes what differs between copies of the same
+            requirement without changing its meaning: list markers and IDs
+            (via _clean_requirement_text), case, punctuation, articles
+            (dedup_stopwords), and modal verbs listed in dedup_equivalents.
+        """
+        canonical = self._clean_requirement_text(text).lower()
+        words = [
+            self.dedup_equivalents.get(word, word)
+            for word in re.findall(r'[a-z0-9]+', canonical)
+            if word not in self.dedup_stopwords
+        ]
+
+        if len(words) < DEDUP_SHINGLE_SIZE:
+            return frozenset(words)
+
+        return frozenset(
+            ' '.join(words[i:i + DEDUP_SHINGLE_SIZE])
+            for i in range(len(words) - DEDUP_SHINGLE_SIZE + 1)
+        )
+
+    @staticmethod
+    def _dedup_min_size(threshold: float, size: int) -> int:
+        """
+        PURPOSE:
+            Smallest whole number of shingles that is at least `threshold`
+            times `size`: ceil(threshold * size).
+
+        WHY THIS APPROACH:
+            The product is a float and can land just past a whole number
+            (0.28 * 25 = 7.000000000000001), which would round a sharp
+            threshold up by one and miss pairs exactly at it. Shingle counts
+            are integers, so the tolerance can't admit a wrong pair.
+        """
+        return math.ceil(threshold * size - 1e-9)
+
+    def _find_near_duplicate(self, shingles: frozenset, prefix: list,
+                             prefix_index: dict, kept_shingles: list,
+                             threshold: float) -> Optional[int]:
+        """
+        PURPOSE:
+            Find the earliest kept requirement whose shingle set is at least
+            `threshold` similar (Jaccard) to `shingles`.
+
+        RETURNS:
+            int or None: Position in the kept list
+        """
+        size = len(shingles)
+        candidates = set()
+        for shingle in prefix:
+            candidates.update(prefix_index.get(shingle, ()))
+
+        for position in sorted(candidates):
+            other = kept_shingles[position]
+
+            # Size filter: |A ∩ B| / |A ∪ B| can't reach t if one set is
+            # less than t times the size of the other
+            if (len(other) < self._dedup_min_size(threshold, size)
+                    or size < self._dedup_min_size(threshold, len(other))):
+                continue
+
+            overlap = len(shingles & other)
+            if overlap / (size + len(other) - overlap) >= threshold:
+                return position
+
+        return None
+
     # ========================================================================
     # PUBLIC UTILITIES
     # ========================================================================
@@ -1222,18 +1867,43 @@ class WordParser:
         WHY THIS APPROACH:
             Useful for understanding document structure.
         """
-        # Parse if not already done
-        if self.document is None:
-            self.parse()
-
         sections = []
-        for para in self.document.paragraphs:
-            if self._is_heading(para) and para.text.strip():
-                sections.append(para.text.strip())
+        for element in self._iter_body_elements():
+            if (isinstance(element, DocParagraph) and self._is_heading(element)
+                    and element.text.strip()):
+                sections.append(element.text.strip())
 
         return sections
 
 
+# ============================================================================
+# PARALLEL WORKER
+# ============================================================================
+
+def _parse_word_shard(task: tuple) -> tuple[list[dict], dict]:
+    """
+    PURPOSE:
+        Parse one shard of a document's body in a worker process.
+
+    PARAMETERS:
+        task (tuple): (file_path, backend, elements, para_offset, table_offset)
+
+    RETURNS:
+        tuple: (requirements, stats) for the shard
+
+    WHY THIS APPROACH:
+        Module-level so the process pool can pickle it. The worker builds
+        its own WordParser for the configuration and starts with an empty
+        section stack, which is what a top-level heading leaves behind.
+    """
+    file_path, backend, elements, para_offset, table_offset = task
+    parser = WordParser(file_path, backend=backend, file_format='docx')
+    requirements = parser._parse_elements(elements, para_offset, table_offset)
+    stats = {key: value for key, value in parser.stats.items()
+             if key not in ('comments_extracted', 'total_requirements')}
+    return requirements, stats
+
+
 # ============================================================================
 # STANDALONE TEST
 # ============================================================================
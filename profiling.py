@@ -0,0 +1,393 @@
+# profiling.py
+# ============================================================================
+# Span Recorder - per-stage timing and memory instrumentation
+# ============================================================================
+#
+# PURPOSE:
+#     Record how long each pipeline stage takes and how much memory it
+#     allocates, plus the counters each component reports via get_stats(),
+#     and write it all to a JSON report.
+#
+# AVIATION ANALOGY:
+#     This is the flight data recorder. It doesn't fly the airplane - it
+#     records what every system was doing and when, so after a slow or
+#     rough flight you can see exactly which phase the problem was in.
+#
+# R EQUIVALENT:
+#     Like wrapping each step in system.time() and profmem::profmem(), and
+#     collecting the results in a list you write out with jsonlite.
+#
+# USAGE:
+#     from profiling import SpanRecorder
+#
+#     recorder = SpanRecorder(track_memory=True)
+#     with recorder:                              # starts/stops tracemalloc
+#         with recorder.span("parse"):
+#             requirements = parser.parse()
+#         recorder.add_counters("parser", parser.get_stats())
+#
+#         # Time every call of one method (aggregated, not one span per call)
+#         recorder.instrument(generator, "_is_duplicate", "duplicate_check")
+#
+#     recorder.write_json("outputs/profiles/run_profile.json")
+#
+# ============================================================================
+
+import os
+import json
+import time
+import threading
+import functools
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+
+class SpanRecorder:
+    """
+    PURPOSE:
+        Collect named, nested timing spans (with optional tracemalloc peak
+        memory) and component counters for one pipeline run.
+
+    R EQUIVALENT:
+        # spans <- list()
+        # t <- system.time(requirements <- parse(file))
+        # spans[["parse"]] <- t[["elapsed"]]
+
+    WHY THIS APPROACH:
+        - Spans nest by path ("stories/duplicate_check"), so a stage's
+          report shows which part of it was slow.
+        - Repeated spans with the same path are aggregated (calls, total
+          seconds, max peak), so instrumenting a method called 10,000 times
+          adds one line to the report instead of 10,000.
+        - Memory is tracemalloc's peak above the level at span start. It
+          shows what a stage allocated, not the process's total RSS, and
+          slows the run down, so it is opt-in (track_memory=True).
+    """
+
+    def __init__(self, track_memory: bool = False):
+        """
+        PURPOSE:
+            Create an empty recorder.
+
+        PARAMETERS:
+            track_memory (bool): Record tracemalloc peak memory per span
+        """
+        self.track_memory = track_memory
+
+        # path -> aggregated span record, in first-seen order
+        self._spans: dict[str, dict] = {}
+        self._counters: dict[str, dict] = {}
+        self._local = threading.local()  # Per-thread stack of open spans
+        self._lock = threading.Lock()
+        self._owns_tracemalloc = False
+        self._started_at: Optional[str] = None
+        self._start_time: Optional[float] = None
+        self._total_seconds: Optional[float] = None
+
+        self.stats = {
+            'spans_recorded': 0,
+            'counter_groups': 0,
+            'peak_memory_kb': 0.0,
+        }
+
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+
+    def start(self) -> None:
+        """Start the run clock (and tracemalloc, if tracking memory)."""
+        self._started_at = datetime.now().isoformat(timespec='seconds')
+        self._start_time = time.perf_counter()
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stop the run clock (and tracemalloc, if this recorder started it)."""
+        if self._start_time is not None:
+            self._total_seconds = time.perf_counter() - self._start_time
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def __enter__(self) -> "SpanRecorder":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    # ========================================================================
+    # SPANS
+    # ========================================================================
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _memory_on(self) -> bool:
+        return self.track_memory and tracemalloc.is_tracing()
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """
+        PURPOSE:
+            Time the enclosed block as a span nested under any open span.
+
+        PARAMETERS:
+            name (str): Span name (e.g., "parse")
+            **attrs: Extra fields stored on the span record (last value wins)
+
+        YIELDS:
+            dict: The aggregated span record. Callers may add fields to it
+                (e.g., record['cached'] = True).
+
+        WHY THIS APPROACH:
+            tracemalloc has a single process-wide peak. Before a child span
+            resets it, the parent's running peak is saved; when the child
+            ends, the child's peak is folded back into the parent's, so both
+            levels report correct peaks.
+        """
+        stack = self._stack()
+        path = "/".join([frame['path'] for frame in stack[-1:]] + [name])
+
+        with self._lock:
+            record = self._spans.get(path)
+            if record is None:
+                record = {
+                    'path': path,
+                    'name': name,
+                    'depth': len(stack),
+                    'calls': 0,
+                    'seconds': 0.0,
+                }
+                if self.track_memory:
+                    record['peak_memory_kb'] = 0.0
+                self._spans[path] = record
+                self.stats['spans_recorded'] += 1
+        record.update(attrs)
+
+        frame = {'path': path, 'peak': 0, 'base': 0}
+        if self._memory_on():
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+            tracemalloc.reset_peak()
+            frame['base'] = current
+        stack.append(frame)
+
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+
+            with self._lock:
+                record['calls'] += 1
+                record['seconds'] += seconds
+
+                if self._memory_on():
+                    peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+                    peak_kb = max(0, peak - frame['base']) / 1024
+                    record['peak_memory_kb'] = max(record['peak_memory_kb'], peak_kb)
+                    self.stats['peak_memory_kb'] = max(self.stats['peak_memory_kb'], peak_kb)
+                    if stack:
+                        stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+
+    def trace(self, name: Optional[str] = None):
+        """
+        PURPOSE:
+            Decorator form of span().
+
+        PARAMETERS:
+            name (str, optional): Span name (default: the function's name)
+
+        RETURNS:
+            callable: Decorator
+
+        EXAMPLE:
+            @recorder.trace("score")
+            def score(requirement): ...
+        """
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def instrument(self, obj, method_name: str, name: Optional[str] = None) -> bool:
+        """
+        PURPOSE:
+            Time every call of obj.method_name as a span, for this object
+            only (the class and other instances are untouched).
+
+        PARAMETERS:
+            obj: Component instance (e.g., a UserStoryGenerator)
+            method_name (str): Method to wrap
+            name (str, optional): Span name (default: method_name)
+
+        RETURNS:
+            bool: True if the method exists and was wrapped
+
+        WHY THIS APPROACH:
+            Components stay free of profiling code; the caller decides what
+            is worth measuring in this run.
+        """
+        method = getattr(obj, method_name, None)
+        if not callable(method):
+            return False
+        setattr(obj, method_name, self.trace(name or method_name.lstrip('_'))(method))
+        return True
+
+    def add_span(self, name: str, seconds: float, **attrs) -> None:
+        """
+        PURPOSE:
+            Record a span that was timed elsewhere (e.g., an exporter that
+            ran in a worker process), nested under the current open span.
+        """
+        stack = self._stack()
+        path = "/".join([frame['path'] for frame in stack[-1:]] + [name])
+
+        with self._lock:
+            record = self._spans.get(path)
+            if record is None:
+                record = {
+                    'path': path,
+                    'name': name,
+                    'depth': len(stack),
+                    'calls': 0,
+                    'seconds': 0.0,
+                }
+                self._spans[path] = record
+                self.stats['spans_recorded'] += 1
+            record['calls'] += 1
+            record['seconds'] += seconds
+            record.update(attrs)
+
+    # ========================================================================
+    # COUNTERS
+    # ========================================================================
+
+    def add_counters(self, component: str, stats: Optional[dict]) -> None:
+        """
+        PURPOSE:
+            Store a component's get_stats() output under its name.
+
+        PARAMETERS:
+            component (str): e.g., "parser", "user_story_generator"
+            stats (dict): Counters (nested dicts are fine)
+        """
+        if not stats:
+            return
+        with self._lock:
+            if component not in self._counters:
+                self.stats['counter_groups'] += 1
+            self._counters[component] = dict(stats)
+
+    # ========================================================================
+    # OUTPUT
+    # ========================================================================
+
+    def report(self, **extra) -> dict:
+        """
+        PURPOSE:
+            Build the report as a JSON-serialisable dict.
+
+        PARAMETERS:
+            **extra: Additional top-level fields (input file, options, ...)
+
+        RETURNS:
+            dict: started_at, total_seconds, track_memory, peak_memory_kb,
+                spans (in first-seen order, seconds rounded), counters, and
+                any extra fields
+        """
+        with self._lock:
+            spans = []
+            for record in self._spans.values():
+                span = dict(record)
+                span['seconds'] = round(span['seconds'], 4)
+                if 'peak_memory_kb' in span:
+                    span['peak_memory_kb'] = round(span['peak_memory_kb'], 1)
+                spans.append(span)
+            counters = dict(self._counters)
+
+        total = self._total_seconds
+        if total is None and self._start_time is not None:
+            total = time.perf_counter() - self._start_time
+
+        report = {
+            'started_at': self._started_at,
+            'total_seconds': round(total, 4) if total is not None else None,
+            'track_memory': self.track_memory,
+            'peak_memory_kb': round(self.stats['peak_memory_kb'], 1) if self.track_memory else None,
+            'spans': spans,
+            'counters': counters,
+        }
+        report.update(extra)
+        return report
+
+    def write_json(self, filepath: str, **extra) -> str:
+        """
+        PURPOSE:
+            Write report(**extra) to a JSON file.
+
+        RETURNS:
+            str: The file path
+        """
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.report(**extra), f, indent=2, default=str)
+        return filepath
+
+    def format_table(self) -> str:
+        """Return the spans as an indented text table for the console."""
+        lines = []
+        for span in self.report()['spans']:
+            label = "  " * span['depth'] + span['name']
+            calls = f"x{span['calls']}" if span['calls'] > 1 else ""
+            memory = ""
+            if span.get('peak_memory_kb') is not None:
+                memory = f"{span['peak_memory_kb'] / 1024:8.2f} MB"
+            cached = " (cached)" if span.get('cached') else ""
+            lines.append(f"{label:<32} {span['seconds']:8.3f}s {calls:>7} {memory}{cached}")
+        return "\n".join(lines)
+
+    def get_stats(self) -> dict:
+        """Return recorder statistics."""
+        return self.stats.copy()
+
+
+# ============================================================================
+# EXAMPLE USAGE
+# ============================================================================
+
+if __name__ == "__main__":
+    recorder = SpanRecorder(track_memory=True)
+
+    with recorder:
+        with recorder.span("build"):
+            data = [str(i) * 10 for i in range(100_000)]
+
+            @recorder.trace("check")
+            def check(value):
+                return value.startswith("9")
+
+            matches = sum(1 for value in data[:1000] if check(value))
+
+        with recorder.span("sort"):
+            data.sort()
+
+        recorder.add_counters("example", {'items': len(data), 'matches': matches})
+
+    print(recorder.format_table())
+    print(json.dumps(recorder.report()['counters'], indent=2))
@@ -28,75 +28,63 @@
 #     python3 run.py "inputs/excel/requirements.xlsx" --prefix GRX --output both
 #     python3 run.py "inputs/excel/client_reqs.xlsx" --prefix ACME --output markdown
 #     python3 run.py "inputs/excel/features.xlsx" --sheet "Phase 1" --output excel
+#     python3 run.py "inputs/excel/big_backlog.xlsx" --prefix BIG --stream
+#     python3 run.py --watch "inputs/excel/requirements.xlsx" --prefix GRX
 #
 # ============================================================================
 
+import io
 import sys
 import os
+import json
+import time
+import pickle
+import hashlib
 import argparse
+import contextlib
+import copy
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Optional
 
 # ============================================================================
-# IMPORTS - Our toolkit modules
+# IMPORTS - Our toolkit modules (loaded on first use)
 # ============================================================================
-# WHY: We import from our package structure for clean organization
-# R EQUIVALENT: Like source("parsers/excel_parser.R") in R
-
-try:
-    from parsers.excel_parser import ExcelParser
-    from parsers.lucidchart_parser import LucidchartParser
-    from parsers.word_parser import WordParser
-    from parsers.user_story_parser import UserStoryParser  # NEW: For phase 2
-    from generators.user_story_generator import UserStoryGenerator
-    from generators.uat_generator import UATGenerator
-    from generators.traceability_generator import generate_traceability_matrix
-    from formatters.github_markdown import format_for_github
-    from formatters.excel_formatter import export_to_excel
-    from formatters.draft_excel_formatter import export_draft_for_review  # NEW: For phase 1
-    # Compliance module - optional but recommended for regulated industries
-    from compliance import (
-        validate_part11, validate_hipaa, validate_soc2, validate_all,
-        generate_part11_tests, generate_hipaa_tests, generate_soc2_tests,
-        generate_all_compliance_tests
-    )
-    COMPLIANCE_AVAILABLE = True
-except ImportError as e:
-    # Check if it's just the compliance module missing (that's okay)
-    if 'compliance' in str(e):
-        COMPLIANCE_AVAILABLE = False
-    else:
-        print(f"ERROR: Failed to import required modules: {e}")
-        print("Make sure you're running from the project root directory.")
-        print("Expected structure:")
-        print("  requirements_toolkit/")
-        print("    ├── run.py")
-        print("    ├── parsers/")
-        print("    ├── generators/")
-        print("    └── formatters/")
-        sys.exit(1)
+# WHY LAZY: Importing every parser, generator and formatter up front pulls in
+# openpyxl, python-docx/lxml and notion-client before argparse even runs -
+# roughly a quarter of a second that an --audit-history lookup (which only
+# needs sqlite3) pays for nothing. Instead, each command and file type
+# imports just the modules it uses, inside the function that uses them.
+# Python caches modules in sys.modules, so after the first call those import
+# statements cost a dictionary lookup.
+#
+# benchmarks/import_time.py measures startup with `python -X importtime`.
+#
+# R EQUIVALENT: Like calling library() inside the function that needs the
+# package instead of at the top of the script.
+#
+# The parser registry is the exception: it only declares where each parser
+# lives ("module:Class") and imports one when a file of its format is parsed.
 
-# Database module - optional for persisting results
-try:
-    from database import ClientProductDatabase, get_database
-    from database import queries as db_queries
-    from database.import_stories import import_stories_from_excel
-    from database.audit_queries import (
-        get_record_audit_trail,
-        get_program_audit_report,
-        get_recent_changes,
-        format_audit_for_display,
-        format_recent_changes_table,
-        format_audit_summary,
-        VALID_RECORD_TYPES
-    )
-    from formatters.audit_excel_formatter import (
-        export_audit_to_excel,
-        export_program_audit_report
-    )
-    DATABASE_AVAILABLE = True
-except ImportError:
-    DATABASE_AVAILABLE = False
+from parsers.registry import detect_format, supported_extensions
+
+
+def _compliance_available() -> bool:
+    """True if the optional compliance module (and PyYAML) can be imported."""
+    try:
+        import compliance  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _database_available() -> bool:
+    """True if the database module can be imported."""
+    try:
+        import database.db_manager  # noqa: F401
+        return True
+    except ImportError:
+        return False
 
 
 # ============================================================================
@@ -194,6 +182,27 @@ Examples:
   python3 run.py "requirements.xlsx" --prefix GRX --output both --compliance soc2
   python3 run.py "requirements.xlsx" --prefix GRX --output both --compliance all
 
+  # Batch mode: every file in a directory, 4 worker processes
+  python3 run.py --batch inputs/ --prefix NIGHTLY --jobs 4 --save-to-db
+
+  # Watch mode: re-run whenever the workbook (or anything in a folder) is saved
+  python3 run.py --watch "inputs/excel/requirements.xlsx" --prefix GRX
+  python3 run.py --watch inputs/excel/ --prefix GRX --save-to-db --client "Acme"
+
+  # Streaming mode for large inputs
+  python3 run.py "inputs/excel/big_backlog.xlsx" --prefix BIG --stream --chunk-size 200
+
+  # Lucidchart process map, requirements in the order the flow runs
+  python3 run.py "inputs/lucidchart/process.csv" --prefix FLOW --lucidchart-order flow
+
+  # Profile a run: per-stage time/memory report in outputs/profiles/
+  python3 run.py "inputs/excel/requirements.xlsx" --prefix GRX --profile
+  python3 run.py "inputs/excel/requirements.xlsx" --prefix GRX --profile-cprofile
+
+  # Dashboard statistics: verify / recompute the program_stats table
+  python3 run.py --check-stats
+  python3 run.py --rebuild-stats
+
 Supported input formats:
   Excel:      .xlsx, .xls, .xlsm
   Word:       .docx (with tables and/or prose requirements)
@@ -251,6 +260,110 @@ Output formats:
         help='Show detailed processing information'
     )
 
+    # Batch mode (many files, one invocation)
+    parser.add_argument(
+        '--batch',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help='Process every supported file under DIR (recursively) and write '
+             'a batch manifest to the output directory'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for --batch (default: number of CPUs). For a '
+             'single Word document, parse its top-level sections in this many '
+             'processes (default: 1)'
+    )
+
+    parser.add_argument(
+        '--word-backend',
+        choices=['docx', 'lxml'],
+        default='docx',
+        help='How Word documents are read: docx (python-docx, default) or '
+             'lxml (stream the document XML - faster and lighter on very '
+             'large documents, same output)'
+    )
+
+    parser.add_argument(
+        '--lucidchart-order',
+        choices=['document', 'flow'],
+        default='document',
+        help='Order of requirements from a Lucidchart diagram: document '
+             '(export order, default) or flow (follow the connectors, so '
+             'each step comes after the steps that lead into it)'
+    )
+
+    # Watch mode (stay running, re-run on save)
+    parser.add_argument(
+        '--watch',
+        type=str,
+        default=None,
+        metavar='PATH',
+        help='Run the pipeline for a file or directory, then keep re-running '
+             'it whenever an input (or a config YAML file) changes. Only the '
+             'stages whose inputs changed are recomputed.'
+    )
+
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=1.0,
+        help='Seconds between change checks in --watch mode (default: 1.0)'
+    )
+
+    # Notion export (runs alongside markdown/Excel export)
+    parser.add_argument(
+        '--notion',
+        action='store_true',
+        help='Also export stories, tests and RTM to a Notion page '
+             '(requires notion-client and NOTION_API_KEY)'
+    )
+
+    parser.add_argument(
+        '--notion-parent',
+        type=str,
+        default=None,
+        help='Notion parent page ID for --notion (default: search shared pages '
+             'matching the program name or prefix)'
+    )
+
+    # Streaming mode (large inputs)
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Process requirements in chunks end-to-end (stories -> tests -> '
+             'markdown/Excel) instead of holding every stage in memory. Output '
+             'is identical to the default batch mode. With --notion every '
+             'story and test is still kept for the Notion page. Ignored for '
+             '--phase draft.'
+    )
+
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=100,
+        help='Requirements per chunk in --stream mode (default: 100)'
+    )
+
+    # Profiling
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Record per-stage time and peak memory (tracemalloc) plus '
+             'component counters, and write a JSON report to '
+             '<output-dir>/profiles/. Tracking memory slows the run down.'
+    )
+
+    parser.add_argument(
+        '--profile-cprofile',
+        action='store_true',
+        help='Like --profile, and also write a cProfile .prof dump'
+    )
+
     parser.add_argument(
         '--compliance',
         type=str,
@@ -374,6 +487,20 @@ Output formats:
         help='Number of days for --recent-changes (default: 7)'
     )
 
+    # Database maintenance commands
+    parser.add_argument(
+        '--check-stats',
+        action='store_true',
+        help='Check the pre-aggregated program_stats table against the '
+             'source tables (exit code 1 if any count differs).'
+    )
+
+    parser.add_argument(
+        '--rebuild-stats',
+        action='store_true',
+        help='Recompute the program_stats table from the source tables.'
+    )
+
     return parser.parse_args()
 
 
@@ -381,6 +508,11 @@ Output formats:
 # FILE VALIDATION
 # ============================================================================
 
+# Supported formats: Excel, Word, and Lucidchart exports - whatever the
+# parser registry has backends for (see parsers/registry.py)
+SUPPORTED_EXTENSIONS = supported_extensions()
+
+
 def validate_input_file(filepath: str) -> bool:
     """
     PURPOSE:
@@ -394,7 +526,10 @@ def validate_input_file(filepath: str) -> bool:
 
     WHY THIS APPROACH:
         Early validation prevents confusing errors later in the pipeline.
-        We check existence first, then format support.
+        We check existence first, then format support. The format check
+        sniffs the content (parsers.registry.detect_format), so a file
+        with an unfamiliar extension is accepted if its content is a
+        supported format.
     """
     # Check if file exists
     if not os.path.exists(filepath):
@@ -404,74 +539,23 @@ def validate_input_file(filepath: str) -> bool:
     if not os.path.isfile(filepath):
         raise ValueError(f"Path is not a file: {filepath}")
 
-    # Check file extension
-    _, ext = os.path.splitext(filepath)
-    # Supported formats: Excel, Word, and Lucidchart exports
-    supported_extensions = ['.xlsx', '.xls', '.xlsm', '.docx', '.csv', '.svg']
-
-    if ext.lower() not in supported_extensions:
-        raise ValueError(
-            f"Unsupported file format: {ext}\n"
-            f"Supported formats: {', '.join(supported_extensions)}\n"
-            f"  Excel: .xlsx, .xls, .xlsm\n"
-            f"  Word: .docx\n"
-            f"  Lucidchart: .csv, .svg"
-        )
+    # Check format (extension, confirmed or overridden by content)
+    detect_format(filepath)
 
     return True
 
 
 # ============================================================================
-# MAIN PIPELINE
+# PIPELINE STEPS
 # ============================================================================
-
-def run_pipeline(
-    input_file: str,
-    prefix: str = "REQ",
-    output_format: str = "both",
-    sheet_name: Optional[str] = None,
-    output_dir: str = "outputs",
-    verbose: bool = False,
-    compliance: str = "none",
-    phase: str = "all",  # draft, final, or all
-    save_to_db: bool = False,  # NEW: Save to SQLite database
-    client_name: Optional[str] = None,  # NEW: Client name for database
-    program_name: Optional[str] = None,  # NEW: Program name for database
-    from_db: bool = False  # NEW: Load stories from database
-) -> dict:
-    """
-    PURPOSE:
-        Execute the full requirements processing pipeline.
-
-    R EQUIVALENT:
-        # run_pipeline <- function(input_file, prefix = "REQ", output = "both") {
-        #     # Parse
-        #     requirements <- parse_excel(input_file)
-        #     # Generate stories
-        #     stories <- generate_user_stories(requirements)
-        #     # Generate tests
-        #     tests <- generate_uat_tests(stories, prefix)
-        #     # Export
-        #     if (output %in% c("both", "markdown")) export_markdown(stories, tests)
-        #     if (output %in% c("both", "excel")) export_excel(stories, tests)
-        # }
-
-    PARAMETERS:
-        input_file (str): Path to the input Excel file
-        prefix (str): Test ID prefix (e.g., "GRX", "NCCN")
-        output_format (str): "markdown", "excel", or "both"
-        sheet_name (str, optional): Specific sheet to parse
-        output_dir (str): Base output directory
-        verbose (bool): Show detailed output
-
-    RETURNS:
-        dict: Results including counts and output file paths
-
-    WHY THIS APPROACH:
-        A single orchestrator function makes the pipeline easy to understand
-        and modify. Each step is clearly separated with progress feedback.
-    """
-    results = {
+# WHY: run_pipeline() (batch) and run_streaming_pipeline() share database
+# setup, parsing, compliance and traceability. Keeping each step in its own
+# helper means both modes print the same progress and record the same
+# results/errors.
+
+def _new_results(phase: str) -> dict:
+    """Return an empty results dict for a pipeline run."""
+    return {
         'success': False,
         'phase': phase,
         'requirements_count': 0,
@@ -483,570 +567,2439 @@ def run_pipeline(
         'flagged_items': 0,
         'output_files': [],
         'errors': [],
-        'database': None  # NEW: Database info if saved
+        'database': None,  # NEW: Database info if saved
+        'stage_timings': {},  # stage -> {'seconds', 'cached'}
+        'component_stats': {}  # component -> its get_stats() counters
     }
 
-    # Extract source filename for documentation
-    source_filename = os.path.basename(input_file)
 
-    # ========================================================================
-    # DATABASE SETUP (Optional)
-    # ========================================================================
-    db = None
-    program_id = None
-    client_id = None
+@contextlib.contextmanager
+def _stage_timer(results: dict, stage: str, recorder=None):
+    """
+    PURPOSE:
+        Time one pipeline stage into results['stage_timings'][stage], and
+        into a profiling.SpanRecorder span when --profile is on.
 
-    if save_to_db:
-        if not DATABASE_AVAILABLE:
-            print_warning("Database module not available. Install sqlite3 or check imports.")
-            print_warning("Continuing without database persistence.")
-            save_to_db = False
-        else:
-            print_subheader("Database Setup")
+    WHY THIS APPROACH:
+        A context manager records the time even when the stage returns
+        early or raises, so a failed run still shows where it stopped.
+    """
+    timing = {'seconds': 0.0, 'cached': False}
+    results['stage_timings'][stage] = timing
+    span = recorder.span(stage) if recorder else contextlib.nullcontext({})
+    record = {}
+    start = time.perf_counter()
+    try:
+        with span as record:
+            yield timing
+    finally:
+        timing['seconds'] = round(time.perf_counter() - start, 3)
+        if timing['cached']:
+            record['cached'] = True
 
-            try:
-                db = get_database()
-
-                # Find or create client
-                if client_name:
-                    existing_client = db.get_client_by_name(client_name)
-                    if existing_client:
-                        client_id = existing_client['client_id']
-                        print_info(f"Found existing client: {client_name}")
-                    else:
-                        client_id = db.create_client(client_name)
-                        print_success(f"Created client: {client_name} ({client_id})")
-                else:
-                    # Use default client
-                    default_client = db.get_client_by_name("Default Client")
-                    if not default_client:
-                        client_id = db.create_client("Default Client", "Auto-created default client")
-                        print_info("Created default client")
-                    else:
-                        client_id = default_client['client_id']
 
-                # Find or create program by prefix
-                existing_program = db.get_program_by_prefix(prefix)
-                if existing_program:
-                    program_id = existing_program['program_id']
-                    print_info(f"Found existing program: {existing_program['name']} ({prefix})")
-                else:
-                    # Create new program
-                    prog_name = program_name or f"{prefix} Program"
-                    program_id = db.create_program(
-                        client_id=client_id,
-                        name=prog_name,
-                        prefix=prefix,
-                        source_file=source_filename
-                    )
-                    print_success(f"Created program: {prog_name} ({prefix})")
+# ============================================================================
+# STAGE CACHE
+# ============================================================================
+# WHY: Watch mode re-runs the pipeline every time a file is saved. Each
+# stage's output is a pure function of its inputs (file contents, upstream
+# records, prefix, YAML config), so a stage whose inputs haven't changed can
+# hand back its previous output instead of recomputing it. run_pipeline()
+# only does this when the caller passes a stage_cache dict.
 
-                results['database'] = {
-                    'client_id': client_id,
-                    'program_id': program_id,
-                    'prefix': prefix
-                }
+CONFIG_DIRS = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config'),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'compliance', 'config'),
+]
 
-            except Exception as e:
-                print_error(f"Database setup failed: {e}")
-                results['errors'].append(f"Database setup error: {e}")
-                save_to_db = False  # Continue without database
 
-    # ========================================================================
-    # PHASE-SPECIFIC ROUTING
-    # ========================================================================
-    # Phase "final": Import refined stories (skip req parsing and story generation)
-    # Phase "draft": Parse reqs, generate stories, export for review, STOP
-    # Phase "all": Full pipeline (default)
+def _fingerprint(value) -> str:
+    """Return a short hash of a picklable value (records, keys, tuples)."""
+    try:
+        data = pickle.dumps(value, protocol=4)
+    except Exception:
+        data = repr(value).encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+def _file_key(path: str) -> tuple:
+    """Cheap change key for a file: (absolute path, mtime_ns, size)."""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _config_files() -> list[str]:
+    """YAML files the generators and compliance validators read."""
+    found = []
+    for config_dir in CONFIG_DIRS:
+        if os.path.isdir(config_dir):
+            found.extend(
+                os.path.join(config_dir, name) for name in sorted(os.listdir(config_dir))
+                if name.endswith(('.yaml', '.yml'))
+            )
+    return found
 
-    requirements = []
-    stories = []
 
-    if phase == "final":
-        # ====================================================================
-        # PHASE 2 (FINAL): Import refined user stories
-        # ====================================================================
-        print_subheader("Step 1: Importing Refined User Stories")
+def _config_key() -> tuple:
+    """Change key for all YAML config (edits invalidate generated stages)."""
+    return tuple(_file_key(path) for path in _config_files())
 
-        try:
-            print_info("Phase: Final - importing refined stories from Excel")
-            story_parser = UserStoryParser(input_file)
-            stories = story_parser.parse()
 
-            if not stories:
-                print_warning("No stories found in file")
-                results['errors'].append("No stories found")
-                return results
+def _memoized(
+    stage_cache: Optional[dict],
+    results: dict,
+    stage: str,
+    key,
+    compute
+):
+    """
+    PURPOSE:
+        Return compute(), or a copy of the last result for this stage if
+        its key is unchanged.
 
-            results['stories_count'] = len(stories)
-            stats = story_parser.get_stats()
+    PARAMETERS:
+        stage_cache (dict, optional): Per-file cache; None disables caching
+        results (dict): Pipeline results (marks the stage timing as cached)
+        stage (str): Stage name, e.g. "parse", "stories"
+        key: Anything picklable that identifies the stage's inputs
+        compute (callable): Produces the stage output
 
-            print_success(f"Imported {len(stories)} refined user stories")
+    RETURNS:
+        The stage output
 
-            if verbose:
-                print_info("Story status breakdown:")
-                print(f"      • Approved: {stats.get('approved', 0)}")
-                print(f"      • Draft: {stats.get('draft', 0)}")
-                print(f"      • Pending Client Review: {stats.get('pending_client_review', 0)}")
-                print(f"      • Needs Discussion: {stats.get('needs_discussion', 0)}")
-                print(f"      • Out of Scope (skipped): {stats.get('out_of_scope', 0)}")
-                print(f"      • Technical: {stats.get('technical', 0)}")
-                print(f"      • Non-technical: {stats.get('non_technical', 0)}")
-
-            # Skip to Step 3 (UAT generation)
-            # requirements are not available in final phase
-            results['requirements_count'] = stats.get('total_rows', len(stories))
+    WHY THIS APPROACH:
+        Later stages modify their inputs (the RTM assigns requirement IDs,
+        compliance tests are appended to the test list), so the cache keeps
+        its own deep copy and hands out copies.
+    """
+    if stage_cache is None:
+        return compute()
+
+    fingerprint = _fingerprint(key)
+    entry = stage_cache.get(stage)
+    if entry and entry['key'] == fingerprint:
+        if stage in results['stage_timings']:
+            results['stage_timings'][stage]['cached'] = True
+        print_info(f"Inputs unchanged - reusing {stage} from the previous run")
+        return copy.deepcopy(entry['value'])
+
+    value = compute()
+    stage_cache[stage] = {'key': fingerprint, 'value': copy.deepcopy(value)}
+    return value
+
+
+def _setup_database(
+    prefix: str,
+    client_name: Optional[str],
+    program_name: Optional[str],
+    source_filename: str,
+    results: dict,
+    db=None
+) -> tuple:
+    """
+    PURPOSE:
+        Find or create the client and program records for this run.
 
-        except Exception as e:
-            print_error(f"Failed to import stories: {e}")
-            results['errors'].append(f"Import error: {e}")
-            return results
+    PARAMETERS:
+        db (ClientProductDatabase, optional): Already-open connection to
+            use (watch mode keeps one open between runs)
 
-    else:
-        # ====================================================================
-        # PHASE 1 (DRAFT) or ALL: Parse raw requirements
-        # ====================================================================
-        print_subheader("Step 1: Parsing Requirements")
+    RETURNS:
+        tuple: (db, program_id) - both None if the database is unavailable
+            or setup failed (the pipeline then continues without persistence)
+    """
+    if not _database_available():
+        print_warning("Database module not available. Install sqlite3 or check imports.")
+        print_warning("Continuing without database persistence.")
+        return None, None
 
-        try:
-            # Detect file type and use appropriate parser
-            _, ext = os.path.splitext(input_file)
-            ext = ext.lower()
-
-            if ext in ['.xlsx', '.xls', '.xlsm']:
-                print_info("Detected: Excel file")
-                parser = ExcelParser(input_file)
-            elif ext == '.docx':
-                print_info("Detected: Word document (.docx)")
-                parser = WordParser(input_file)
-            elif ext in ['.csv', '.svg']:
-                print_info(f"Detected: Lucidchart export ({ext})")
-                parser = LucidchartParser(input_file)
+    from database.db_manager import get_database
+
+    print_subheader("Database Setup")
+
+    try:
+        db = db or get_database()
+
+        # Find or create client
+        if client_name:
+            existing_client = db.get_client_by_name(client_name)
+            if existing_client:
+                client_id = existing_client['client_id']
+                print_info(f"Found existing client: {client_name}")
             else:
-                raise ValueError(f"No parser available for {ext} files")
+                client_id = db.create_client(client_name)
+                print_success(f"Created client: {client_name} ({client_id})")
+        else:
+            # Use default client
+            default_client = db.get_client_by_name("Default Client")
+            if not default_client:
+                client_id = db.create_client("Default Client", "Auto-created default client")
+                print_info("Created default client")
+            else:
+                client_id = default_client['client_id']
 
-            # Parse the file
-            requirements = parser.parse()
+        # Find or create program by prefix
+        existing_program = db.get_program_by_prefix(prefix)
+        if existing_program:
+            program_id = existing_program['program_id']
+            print_info(f"Found existing program: {existing_program['name']} ({prefix})")
+        else:
+            # Create new program
+            prog_name = program_name or f"{prefix} Program"
+            program_id = db.create_program(
+                client_id=client_id,
+                name=prog_name,
+                prefix=prefix,
+                source_file=source_filename
+            )
+            print_success(f"Created program: {prog_name} ({prefix})")
 
-            if not requirements:
-                print_warning("No requirements found in file")
-                results['errors'].append("No requirements found")
-                return results
+        results['database'] = {
+            'client_id': client_id,
+            'program_id': program_id,
+            'prefix': prefix
+        }
+        return db, program_id
 
-            results['requirements_count'] = len(requirements)
-            print_success(f"Parsed {len(requirements)} requirements")
+    except Exception as e:
+        print_error(f"Database setup failed: {e}")
+        results['errors'].append(f"Database setup error: {e}")
+        return None, None  # Continue without database
 
-            if verbose:
-                print_info("Sample requirements:")
-                for req in requirements[:3]:
-                    desc = req.get('description', req.get('raw_text', 'N/A'))
-                    if len(desc) > 60:
-                        desc = desc[:57] + "..."
-                    print(f"      • {desc}")
-
-            # Save requirements to database
-            if save_to_db and db and program_id:
-                try:
-                    inserted, updated = db.save_requirements(
-                        program_id, requirements, source_filename
-                    )
-                    print_success(f"Saved to database: {inserted} new, {updated} updated")
-                except Exception as e:
-                    print_warning(f"Database save failed: {e}")
 
-        except Exception as e:
-            print_error(f"Failed to parse file: {e}")
-            results['errors'].append(f"Parse error: {e}")
-            return results
+def _compliance_gaps(compliance_reports: dict) -> list:
+    """Return every framework's gaps from results['compliance_reports'] as one list."""
+    gaps = []
+    for report in compliance_reports.values():
+        gaps.extend(report.get('gaps', []))
+    return gaps
 
-        # ====================================================================
-        # STEP 2: GENERATE USER STORIES (for draft and all phases)
-        # ====================================================================
-        print_subheader("Step 2: Generating User Stories")
 
-        try:
-            # Pass prefix for new Story ID format: PREFIX-CATEGORY-SEQ
-            story_generator = UserStoryGenerator(prefix=prefix)
-            stories = story_generator.generate(requirements)
+# Fields db.persist_run() reads from a story / test case. Streaming mode
+# keeps only these (not the full records) until its single save at the end.
+_DB_STORY_FIELDS = (
+    'story_id', 'generated_id', 'title', 'user_story', 'role', 'capability',
+    'benefit', 'acceptance_criteria', 'success_metrics', 'priority',
+    'category_abbrev', 'category', 'category_full', 'is_technical', 'flags',
+)
+_DB_TEST_FIELDS = (
+    'test_id', 'source_story_id', 'title', 'category', 'test_type',
+    'prerequisites', 'test_steps', 'expected_results', 'moscow', 'priority',
+    'est_time', 'estimated_time', 'compliance_framework', 'notes',
+)
 
-            if not stories:
-                print_warning("No user stories generated")
-                results['errors'].append("No stories generated")
-                return results
 
-            results['stories_count'] = len(stories)
+def _db_record(record: dict, fields: tuple) -> dict:
+    """Return the subset of record's keys listed in fields."""
+    return {key: record[key] for key in fields if key in record}
+
+
+def _db_story(story: dict) -> dict:
+    """
+    PURPOSE:
+        Slim copy of a story for persist_run(): the saved columns plus the
+        source requirement's ID and row number (used to link the story).
+    """
+    slim = _db_record(story, _DB_STORY_FIELDS)
+    source = story.get('source_requirement')
+    if isinstance(source, dict):
+        slim['source_requirement'] = _db_record(source, ('requirement_id', 'row_number'))
+    return slim
+
+
+def _persist_run(
+    db,
+    program_id: str,
+    results: dict,
+    verbose: bool,
+    source_filename: str,
+    **records
+) -> Optional[dict]:
+    """
+    PURPOSE:
+        Save everything a pipeline run produced with db.persist_run() and
+        report what was written.
+
+    PARAMETERS:
+        db (ClientProductDatabase): Open database
+        program_id (str): Program to save under
+        results (dict): Pipeline results (counts go in results['database'])
+        verbose (bool): Show the per-table timing breakdown
+        source_filename (str): Input file name, for the audit trail
+        **records: requirements, stories, test_cases, compliance_gaps,
+            traceability_matrix - as accepted by persist_run()
+
+    RETURNS:
+        dict or None: persist_run() counts and timings, or None if the
+            save failed
+
+    WHY THIS APPROACH:
+        persist_run() is one transaction, so a failed save leaves the
+        database exactly as it was. As before, a failed save is a warning,
+        not a pipeline error - the output files are still written.
+    """
+    try:
+        saved = db.persist_run(program_id, source_file=source_filename, **records)
+    except Exception as e:
+        print_warning(f"Database save failed - nothing from this run was saved: {e}")
+        return None
+
+    if results.get('database'):
+        results['database']['saved'] = saved
+
+    print_success(
+        f"Saved to database in {saved['total_seconds']:.2f}s: "
+        f"{saved['requirements']['inserted']} new / {saved['requirements']['updated']} updated requirements, "
+        f"{saved['stories']['inserted']} / {saved['stories']['updated']} stories, "
+        f"{saved['test_cases']['inserted']} / {saved['test_cases']['updated']} test cases"
+    )
+    if saved['compliance_gaps'] or saved['traceability']:
+        print_info(f"{saved['compliance_gaps']} compliance gaps, "
+                   f"{saved['traceability']} traceability records, "
+                   f"{saved['audit_rows']} audit entries")
+    if verbose:
+        breakdown = " | ".join(f"{step} {seconds:.3f}s"
+                               for step, seconds in saved['timings'].items())
+        print_info(f"Save timings: {breakdown}")
+
+    return saved
+
+
+def _import_refined_stories(
+    input_file: str,
+    results: dict,
+    verbose: bool,
+    stage_cache: Optional[dict] = None
+) -> Optional[list]:
+    """
+    PURPOSE:
+        Step 1 for phase "final": read refined stories from a review workbook.
+
+    RETURNS:
+        list[dict] or None: Stories, or None if the pipeline should stop
+    """
+    print_subheader("Step 1: Importing Refined User Stories")
+
+    try:
+        print_info("Phase: Final - importing refined stories from Excel")
+
+        def parse_stories():
+            from parsers.user_story_parser import UserStoryParser
+            story_parser = UserStoryParser(input_file)
+            return story_parser.parse(), story_parser.get_stats()
+
+        stories, stats = _memoized(
+            stage_cache, results, 'parse', _file_key(input_file), parse_stories
+        )
+
+        if not stories:
+            print_warning("No stories found in file")
+            results['errors'].append("No stories found")
+            return None
+
+        _report_refined_stories(len(stories), stats, results, verbose)
+        return stories
+
+    except Exception as e:
+        print_error(f"Failed to import stories: {e}")
+        results['errors'].append(f"Import error: {e}")
+        return None
+
 
-            # Get stats for requirement type breakdown
-            gen_stats = story_generator.get_stats()
-            results['story_stats'] = gen_stats
+def _open_refined_stories(input_file: str, results: dict):
+    """
+    PURPOSE:
+        Step 1 for phase "final" in streaming mode: open the review workbook
+        without reading it. The caller pulls stories from iter_parse(), so
+        UAT generation starts on the first story while the rest stream in.
 
-            print_success(f"Generated {len(stories)} user stories")
+    RETURNS:
+        UserStoryParser or None: Parser, or None if the pipeline should stop
+    """
+    print_subheader("Step 1: Importing Refined User Stories (streaming)")
+
+    try:
+        print_info("Phase: Final - streaming refined stories from Excel")
+        from parsers.user_story_parser import UserStoryParser
+        return UserStoryParser(input_file)
+
+    except Exception as e:
+        print_error(f"Failed to import stories: {e}")
+        results['errors'].append(f"Import error: {e}")
+        return None
+
+
+def _report_refined_stories(
+    stories_count: int,
+    stats: dict,
+    results: dict,
+    verbose: bool
+) -> None:
+    """
+    PURPOSE:
+        Record and print the UserStoryParser stats for an imported workbook.
+    """
+    results['stories_count'] = stories_count
+    results['component_stats']['user_story_parser'] = stats
+
+    print_success(f"Imported {stories_count} refined user stories")
+
+    if verbose:
+        print_info("Story status breakdown:")
+        print(f"      • Approved: {stats.get('approved', 0)}")
+        print(f"      • Draft: {stats.get('draft', 0)}")
+        print(f"      • Pending Client Review: {stats.get('pending_client_review', 0)}")
+        print(f"      • Needs Discussion: {stats.get('needs_discussion', 0)}")
+        print(f"      • Out of Scope (skipped): {stats.get('out_of_scope', 0)}")
+        print(f"      • Technical: {stats.get('technical', 0)}")
+        print(f"      • Non-technical: {stats.get('non_technical', 0)}")
+
+    # Skip to Step 3 (UAT generation)
+    # requirements are not available in final phase
+    results['requirements_count'] = stats.get('total_rows', stories_count)
+
+
+def _parse_requirements(
+    input_file: str,
+    results: dict,
+    verbose: bool,
+    db,
+    program_id,
+    source_filename: str,
+    stage_cache: Optional[dict] = None,
+    recorder=None,
+    parse_jobs: Optional[int] = None,
+    word_backend: str = 'docx',
+    lucidchart_order: str = 'document'
+) -> Optional[list]:
+    """
+    PURPOSE:
+        Step 1 for phases "draft"/"all": parse raw requirements with the
+        parser that matches the file type, and save them if requested.
+        With a recorder (--profile), the parser's duplicate removal is
+        timed as its own span. parse_jobs > 1 parses Word documents
+        section by section in that many worker processes; word_backend
+        picks how Word documents are read ('docx' or 'lxml') and
+        lucidchart_order how diagram shapes are ordered ('document' or
+        'flow').
+
+    RETURNS:
+        list[dict] or None: Requirements, or None if the pipeline should stop
+    """
+    print_subheader("Step 1: Parsing Requirements")
+
+    try:
+        def parse_file():
+            # Detect file type and use appropriate parser
+            # WHY: The registry sniffs the content, so a mislabelled file
+            # goes to the right parser; only that parser's module is imported
+            backend, mislabelled = detect_format(input_file)
+            if mislabelled:
+                print_warning(
+                    f"{os.path.basename(input_file)} contains a {backend.label}, "
+                    f"not what its extension says - parsing it as one"
+                )
+            print_info(f"Detected: {backend.label}")
+
+            parser = backend.create(
+                input_file, mislabelled,
+                parse_jobs=parse_jobs, word_backend=word_backend,
+                lucidchart_order=lucidchart_order
+            )
+
+            if recorder:
+                recorder.instrument(parser, '_deduplicate_requirements', 'deduplicate')
+
+            return parser.parse(), parser.get_stats()
+
+        # Parse the file (watch mode reuses the result if it hasn't changed)
+        requirements, parser_stats = _memoized(
+            stage_cache, results, 'parse', _file_key(input_file), parse_file
+        )
+        results['component_stats']['parser'] = parser_stats
+
+        if not requirements:
+            print_warning("No requirements found in file")
+            results['errors'].append("No requirements found")
+            return None
+
+        results['requirements_count'] = len(requirements)
+        print_success(f"Parsed {len(requirements)} requirements")
+
+        if verbose:
+            print_info("Sample requirements:")
+            for req in requirements[:3]:
+                desc = req.get('description', req.get('raw_text', 'N/A'))
+                if len(desc) > 60:
+                    desc = desc[:57] + "..."
+                print(f"      • {desc}")
+
+        # Save requirements to database
+        if db and program_id:
+            try:
+                inserted, updated = db.save_requirements(
+                    program_id, requirements, source_filename
+                )
+                print_success(f"Saved to database: {inserted} new, {updated} updated")
+            except Exception as e:
+                print_warning(f"Database save failed: {e}")
+
+        return requirements
+
+    except Exception as e:
+        print_error(f"Failed to parse file: {e}")
+        results['errors'].append(f"Parse error: {e}")
+        return None
+
+
+def _run_compliance(
+    requirements: list,
+    prefix: str,
+    compliance: str,
+    results: dict,
+    verbose: bool,
+    db,
+    program_id,
+    stage_cache: Optional[dict] = None,
+    cache_key=None
+) -> list:
+    """
+    PURPOSE:
+        Step 3.5: validate requirements against the selected compliance
+        framework(s), generate compliance tests and save gaps.
+
+    RETURNS:
+        list[dict]: Compliance test cases (empty if skipped or failed).
+            The caller appends them after the UAT tests.
+
+    WHY THIS APPROACH:
+        Validation and test generation depend only on the requirements,
+        prefix, framework and YAML config. With a stage_cache, cache_key
+        identifies those inputs and an unchanged run reuses the reports.
+    """
+    compliance_tests = []
+
+    if compliance == 'none':
+        return compliance_tests
+
+    if not _compliance_available():
+        print_warning("Compliance module not available. Skipping compliance validation.")
+        return compliance_tests
+
+    from compliance import (
+        validate_part11, validate_hipaa, validate_soc2,
+        generate_part11_tests, generate_hipaa_tests, generate_soc2_tests,
+        generate_all_compliance_tests
+    )
+
+    print_subheader("Step 3.5: Compliance Validation")
+
+    try:
+        def validate():
+            reports = {}
+            compliance_tests = []
+
+            # Validate against selected framework(s)
+            if compliance == 'all':
+                print_info("Validating against: Part 11, HIPAA, SOC 2")
+
+                # Part 11
+                p11_report = validate_part11(requirements, prefix)
+                reports['part11'] = p11_report
+                print_success(f"Part 11: {p11_report['summary']['compliance_score']}% compliant, "
+                            f"{p11_report['summary']['requirements_with_gaps']} gaps found")
+
+                # HIPAA
+                hipaa_report = validate_hipaa(requirements, prefix)
+                reports['hipaa'] = hipaa_report
+                print_success(f"HIPAA: {hipaa_report['summary']['compliance_score']}% compliant, "
+                            f"{hipaa_report['summary']['requirements_with_gaps']} gaps found")
+
+                # SOC 2
+                soc2_report = validate_soc2(requirements, prefix)
+                reports['soc2'] = soc2_report
+                print_success(f"SOC 2: {soc2_report['summary']['compliance_score']}% compliant, "
+                            f"{soc2_report['summary']['requirements_with_gaps']} gaps found")
+
+                # Generate compliance tests
+                all_compliance = generate_all_compliance_tests(requirements, prefix)
+                compliance_tests = all_compliance['combined']
+
+            elif compliance == 'part11':
+                print_info("Validating against: FDA 21 CFR Part 11")
+                report = validate_part11(requirements, prefix)
+                reports['part11'] = report
+                print_success(f"Compliance score: {report['summary']['compliance_score']}%")
+                print_info(f"Requirements with gaps: {report['summary']['requirements_with_gaps']}")
+                compliance_tests = generate_part11_tests(requirements, prefix)
+
+            elif compliance == 'hipaa':
+                print_info("Validating against: HIPAA Security Rule")
+                report = validate_hipaa(requirements, prefix)
+                reports['hipaa'] = report
+                print_success(f"Compliance score: {report['summary']['compliance_score']}%")
+                print_info(f"Requirements with gaps: {report['summary']['requirements_with_gaps']}")
+                compliance_tests = generate_hipaa_tests(requirements, prefix)
+
+            elif compliance == 'soc2':
+                print_info("Validating against: SOC 2 Trust Services Criteria")
+                report = validate_soc2(requirements, prefix)
+                reports['soc2'] = report
+                print_success(f"Compliance score: {report['summary']['compliance_score']}%")
+                print_info(f"Requirements with gaps: {report['summary']['requirements_with_gaps']}")
+                compliance_tests = generate_soc2_tests(requirements, prefix)
+
+            return compliance_tests, reports
+
+        compliance_tests, reports = _memoized(
+            stage_cache, results, 'compliance',
+            (cache_key, prefix, compliance), validate
+        )
+        results['compliance_reports'].update(reports)
+
+        if compliance_tests:
+            results['compliance_tests_count'] = len(compliance_tests)
+            print_success(f"Generated {len(compliance_tests)} compliance test cases")
+
+            # Save compliance tests to database
+            if db and program_id:
+                try:
+                    inserted, _ = db.save_test_cases(program_id, compliance_tests)
+                    print_success(f"Compliance tests saved: {inserted}")
+                except Exception as e:
+                    print_warning(f"Database save failed: {e}")
+
+        # Save compliance gaps to database
+        if db and program_id:
+            for framework, report in results['compliance_reports'].items():
+                gaps = report.get('gaps', [])
+                if gaps:
+                    try:
+                        count = db.save_compliance_gaps(program_id, gaps)
+                        if verbose:
+                            print_info(f"Saved {count} {framework} gaps to database")
+                    except Exception as e:
+                        print_warning(f"Failed to save {framework} gaps: {e}")
+
+        if verbose:
+            # Show gap breakdown
+            for framework, report in results['compliance_reports'].items():
+                print_info(f"{framework.upper()} gaps by category:")
+                for cat, count in report.get('gaps_by_category', {}).items():
+                    print(f"        {cat}: {count}")
+
+    except Exception as e:
+        print_error(f"Compliance validation failed: {e}")
+        results['errors'].append(f"Compliance error: {e}")
+        # Continue without compliance - don't fail the whole pipeline
+
+    return compliance_tests
+
+
+def _build_traceability(
+    requirements: list,
+    stories: list,
+    test_cases: list,
+    phase: str,
+    results: dict,
+    verbose: bool,
+    db,
+    program_id
+) -> Optional[dict]:
+    """
+    PURPOSE:
+        Step 4: build the requirements traceability matrix and save it.
+
+    RETURNS:
+        dict or None: The traceability matrix, or None if generation failed
+            (the pipeline continues without it)
+    """
+    print_subheader("Step 4: Generating Traceability Matrix")
+
+    try:
+        # For final phase, we need to reconstruct requirements from stories
+        # since we don't have the original requirements
+        if phase == "final" and not requirements:
+            # Build requirements from story source info
+            requirements = []
+            for story in stories:
+                # Handle source_requirement which may be a dict or string
+                source_req = story.get('source_requirement', {})
+                if isinstance(source_req, dict):
+                    description = source_req.get('description', story.get('user_story', ''))
+                else:
+                    # String fallback
+                    description = str(source_req) if source_req else story.get('user_story', '')
+
+                req = {
+                    'requirement_id': story.get('story_id', story.get('generated_id')),
+                    'description': description,
+                    'row_number': story.get('source_row'),
+                    'title': story.get('title'),
+                    'priority': story.get('priority', 'Medium'),
+                }
+                requirements.append(req)
+            print_info(f"Reconstructed {len(requirements)} requirements from refined stories")
+
+        from generators.traceability_generator import generate_traceability_matrix
+
+        traceability_matrix = generate_traceability_matrix(
+            requirements=requirements,
+            stories=stories,
+            test_cases=test_cases
+        )
+
+        summary = traceability_matrix.get('summary', {})
+        results['traceability'] = summary
+
+        full_pct = summary.get('full_coverage_pct', 0)
+        partial_pct = summary.get('partial_coverage_pct', 0)
+        none_pct = summary.get('no_coverage_pct', 0)
+        gap_count = summary.get('total_gaps', 0)
+
+        print_success(f"Built traceability matrix")
+        print_info(f"Coverage: {full_pct}% full, {partial_pct}% partial, {none_pct}% none")
+
+        if gap_count > 0:
+            print_warning(f"{gap_count} requirements have coverage gaps")
+
+        # Save traceability to database
+        if db and program_id:
+            try:
+                count = db.save_traceability(program_id, traceability_matrix)
+                print_success(f"Traceability saved to database: {count} records")
+            except Exception as e:
+                print_warning(f"Database save failed: {e}")
+
+        if verbose:
+            print_info("Coverage breakdown:")
+            print(f"      • Full coverage: {summary.get('full_coverage_count', 0)} requirements")
+            print(f"      • Partial coverage: {summary.get('partial_coverage_count', 0)} requirements")
+            print(f"      • No coverage: {summary.get('no_coverage_count', 0)} requirements")
+
+            # Show compliance test coverage
+            compliance_coverage = summary.get('compliance_coverage', {})
+            if any(c.get('tests', 0) > 0 for c in compliance_coverage.values()):
+                print_info("Compliance test coverage:")
+                for framework, stats in compliance_coverage.items():
+                    tests = stats.get('tests', 0)
+                    if tests > 0:
+                        print(f"      • {framework}: {tests} tests")
+
+        return traceability_matrix
+
+    except Exception as e:
+        print_error(f"Failed to generate traceability matrix: {e}")
+        results['errors'].append(f"Traceability error: {e}")
+        # Continue without traceability - don't fail the whole pipeline
+        return None
+
+
+def _prepare_output_paths(output_dir: str, source_filename: str) -> tuple:
+    """
+    PURPOSE:
+        Build the timestamped base filename and create outputs/github and
+        outputs/excel.
+
+    RETURNS:
+        tuple: (base_name, timestamp, github_dir, excel_dir)
+    """
+    # Create base filename from input
+    base_name = os.path.splitext(source_filename)[0]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+
+    # Ensure output directories exist
+    github_dir = os.path.join(output_dir, 'github')
+    excel_dir = os.path.join(output_dir, 'excel')
+    os.makedirs(github_dir, exist_ok=True)
+    os.makedirs(excel_dir, exist_ok=True)
+
+    return base_name, timestamp, github_dir, excel_dir
+
+
+# ============================================================================
+# EXPORT SCHEDULER
+# ============================================================================
+# WHY: Markdown, Excel and Notion exports only read the finished stories,
+# tests and RTM, so there is no reason to run them one after another.
+# Notion export is network-bound (a thread is enough); building the openpyxl
+# workbook is CPU-bound Python (a worker process sidesteps the GIL). Each
+# exporter succeeds or fails on its own and reports its own timing.
+#
+# AVIATION ANALOGY:
+#     Like a turnaround where fueling, catering and baggage happen at the
+#     same time - each crew reports done (or a problem) independently, and a
+#     late catering truck doesn't hold up the fuel truck.
+
+# Batch workers set this to False: they are already one process per file,
+# so exporters run on threads inside them instead of forking again.
+EXPORT_IN_PROCESSES = True
+
+
+def _timed_call(func, args: tuple, kwargs: dict) -> tuple:
+    """
+    PURPOSE:
+        Run func(*args, **kwargs) and return (value, seconds).
+
+    WHY THIS APPROACH:
+        Defined at module level so it can be pickled into a worker process.
+        Timing inside the worker measures the exporter itself, not the time
+        spent waiting for a pool slot.
+    """
+    start = time.perf_counter()
+    value = func(*args, **kwargs)
+    return value, time.perf_counter() - start
+
+
+def _export_job(
+    name: str,
+    label: str,
+    func,
+    *args,
+    executor: str = "thread",
+    **kwargs
+) -> dict:
+    """
+    PURPOSE:
+        Describe one exporter for _run_exports().
+
+    PARAMETERS:
+        name (str): Key in results['exports'] (e.g., "excel")
+        label (str): Name used in console messages (e.g., "Excel")
+        func (callable): Exporter to call. Must be a module-level function
+            when executor="process" (it is pickled into the worker).
+        *args, **kwargs: Arguments for func
+        executor (str): "thread" for I/O-bound exporters, "process" for
+            CPU-bound ones
+
+    RETURNS:
+        dict: Job description
+    """
+    return {
+        'name': name,
+        'label': label,
+        'func': func,
+        'args': args,
+        'kwargs': kwargs,
+        'executor': executor,
+    }
+
+
+def _export_outputs(value) -> tuple:
+    """
+    PURPOSE:
+        Normalise an exporter's return value to (output_paths, error).
+
+    WHY THIS APPROACH:
+        format_for_github returns a list of paths, export_to_excel a single
+        path, and export_to_notion a results dict with its own error list.
+    """
+    if isinstance(value, dict):
+        if not value.get('success'):
+            errors = value.get('errors') or ["export did not complete"]
+            return [], "; ".join(str(e) for e in errors)
+        return ([value['page_url']] if value.get('page_url') else []), None
+    if isinstance(value, (list, tuple)):
+        return list(value), None
+    return ([value] if value else []), None
+
+
+def _run_exports(jobs: list, results: dict) -> None:
+    """
+    PURPOSE:
+        Run the selected exporters concurrently and record each one's
+        outputs, timing and error in results.
+
+    PARAMETERS:
+        jobs (list[dict]): Jobs from _export_job()
+        results (dict): Pipeline results. Adds results['exports'][name] =
+            {'success', 'seconds', 'executor', 'outputs', 'error'}, extends
+            results['output_files'] (in job order) and results['errors'].
+
+    RETURNS:
+        None
+
+    WHY THIS APPROACH:
+        concurrent.futures gives thread and process pools the same Future
+        interface, so results are collected the same way for both. A single
+        job runs inline - a pool for one exporter only adds overhead. If a
+        process pool can't be started on this platform, process jobs fall
+        back to threads rather than failing the export.
+    """
+    results.setdefault('exports', {})
+    outcomes = {}
+
+    def record(job, executor, value=None, seconds=0.0, error=None):
+        outputs = []
+        if error is None:
+            outputs, error = _export_outputs(value)
+
+        outcomes[job['name']] = {
+            'success': error is None,
+            'seconds': round(seconds, 3),
+            'executor': executor,
+            'outputs': outputs,
+            'error': error,
+        }
+
+        if error is None:
+            for output in outputs:
+                print_success(f"Created {job['label']}: {output} ({seconds:.2f}s)")
+        else:
+            print_error(f"Failed to export {job['label']}: {error}")
+
+    if len(jobs) == 1:
+        job = jobs[0]
+        try:
+            value, seconds = _timed_call(job['func'], job['args'], job['kwargs'])
+            record(job, 'inline', value, seconds)
+        except Exception as e:
+            record(job, 'inline', error=str(e))
+
+    elif jobs:
+        process_jobs = [j for j in jobs if j['executor'] == 'process']
+        process_pool = None
+
+        if process_jobs and EXPORT_IN_PROCESSES:
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+                process_pool = ProcessPoolExecutor(max_workers=len(process_jobs))
+            except (OSError, NotImplementedError, ImportError) as e:
+                print_warning(f"Process pool unavailable ({e}); exporting with threads")
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        futures = {}
+        try:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as thread_pool:
+                # Submit process jobs first so workers are forked before
+                # any exporter threads are running
+                for job in sorted(jobs, key=lambda j: j['executor'] != 'process'):
+                    if job['executor'] == 'process' and process_pool:
+                        pool, executor = process_pool, 'process'
+                    else:
+                        pool, executor = thread_pool, 'thread'
+                    future = pool.submit(
+                        _timed_call, job['func'], job['args'], job['kwargs']
+                    )
+                    futures[future] = (job, executor)
+
+                # Record each exporter as soon as it finishes
+                for future in as_completed(futures):
+                    job, executor = futures[future]
+                    try:
+                        value, seconds = future.result()
+                        record(job, executor, value, seconds)
+                    except Exception as e:
+                        record(job, executor, error=str(e))
+        finally:
+            if process_pool:
+                process_pool.shutdown()
+
+    # Record in job order so output_files is stable from run to run
+    for job in jobs:
+        outcome = outcomes[job['name']]
+        results['exports'][job['name']] = outcome
+        results['output_files'].extend(outcome['outputs'])
+        if outcome['error'] is not None:
+            results['errors'].append(
+                f"{job['label'].capitalize()} export error: {outcome['error']}"
+            )
+
+
+def _notion_export_job(
+    stories: list,
+    test_cases: list,
+    traceability_matrix: Optional[dict],
+    prefix: str,
+    program_name: Optional[str],
+    notion_parent: Optional[str],
+    source_filename: str
+) -> dict:
+    """
+    PURPOSE:
+        Build the Notion export job.
+
+    WHY THIS APPROACH:
+        auto_create=True because the export runs on a worker thread, where
+        the interactive "page already exists" prompt can't be answered.
+    """
+    from formatters.notion_formatter import export_to_notion
+
+    return _export_job(
+        'notion', 'Notion page', export_to_notion,
+        stories,
+        test_cases,
+        project_name=program_name or f"{prefix} Program",
+        prefix=prefix,
+        parent_page_id=notion_parent,
+        auto_create=True,
+        source_filename=source_filename,
+        traceability_matrix=traceability_matrix,
+        executor='thread'
+    )
+
+
+def _iter_chunks(items: Iterable, chunk_size: int):
+    """
+    PURPOSE:
+        Yield successive lists of at most chunk_size items. Works on lists
+        and on lazy iterators (e.g. UserStoryParser.iter_parse()).
+
+    R EQUIVALENT:
+        split(items, ceiling(seq_along(items) / chunk_size))
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ============================================================================
+# MAIN PIPELINE
+# ============================================================================
+
+def run_pipeline(
+    input_file: str,
+    prefix: str = "REQ",
+    output_format: str = "both",
+    sheet_name: Optional[str] = None,
+    output_dir: str = "outputs",
+    verbose: bool = False,
+    compliance: str = "none",
+    phase: str = "all",  # draft, final, or all
+    save_to_db: bool = False,  # NEW: Save to SQLite database
+    client_name: Optional[str] = None,  # NEW: Client name for database
+    program_name: Optional[str] = None,  # NEW: Program name for database
+    from_db: bool = False,  # NEW: Load stories from database
+    notion: bool = False,
+    notion_parent: Optional[str] = None,
+    collect_records: bool = False,
+    stage_cache: Optional[dict] = None,
+    db=None,
+    recorder=None,
+    parse_jobs: Optional[int] = None,
+    word_backend: str = 'docx',
+    lucidchart_order: str = 'document'
+) -> dict:
+    """
+    PURPOSE:
+        Execute the full requirements processing pipeline.
+
+    R EQUIVALENT:
+        # run_pipeline <- function(input_file, prefix = "REQ", output = "both") {
+        #     # Parse
+        #     requirements <- parse_excel(input_file)
+        #     # Generate stories
+        #     stories <- generate_user_stories(requirements)
+        #     # Generate tests
+        #     tests <- generate_uat_tests(stories, prefix)
+        #     # Export
+        #     if (output %in% c("both", "markdown")) export_markdown(stories, tests)
+        #     if (output %in% c("both", "excel")) export_excel(stories, tests)
+        # }
+
+    PARAMETERS:
+        input_file (str): Path to the input Excel file
+        prefix (str): Test ID prefix (e.g., "GRX", "NCCN")
+        output_format (str): "markdown", "excel", or "both"
+        sheet_name (str, optional): Specific sheet to parse
+        output_dir (str): Base output directory
+        verbose (bool): Show detailed output
+        notion (bool): Also export a Notion page (needs NOTION_API_KEY)
+        notion_parent (str, optional): Notion parent page ID
+        collect_records (bool): Return the generated requirements, stories,
+            tests and RTM under results['records'] so a caller (batch mode)
+            can persist them itself instead of save_to_db
+        stage_cache (dict, optional): Stage outputs from the previous run of
+            this file. Stages whose inputs are unchanged reuse them (watch
+            mode passes the same dict on every re-run).
+        db (ClientProductDatabase, optional): Open connection to use with
+            save_to_db instead of opening a new one
+        recorder (profiling.SpanRecorder, optional): Records a span per
+            stage (with memory, if enabled), plus duplicate-check and
+            per-exporter spans. Used by --profile.
+        parse_jobs (int, optional): Worker processes for parsing a Word
+            document (default: parse in this process)
+        word_backend (str): How Word documents are read - 'docx'
+            (python-docx) or 'lxml' (streamed XML, for very large documents)
+        lucidchart_order (str): Order of Lucidchart requirements -
+            'document' (export order) or 'flow' (follow the connectors)
+
+    RETURNS:
+        dict: Results including counts, output file paths, per-stage timings
+            under results['stage_timings'], component get_stats() counters
+            under results['component_stats'] and per-exporter timings/errors
+            under results['exports']
+
+    WHY THIS APPROACH:
+        A single orchestrator function makes the pipeline easy to understand
+        and modify. Each step is clearly separated with progress feedback.
+    """
+    results = _new_results(phase)
+
+    # Extract source filename for documentation
+    source_filename = os.path.basename(input_file)
+
+    # ========================================================================
+    # DATABASE SETUP (Optional)
+    # ========================================================================
+    program_id = None
+
+    if save_to_db:
+        db, program_id = _setup_database(
+            prefix, client_name, program_name, source_filename, results, db=db
+        )
+    else:
+        db = None
+
+    # Stage cache keys: YAML config feeds every generation stage
+    config_key = _config_key() if stage_cache is not None else None
+    requirements_key = None
+
+    # ========================================================================
+    # PHASE-SPECIFIC ROUTING
+    # ========================================================================
+    # Phase "final": Import refined stories (skip req parsing and story generation)
+    # Phase "draft": Parse reqs, generate stories, export for review, STOP
+    # Phase "all": Full pipeline (default)
+
+    requirements = []
+    stories = []
+
+    if phase == "final":
+        # ====================================================================
+        # PHASE 2 (FINAL): Import refined user stories
+        # ====================================================================
+        with _stage_timer(results, 'parse', recorder):
+            stories = _import_refined_stories(
+                input_file, results, verbose, stage_cache
+            )
+        if stories is None:
+            return results
+
+    else:
+        # ====================================================================
+        # PHASE 1 (DRAFT) or ALL: Parse raw requirements
+        # ====================================================================
+        with _stage_timer(results, 'parse', recorder):
+            # Saved with everything else in one transaction (STEP 4.5)
+            requirements = _parse_requirements(
+                input_file, results, verbose, None, None, source_filename,
+                stage_cache, recorder, parse_jobs, word_backend,
+                lucidchart_order
+            )
+        if requirements is None:
+            return results
+
+        if stage_cache is not None:
+            requirements_key = (_fingerprint(requirements), config_key)
+
+        # ====================================================================
+        # STEP 2: GENERATE USER STORIES (for draft and all phases)
+        # ====================================================================
+        with _stage_timer(results, 'stories', recorder):
+            print_subheader("Step 2: Generating User Stories")
+
+            try:
+                from generators.user_story_generator import UserStoryGenerator
+
+                # Pass prefix for new Story ID format: PREFIX-CATEGORY-SEQ
+                story_generator = UserStoryGenerator(prefix=prefix)
+                if recorder:
+                    recorder.instrument(story_generator, '_is_duplicate', 'duplicate_check')
+                stories, gen_stats = _memoized(
+                    stage_cache, results, 'stories', (requirements_key, prefix),
+                    lambda: (story_generator.generate(requirements),
+                             story_generator.get_stats())
+                )
+
+                if not stories:
+                    print_warning("No user stories generated")
+                    results['errors'].append("No stories generated")
+                    return results
+
+                results['stories_count'] = len(stories)
+
+                # Stats for requirement type breakdown
+                results['story_stats'] = gen_stats
+                results['component_stats']['user_story_generator'] = gen_stats
+
+                print_success(f"Generated {len(stories)} user stories")
+
+                # Count stories by priority
+                priority_counts = {}
+                for story in stories:
+                    priority = story.get('priority', 'Medium')
+                    priority_counts[priority] = priority_counts.get(priority, 0) + 1
+
+                if verbose:
+                    print_info("By priority:")
+                    for priority, count in sorted(priority_counts.items()):
+                        print(f"      • {priority}: {count}")
+
+                    # Show requirement type breakdown
+                    print_info("By requirement type:")
+                    if gen_stats.get('technical_features'):
+                        print(f"      • Technical Features: {gen_stats['technical_features']}")
+                    if gen_stats.get('workflow_changes'):
+                        print(f"      • Workflow Changes: {gen_stats['workflow_changes']}")
+                    if gen_stats.get('out_of_scope'):
+                        print(f"      • Out of Scope: {gen_stats['out_of_scope']}")
+                    if gen_stats.get('completed'):
+                        print(f"      • Completed: {gen_stats['completed']}")
+
+                # Check for flagged items
+                flagged = [s for s in stories if s.get('flags')]
+                results['flagged_items'] = len(flagged)
+
+                if flagged:
+                    print_warning(f"{len(flagged)} stories have quality flags")
+                    if verbose:
+                        for story in flagged[:3]:
+                            flags = ', '.join(story.get('flags', []))
+                            print(f"      • {story.get('title', 'Untitled')[:40]}: {flags}")
+
+            except Exception as e:
+                print_error(f"Failed to generate stories: {e}")
+                results['errors'].append(f"Story generation error: {e}")
+                return results
+
+        # ====================================================================
+        # PHASE "DRAFT": Export for review and STOP
+        # ====================================================================
+        if phase == "draft":
+            if db and program_id:
+                with _stage_timer(results, 'save', recorder):
+                    _persist_run(
+                        db, program_id, results, verbose, source_filename,
+                        requirements=requirements, stories=stories
+                    )
+
+            with _stage_timer(results, 'draft_export', recorder):
+                print_subheader("Step 3: Exporting Draft for Review")
+
+                try:
+                    # Create draft output directory
+                    draft_output_dir = os.path.join(output_dir, "drafts")
+
+                    # Export using draft formatter
+                    from formatters.draft_excel_formatter import export_draft_for_review
+                    draft_filepath = export_draft_for_review(
+                        stories=stories,
+                        prefix=prefix,
+                        output_dir=draft_output_dir,
+                        source_filename=source_filename
+                    )
+
+                    results['output_files'].append(draft_filepath)
+                    results['success'] = True
+
+                    if collect_records:
+                        results['records'] = {
+                            'requirements': requirements,
+                            'stories': stories,
+                            'test_cases': [],
+                            'compliance_tests': [],
+                            'traceability_matrix': None,
+                        }
+
+                    print_success(f"Draft exported: {draft_filepath}")
+                    print()
+                    print_info("NEXT STEPS:")
+                    print(f"    1. Open and review: {draft_filepath}")
+                    print("    2. Refine stories, add context, set status")
+                    print(f"    3. Run: python3 run.py \"{draft_filepath}\" --prefix {prefix} --phase final")
+
+                    return results
+
+                except Exception as e:
+                    print_error(f"Failed to export draft: {e}")
+                    results['errors'].append(f"Draft export error: {e}")
+                    return results
+
+    # End of if phase != "final" block
+
+    # ========================================================================
+    # STEP 3: GENERATE UAT TEST CASES
+    # ========================================================================
+    with _stage_timer(results, 'tests', recorder):
+        print_subheader("Step 3: Generating UAT Test Cases")
+
+        try:
+            from generators.uat_generator import UATGenerator
+            uat_generator = UATGenerator(test_id_prefix=prefix)
+            stories_key = (_fingerprint(stories), config_key) if stage_cache is not None else None
+            test_cases, stats = _memoized(
+                stage_cache, results, 'tests', (stories_key, prefix),
+                lambda: (uat_generator.generate(stories), uat_generator.get_stats())
+            )
+
+            if not test_cases:
+                print_warning("No test cases generated")
+                results['errors'].append("No test cases generated")
+                return results
+
+            results['test_cases_count'] = len(test_cases)
+            results['component_stats']['uat_generator'] = stats
+            print_success(f"Generated {len(test_cases)} test cases")
+
+            if verbose:
+                print_info("By type:")
+                by_type = stats.get('by_type', {})
+                print(f"      • Happy Path: {by_type.get('happy_path', 0)}")
+                print(f"      • Validation: {by_type.get('validation', 0)}")
+                print(f"      • Negative: {by_type.get('negative', 0)}")
+                print(f"      • Edge Cases: {by_type.get('edge_case', 0)}")
+                # Show skipped non-technical items
+                if stats.get('non_technical_skipped', 0) > 0:
+                    print(f"      • Skipped (non-technical): {stats['non_technical_skipped']}")
+
+        except Exception as e:
+            print_error(f"Failed to generate test cases: {e}")
+            results['errors'].append(f"UAT generation error: {e}")
+            return results
+
+    # ========================================================================
+    # STEP 3.5: COMPLIANCE VALIDATION (Optional)
+    # ========================================================================
+    with _stage_timer(results, 'compliance', recorder):
+        compliance_tests = _run_compliance(
+            requirements, prefix, compliance, results, verbose, None, None,
+            stage_cache, requirements_key
+        )
+
+    # Add compliance tests to the main test list
+    if compliance_tests:
+        test_cases.extend(compliance_tests)
+        results['test_cases_count'] = len(test_cases)
+
+    # ========================================================================
+    # STEP 4: GENERATE TRACEABILITY MATRIX
+    # ========================================================================
+    with _stage_timer(results, 'traceability', recorder):
+        traceability_matrix = _build_traceability(
+            requirements, stories, test_cases, phase, results, verbose,
+            None, None
+        )
+
+    # ========================================================================
+    # STEP 4.5: SAVE TO DATABASE (Optional)
+    # ========================================================================
+    # One transaction for the whole run: if any part fails to save, none of
+    # it is kept. Refined stories (phase "final") are read back from the
+    # review workbook by UserStoryParser, so they aren't saved: the baseline
+    # never saved them, and persist_run would reset their status to 'Draft'.
+    if db and program_id:
+        with _stage_timer(results, 'save', recorder):
+            _persist_run(
+                db, program_id, results, verbose, source_filename,
+                requirements=requirements,
+                stories=stories if phase != "final" else None,
+                test_cases=test_cases,
+                compliance_gaps=_compliance_gaps(results['compliance_reports']),
+                traceability_matrix=traceability_matrix
+            )
+
+    if collect_records:
+        uat_count = len(test_cases) - len(compliance_tests)
+        results['records'] = {
+            'requirements': requirements,
+            'stories': stories,
+            'test_cases': test_cases[:uat_count],
+            'compliance_tests': compliance_tests,
+            'traceability_matrix': traceability_matrix,
+        }
+
+    # ========================================================================
+    # STEP 5: EXPORT OUTPUT
+    # ========================================================================
+    with _stage_timer(results, 'export', recorder):
+        print_subheader("Step 5: Exporting Output")
+
+        base_name, timestamp, github_dir, excel_dir = _prepare_output_paths(
+            output_dir, source_filename
+        )
+
+        export_jobs = []
+
+        # Export to Markdown (no traceability matrix - use Excel for RTM)
+        if output_format in ['markdown', 'both']:
+            from formatters.github_markdown import format_for_github
+            export_jobs.append(_export_job(
+                'markdown', 'markdown', format_for_github,
+                stories,
+                test_cases,
+                output_dir=github_dir,
+                source_file=source_filename,
+                mode='single',
+                filename=f"{base_name}_{timestamp}.md"
+            ))
+
+        # Export to Excel (CPU-bound openpyxl - run in a worker process)
+        if output_format in ['excel', 'both']:
+            from formatters.excel_formatter import export_to_excel
+            export_jobs.append(_export_job(
+                'excel', 'Excel', export_to_excel,
+                stories,
+                test_cases,
+                output_dir=excel_dir,
+                source_file=source_filename,
+                filename=f"{base_name}_{timestamp}.xlsx",
+                traceability_matrix=traceability_matrix,
+                executor='process'
+            ))
+
+        # Export to Notion (network-bound - run in a thread)
+        if notion:
+            export_jobs.append(_notion_export_job(
+                stories, test_cases, traceability_matrix, prefix,
+                program_name, notion_parent, source_filename
+            ))
+
+        _run_exports(export_jobs, results)
+
+        if recorder:
+            # Exporters may run in other threads/processes: record the
+            # timing each one measured for itself
+            for name, outcome in results['exports'].items():
+                recorder.add_span(name, outcome['seconds'],
+                                  executor=outcome['executor'],
+                                  success=outcome['success'])
+
+    # ========================================================================
+    # DONE
+    # ========================================================================
+    results['success'] = len(results['errors']) == 0
+
+    return results
+
+
+def run_streaming_pipeline(
+    input_file: str,
+    prefix: str = "REQ",
+    output_format: str = "both",
+    output_dir: str = "outputs",
+    verbose: bool = False,
+    compliance: str = "none",
+    phase: str = "all",
+    save_to_db: bool = False,
+    client_name: Optional[str] = None,
+    program_name: Optional[str] = None,
+    chunk_size: int = 100,
+    notion: bool = False,
+    notion_parent: Optional[str] = None,
+    recorder=None,
+    parse_jobs: Optional[int] = None,
+    word_backend: str = 'docx',
+    lucidchart_order: str = 'document'
+) -> dict:
+    """
+    PURPOSE:
+        Run the pipeline end-to-end in chunks: each chunk of requirements is
+        turned into stories, the stories into UAT tests, and the result is
+        handed straight to the markdown and Excel writers before the next
+        chunk starts.
+
+    PARAMETERS:
+        Same as run_pipeline(), plus:
+        chunk_size (int): Requirements (or refined stories) per chunk
+        recorder (profiling.SpanRecorder, optional): As in run_pipeline();
+            stories, tests and markdown are one "stream" span
+        parse_jobs (int, optional): As in run_pipeline()
+        word_backend (str): As in run_pipeline()
+        lucidchart_order (str): As in run_pipeline()
+
+    RETURNS:
+        dict: Same results structure as run_pipeline()
+
+    WHY THIS APPROACH:
+        On large inputs the batch pipeline holds every story and every test
+        before writing anything. Here the generators keep their own state
+        across chunks (story/test ID sequences, duplicate index), so the
+        output is identical to a batch run - the markdown file matches
+        byte-for-byte and the workbook cell for cell - while only one chunk
+        of full story/test dicts is alive at a time. In phase "final" the
+        refined stories are read from the workbook row by row
+        (UserStoryParser.iter_parse()), so the first chunk is generated
+        before the rest of the sheet has been read.
+
+        Some stages still need the whole run:
+        - Requirements are kept (compliance validation and the RTM need them)
+        - Compliance tests are generated up front so each story section can
+          include any that reference it, as the batch formatter does
+        - The RTM is built from lightweight story/test projections
+        - With save_to_db, the columns the database stores are kept and
+          the run is saved in one persist_run() transaction at the end
+        - The Notion page is sent in one API call, so with --notion the
+          full story/test records are retained
+
+        The draft phase exports every story to one review workbook and has
+        no test stage, so it always runs in batch mode.
+    """
+    results = _new_results(phase)
+    source_filename = os.path.basename(input_file)
+
+    db = None
+    program_id = None
+
+    if save_to_db:
+        db, program_id = _setup_database(
+            prefix, client_name, program_name, source_filename, results
+        )
+
+    # ========================================================================
+    # STEP 1: PARSE INPUT (requirements, or refined stories for "final")
+    # ========================================================================
+    requirements = []
+    story_parser = None
+
+    if phase == "final":
+        # Stories are read lazily inside the stream stage below, so "parse"
+        # only covers opening the workbook
+        with _stage_timer(results, 'parse', recorder):
+            story_parser = _open_refined_stories(input_file, results)
+        if story_parser is None:
+            return results
+    else:
+        with _stage_timer(results, 'parse', recorder):
+            # Saved with everything else in one transaction (STEP 4.5)
+            requirements = _parse_requirements(
+                input_file, results, verbose, None, None, source_filename,
+                recorder=recorder, parse_jobs=parse_jobs,
+                word_backend=word_backend, lucidchart_order=lucidchart_order
+            )
+        if requirements is None:
+            return results
+
+    # ========================================================================
+    # STEP 3.5 (run early): COMPLIANCE VALIDATION
+    # ========================================================================
+    # WHY EARLY: Compliance tests depend only on requirements, and the
+    # markdown writer needs them before the first story section is written.
+    with _stage_timer(results, 'compliance', recorder):
+        compliance_tests = _run_compliance(
+            requirements, prefix, compliance, results, verbose, None, None
+        )
+
+    # ========================================================================
+    # STEPS 2-3 + MARKDOWN: STREAM CHUNKS THROUGH THE PIPELINE
+    # ========================================================================
+    print_subheader(f"Steps 2-3: Streaming Stories and UAT Tests "
+                    f"(chunks of {chunk_size})")
+
+    base_name, timestamp, github_dir, excel_dir = _prepare_output_paths(
+        output_dir, source_filename
+    )
+
+    write_markdown = output_format in ['markdown', 'both']
+    write_excel = output_format in ['excel', 'both']
+
+    from generators.user_story_generator import UserStoryGenerator
+    from generators.uat_generator import UATGenerator
+
+    story_generator = UserStoryGenerator(prefix=prefix) if phase != "final" else None
+    uat_generator = UATGenerator(test_id_prefix=prefix)
+
+    md_formatter = None
+    md_filename = f"{base_name}_{timestamp}.md"
+    if write_markdown:
+        from formatters.github_markdown import GitHubMarkdownFormatter
+        md_formatter = GitHubMarkdownFormatter(
+            output_dir=github_dir,
+            source_file=source_filename
+        )
+        md_formatter.begin_stream(md_filename, trailing_tests=compliance_tests)
+
+    xl_formatter = None
+    if write_excel:
+        from formatters.excel_formatter import ExcelFormatter
+        xl_formatter = ExcelFormatter(
+            output_dir=excel_dir,
+            source_file=source_filename
+        )
+        xl_formatter.begin_stream(f"{base_name}_{timestamp}.xlsx",
+                                  trailing_tests=compliance_tests)
+
+    # Lightweight projections for the RTM (only the linking fields it reads)
+    rtm_stories = []
+    rtm_tests = []
+
+    # Full records, only when the Notion page needs them
+    notion_stories = []
+    notion_tests = []
+
+    # The columns persist_run() saves, for the single save at the end
+    save_records = bool(db and program_id)
+    db_stories = []
+    db_tests = []
+
+    priority_counts = {}
+    flagged_titles = []
+    stories_count = 0
+    uat_tests_count = 0
+    chunks_done = 0
+
+    source = requirements if phase != "final" else story_parser.iter_parse()
+
+    with _stage_timer(results, 'stream', recorder):
+        try:
+            for chunk in _iter_chunks(source, chunk_size):
+                if story_generator:
+                    story_chunk = list(story_generator.iter_generate(chunk))
+                else:
+                    story_chunk = chunk
+
+                test_chunk = list(uat_generator.iter_generate(story_chunk))
+
+                stories_count += len(story_chunk)
+                uat_tests_count += len(test_chunk)
+                chunks_done += 1
+
+                for story in story_chunk:
+                    priority = story.get('priority', 'Medium')
+                    priority_counts[priority] = priority_counts.get(priority, 0) + 1
+                    if story.get('flags'):
+                        flagged_titles.append(
+                            (story.get('title', 'Untitled'), story.get('flags', []))
+                        )
+
+                    source_req = story.get('source_requirement', {})
+                    rtm_story = {
+                        'generated_id': story.get('generated_id'),
+                        'title': story.get('title', ''),
+                        'source_requirement': source_req,
+                    }
+                    if phase == "final":
+                        # Needed to reconstruct requirements in _build_traceability
+                        for key in ('story_id', 'user_story', 'source_row', 'priority'):
+                            if key in story:
+                                rtm_story[key] = story[key]
+                    rtm_stories.append(rtm_story)
+
+                for tc in test_chunk:
+                    rtm_tests.append({
+                        'test_id': tc.get('test_id', ''),
+                        'source_story_id': tc.get('source_story_id', ''),
+                        'category': tc.get('category', ''),
+                    })
+
+                if save_records:
+                    if story_generator:
+                        db_stories.extend(_db_story(story) for story in story_chunk)
+                    db_tests.extend(_db_record(tc, _DB_TEST_FIELDS) for tc in test_chunk)
+
+                if md_formatter:
+                    md_formatter.write_chunk(story_chunk, test_chunk)
+
+                if xl_formatter:
+                    xl_formatter.write_chunk(story_chunk, test_chunk)
+
+                if notion:
+                    notion_stories.extend(story_chunk)
+                    notion_tests.extend(test_chunk)
+
+                if verbose:
+                    print_info(f"Chunk {chunks_done}: {len(story_chunk)} stories, "
+                               f"{len(test_chunk)} tests")
+
+        except Exception as e:
+            print_error(f"Streaming pipeline failed: {e}")
+            results['errors'].append(f"Streaming error: {e}")
+            return results
+
+    if story_parser:
+        if not stories_count:
+            print_warning("No stories found in file")
+            results['errors'].append("No stories found")
+            return results
+        _report_refined_stories(stories_count, story_parser.get_stats(),
+                                results, verbose)
+
+    if not stories_count:
+        print_warning("No user stories generated")
+        results['errors'].append("No stories generated")
+        return results
+
+    if not uat_tests_count:
+        print_warning("No test cases generated")
+        results['errors'].append("No test cases generated")
+        return results
+
+    results['stories_count'] = stories_count
+    results['test_cases_count'] = uat_tests_count + len(compliance_tests)
+    results['flagged_items'] = len(flagged_titles)
+    if story_generator:
+        results['story_stats'] = story_generator.get_stats()
+        results['component_stats']['user_story_generator'] = results['story_stats']
+    results['component_stats']['uat_generator'] = uat_generator.get_stats()
+
+    print_success(f"Processed {chunks_done} chunks: {stories_count} user stories, "
+                  f"{uat_tests_count} test cases")
+
+    if verbose:
+        print_info("By priority:")
+        for priority, count in sorted(priority_counts.items()):
+            print(f"      • {priority}: {count}")
+
+    if flagged_titles:
+        print_warning(f"{len(flagged_titles)} stories have quality flags")
+        if verbose:
+            for title, flags in flagged_titles[:3]:
+                print(f"      • {title[:40]}: {', '.join(flags)}")
+
+    # ========================================================================
+    # STEP 4: GENERATE TRACEABILITY MATRIX
+    # ========================================================================
+    with _stage_timer(results, 'traceability', recorder):
+        traceability_matrix = _build_traceability(
+            requirements, rtm_stories, rtm_tests + compliance_tests, phase,
+            results, verbose, None, None
+        )
+
+    # ========================================================================
+    # STEP 4.5: SAVE TO DATABASE (Optional)
+    # ========================================================================
+    # One transaction for the whole run, as in run_pipeline(). Nothing is
+    # saved per chunk: a failure part-way through would leave half a
+    # program behind, and compliance tests (generated before the first
+    # chunk) must not be written before the stories they reference.
+    if save_records:
+        with _stage_timer(results, 'save', recorder):
+            _persist_run(
+                db, program_id, results, verbose, source_filename,
+                requirements=requirements,
+                stories=db_stories if story_generator else None,
+                test_cases=db_tests + compliance_tests,
+                compliance_gaps=_compliance_gaps(results['compliance_reports']),
+                traceability_matrix=traceability_matrix
+            )
+        db_stories = db_tests = None
+
+    # ========================================================================
+    # STEP 5: FINISH OUTPUT
+    # ========================================================================
+    with _stage_timer(results, 'export', recorder):
+        print_subheader("Step 5: Exporting Output")
+
+        export_jobs = []
+
+        if md_formatter:
+            export_jobs.append(_export_job(
+                'markdown', 'markdown', md_formatter.end_stream
+            ))
+
+        if xl_formatter:
+            export_jobs.append(_export_job(
+                'excel', 'Excel', xl_formatter.end_stream,
+                traceability_matrix=traceability_matrix
+            ))
+
+        if notion:
+            export_jobs.append(_notion_export_job(
+                notion_stories, notion_tests + compliance_tests, traceability_matrix,
+                prefix, program_name, notion_parent, source_filename
+            ))
+
+        _run_exports(export_jobs, results)
+
+        if recorder:
+            for name, outcome in results['exports'].items():
+                recorder.add_span(name, outcome['seconds'],
+                                  executor=outcome['executor'],
+                                  success=outcome['success'])
+
+    results['success'] = len(results['errors']) == 0
+
+    return results
+
+
+# ============================================================================
+# BATCH MODE
+# ============================================================================
+# WHY: A nightly drop of hundreds of workbooks shouldn't cost hundreds of
+# interpreter starts, config loads and schema setups. Batch mode runs every
+# file through run_pipeline() on a pool of long-lived worker processes that
+# have the modules imported and YAML config parsed before the first file.
+# Workers never touch SQLite - they hand their records back and the parent
+# process is the only database writer, so there is no lock contention.
+#
+# AVIATION ANALOGY:
+#     Like a maintenance hangar working a line of aircraft: several crews
+#     work in parallel, but only the records clerk writes in the logbook.
+
+def discover_input_files(input_dir: str) -> list[str]:
+    """
+    PURPOSE:
+        Find every supported input file under a directory.
+
+    PARAMETERS:
+        input_dir (str): Directory to search (recursively)
+
+    RETURNS:
+        list[str]: File paths in sorted order
+
+    WHY THIS APPROACH:
+        Sorted order keeps the manifest and console output stable between
+        runs. Office lock files (~$Book.xlsx) and hidden files are skipped.
+    """
+    found = []
+
+    for root, dirs, files in os.walk(input_dir):
+        # Don't descend into hidden directories (.git, .venv, ...)
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+
+        for name in sorted(files):
+            if name.startswith('~$') or name.startswith('.'):
+                continue
+            _, ext = os.path.splitext(name)
+            if ext.lower() in SUPPORTED_EXTENSIONS:
+                found.append(os.path.join(root, name))
+
+    return found
+
+
+def _warm_pipeline_config() -> None:
+    """
+    PURPOSE:
+        Load the YAML config used by the generators and compliance
+        validators into this process's config cache.
+
+    WHY THIS APPROACH:
+        Called in the parent before the pool starts (forked workers inherit
+        the parsed config) and again in each worker's initializer (spawned
+        workers, e.g. on macOS, start empty).
+    """
+    from generators.user_story_generator import UserStoryGenerator
+
+    UserStoryGenerator()
+    if _compliance_available():
+        from compliance import Part11Validator, HIPAAValidator, SOC2Validator
+        for validator_class in (Part11Validator, HIPAAValidator, SOC2Validator):
+            validator_class()
+
+
+def _batch_worker_init() -> None:
+    """Pool initializer: warm config and keep exports inside this process."""
+    global EXPORT_IN_PROCESSES
+    EXPORT_IN_PROCESSES = False
+    _warm_pipeline_config()
+
+
+def _batch_worker(task: dict) -> dict:
+    """
+    PURPOSE:
+        Run the pipeline for one file inside a batch worker.
+
+    PARAMETERS:
+        task (dict): input_file, output_dir, log_path, pipeline_kwargs,
+            collect_records
+
+    RETURNS:
+        dict: Manifest entry for the file, plus 'records' when the parent
+            needs to write them to the database
+
+    WHY THIS APPROACH:
+        The pipeline's console output is redirected to a per-file log so
+        parallel runs don't interleave on the terminal.
+    """
+    start = time.perf_counter()
+    os.makedirs(os.path.dirname(task['log_path']), exist_ok=True)
+
+    try:
+        with open(task['log_path'], 'w', encoding='utf-8') as log, \
+                contextlib.redirect_stdout(log):
+            results = run_pipeline(
+                task['input_file'],
+                output_dir=task['output_dir'],
+                collect_records=task['collect_records'],
+                **task['pipeline_kwargs']
+            )
+    except Exception as e:
+        results = _new_results(task['pipeline_kwargs'].get('phase', 'all'))
+        results['errors'].append(f"Pipeline crashed: {e}")
+
+    return {
+        'file': task['input_file'],
+        'success': results['success'],
+        'seconds': round(time.perf_counter() - start, 3),
+        'requirements_count': results['requirements_count'],
+        'stories_count': results['stories_count'],
+        'test_cases_count': results['test_cases_count'],
+        'compliance_tests_count': results['compliance_tests_count'],
+        'flagged_items': results['flagged_items'],
+        'traceability': results['traceability'],
+        'exports': results.get('exports', {}),
+        'output_files': results['output_files'],
+        'errors': results['errors'],
+        'log': task['log_path'],
+        'records': results.get('records'),
+        'compliance_reports': results['compliance_reports'],
+    }
+
+
+def _persist_batch_records(
+    db,
+    program_id,
+    entry: dict
+) -> dict:
+    """
+    PURPOSE:
+        Write one file's records to the database from the parent process.
+
+    PARAMETERS:
+        db (ClientProductDatabase): Open database
+        program_id (str): Program all batch files are saved under
+        entry (dict): Manifest entry returned by _batch_worker()
+
+    RETURNS:
+        dict: persist_run() counts and timings, plus 'warnings' if the
+            save failed
+
+    WHY THIS APPROACH:
+        Same single-transaction save as a single-file --save-to-db run. As
+        there, a failed save is a warning - it doesn't fail the file, and
+        nothing from the file is left half-saved.
+    """
+    records = entry.get('records') or {}
+    saved = {'warnings': []}
+
+    # Refined stories (phase "final") come from the review workbook, not from
+    # requirements, and aren't saved - see run_pipeline STEP 4.5
+    stories = records.get('stories') if records.get('requirements') else None
+
+    try:
+        saved.update(db.persist_run(
+            program_id,
+            requirements=records.get('requirements'),
+            stories=stories,
+            test_cases=(records.get('test_cases') or []) + (records.get('compliance_tests') or []),
+            compliance_gaps=_compliance_gaps(entry.get('compliance_reports', {})),
+            traceability_matrix=records.get('traceability_matrix'),
+            source_file=os.path.basename(entry['file'])
+        ))
+    except Exception as e:
+        saved['warnings'].append(f"nothing saved: {e}")
+
+    return saved
+
+
+def run_batch(
+    input_dir: str,
+    jobs: Optional[int] = None,
+    output_dir: str = "outputs",
+    save_to_db: bool = False,
+    client_name: Optional[str] = None,
+    program_name: Optional[str] = None,
+    **pipeline_kwargs
+) -> dict:
+    """
+    PURPOSE:
+        Run the pipeline over every supported file in a directory using a
+        process pool, and write a consolidated run manifest.
+
+    PARAMETERS:
+        input_dir (str): Directory to scan (recursively)
+        jobs (int, optional): Worker processes (default: CPU count)
+        output_dir (str): Base output directory. Files in subdirectories of
+            input_dir write to matching subdirectories of output_dir, so two
+            "requirements.xlsx" in different client folders don't collide.
+        save_to_db (bool): Persist results (written by this process only)
+        client_name, program_name (str, optional): Database client/program
+        **pipeline_kwargs: Passed to run_pipeline() for every file
+            (prefix, output_format, compliance, phase, verbose, ...)
+
+    RETURNS:
+        dict: The manifest (also written to
+            <output_dir>/batch_manifest_<timestamp>.json)
+    """
+    started_at = datetime.now()
+    wall_start = time.perf_counter()
+    timestamp = started_at.strftime("%Y%m%d_%H%M%S")
+
+    files = discover_input_files(input_dir)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(files) or 1))
+
+    manifest = {
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'finished_at': None,
+        'wall_seconds': None,
+        'input_dir': input_dir,
+        'output_dir': output_dir,
+        'jobs': jobs,
+        'options': {
+            key: value for key, value in pipeline_kwargs.items()
+            if isinstance(value, (str, int, float, bool, type(None)))
+        },
+        'totals': {},
+        'database': None,
+        'files': [],
+    }
 
-            # Count stories by priority
-            priority_counts = {}
-            for story in stories:
-                priority = story.get('priority', 'Medium')
-                priority_counts[priority] = priority_counts.get(priority, 0) + 1
+    print_subheader(f"Batch: {len(files)} files, {jobs} workers")
 
-            if verbose:
-                print_info("By priority:")
-                for priority, count in sorted(priority_counts.items()):
-                    print(f"      • {priority}: {count}")
-
-                # Show requirement type breakdown
-                print_info("By requirement type:")
-                if gen_stats.get('technical_features'):
-                    print(f"      • Technical Features: {gen_stats['technical_features']}")
-                if gen_stats.get('workflow_changes'):
-                    print(f"      • Workflow Changes: {gen_stats['workflow_changes']}")
-                if gen_stats.get('out_of_scope'):
-                    print(f"      • Out of Scope: {gen_stats['out_of_scope']}")
-                if gen_stats.get('completed'):
-                    print(f"      • Completed: {gen_stats['completed']}")
-
-            # Check for flagged items
-            flagged = [s for s in stories if s.get('flags')]
-            results['flagged_items'] = len(flagged)
-
-            if flagged:
-                print_warning(f"{len(flagged)} stories have quality flags")
-                if verbose:
-                    for story in flagged[:3]:
-                        flags = ', '.join(story.get('flags', []))
-                        print(f"      • {story.get('title', 'Untitled')[:40]}: {flags}")
+    if not files:
+        print_warning(f"No supported files found in {input_dir}")
 
-            # Save stories to database
-            if save_to_db and db and program_id:
+    # Database: set up once here; workers only return records
+    db = None
+    program_id = None
+    if save_to_db and files:
+        db_results = _new_results(pipeline_kwargs.get('phase', 'all'))
+        db, program_id = _setup_database(
+            pipeline_kwargs.get('prefix', 'REQ'), client_name, program_name,
+            os.path.basename(os.path.normpath(input_dir)), db_results
+        )
+        manifest['database'] = db_results['database']
+
+    tasks = []
+    for path in files:
+        rel_dir = os.path.dirname(os.path.relpath(path, input_dir))
+        file_output_dir = os.path.join(output_dir, rel_dir) if rel_dir else output_dir
+        log_name = os.path.relpath(path, input_dir).replace(os.sep, '__') + ".log"
+        tasks.append({
+            'input_file': path,
+            'output_dir': file_output_dir,
+            'log_path': os.path.join(output_dir, 'logs', f"batch_{timestamp}", log_name),
+            'pipeline_kwargs': pipeline_kwargs,
+            'collect_records': db is not None,
+        })
+
+    entries = {}
+
+    def finish(entry: dict) -> None:
+        """Persist (single writer) and report one completed file."""
+        rel = os.path.relpath(entry['file'], input_dir)
+
+        if db and program_id and entry.get('records'):
+            entry['database'] = _persist_batch_records(db, program_id, entry)
+        entry.pop('records', None)
+
+        entries[entry['file']] = entry
+        done = len(entries)
+
+        if entry['success']:
+            print_success(f"[{done}/{len(files)}] {rel}: "
+                          f"{entry['stories_count']} stories, "
+                          f"{entry['test_cases_count']} tests "
+                          f"({entry['seconds']:.1f}s)")
+            for warning in entry.get('database', {}).get('warnings', []):
+                print_warning(f"    Database save failed ({warning})")
+        else:
+            first_error = entry['errors'][0] if entry['errors'] else "failed"
+            print_error(f"[{done}/{len(files)}] {rel}: {first_error} "
+                        f"(log: {entry['log']})")
+
+    if jobs == 1:
+        _warm_pipeline_config()
+        for task in tasks:
+            finish(_batch_worker(task))
+    elif tasks:
+        # Warm config in the parent so forked workers inherit it
+        _warm_pipeline_config()
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_batch_worker_init) as pool:
+            futures = {pool.submit(_batch_worker, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
                 try:
-                    inserted, updated = db.save_user_stories(program_id, stories)
-                    print_success(f"Stories saved to database: {inserted} new, {updated} updated")
+                    finish(future.result())
                 except Exception as e:
-                    print_warning(f"Database save failed: {e}")
-
-        except Exception as e:
-            print_error(f"Failed to generate stories: {e}")
-            results['errors'].append(f"Story generation error: {e}")
-            return results
+                    # Worker process died (e.g. out of memory)
+                    finish({
+                        'file': task['input_file'],
+                        'success': False,
+                        'seconds': 0.0,
+                        'requirements_count': 0,
+                        'stories_count': 0,
+                        'test_cases_count': 0,
+                        'compliance_tests_count': 0,
+                        'flagged_items': 0,
+                        'traceability': None,
+                        'exports': {},
+                        'output_files': [],
+                        'errors': [f"Worker failed: {e}"],
+                        'log': task['log_path'],
+                    })
+
+    if db:
+        db.close()
 
-        # ====================================================================
-        # PHASE "DRAFT": Export for review and STOP
-        # ====================================================================
-        if phase == "draft":
-            print_subheader("Step 3: Exporting Draft for Review")
+    # Manifest lists files in discovery order, not completion order
+    manifest['files'] = [entries[path] for path in files if path in entries]
+    for entry in manifest['files']:
+        entry.pop('compliance_reports', None)
+
+    manifest['totals'] = {
+        'files': len(files),
+        'succeeded': sum(1 for e in manifest['files'] if e['success']),
+        'failed': sum(1 for e in manifest['files'] if not e['success']),
+        'requirements': sum(e['requirements_count'] for e in manifest['files']),
+        'stories': sum(e['stories_count'] for e in manifest['files']),
+        'test_cases': sum(e['test_cases_count'] for e in manifest['files']),
+        'file_seconds': round(sum(e['seconds'] for e in manifest['files']), 3),
+    }
+    manifest['finished_at'] = datetime.now().isoformat(timespec='seconds')
+    manifest['wall_seconds'] = round(time.perf_counter() - wall_start, 3)
 
-            try:
-                # Create draft output directory
-                draft_output_dir = os.path.join(output_dir, "drafts")
-
-                # Export using draft formatter
-                draft_filepath = export_draft_for_review(
-                    stories=stories,
-                    prefix=prefix,
-                    output_dir=draft_output_dir,
-                    source_filename=source_filename
-                )
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, f"batch_manifest_{timestamp}.json")
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, default=str)
+    manifest['manifest_path'] = manifest_path
 
-                results['output_files'].append(draft_filepath)
-                results['success'] = True
+    return manifest
 
-                print_success(f"Draft exported: {draft_filepath}")
-                print()
-                print_info("NEXT STEPS:")
-                print(f"    1. Open and review: {draft_filepath}")
-                print("    2. Refine stories, add context, set status")
-                print(f"    3. Run: python3 run.py \"{draft_filepath}\" --prefix {prefix} --phase final")
 
-                return results
+# ============================================================================
+# WATCH MODE
+# ============================================================================
+# WHY: Analysts iterate on one workbook and re-run the pipeline dozens of
+# times an hour. Each fresh `python3 run.py` pays interpreter start, imports,
+# YAML config loads and database setup again. Watch mode stays running:
+# modules and config stay loaded, one database connection stays open, and
+# each saved file re-runs only the stages whose inputs actually changed
+# (see STAGE CACHE). Editing a YAML config file re-runs every watched file
+# from story generation onward, reusing the parsed requirements.
+#
+# Change detection polls file modification times. That is portable (no
+# inotify/FSEvents dependency) and cheap for the handful of files an analyst
+# works on. A change is only acted on once the file has stopped changing for
+# one poll, so Excel's save-to-temp-then-rename isn't read half-written.
+#
+# AVIATION ANALOGY:
+#     Like keeping the APU running between short hops instead of a full
+#     cold start each time - and only re-running the checklist items the
+#     last change actually affects.
+
+def _watch_snapshot(paths: list) -> dict:
+    """Return {path: (mtime_ns, size)} for the paths that currently exist."""
+    snapshot = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue  # Deleted (or mid-rename) since it was listed
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _format_stage_timings(stage_timings: dict) -> str:
+    """Format results['stage_timings'] as one line, e.g. "parse 0.12s | stories cached"."""
+    parts = []
+    for stage, timing in stage_timings.items():
+        if timing.get('cached'):
+            parts.append(f"{stage} cached")
+        else:
+            parts.append(f"{stage} {timing['seconds']:.2f}s")
+    return " | ".join(parts)
+
+
+def _watch_run_file(
+    path: str,
+    watch_root: Optional[str],
+    output_dir: str,
+    stage_cache: dict,
+    db,
+    verbose: bool,
+    pipeline_kwargs: dict
+) -> dict:
+    """
+    PURPOSE:
+        Re-run the pipeline for one changed file and print a one-line
+        summary with per-stage timings.
 
-            except Exception as e:
-                print_error(f"Failed to export draft: {e}")
-                results['errors'].append(f"Draft export error: {e}")
-                return results
+    PARAMETERS:
+        path (str): Input file
+        watch_root (str, optional): Watched directory (None when watching a
+            single file). Subdirectories map to matching output directories,
+            as in batch mode.
+        output_dir (str): Base output directory
+        stage_cache (dict): This file's stage cache, kept between runs
+        db (ClientProductDatabase or None): Open connection for save_to_db
+        verbose (bool): Show the full pipeline output instead of a summary
+        pipeline_kwargs (dict): Passed to run_pipeline()
 
-    # End of if phase != "final" block
+    RETURNS:
+        dict: run_pipeline() results
+    """
+    file_output_dir = output_dir
+    label = os.path.basename(path)
+    if watch_root:
+        label = os.path.relpath(path, watch_root)
+        rel_dir = os.path.dirname(label)
+        if rel_dir:
+            file_output_dir = os.path.join(output_dir, rel_dir)
 
-    # ========================================================================
-    # STEP 3: GENERATE UAT TEST CASES
-    # ========================================================================
-    print_subheader("Step 3: Generating UAT Test Cases")
+    start = time.perf_counter()
+    log = None if verbose else io.StringIO()
 
     try:
-        uat_generator = UATGenerator(test_id_prefix=prefix)
-        test_cases = uat_generator.generate(stories)
-
-        if not test_cases:
-            print_warning("No test cases generated")
-            results['errors'].append("No test cases generated")
-            return results
+        with contextlib.redirect_stdout(log) if log else contextlib.nullcontext():
+            results = run_pipeline(
+                path,
+                output_dir=file_output_dir,
+                verbose=verbose,
+                stage_cache=stage_cache,
+                db=db,
+                save_to_db=db is not None,
+                **pipeline_kwargs
+            )
+    except Exception as e:
+        # A bad save shouldn't stop the watcher - report it and keep going
+        results = _new_results(pipeline_kwargs.get('phase', 'all'))
+        results['errors'].append(f"Pipeline crashed: {e}")
+        stage_cache.clear()
 
-        results['test_cases_count'] = len(test_cases)
-        print_success(f"Generated {len(test_cases)} test cases")
+    seconds = time.perf_counter() - start
+    stamp = datetime.now().strftime("%H:%M:%S")
 
-        # Get stats
-        stats = uat_generator.get_stats()
-        if verbose:
-            print_info("By type:")
-            by_type = stats.get('by_type', {})
-            print(f"      • Happy Path: {by_type.get('happy_path', 0)}")
-            print(f"      • Validation: {by_type.get('validation', 0)}")
-            print(f"      • Negative: {by_type.get('negative', 0)}")
-            print(f"      • Edge Cases: {by_type.get('edge_case', 0)}")
-            # Show skipped non-technical items
-            if stats.get('non_technical_skipped', 0) > 0:
-                print(f"      • Skipped (non-technical): {stats['non_technical_skipped']}")
-
-        # Save test cases to database
-        if save_to_db and db and program_id:
-            try:
-                inserted, updated = db.save_test_cases(program_id, test_cases)
-                print_success(f"Test cases saved to database: {inserted} new, {updated} updated")
-            except Exception as e:
-                print_warning(f"Database save failed: {e}")
+    if results['success']:
+        print_success(f"[{stamp}] {label}: {results['requirements_count']} requirements, "
+                      f"{results['stories_count']} stories, "
+                      f"{results['test_cases_count']} tests ({seconds:.2f}s)")
+    else:
+        first_error = results['errors'][0] if results['errors'] else "failed"
+        print_error(f"[{stamp}] {label}: {first_error} ({seconds:.2f}s)")
 
-    except Exception as e:
-        print_error(f"Failed to generate test cases: {e}")
-        results['errors'].append(f"UAT generation error: {e}")
-        return results
+    if results['stage_timings']:
+        print(f"      {_format_stage_timings(results['stage_timings'])}")
 
-    # ========================================================================
-    # STEP 3.5: COMPLIANCE VALIDATION (Optional)
-    # ========================================================================
-    compliance_tests = []
+    return results
 
-    if compliance != 'none':
-        if not COMPLIANCE_AVAILABLE:
-            print_warning("Compliance module not available. Skipping compliance validation.")
-        else:
-            print_subheader("Step 3.5: Compliance Validation")
 
-            try:
-                # Validate against selected framework(s)
-                if compliance == 'all':
-                    print_info("Validating against: Part 11, HIPAA, SOC 2")
-
-                    # Part 11
-                    p11_report = validate_part11(requirements, prefix)
-                    results['compliance_reports']['part11'] = p11_report
-                    print_success(f"Part 11: {p11_report['summary']['compliance_score']}% compliant, "
-                                f"{p11_report['summary']['requirements_with_gaps']} gaps found")
-
-                    # HIPAA
-                    hipaa_report = validate_hipaa(requirements, prefix)
-                    results['compliance_reports']['hipaa'] = hipaa_report
-                    print_success(f"HIPAA: {hipaa_report['summary']['compliance_score']}% compliant, "
-                                f"{hipaa_report['summary']['requirements_with_gaps']} gaps found")
-
-                    # SOC 2
-                    soc2_report = validate_soc2(requirements, prefix)
-                    results['compliance_reports']['soc2'] = soc2_report
-                    print_success(f"SOC 2: {soc2_report['summary']['compliance_score']}% compliant, "
-                                f"{soc2_report['summary']['requirements_with_gaps']} gaps found")
-
-                    # Generate compliance tests
-                    all_compliance = generate_all_compliance_tests(requirements, prefix)
-                    compliance_tests = all_compliance['combined']
-
-                elif compliance == 'part11':
-                    print_info("Validating against: FDA 21 CFR Part 11")
-                    report = validate_part11(requirements, prefix)
-                    results['compliance_reports']['part11'] = report
-                    print_success(f"Compliance score: {report['summary']['compliance_score']}%")
-                    print_info(f"Requirements with gaps: {report['summary']['requirements_with_gaps']}")
-                    compliance_tests = generate_part11_tests(requirements, prefix)
-
-                elif compliance == 'hipaa':
-                    print_info("Validating against: HIPAA Security Rule")
-                    report = validate_hipaa(requirements, prefix)
-                    results['compliance_reports']['hipaa'] = report
-                    print_success(f"Compliance score: {report['summary']['compliance_score']}%")
-                    print_info(f"Requirements with gaps: {report['summary']['requirements_with_gaps']}")
-                    compliance_tests = generate_hipaa_tests(requirements, prefix)
-
-                elif compliance == 'soc2':
-                    print_info("Validating against: SOC 2 Trust Services Criteria")
-                    report = validate_soc2(requirements, prefix)
-                    results['compliance_reports']['soc2'] = report
-                    print_success(f"Compliance score: {report['summary']['compliance_score']}%")
-                    print_info(f"Requirements with gaps: {report['summary']['requirements_with_gaps']}")
-                    compliance_tests = generate_soc2_tests(requirements, prefix)
-
-                # Add compliance tests to the main test list
-                if compliance_tests:
-                    results['compliance_tests_count'] = len(compliance_tests)
-                    test_cases.extend(compliance_tests)
-                    print_success(f"Generated {len(compliance_tests)} compliance test cases")
-                    results['test_cases_count'] = len(test_cases)
-
-                    # Save compliance tests to database
-                    if save_to_db and db and program_id:
-                        try:
-                            inserted, _ = db.save_test_cases(program_id, compliance_tests)
-                            print_success(f"Compliance tests saved: {inserted}")
-                        except Exception as e:
-                            print_warning(f"Database save failed: {e}")
-
-                # Save compliance gaps to database
-                if save_to_db and db and program_id:
-                    for framework, report in results['compliance_reports'].items():
-                        gaps = report.get('gaps', [])
-                        if gaps:
-                            try:
-                                count = db.save_compliance_gaps(program_id, gaps)
-                                if verbose:
-                                    print_info(f"Saved {count} {framework} gaps to database")
-                            except Exception as e:
-                                print_warning(f"Failed to save {framework} gaps: {e}")
+def run_watch(
+    watch_path: str,
+    poll_interval: float = 1.0,
+    output_dir: str = "outputs",
+    save_to_db: bool = False,
+    client_name: Optional[str] = None,
+    program_name: Optional[str] = None,
+    verbose: bool = False,
+    max_polls: Optional[int] = None,
+    **pipeline_kwargs
+) -> int:
+    """
+    PURPOSE:
+        Run the pipeline for a file (or every supported file in a
+        directory), then keep re-running it as files change.
 
-                if verbose:
-                    # Show gap breakdown
-                    for framework, report in results['compliance_reports'].items():
-                        print_info(f"{framework.upper()} gaps by category:")
-                        for cat, count in report.get('gaps_by_category', {}).items():
-                            print(f"        {cat}: {count}")
+    PARAMETERS:
+        watch_path (str): Input file or directory (searched recursively;
+            files added later are picked up)
+        poll_interval (float): Seconds between checks for changes
+        output_dir (str): Base output directory
+        save_to_db (bool): Persist each run over one shared connection
+        client_name, program_name (str, optional): Database client/program
+        verbose (bool): Show full pipeline output for every run
+        max_polls (int, optional): Stop after this many polls (default: run
+            until interrupted with Ctrl+C)
+        **pipeline_kwargs: Passed to run_pipeline() (prefix, output_format,
+            compliance, phase, ...)
 
-            except Exception as e:
-                print_error(f"Compliance validation failed: {e}")
-                results['errors'].append(f"Compliance error: {e}")
-                # Continue without compliance - don't fail the whole pipeline
+    RETURNS:
+        int: Number of pipeline runs
 
-    # ========================================================================
-    # STEP 4: GENERATE TRACEABILITY MATRIX
-    # ========================================================================
-    print_subheader("Step 4: Generating Traceability Matrix")
+    WHY THIS APPROACH:
+        Each file keeps its own stage cache, so saving one workbook never
+        invalidates another's. The run happens in this process, which keeps
+        imports, compiled patterns and parsed YAML warm between runs.
+    """
+    watch_root = watch_path if os.path.isdir(watch_path) else None
 
-    try:
-        # For final phase, we need to reconstruct requirements from stories
-        # since we don't have the original requirements
-        if phase == "final" and not requirements:
-            # Build requirements from story source info
-            requirements = []
-            for story in stories:
-                # Handle source_requirement which may be a dict or string
-                source_req = story.get('source_requirement', {})
-                if isinstance(source_req, dict):
-                    description = source_req.get('description', story.get('user_story', ''))
-                else:
-                    # String fallback
-                    description = str(source_req) if source_req else story.get('user_story', '')
+    def input_files() -> list:
+        return discover_input_files(watch_root) if watch_root else [watch_path]
 
-                req = {
-                    'requirement_id': story.get('story_id', story.get('generated_id')),
-                    'description': description,
-                    'row_number': story.get('source_row'),
-                    'title': story.get('title'),
-                    'priority': story.get('priority', 'Medium'),
-                }
-                requirements.append(req)
-            print_info(f"Reconstructed {len(requirements)} requirements from refined stories")
+    db = None
+    if save_to_db:
+        if _database_available():
+            from database.db_manager import get_database
+            db = get_database()
+        else:
+            print_warning("Database module not available. Watching without database persistence.")
 
-        traceability_matrix = generate_traceability_matrix(
-            requirements=requirements,
-            stories=stories,
-            test_cases=test_cases
-        )
+    # Database setup and client/program names are handled per run
+    pipeline_kwargs.update(client_name=client_name, program_name=program_name)
 
-        summary = traceability_matrix.get('summary', {})
-        results['traceability'] = summary
+    caches = {}  # path -> stage cache
+    runs = 0
 
-        full_pct = summary.get('full_coverage_pct', 0)
-        partial_pct = summary.get('partial_coverage_pct', 0)
-        none_pct = summary.get('no_coverage_pct', 0)
-        gap_count = summary.get('total_gaps', 0)
+    def run_files(paths: list) -> None:
+        nonlocal runs
+        for path in paths:
+            _watch_run_file(
+                path, watch_root, output_dir, caches.setdefault(path, {}),
+                db, verbose, pipeline_kwargs
+            )
+            runs += 1
 
-        print_success(f"Built traceability matrix")
-        print_info(f"Coverage: {full_pct}% full, {partial_pct}% partial, {none_pct}% none")
+    try:
+        files = input_files()
+        print_subheader(f"Watching {len(files)} file(s) in {watch_path}"
+                        if watch_root else f"Watching {watch_path}")
+        print_info(f"Polling every {poll_interval:g}s - press Ctrl+C to stop")
+
+        # Initial run of everything
+        seen = _watch_snapshot(files)
+        seen_config = _watch_snapshot(_config_files())
+        run_files(sorted(seen))
+
+        pending = {}          # path -> stat seen on the previous poll
+        pending_config = None
+        polls = 0
+
+        while max_polls is None or polls < max_polls:
+            time.sleep(poll_interval)
+            polls += 1
+
+            current = _watch_snapshot(input_files())
+            current_config = _watch_snapshot(_config_files())
+
+            # Forget deleted files
+            for path in set(seen) - set(current):
+                seen.pop(path)
+                pending.pop(path, None)
+                caches.pop(path, None)
+                print_info(f"Removed: {os.path.basename(path)}")
+
+            # Changed or new files run once their stat is stable for one poll
+            ready = []
+            for path, stat in current.items():
+                if seen.get(path) == stat:
+                    pending.pop(path, None)
+                elif pending.get(path) == stat:
+                    ready.append(path)
+                else:
+                    pending[path] = stat
+
+            # Config edits re-run every file (parsing is reused)
+            config_ready = False
+            if current_config != seen_config:
+                if pending_config == current_config:
+                    config_ready = True
+                    seen_config = current_config
+                    pending_config = None
+                    print_info("Config changed - re-running all files")
+                else:
+                    pending_config = current_config
 
-        if gap_count > 0:
-            print_warning(f"{gap_count} requirements have coverage gaps")
+            if config_ready:
+                ready = sorted(current)
+            for path in ready:
+                seen[path] = current[path]
+                pending.pop(path, None)
+            run_files(sorted(ready))
 
-        # Save traceability to database
-        if save_to_db and db and program_id:
-            try:
-                count = db.save_traceability(program_id, traceability_matrix)
-                print_success(f"Traceability saved to database: {count} records")
-            except Exception as e:
-                print_warning(f"Database save failed: {e}")
+    finally:
+        if db:
+            db.close()
 
-        if verbose:
-            print_info("Coverage breakdown:")
-            print(f"      • Full coverage: {summary.get('full_coverage_count', 0)} requirements")
-            print(f"      • Partial coverage: {summary.get('partial_coverage_count', 0)} requirements")
-            print(f"      • No coverage: {summary.get('no_coverage_count', 0)} requirements")
+    return runs
 
-            # Show compliance test coverage
-            compliance_coverage = summary.get('compliance_coverage', {})
-            if any(c.get('tests', 0) > 0 for c in compliance_coverage.values()):
-                print_info("Compliance test coverage:")
-                for framework, stats in compliance_coverage.items():
-                    tests = stats.get('tests', 0)
-                    if tests > 0:
-                        print(f"      • {framework}: {tests} tests")
 
-    except Exception as e:
-        print_error(f"Failed to generate traceability matrix: {e}")
-        results['errors'].append(f"Traceability error: {e}")
-        traceability_matrix = None
-        # Continue without traceability - don't fail the whole pipeline
+# ============================================================================
+# PROFILING (--profile)
+# ============================================================================
+# WHY: The console shows progress but not where the time goes. With
+# --profile, run_pipeline() records a span per stage through a
+# profiling.SpanRecorder (with tracemalloc peak memory), along with each
+# component's get_stats() counters, and writes a JSON report next to the
+# outputs. --profile-cprofile also dumps function-level cProfile stats
+# (open them with `python -m pstats` or snakeviz).
+
+def _start_profile(cprofile: bool = False) -> tuple:
+    """
+    PURPOSE:
+        Start a span recorder (and optionally cProfile) for one run.
 
-    # ========================================================================
-    # STEP 5: EXPORT OUTPUT
-    # ========================================================================
-    print_subheader("Step 5: Exporting Output")
+    RETURNS:
+        tuple: (recorder, profiler) - profiler is None unless cprofile
+    """
+    from profiling import SpanRecorder
 
-    # Create base filename from input
-    base_name = os.path.splitext(source_filename)[0]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+    recorder = SpanRecorder(track_memory=True)
+    recorder.start()
 
-    # Ensure output directories exist
-    github_dir = os.path.join(output_dir, 'github')
-    excel_dir = os.path.join(output_dir, 'excel')
-    os.makedirs(github_dir, exist_ok=True)
-    os.makedirs(excel_dir, exist_ok=True)
+    profiler = None
+    if cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
 
-    # Export to Markdown (no traceability matrix - use Excel for RTM)
-    if output_format in ['markdown', 'both']:
-        try:
-            md_filename = f"{base_name}_{timestamp}.md"
-            md_files = format_for_github(
-                stories,
-                test_cases,
-                output_dir=github_dir,
-                source_file=source_filename,
-                mode='single',
-                filename=md_filename
-            )
-            results['output_files'].extend(md_files)
-            print_success(f"Created markdown: {md_files[0]}")
+    return recorder, profiler
 
-        except Exception as e:
-            print_error(f"Failed to export markdown: {e}")
-            results['errors'].append(f"Markdown export error: {e}")
 
-    # Export to Excel
-    if output_format in ['excel', 'both']:
-        try:
-            excel_filename = f"{base_name}_{timestamp}.xlsx"
-            excel_path = export_to_excel(
-                stories,
-                test_cases,
-                output_dir=excel_dir,
-                source_file=source_filename,
-                filename=excel_filename,
-                traceability_matrix=traceability_matrix
-            )
-            results['output_files'].append(excel_path)
-            print_success(f"Created Excel: {excel_path}")
+def _finish_profile(
+    recorder,
+    profiler,
+    results: dict,
+    input_file: str,
+    output_dir: str,
+    options: dict
+) -> dict:
+    """
+    PURPOSE:
+        Stop profiling and write the report to
+        <output_dir>/profiles/<input name>_<timestamp>_profile.json
+        (plus a .prof cProfile dump when enabled).
 
-        except Exception as e:
-            print_error(f"Failed to export Excel: {e}")
-            results['errors'].append(f"Excel export error: {e}")
+    PARAMETERS:
+        recorder (SpanRecorder): From _start_profile()
+        profiler (cProfile.Profile or None): From _start_profile()
+        results (dict): Pipeline results
+        input_file (str): Input path (names the report)
+        output_dir (str): Base output directory
+        options (dict): Run options to store in the report
 
-    # ========================================================================
-    # DONE
-    # ========================================================================
-    results['success'] = len(results['errors']) == 0
+    RETURNS:
+        dict: {'json': path, 'cprofile': path or None}
+    """
+    if profiler:
+        profiler.disable()
+    recorder.stop()
+
+    # Component counters (compliance and RTM summaries come from results)
+    for component, stats in results.get('component_stats', {}).items():
+        recorder.add_counters(component, stats)
+    if results.get('traceability'):
+        recorder.add_counters('traceability', results['traceability'])
+    if results.get('compliance_reports'):
+        recorder.add_counters('compliance', {
+            framework: report.get('summary', {})
+            for framework, report in results['compliance_reports'].items()
+        })
+
+    base_name = os.path.splitext(os.path.basename(input_file))[0]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    profile_dir = os.path.join(output_dir, 'profiles')
+    os.makedirs(profile_dir, exist_ok=True)
+    stem = os.path.join(profile_dir, f"{base_name}_{timestamp}")
+
+    cprofile_path = None
+    if profiler:
+        cprofile_path = f"{stem}.prof"
+        profiler.dump_stats(cprofile_path)
+
+    json_path = recorder.write_json(
+        f"{stem}_profile.json",
+        input_file=input_file,
+        options=options,
+        success=results['success'],
+        counts={
+            'requirements': results['requirements_count'],
+            'stories': results['stories_count'],
+            'test_cases': results['test_cases_count'],
+            'compliance_tests': results['compliance_tests_count'],
+        },
+        exports=results.get('exports', {}),
+        errors=results['errors'],
+        cprofile=cprofile_path
+    )
 
-    return results
+    return {'json': json_path, 'cprofile': cprofile_path}
 
 
 # ============================================================================
@@ -1077,7 +3030,13 @@ def main():
 
     # Show configuration
     print_subheader("Configuration")
-    print_stat("Input file", args.input_file)
+    if args.batch:
+        print_stat("Batch directory", args.batch)
+        print_stat("Workers", args.jobs or os.cpu_count())
+    elif args.watch:
+        print_stat("Watching", args.watch)
+    else:
+        print_stat("Input file", args.input_file)
     print_stat("Test ID prefix", args.prefix)
     print_stat("Output format", args.output)
     if args.sheet:
@@ -1100,6 +3059,16 @@ def main():
         }
         print_stat("Phase", phase_names.get(args.phase, args.phase))
 
+    if args.notion:
+        print_stat("Notion export", "Enabled")
+
+    # Show streaming mode
+    if args.stream and args.phase != 'draft':
+        print_stat("Mode", f"Streaming (chunks of {args.chunk_size})")
+        if args.notion:
+            print_info("--notion keeps every story and test in memory for the "
+                       "Notion page, even with --stream")
+
     # Show database configuration
     if args.save_to_db or args.import_stories:
         print_stat("Database", "Enabled (data/client_product_database.db)")
@@ -1121,10 +3090,22 @@ def main():
     # AUDIT COMMANDS (no input file required)
     # ========================================================================
     if args.audit_history or args.audit_report or args.recent_changes:
-        if not DATABASE_AVAILABLE:
+        if not _database_available():
             print_error("Database module not available for audit commands.")
             sys.exit(1)
 
+        # Audit commands only need sqlite3 - keep openpyxl and the parsers
+        # out of this path so lookups start instantly
+        from database.db_manager import get_database
+        from database.audit_queries import (
+            get_record_audit_trail,
+            get_program_audit_report,
+            get_recent_changes,
+            format_audit_for_display,
+            format_recent_changes_table,
+            format_audit_summary
+        )
+
         db = get_database()
 
         # ------------------------------------------------------------------
@@ -1164,6 +3145,7 @@ def main():
                     filename = f"audit_{args.record_type}_{safe_id}_{timestamp}.xlsx"
                     output_path = os.path.join(output_dir, filename)
 
+                    from formatters.audit_excel_formatter import export_audit_to_excel
                     export_audit_to_excel(
                         entries, output_path,
                         report_title=f"Audit Trail: {args.record_id}"
@@ -1222,6 +3204,7 @@ def main():
             if args.output == 'excel' and entries:
                 output_dir = os.path.join(args.output_dir, 'audit')
                 os.makedirs(output_dir, exist_ok=True)
+                from formatters.audit_excel_formatter import export_program_audit_report
                 output_path = export_program_audit_report(report, output_dir)
                 print()
                 print_success(f"Exported to: {output_path}")
@@ -1252,6 +3235,7 @@ def main():
                     filename = f"recent_changes_{args.days}days_{timestamp}.xlsx"
                     output_path = os.path.join(output_dir, filename)
 
+                    from formatters.audit_excel_formatter import export_audit_to_excel
                     export_audit_to_excel(
                         entries, output_path,
                         report_title=f"Recent Changes (Last {args.days} Days)"
@@ -1263,6 +3247,141 @@ def main():
             print()
             sys.exit(0)
 
+    # ========================================================================
+    # STATS COMMANDS: program_stats consistency check / rebuild
+    # ========================================================================
+    if args.check_stats or args.rebuild_stats:
+        if not _database_available():
+            print_error("Database module not available for stats commands.")
+            sys.exit(1)
+
+        from database.db_manager import get_database
+
+        db = get_database()
+        exit_code = 0
+
+        if args.rebuild_stats:
+            print_subheader("Rebuilding Program Stats")
+            rebuilt = db.rebuild_program_stats()
+            print_success(f"Rebuilt {rebuilt['rows']} rows for {rebuilt['programs']} "
+                          f"programs ({rebuilt['seconds']:.2f}s)")
+        else:
+            print_subheader("Checking Program Stats")
+            mismatches = db.check_program_stats()
+            if not mismatches:
+                print_success("program_stats matches the source tables")
+            else:
+                exit_code = 1
+                print_warning(f"{len(mismatches)} counts differ from the source tables")
+                for m in mismatches[:20]:
+                    dims = "/".join(d for d in (m['dim1'], m['dim2']) if d) or "-"
+                    print(f"      • {m['program_id']} {m['metric']} [{dims}]: "
+                          f"stored {m['stored']}, actual {m['actual']}")
+                if len(mismatches) > 20:
+                    print(f"      ... and {len(mismatches) - 20} more")
+                print_info("Fix with: python3 run.py --rebuild-stats")
+
+        db.close()
+        print()
+        sys.exit(exit_code)
+
+    # ========================================================================
+    # BATCH MODE: Every supported file in a directory
+    # ========================================================================
+    if args.batch:
+        if not os.path.isdir(args.batch):
+            print_error(f"Batch directory not found: {args.batch}")
+            sys.exit(1)
+        if args.jobs is not None and args.jobs < 1:
+            print_error("--jobs must be at least 1")
+            sys.exit(1)
+        if args.stream:
+            print_info("--stream is ignored in batch mode (each worker runs one file)")
+        if args.notion:
+            print_warning("--notion is not supported in batch mode. Skipping Notion export.")
+        if args.profile or args.profile_cprofile:
+            print_info("--profile is ignored in batch mode (see per-file seconds in the manifest)")
+
+        manifest = run_batch(
+            args.batch,
+            jobs=args.jobs,
+            output_dir=args.output_dir,
+            save_to_db=args.save_to_db,
+            client_name=args.client,
+            program_name=args.program,
+            prefix=args.prefix,
+            output_format=args.output,
+            sheet_name=args.sheet,
+            verbose=args.verbose,
+            compliance=args.compliance,
+            phase=args.phase,
+            word_backend=args.word_backend,
+            lucidchart_order=args.lucidchart_order
+        )
+
+        totals = manifest['totals']
+        print_header("Batch Summary")
+        print_stat("Files processed", totals['files'])
+        print_stat("Succeeded", totals['succeeded'])
+        print_stat("Failed", totals['failed'])
+        print_stat("Requirements parsed", totals['requirements'])
+        print_stat("User stories generated", totals['stories'])
+        print_stat("UAT test cases created", totals['test_cases'])
+        print_stat("Wall time", f"{manifest['wall_seconds']:.1f}s "
+                                f"({totals['file_seconds']:.1f}s of pipeline work)")
+        print()
+        print(f"Manifest: {manifest['manifest_path']}")
+        print()
+        sys.exit(0 if totals['failed'] == 0 else 1)
+
+    # ========================================================================
+    # WATCH MODE: Re-run on every save until Ctrl+C
+    # ========================================================================
+    if args.watch:
+        if args.batch:
+            print_error("--watch and --batch can't be combined")
+            sys.exit(1)
+        if not os.path.exists(args.watch):
+            print_error(f"Watch path not found: {args.watch}")
+            sys.exit(1)
+        if os.path.isfile(args.watch):
+            try:
+                validate_input_file(args.watch)
+            except (FileNotFoundError, ValueError) as e:
+                print_error(str(e))
+                sys.exit(1)
+        if args.poll_interval <= 0:
+            print_error("--poll-interval must be greater than 0")
+            sys.exit(1)
+        if args.stream:
+            print_info("--stream is ignored in watch mode")
+        if args.notion:
+            print_warning("--notion is not supported in watch mode. Skipping Notion export.")
+        if args.profile or args.profile_cprofile:
+            print_info("--profile is ignored in watch mode (stage timings print after each run)")
+
+        try:
+            run_watch(
+                args.watch,
+                poll_interval=args.poll_interval,
+                output_dir=args.output_dir,
+                save_to_db=args.save_to_db,
+                client_name=args.client,
+                program_name=args.program,
+                verbose=args.verbose,
+                prefix=args.prefix,
+                output_format=args.output,
+                sheet_name=args.sheet,
+                compliance=args.compliance,
+                phase=args.phase,
+                word_backend=args.word_backend,
+                lucidchart_order=args.lucidchart_order
+            )
+        except KeyboardInterrupt:
+            print()
+            print_info("Stopped watching")
+        sys.exit(0)
+
     # ========================================================================
     # NORMAL MODE: Validate input file required
     # ========================================================================
@@ -1294,10 +3413,13 @@ def main():
     # IMPORT MODE: Direct import to database (skip parsing/generation)
     # ========================================================================
     if args.import_stories:
-        if not DATABASE_AVAILABLE:
+        if not _database_available():
             print_error("Database module not available for import mode.")
             sys.exit(1)
 
+        from database.db_manager import get_database
+        from database.import_stories import import_stories_from_excel
+
         if not args.client:
             print_error("--client is required for --import-stories mode")
             print()
@@ -1362,21 +3484,81 @@ def main():
         print()
         sys.exit(0 if import_result['success'] else 1)
 
+    if args.notion:
+        from formatters.notion_formatter import NOTION_AVAILABLE
+    if args.notion and not NOTION_AVAILABLE:
+        print_warning("notion-client not installed. Skipping Notion export.")
+        args.notion = False
+
+    if args.stream and args.chunk_size < 1:
+        print_error("--chunk-size must be at least 1")
+        sys.exit(1)
+
+    if args.jobs is not None and args.jobs < 1:
+        print_error("--jobs must be at least 1")
+        sys.exit(1)
+
+    # Start profiling (single-file runs only)
+    recorder = profiler = None
+    if args.profile or args.profile_cprofile:
+        recorder, profiler = _start_profile(cprofile=args.profile_cprofile)
+
     # Run the pipeline
-    results = run_pipeline(
-        input_file=args.input_file,
-        prefix=args.prefix,
-        output_format=args.output,
-        sheet_name=args.sheet,
-        output_dir=args.output_dir,
-        verbose=args.verbose,
-        compliance=args.compliance,
-        phase=args.phase,
-        save_to_db=args.save_to_db,
-        client_name=args.client,
-        program_name=args.program,
-        from_db=args.from_db
-    )
+    if args.stream and args.phase != 'draft':
+        results = run_streaming_pipeline(
+            input_file=args.input_file,
+            prefix=args.prefix,
+            output_format=args.output,
+            output_dir=args.output_dir,
+            verbose=args.verbose,
+            compliance=args.compliance,
+            phase=args.phase,
+            save_to_db=args.save_to_db,
+            client_name=args.client,
+            program_name=args.program,
+            chunk_size=args.chunk_size,
+            notion=args.notion,
+            notion_parent=args.notion_parent,
+            recorder=recorder,
+            parse_jobs=args.jobs,
+            word_backend=args.word_backend,
+            lucidchart_order=args.lucidchart_order
+        )
+    else:
+        results = run_pipeline(
+            input_file=args.input_file,
+            prefix=args.prefix,
+            output_format=args.output,
+            sheet_name=args.sheet,
+            output_dir=args.output_dir,
+            verbose=args.verbose,
+            compliance=args.compliance,
+            phase=args.phase,
+            save_to_db=args.save_to_db,
+            client_name=args.client,
+            program_name=args.program,
+            from_db=args.from_db,
+            notion=args.notion,
+            notion_parent=args.notion_parent,
+            recorder=recorder,
+            parse_jobs=args.jobs,
+            word_backend=args.word_backend,
+            lucidchart_order=args.lucidchart_order
+        )
+
+    profile_paths = None
+    if recorder:
+        profile_paths = _finish_profile(
+            recorder, profiler, results, args.input_file, args.output_dir,
+            options={
+                'prefix': args.prefix,
+                'output_format': args.output,
+                'compliance': args.compliance,
+                'phase': args.phase,
+                'stream': bool(args.stream and args.phase != 'draft'),
+                'save_to_db': args.save_to_db,
+            }
+        )
 
     # Print summary
     print_header("Summary")
@@ -1430,6 +3612,25 @@ def main():
         for filepath in results['output_files']:
             print(f"    • {filepath}")
 
+        # Show per-exporter timings
+        if args.verbose and results.get('exports'):
+            print()
+            print("Export timings:")
+            for name, outcome in results['exports'].items():
+                status = "ok" if outcome['success'] else "FAILED"
+                print(f"    • {name}: {outcome['seconds']:.2f}s "
+                      f"({outcome['executor']}, {status})")
+
+        # Show profile
+        if profile_paths:
+            print()
+            print("Profile (time, peak traced memory):")
+            for line in recorder.format_table().splitlines():
+                print(f"    {line}")
+            print(f"    Report: {profile_paths['json']}")
+            if profile_paths['cprofile']:
+                print(f"    cProfile: {profile_paths['cprofile']}")
+
         # Show database info if saved
         if results.get('database'):
             db_info = results['database']
@@ -1460,6 +3661,9 @@ def main():
         print()
         for error in results['errors']:
             print(f"    • {error}")
+        if profile_paths:
+            print()
+            print(f"Profile report: {profile_paths['json']}")
         print()
         print("Please resolve the errors and try again.")
         sys.exit(1)